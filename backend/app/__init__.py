@@ -5,47 +5,152 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import JWTManager
 import os
 
-db = SQLAlchemy()
+from .database import RoutingSession, engine_options
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 jwt = JWTManager()
 
+# Options CORS des routes /api (reprises par le mode ASGI)
+CORS_API_OPTIONS = {
+    "origins": [
+        "http://localhost:5173",           # Frontend local Vite
+        "http://localhost:3000",           # Frontend local React
+        "http://54.196.196.2",             # Backend AWS
+        "http://54.196.196.2:5173",        # Si frontend sur AWS
+        "*"                                 # TEMPORAIRE - À enlever en production
+    ],
+    "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    "allow_headers": ["Content-Type", "Authorization", "Range", "If-None-Match", "Last-Event-ID", "Idempotency-Key"],
+    "expose_headers": ["Content-Type", "Authorization", "X-Next-Cursor", "ETag", "Content-Disposition", "X-Cache",
+                       "Idempotent-Replayed", "Retry-After"],
+    "supports_credentials": True,
+    "max_age": 3600
+}
+
 def create_app():
+    """Application configurée, sans connexion à la base ni travail sur le schéma
+
+    Le schéma se met à jour par ``flask schema upgrade`` (voir ``schema.py``).
+    """
+    from .schema import CommandGroup
     app = Flask(__name__)
+    app.cli = CommandGroup()
     
     # Configuration
     app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
     app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///app.db')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['DB_POOL_SIZE'] = int(os.environ.get('DB_POOL_SIZE', 5))  # par processus
+    app.config['DB_MAX_OVERFLOW'] = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+    app.config['DB_POOL_TIMEOUT'] = float(os.environ.get('DB_POOL_TIMEOUT', 30))  # secondes d'attente max
+    app.config['DB_POOL_RECYCLE'] = int(os.environ.get('DB_POOL_RECYCLE', 1800))  # secondes, -1 = jamais
+    app.config['DB_POOL_PRE_PING'] = os.environ.get('DB_POOL_PRE_PING', '1') == '1'
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config['SQLALCHEMY_DATABASE_URI'], app.config)
+    # Réplique en lecture (optionnelle) : listes, détail des projets, exports
+    app.config['DATABASE_REPLICA_URL'] = os.environ.get('DATABASE_REPLICA_URL')
+    app.config['REPLICA_STICKY_SECONDS'] = int(os.environ.get('REPLICA_STICKY_SECONDS', 10))  # primaire après une écriture
+    app.config['REPLICA_STICKY_BACKEND'] = os.environ.get('REPLICA_STICKY_BACKEND', 'memory')  # memory ou redis (partagé entre workers)
     app.config['JWT_SECRET_KEY'] = os.environ.get('JWT_SECRET_KEY', 'jwt-secret-key-change-in-production')
-    app.config['UPLOAD_FOLDER'] = os.path.join(os.path.dirname(__file__), '..', 'uploads')
+    app.config['JWT_BLOCKLIST_REFRESH'] = int(os.environ.get('JWT_BLOCKLIST_REFRESH', 60))  # secondes
+    app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN')  # jeton du collecteur pour /api/metrics, sinon admin seulement
+    app.config['UPLOAD_FOLDER'] = os.environ.get('UPLOAD_FOLDER', os.path.join(os.path.dirname(__file__), '..', 'uploads'))
+    app.config['STORAGE_BACKEND'] = os.environ.get('STORAGE_BACKEND', 'local')  # local ou s3
+    app.config['STORAGE_CHUNK_SIZE'] = int(os.environ.get('STORAGE_CHUNK_SIZE', 64 * 1024))
+    app.config['S3_BUCKET'] = os.environ.get('S3_BUCKET')
+    app.config['S3_PREFIX'] = os.environ.get('S3_PREFIX', '')
+    app.config['S3_ENDPOINT_URL'] = os.environ.get('S3_ENDPOINT_URL')
+    app.config['JOB_QUEUE_BACKEND'] = os.environ.get('JOB_QUEUE_BACKEND', 'database')  # database ou memory
+    app.config['JOB_WORKERS'] = int(os.environ.get('JOB_WORKERS', 2))
+    app.config['JOB_POLL_INTERVAL'] = float(os.environ.get('JOB_POLL_INTERVAL', 1.0))  # secondes
+    app.config['JOB_MAX_ATTEMPTS'] = int(os.environ.get('JOB_MAX_ATTEMPTS', 3))
+    app.config['JOB_RETRY_BACKOFF'] = float(os.environ.get('JOB_RETRY_BACKOFF', 5))  # secondes, doublé à chaque essai
+    app.config['JOB_VISIBILITY_TIMEOUT'] = float(os.environ.get('JOB_VISIBILITY_TIMEOUT', 600))  # secondes avant reprise d'un travail orphelin
+    # Préfixe interne nginx (ex. /protected-uploads) : délègue l'envoi des fichiers au proxy
+    app.config['DOCUMENT_ACCEL_REDIRECT'] = os.environ.get('DOCUMENT_ACCEL_REDIRECT')
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16 MB max
+    app.config['PAGE_SIZE_DEFAULT'] = int(os.environ.get('PAGE_SIZE_DEFAULT', 50))
+    app.config['PAGE_SIZE_MAX'] = int(os.environ.get('PAGE_SIZE_MAX', 200))
+    app.config['DASHBOARD_STATS_TTL'] = int(os.environ.get('DASHBOARD_STATS_TTL', 30))  # secondes, 0 = pas de cache
+    app.config['RESPONSE_CACHE_BACKEND'] = os.environ.get('RESPONSE_CACHE_BACKEND', 'memory')  # memory, redis ou none
+    app.config['RESPONSE_CACHE_TTL'] = int(os.environ.get('RESPONSE_CACHE_TTL', 60))  # secondes
+    app.config['RESPONSE_CACHE_MAXSIZE'] = int(os.environ.get('RESPONSE_CACHE_MAXSIZE', 1024))
+    app.config['RESPONSE_CACHE_PRIMARY_SECONDS'] = int(os.environ.get('RESPONSE_CACHE_PRIMARY_SECONDS', 10))  # après une invalidation, remplissage depuis le primaire (retard de la réplique)
+    app.config['REDIS_URL'] = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+    app.config['SCORING_WEIGHTS'] = os.environ.get('SCORING_WEIGHTS', 'price:0.5,timeline:0.2,completeness:0.15,verification:0.15')
+    app.config['SCORING_ABNORMAL_K'] = float(os.environ.get('SCORING_ABNORMAL_K', 1.5))  # seuil : moyenne - k·σ
+    app.config['SCORING_CACHE_TTL'] = int(os.environ.get('SCORING_CACHE_TTL', 300))  # secondes, 0 = pas de cache
+    app.config['SCHEDULER_ENABLED'] = os.environ.get('SCHEDULER_ENABLED', '1') == '1'
+    app.config['SCHEDULER_INTERVAL'] = float(os.environ.get('SCHEDULER_INTERVAL', 60))  # secondes
+    app.config['IDEMPOTENCY_KEY_TTL'] = int(os.environ.get('IDEMPOTENCY_KEY_TTL', 86400))  # secondes
+    app.config['STAGING_MAX_AGE'] = int(os.environ.get('STAGING_MAX_AGE', 3600))  # secondes avant balayage
+    app.config['PASSWORD_HASH_METHOD'] = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')  # ou pbkdf2:sha256:600000
+    app.config['PASSWORD_HASH_WORKERS'] = int(os.environ.get('PASSWORD_HASH_WORKERS', 2))  # hachages simultanés par processus
+    app.config['PASSWORD_HASH_QUEUE'] = int(os.environ.get('PASSWORD_HASH_QUEUE', 16))  # demandes en attente avant 503
+    app.config['PASSWORD_HASH_TIMEOUT'] = float(os.environ.get('PASSWORD_HASH_TIMEOUT', 10))  # secondes d'attente max
+    app.config['RATE_LIMIT_ENABLED'] = os.environ.get('RATE_LIMIT_ENABLED', '1') == '1'
+    app.config['RATE_LIMIT_BACKEND'] = os.environ.get('RATE_LIMIT_BACKEND', 'memory')  # memory ou redis
+    app.config['RATE_LIMIT_LOGIN'] = os.environ.get('RATE_LIMIT_LOGIN', '20/minute')  # par adresse IP
+    app.config['RATE_LIMIT_LOGIN_ACCOUNT'] = os.environ.get('RATE_LIMIT_LOGIN_ACCOUNT', '10/minute')  # par email visé
+    app.config['RATE_LIMIT_REGISTER'] = os.environ.get('RATE_LIMIT_REGISTER', '10/hour')  # par adresse IP
+    app.config['RATE_LIMIT_SUBMIT_BID'] = os.environ.get('RATE_LIMIT_SUBMIT_BID', '30/minute')  # par candidat
+    app.config['TRUSTED_PROXIES'] = int(os.environ.get('TRUSTED_PROXIES', 0))  # mandataires ajoutant X-Forwarded-For
+    app.config['ADMISSION_MAX_INFLIGHT'] = int(os.environ.get('ADMISSION_MAX_INFLIGHT', 64))  # par processus, 0 = sans limite
+    app.config['ADMISSION_P99_MS'] = float(os.environ.get('ADMISSION_P99_MS', 5000))  # 0 = désactivé
+    app.config['ADMISSION_WINDOW'] = float(os.environ.get('ADMISSION_WINDOW', 10))  # secondes
+    app.config['ADMISSION_MIN_SAMPLES'] = int(os.environ.get('ADMISSION_MIN_SAMPLES', 50))
+    app.config['ADMISSION_MAX_SHED'] = float(os.environ.get('ADMISSION_MAX_SHED', 0.9))  # part refusée au plus quand le p99 dépasse
+    app.config['EVENTS_BACKEND'] = os.environ.get('EVENTS_BACKEND', 'auto')  # auto, memory ou postgres
+    app.config['SSE_HEARTBEAT'] = float(os.environ.get('SSE_HEARTBEAT', 15))  # secondes
+    app.config['SSE_BUFFER_SIZE'] = int(os.environ.get('SSE_BUFFER_SIZE', 100))  # événements par connexion
+    app.config['SSE_HISTORY_SIZE'] = int(os.environ.get('SSE_HISTORY_SIZE', 1000))  # pour Last-Event-ID
+    app.config['SSE_MAX_DURATION'] = float(os.environ.get('SSE_MAX_DURATION', 300))  # secondes, puis reconnexion
+    app.config['SSE_RETRY_MS'] = int(os.environ.get('SSE_RETRY_MS', 3000))
+    app.config['ASYNC_DATABASE_URL'] = os.environ.get('ASYNC_DATABASE_URL')  # sinon DATABASE_URL + aiosqlite/asyncpg
+    app.config['ASGI_THREADS'] = int(os.environ.get('ASGI_THREADS', 10))  # vues Flask en mode ASGI
+    app.config['ASGI_SPOOL_SIZE'] = int(os.environ.get('ASGI_SPOOL_SIZE', 1024 * 1024))  # corps reçus en mémoire jusqu'à
+    app.config['JSON_BACKEND'] = os.environ.get('JSON_BACKEND', 'auto')  # auto (orjson si installé), orjson ou stdlib
+    app.config['PAYLOAD_CACHE_SIZE'] = int(os.environ.get('PAYLOAD_CACHE_SIZE', 10000))  # fragments JSON par processus, 0 = sans
+    app.config['COMPRESSION_ALGORITHMS'] = os.environ.get('COMPRESSION_ALGORITHMS', 'br,gzip')  # par préférence, vide = sans
+    app.config['COMPRESSION_MIN_SIZE'] = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))  # octets
+    app.config['GZIP_LEVEL'] = int(os.environ.get('GZIP_LEVEL', 6))
+    app.config['BROTLI_QUALITY'] = int(os.environ.get('BROTLI_QUALITY', 4))
+    app.config['SLOW_REQUEST_MS'] = float(os.environ.get('SLOW_REQUEST_MS', 500))
+    app.config['SLOW_QUERY_MS'] = float(os.environ.get('SLOW_QUERY_MS', 100))
+    app.config['SERVER_TIMING'] = os.environ.get('SERVER_TIMING', '1') == '1'
     
     # ============================================
     # CONFIGURATION CORS - CORRECTION ICI
     # ============================================
-    CORS(app, resources={
-        r"/api/*": {
-            "origins": [
-                "http://localhost:5173",           # Frontend local Vite
-                "http://localhost:3000",           # Frontend local React
-                "http://54.196.196.2",             # Backend AWS
-                "http://54.196.196.2:5173",        # Si frontend sur AWS
-                "*"                                 # TEMPORAIRE - À enlever en production
-            ],
-            "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            "allow_headers": ["Content-Type", "Authorization"],
-            "expose_headers": ["Content-Type", "Authorization"],
-            "supports_credentials": True,
-            "max_age": 3600
-        }
-    })
+    # Pas de CORS sur les métriques : lues par le collecteur, jamais par un navigateur
+    CORS(app, resources={r"/api/(?!metrics$).*": CORS_API_OPTIONS})
+    
+    from .serializers import create_json_provider
+    app.json = create_json_provider(app)
     
     # Initialize extensions
     db.init_app(app)
     jwt.init_app(app)
+    from .instrumentation import init_instrumentation
+    registry = init_instrumentation(app)
+    from .database import init_database
+    init_database(app, registry)
+    from .ratelimit import init_rate_limiting
+    init_rate_limiting(app, registry)
+    from .compression import init_compression
+    init_compression(app)
     
     # Register routes
-    with app.app_context():
-        from . import routes
-        db.create_all()
+    from . import auth  # noqa: F401 - enregistre le chargeur de blocklist JWT
+    from . import verification  # noqa: F401 - enregistre les traitements de la file
+    from .jobs import jobs_cli
+    from .routes import register_blueprints
+    from .scheduler import scheduler_cli
+    from .schema import schema_cli
+    from .synthetic import synthetic_cli
+    register_blueprints(app)
+    app.cli.add_command(jobs_cli)
+    app.cli.add_command(scheduler_cli)
+    app.cli.add_command(schema_cli)
+    app.cli.add_command(synthetic_cli)
     
     return app
\ No newline at end of file
@@ -0,0 +1,115 @@
+# backend/app/adjudication.py
+"""Décisions en lot sur les offres : mises à jour ensemblistes.
+
+Attribuer un marché ou traiter une liste de décisions coûte un nombre
+constant d'instructions SQL, quel que soit le nombre d'offres concernées.
+"""
+from datetime import datetime
+
+from sqlalchemy import case
+
+from . import db
+from .events import publish_bid_status, publish_project_status
+from .models import BID_STATUSES, Bid, Project
+
+
+def award_project(project_id, winning_bid_id, notes=None):
+    """Accepter ``winning_bid_id``, rejeter les autres offres, marquer le projet attribué.
+
+    Trois ``UPDATE`` et un ``SELECT`` des soumissionnaires (notifications),
+    dans la transaction courante (non validée ici).
+    Retourne le nombre d'offres rejetées, ou ``None`` si l'offre gagnante
+    n'appartient pas au projet (rien n'est alors modifié).
+    """
+    now = datetime.utcnow()
+
+    winner_values = {Bid.status: 'accepted', Bid.reviewed_at: now}
+    if notes is not None:
+        winner_values[Bid.notes] = notes
+    accepted = (
+        db.session.query(Bid)
+        .filter(Bid.id == winning_bid_id, Bid.project_id == project_id)
+        .update(winner_values, synchronize_session=False)
+    )
+    if accepted != 1:
+        db.session.rollback()
+        return None
+
+    rejected = (
+        db.session.query(Bid)
+        .filter(Bid.project_id == project_id, Bid.id != winning_bid_id)
+        .update({Bid.status: 'rejected', Bid.reviewed_at: now}, synchronize_session=False)
+    )
+
+    (db.session.query(Project)
+     .filter(Project.id == project_id)
+     .update({Project.status: 'awarded', Project.updated_at: now}, synchronize_session=False))
+
+    # Notifications : un SELECT des soumissionnaires (index unique project_id, candidate_id)
+    bidders = db.session.query(Bid.id, Bid.candidate_id).filter(Bid.project_id == project_id).all()
+    publish_bid_status(
+        (bid_id, project_id, candidate_id, 'accepted' if bid_id == winning_bid_id else 'rejected')
+        for bid_id, candidate_id in bidders
+    )
+    publish_project_status(project_id, 'awarded', {candidate_id for _, candidate_id in bidders})
+
+    return rejected
+
+
+def apply_bid_status_changes(changes):
+    """Appliquer une liste ``[{'bid_id', 'status', 'notes'?}, ...]``.
+
+    Un ``SELECT`` des identifiants existants puis un seul ``UPDATE … CASE``.
+    Retourne un résultat par élément, dans l'ordre de la demande.
+    """
+    results = []
+    valid = {}
+
+    for change in changes:
+        bid_id = change.get('bid_id') if isinstance(change, dict) else None
+        status = change.get('status') if isinstance(change, dict) else None
+        if not isinstance(bid_id, int) or isinstance(bid_id, bool):
+            results.append({'bid_id': bid_id, 'result': 'error', 'message': 'Invalid bid_id'})
+        elif status not in BID_STATUSES:
+            results.append({'bid_id': bid_id, 'result': 'error', 'message': 'Invalid status'})
+        else:
+            results.append({'bid_id': bid_id, 'result': None})
+            valid[bid_id] = change
+
+    existing = {}
+    if valid:
+        existing = {
+            bid_id: (project_id, candidate_id) for bid_id, project_id, candidate_id in
+            db.session.query(Bid.id, Bid.project_id, Bid.candidate_id).filter(Bid.id.in_(list(valid)))
+        }
+
+    for result in results:
+        if result['result'] is None:
+            if result['bid_id'] in existing:
+                result['result'] = 'updated'
+                result['status'] = valid[result['bid_id']]['status']
+            else:
+                result['result'] = 'error'
+                result['message'] = 'Bid not found'
+
+    to_update = {bid_id: change for bid_id, change in valid.items() if bid_id in existing}
+    if to_update:
+        values = {
+            Bid.status: case(
+                {bid_id: change['status'] for bid_id, change in to_update.items()},
+                value=Bid.id
+            ),
+            Bid.reviewed_at: datetime.utcnow(),
+        }
+        with_notes = {bid_id: change['notes'] for bid_id, change in to_update.items() if 'notes' in change}
+        if with_notes:
+            values[Bid.notes] = case(with_notes, value=Bid.id, else_=Bid.notes)
+
+        (db.session.query(Bid)
+         .filter(Bid.id.in_(list(to_update)))
+         .update(values, synchronize_session=False))
+        publish_bid_status(
+            (bid_id, *existing[bid_id], change['status']) for bid_id, change in to_update.items()
+        )
+
+    return results
@@ -0,0 +1,430 @@
+# backend/app/asgi.py
+"""Mode de service ASGI : ``uvicorn asgi:app`` (voir ``backend/asgi.py``).
+
+Sous gunicorn en workers synchrones, un envoi lent de 16 Mo ou un flux SSE
+occupe un worker pendant toute la durée de la connexion. Ici les attentes
+réseau sont faites par la boucle asyncio :
+
+- corps des requêtes (dépôt d'offre avec pièces jointes, etc.) : reçus de
+  façon asynchrone dans un fichier temporaire, puis la vue Flask habituelle
+  est exécutée dans le pool de threads, corps déjà complet ;
+- ``GET /api/documents/{id}`` : envoi asynchrone du fichier (``Range``,
+  ETag) ;
+- ``GET /api/projects``, ``GET /api/bids/mine`` : lues par une session
+  SQLAlchemy asynchrone (aiosqlite ou asyncpg), avec les mêmes requêtes,
+  le même cache et le même JSON que les vues Flask, sur la réplique si
+  elle est configurée, sauf pour un utilisateur qui vient d'écrire
+  (identité du JWT, même règle que ``database.py``) ;
+- ``GET /api/events`` : flux SSE attendu sans thread bloqué.
+
+Toutes les autres routes sont servies telles quelles par l'application
+Flask (WSGI, dans le pool de threads ``ASGI_THREADS``), avec ses limites
+de débit. Les routes asynchrones ci-dessus, sans limite de débit, passent
+par le même contrôle d'admission que les vues Flask (``ratelimit.py``).
+"""
+import math
+import tempfile
+import time
+from contextlib import asynccontextmanager
+
+from a2wsgi import WSGIMiddleware
+from flask import g
+from flask_jwt_extended import decode_token
+from jwt import ExpiredSignatureError, InvalidTokenError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import FileResponse, JSONResponse, RedirectResponse, Response, StreamingResponse
+from starlette.routing import Mount, Route
+from werkzeug.http import http_date, parse_etags, unquote_etag
+
+from . import CORS_API_OPTIONS
+from .auth import blocklist
+from .cache import get_response_cache, projects_etag, projects_last_modified
+from .compression import encode_body
+from .database import REPLICA_BIND, all_engines, replica_configured
+from .events import AsyncSubscription, astream_events, get_bus
+from .models import Bid, Document, Project
+from .pagination import InvalidQuery, keyset, page, parse_float, parse_int, parse_limit
+from .queries import bid_listing_query, project_listing_query
+from .ratelimit import STREAM_PATHS
+from .serializers import encode_rows, serialize_bid_row, serialize_project
+from .scheduler import start_scheduler
+from .storage import get_storage, key_sha256
+
+
+ASYNC_DRIVERS = {'sqlite': 'sqlite+aiosqlite', 'postgresql': 'postgresql+asyncpg'}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, payload):
+        self.response = JSONResponse(payload, status_code=status)
+
+
+def async_database_url(flask_app, bind=None):
+    """URL de la base avec un pilote asynchrone (``ASYNC_DATABASE_URL`` sinon déduite)"""
+    if bind is None and flask_app.config.get('ASYNC_DATABASE_URL'):
+        return flask_app.config['ASYNC_DATABASE_URL']
+    # URL résolue par Flask-SQLAlchemy (chemin SQLite relatif au dossier instance)
+    url = all_engines(flask_app)[bind or 'default'].url
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise RuntimeError(f'No async driver for {backend}; set ASYNC_DATABASE_URL')
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+# ============================================
+# CORPS DES REQUÊTES
+# ============================================
+
+class BufferedBody:
+    """Recevoir tout le corps avant d'appeler l'application WSGI.
+
+    Un client lent n'immobilise alors aucun thread : la vue ne démarre
+    qu'une fois le corps complet, lu depuis un fichier temporaire (en
+    mémoire jusqu'à ``spool_size`` octets). Au-delà de ``max_size`` : 413.
+    """
+
+    def __init__(self, app, max_size=None, spool_size=1024 * 1024, chunk_size=64 * 1024):
+        self.app = app
+        self.max_size = max_size
+        self.spool_size = spool_size
+        self.chunk_size = chunk_size
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] in ('GET', 'HEAD', 'OPTIONS', 'DELETE'):
+            return await self.app(scope, receive, send)
+
+        declared = dict(scope['headers']).get(b'content-length')
+        if self.max_size and declared and declared.isdigit() and int(declared) > self.max_size:
+            return await self._too_large(scope, receive, send)
+
+        body = tempfile.SpooledTemporaryFile(max_size=self.spool_size)
+        try:
+            size = 0
+            more_body = True
+            while more_body:
+                message = await receive()
+                if message['type'] == 'http.disconnect':
+                    return
+                chunk = message.get('body', b'')
+                size += len(chunk)
+                if self.max_size and size > self.max_size:
+                    return await self._too_large(scope, receive, send)
+                body.write(chunk)
+                more_body = message.get('more_body', False)
+            body.seek(0)
+
+            async def replay():
+                if body.closed:
+                    # Corps déjà rejoué : attendre la déconnexion du client
+                    return await receive()
+                chunk = body.read(self.chunk_size)
+                if not chunk:
+                    body.close()
+                return {'type': 'http.request', 'body': chunk, 'more_body': bool(chunk)}
+
+            await self.app(scope, replay, send)
+        finally:
+            body.close()
+
+    async def _too_large(self, scope, receive, send):
+        response = JSONResponse({'message': 'Request entity too large'}, status_code=413)
+        await response(scope, receive, send)
+
+
+# ============================================
+# AUTHENTIFICATION
+# ============================================
+
+def _decode(flask_app, token):
+    with flask_app.app_context():
+        payload = decode_token(token)
+        refresh = flask_app.config.get('JWT_BLOCKLIST_REFRESH', 60)
+        if blocklist().is_blocked(payload, refresh):
+            raise HTTPError(401, {'msg': 'Token has been revoked'})
+        return payload
+
+
+async def authenticate(flask_app, request, roles, query_token=False):
+    """Claims du JWT (en-tête, ou ``?jwt=`` pour EventSource), mêmes réponses que Flask"""
+    header = request.headers.get('authorization', '')
+    if header.startswith('Bearer '):
+        token = header[7:]
+    else:
+        token = request.query_params.get('jwt') if query_token else None
+    if not token:
+        raise HTTPError(401, {'msg': 'Missing Authorization Header'})
+    try:
+        # La liste de blocage peut relire la base : hors de la boucle
+        payload = await run_in_threadpool(_decode, flask_app, token)
+    except ExpiredSignatureError:
+        raise HTTPError(401, {'msg': 'Token has expired'})
+    except InvalidTokenError as e:
+        raise HTTPError(422, {'msg': str(e)})
+    if payload.get('role') not in roles:
+        raise HTTPError(403, {'message': 'Unauthorized'})
+    return payload
+
+
+# ============================================
+# APPLICATION
+# ============================================
+
+def create_asgi_app(flask_app):
+    """Application ASGI : routes asynchrones devant l'application Flask"""
+    config = flask_app.config
+    engines = [create_async_engine(async_database_url(flask_app))]
+    sessions = replica_sessions = async_sessionmaker(engines[0], expire_on_commit=False)
+    if replica_configured(flask_app):
+        engines.append(create_async_engine(async_database_url(flask_app, REPLICA_BIND)))
+        replica_sessions = async_sessionmaker(engines[1], expire_on_commit=False)
+    with flask_app.app_context():
+        storage = get_storage()
+        cache = get_response_cache()
+    registry = flask_app.extensions['metrics']
+    cors = Middleware(
+        CORSMiddleware,
+        allow_origins=CORS_API_OPTIONS['origins'],
+        allow_methods=CORS_API_OPTIONS['methods'],
+        allow_headers=CORS_API_OPTIONS['allow_headers'],
+        expose_headers=CORS_API_OPTIONS['expose_headers'],
+        allow_credentials=CORS_API_OPTIONS['supports_credentials'],
+        max_age=CORS_API_OPTIONS['max_age'],
+    )
+
+    def route(path, rule, handler):
+        """Handler mesuré et admis comme les vues Flask (métriques, ``Server-Timing``)"""
+        stream = rule in STREAM_PATHS
+
+        async def endpoint(request):
+            admission = flask_app.extensions['admission']
+            if admission.admit(track=not stream):
+                retry_after = max(1, math.ceil(config.get('ADMISSION_RETRY_AFTER', 1)))
+                return JSONResponse({'message': 'Server is overloaded, retry shortly'}, status_code=429,
+                                    headers={'Retry-After': str(retry_after)})
+            started = time.perf_counter()
+            try:
+                with flask_app.app_context():
+                    g._perf = {
+                        'started': started, 'queries': 0, 'db_time': 0.0, 'route': rule,
+                        'slow_query_ms': config.get('SLOW_QUERY_MS', 100), 'registry': registry,
+                    }
+                    try:
+                        response = await handler(request)
+                    except HTTPError as e:
+                        response = e.response
+                    except InvalidQuery as e:
+                        response = JSONResponse({'message': str(e)}, status_code=400)
+                    except Exception as e:
+                        response = JSONResponse({'message': str(e)}, status_code=500)
+                    stats = g.pop('_perf')
+            finally:
+                # Latence jusqu'à la réponse prête, comme ``_measure`` côté Flask
+                duration = time.perf_counter() - started
+                if not stream:
+                    admission.release(duration)
+
+            registry.observe_request(request.method, rule, response.status_code,
+                                     duration, stats['queries'], stats['db_time'])
+            if config.get('SERVER_TIMING', True):
+                response.headers.append(
+                    'Server-Timing',
+                    f'app;dur={duration * 1000:.1f}, '
+                    f'db;dur={stats["db_time"] * 1000:.1f};desc="{stats["queries"]} queries"'
+                )
+            return response
+        # OPTIONS : pré-vérifications CORS traitées par le middleware
+        return Route(path, endpoint, methods=['GET', 'OPTIONS'], middleware=[cors])
+
+    def json_response(request, body, headers):
+        """Corps JSON compressé selon ``Accept-Encoding``, comme par l'application Flask"""
+        body, algorithm = encode_body(body, request.headers.get('accept-encoding'), config)
+        headers['Vary'] = 'Accept-Encoding'
+        if algorithm:
+            headers['Content-Encoding'] = algorithm
+            if headers.get('ETag', '').startswith('"'):
+                headers['ETag'] = 'W/' + headers['ETag']
+        return Response(body, media_type='application/json', headers=headers)
+
+    async def read_sessions(request):
+        """Réplique pour les listes, sauf juste après une écriture de l'utilisateur"""
+        if replica_sessions is sessions:
+            return sessions
+        header = request.headers.get('authorization', '')
+        if not header.startswith('Bearer '):
+            return replica_sessions
+        try:
+            with flask_app.app_context():
+                identity = decode_token(header[7:]).get('sub')
+        except Exception:
+            return replica_sessions
+        if identity is None:
+            return replica_sessions
+        # Backend redis : appel réseau, hors de la boucle
+        recent = await run_in_threadpool(flask_app.extensions['db_write_marks'].recent, identity)
+        return sessions if recent else replica_sessions
+
+    async def get_projects(request):
+        args = request.query_params
+        key = cache.key('projects', request.url.path, args.multi_items())
+        entry = await run_in_threadpool(cache.lookup, key)
+        status = 'HIT'
+
+        if entry is None:
+            limit = parse_limit(args)
+            statement = keyset(project_listing_query(args), Project.created_at, Project.id,
+                               args.get('cursor'), limit).statement
+            # Juste après une invalidation : remplissage depuis le primaire
+            fresh = await run_in_threadpool(cache.fill_from_primary, 'projects')
+            async with (sessions if fresh else await read_sessions(request))() as session:
+                projects = (await session.execute(statement)).all()
+            projects, next_cursor = page(projects, Project.created_at, Project.id, limit)
+
+            headers = {'ETag': f'"{projects_etag(projects)}"'}
+            last_modified = projects_last_modified(projects)
+            if last_modified is not None:
+                headers['Last-Modified'] = http_date(last_modified)
+            if next_cursor:
+                headers['X-Next-Cursor'] = next_cursor
+            # Même corps que la vue Flask : entrées de cache partagées
+            entry = {
+                'body': encode_rows('project', projects, serialize_project).decode(),
+                'mimetype': 'application/json',
+                'headers': headers,
+            }
+            await run_in_threadpool(cache.store, key, entry)
+            status = 'MISS'
+
+        headers = {**entry['headers'], 'X-Cache': status, 'Cache-Control': 'public, no-cache'}
+        etag = entry['headers'].get('ETag')
+        if etag and parse_etags(request.headers.get('if-none-match')).contains_weak(unquote_etag(etag)[0]):
+            return Response(status_code=304, headers=headers)
+        return json_response(request, entry['body'].encode(), headers)
+
+    async def get_my_bids(request):
+        claims = await authenticate(flask_app, request, ('candidate',))
+        candidate_id = claims.get('candidate_id')
+        if candidate_id is None:
+            return JSONResponse([])
+
+        args = request.query_params
+        limit = parse_limit(args)
+        query = bid_listing_query(
+            candidate_id=candidate_id,
+            project_id=parse_int(args, 'project_id'),
+            status=args.get('status') or None
+        )
+        statement = keyset(query, Bid.submitted_at, Bid.id, args.get('cursor'), limit).statement
+        async with (await read_sessions(request))() as session:
+            rows = (await session.execute(statement)).all()
+        rows, next_cursor = page(rows, Bid.submitted_at, Bid.id, limit)
+
+        headers = {'X-Next-Cursor': next_cursor} if next_cursor else {}
+        return json_response(request, encode_rows('bid', rows, serialize_bid_row), headers)
+
+    async def download_document(request):
+        claims = await authenticate(flask_app, request, ('admin', 'candidate'))
+        async with sessions() as session:
+            document = (await session.execute(
+                select(Document.file_name, Document.file_path, Bid.candidate_id)
+                .join(Document.bid)
+                .where(Document.id == request.path_params['document_id'])
+            )).first()
+        if document is None:
+            return JSONResponse({'message': 'Document not found'}, status_code=404)
+        if claims.get('role') != 'admin' and document.candidate_id != claims.get('candidate_id'):
+            return JSONResponse({'message': 'Unauthorized'}, status_code=403)
+
+        key, file_name = document.file_path, document.file_name
+        etag = key_sha256(key)
+        headers = {'Cache-Control': 'private'}
+        if etag:
+            headers['ETag'] = f'"{etag}"'
+            if parse_etags(request.headers.get('if-none-match')).contains(etag):
+                return Response(status_code=304, headers=headers)
+
+        path = storage.local_path(key)
+        if path is None:
+            url = storage.download_url(key, file_name)
+            if url is not None:
+                return RedirectResponse(url, status_code=302)
+            return StreamingResponse(_read_chunks(storage, key), media_type='application/octet-stream',
+                                     headers={**headers, 'Content-Disposition': f'attachment; filename="{file_name}"'})
+
+        accel_prefix = config.get('DOCUMENT_ACCEL_REDIRECT')
+        if accel_prefix and etag:
+            headers['X-Accel-Redirect'] = accel_prefix.rstrip('/') + '/' + key
+            headers['Content-Disposition'] = f'attachment; filename="{file_name}"'
+            return Response(media_type='application/octet-stream', headers=headers)
+
+        # Lecture asynchrone par blocs, Range (206) géré par FileResponse
+        return FileResponse(path, filename=file_name, headers=headers)
+
+    async def stream_notifications(request):
+        claims = await authenticate(flask_app, request, ('admin', 'candidate'), query_token=True)
+        args = request.query_params
+        if claims.get('role') == 'admin':
+            channels = ['admin']
+            project_id = parse_int(args, 'project_id')
+        else:
+            if claims.get('candidate_id') is None:
+                return JSONResponse({'message': 'Candidate profile not found'}, status_code=404)
+            channels = [f'candidate:{claims["candidate_id"]}']
+            project_id = None
+
+        max_duration = parse_float(args, 'max_duration')
+        if max_duration is not None:
+            max_duration = min(max(max_duration, 0), config['SSE_MAX_DURATION'])
+
+        subscription = AsyncSubscription(channels, project_id, config['SSE_BUFFER_SIZE'])
+        last_event_id = request.headers.get('last-event-id') or args.get('last_event_id')
+        return StreamingResponse(
+            astream_events(subscription, get_bus(), config, last_event_id, max_duration),
+            media_type='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+
+    @asynccontextmanager
+    async def lifespan(app):
+        # Un planificateur par worker uvicorn, comme sous gunicorn
+        start_scheduler(flask_app)
+        yield
+        for engine in engines:
+            await engine.dispose()
+
+    wsgi = BufferedBody(
+        WSGIMiddleware(flask_app, workers=config.get('ASGI_THREADS', 10)),
+        max_size=config.get('MAX_CONTENT_LENGTH'),
+        spool_size=config.get('ASGI_SPOOL_SIZE', 1024 * 1024),
+    )
+    app = Starlette(
+        routes=[
+            route('/api/projects', '/api/projects', get_projects),
+            route('/api/bids', '/api/bids', get_my_bids),
+            route('/api/bids/mine', '/api/bids/mine', get_my_bids),
+            route('/api/documents/{document_id:int}', '/api/documents/<int:document_id>', download_document),
+            route('/api/events', '/api/events', stream_notifications),
+            Mount('/', app=wsgi),
+        ],
+        lifespan=lifespan,
+    )
+    app.state.flask_app = flask_app
+    app.state.engine = engines[0]
+    return app
+
+
+async def _read_chunks(storage, key):
+    """Relais d'un backend sans URL directe, lectures dans le pool de threads"""
+    f = await run_in_threadpool(storage.open, key)
+    try:
+        while True:
+            chunk = await run_in_threadpool(f.read, storage.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        f.close()
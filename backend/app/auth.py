@@ -0,0 +1,154 @@
+# backend/app/auth.py
+"""Autorisation sans état : rôle et candidat portés par le JWT.
+
+Le jeton émis par ``login`` contient les claims ``role`` et
+``candidate_id`` ; ``role_required`` autorise à partir de ces seuls claims,
+sans relire ``User``/``Candidate`` à chaque requête. La révocation (logout)
+et les comptes désactivés passent par une liste de blocage partagée en
+base, relue périodiquement par chaque processus plutôt qu'interrogée à
+chaque appel.
+"""
+import threading
+import time
+from datetime import datetime
+from functools import wraps
+
+from flask import current_app, jsonify
+from flask_jwt_extended import create_access_token, get_jwt, verify_jwt_in_request
+from sqlalchemy import delete, select
+
+from . import db, jwt
+from .models import RevokedToken, User
+
+
+# ============================================
+# JETONS
+# ============================================
+
+def issue_access_token(user):
+    """Jeton d'accès avec les claims d'autorisation de ``user``"""
+    candidate = user.candidate
+    return create_access_token(
+        identity=str(user.id),
+        additional_claims={
+            'role': user.role,
+            'candidate_id': candidate.id if candidate else None,
+        }
+    )
+
+
+def current_role():
+    return get_jwt().get('role')
+
+
+def current_candidate_id():
+    """``Candidate.id`` de l'utilisateur courant, lu dans le jeton"""
+    return get_jwt().get('candidate_id')
+
+
+def role_required(*roles):
+    """Exiger un JWT valide dont le claim ``role`` fait partie de ``roles``"""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            verify_jwt_in_request()
+            if get_jwt().get('role') not in roles:
+                return jsonify({'message': 'Unauthorized'}), 403
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ============================================
+# LISTE DE BLOCAGE
+# ============================================
+
+class Blocklist:
+    """Jetons révoqués et comptes désactivés, vus par tous les processus.
+
+    Les révocations sont écrites dans ``revoked_tokens`` (jusqu'à
+    l'expiration du jeton) et la désactivation dans ``User.is_active`` :
+    chaque worker relit les deux en une requête chacune au plus toutes les
+    ``refresh_interval`` secondes. Ce que le processus courant révoque ou
+    désactive est refusé aussitôt, sans attendre la relecture.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._revoked = {}
+        self._shared_revoked = frozenset()
+        self._inactive_users = frozenset()
+        self._refreshed_at = None
+
+    def revoke(self, jti, expires_at):
+        with self._lock:
+            self._revoked[jti] = expires_at
+
+    def deactivate(self, user_id):
+        with self._lock:
+            self._inactive_users = self._inactive_users | {str(user_id)}
+
+    def invalidate(self):
+        """Forcer la relecture de la base au prochain contrôle"""
+        with self._lock:
+            self._refreshed_at = None
+
+    def is_blocked(self, jwt_payload, refresh_interval):
+        now = time.time()
+        with self._lock:
+            if self._revoked:
+                self._revoked = {jti: exp for jti, exp in self._revoked.items() if exp > now}
+            if jwt_payload.get('jti') in self._revoked:
+                return True
+            stale = self._refreshed_at is None or now - self._refreshed_at > refresh_interval
+
+        if stale:
+            shared_revoked = frozenset(db.session.scalars(
+                select(RevokedToken.jti).where(RevokedToken.expires_at > datetime.utcnow())
+            ))
+            inactive = frozenset(
+                str(user_id) for (user_id,) in
+                db.session.query(User.id).filter(User.is_active.is_(False))
+            )
+            with self._lock:
+                self._shared_revoked = shared_revoked
+                self._inactive_users = inactive
+                self._refreshed_at = now
+
+        return (jwt_payload.get('jti') in self._shared_revoked
+                or jwt_payload.get('sub') in self._inactive_users)
+
+
+def blocklist():
+    return current_app.extensions.setdefault('jwt_blocklist', Blocklist())
+
+
+@jwt.token_in_blocklist_loader
+def _token_in_blocklist(jwt_header, jwt_payload):
+    return blocklist().is_blocked(
+        jwt_payload, current_app.config.get('JWT_BLOCKLIST_REFRESH', 60)
+    )
+
+
+def revoke_current_token():
+    """Révoquer le jeton courant ; l'appelant valide la transaction"""
+    payload = get_jwt()
+    expires_at = payload.get('exp', time.time())
+    db.session.merge(RevokedToken(jti=payload['jti'], expires_at=datetime.utcfromtimestamp(expires_at)))
+    blocklist().revoke(payload['jti'], expires_at)
+
+
+def deactivate_user(user):
+    """Désactiver un compte : refusé aussitôt ici, par les autres processus à leur relecture"""
+    user.is_active = False
+    blocklist().deactivate(user.id)
+
+
+def purge_revoked_tokens(now):
+    """Supprimer les révocations de jetons expirés ; nombre de lignes supprimées"""
+    result = db.session.execute(
+        delete(RevokedToken)
+        .where(RevokedToken.expires_at <= now)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
@@ -0,0 +1,299 @@
+# backend/app/cache.py
+"""Cache HTTP des endpoints publics (projets) : réponses, ETag, 304.
+
+Les réponses 200 de ``get_projects`` / ``get_project`` sont gardées sous une
+clé (chemin + paramètres + version de l'espace de noms). Une écriture sur
+les projets incrémente la version : toutes les entrées précédentes sont
+ignorées d'un coup, sans parcourir le cache. ``If-None-Match`` est traité
+à partir de l'entrée en cache, sans toucher la base.
+
+Pendant ``RESPONSE_CACHE_PRIMARY_SECONDS`` après une invalidation, les
+entrées manquantes sont calculées sur le primaire, même sous
+``@replica_reads`` : une réplique en retard ne peut pas remplir la nouvelle
+version avec des données antérieures à l'écriture.
+
+Backends (``RESPONSE_CACHE_BACKEND``) : ``memory`` (LRU par processus),
+``redis`` (partagé entre workers, client compatible redis-py) ou ``none``.
+Avec ``memory``, une invalidation ne touche que le worker qui a écrit : les
+autres servent leurs entrées jusqu'au TTL. Plusieurs workers (gunicorn,
+uvicorn ``--workers``) demandent ``redis``.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from functools import wraps
+from urllib.parse import urlencode
+
+from flask import Response, current_app, request
+
+from .database import use_primary
+
+
+CACHED_HEADERS = ('ETag', 'Last-Modified', 'X-Next-Cursor')
+
+
+# ============================================
+# BACKENDS
+# ============================================
+
+class LRUCache:
+    """Cache LRU borné en mémoire, avec TTL"""
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._bumped = {}
+
+    def get(self, key):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def version(self, namespace):
+        with self._lock:
+            return self._versions.get(namespace, 0)
+
+    def bump(self, namespace):
+        with self._lock:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+            self._bumped[namespace] = time.time()
+            # Les entrées de l'ancienne version ne seront plus jamais lues
+            prefix = f'{namespace}:'
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def last_bump(self, namespace):
+        with self._lock:
+            return self._bumped.get(namespace)
+
+    def size(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class RedisCache:
+    """Cache partagé sur un serveur compatible Redis"""
+
+    def __init__(self, client, ttl=60, prefix='tender:cache:'):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, value):
+        self.client.set(self.prefix + key, json.dumps(value), ex=self.ttl)
+
+    def version(self, namespace):
+        raw = self.client.get(f'{self.prefix}version:{namespace}')
+        return int(raw) if raw is not None else 0
+
+    def bump(self, namespace):
+        # Les anciennes entrées expirent d'elles-mêmes (TTL)
+        self.client.incr(f'{self.prefix}version:{namespace}')
+        self.client.set(f'{self.prefix}bumped:{namespace}', time.time())
+
+    def last_bump(self, namespace):
+        raw = self.client.get(f'{self.prefix}bumped:{namespace}')
+        return float(raw) if raw is not None else None
+
+    def size(self):
+        return None
+
+
+class NullCache:
+    def get(self, key):
+        return None
+
+    def set(self, key, value):
+        pass
+
+    def version(self, namespace):
+        return 0
+
+    def bump(self, namespace):
+        pass
+
+    def last_bump(self, namespace):
+        return None
+
+    def size(self):
+        return 0
+
+
+# ============================================
+# CACHE DE RÉPONSES
+# ============================================
+
+class ResponseCache:
+    """Backend + compteurs succès/échecs/invalidations"""
+
+    def __init__(self, backend, primary_seconds=0):
+        self.backend = backend
+        self.primary_seconds = primary_seconds
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def key(self, namespace, path=None, args=None):
+        """Clé de la requête courante (ou de ``path`` + ``args`` hors Flask)"""
+        if path is None:
+            path, args = request.path, request.args.items(multi=True)
+        query = urlencode(sorted(args))
+        return f'{namespace}:{self.backend.version(namespace)}:{path}?{query}'
+
+    def lookup(self, key):
+        entry = self.backend.get(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def fill_from_primary(self, namespace):
+        """Invalidation récente : la réplique peut ne pas avoir reçu l'écriture"""
+        bumped = self.backend.last_bump(namespace)
+        return bumped is not None and time.time() - bumped < self.primary_seconds
+
+    def store(self, key, entry):
+        self.backend.set(key, entry)
+
+    def invalidate(self, namespace):
+        self.backend.bump(namespace)
+        with self._lock:
+            self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'entries': self.backend.size(),
+            }
+
+    def metrics_lines(self):
+        stats = self.stats()
+        lines = []
+        for name in ('hits', 'misses', 'invalidations'):
+            lines.append(f'# TYPE response_cache_{name}_total counter')
+            lines.append(f'response_cache_{name}_total {stats[name]}')
+        if stats['entries'] is not None:
+            lines.append('# TYPE response_cache_entries gauge')
+            lines.append(f'response_cache_entries {stats["entries"]}')
+        return lines
+
+
+def create_response_cache(config):
+    backend = config.get('RESPONSE_CACHE_BACKEND', 'memory')
+    ttl = config.get('RESPONSE_CACHE_TTL', 60)
+    primary_seconds = config.get('RESPONSE_CACHE_PRIMARY_SECONDS', 10)
+
+    if backend == 'memory':
+        return ResponseCache(LRUCache(maxsize=config.get('RESPONSE_CACHE_MAXSIZE', 1024), ttl=ttl),
+                             primary_seconds)
+    if backend == 'redis':
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError('RESPONSE_CACHE_BACKEND=redis requires redis (pip install redis)')
+        return ResponseCache(RedisCache(redis.Redis.from_url(config['REDIS_URL']), ttl=ttl),
+                             primary_seconds)
+    if backend == 'none':
+        return ResponseCache(NullCache())
+    raise RuntimeError(f'Unknown RESPONSE_CACHE_BACKEND: {backend}')
+
+
+def get_response_cache():
+    cache = current_app.extensions.get('response_cache')
+    if cache is None:
+        cache = current_app.extensions['response_cache'] = create_response_cache(current_app.config)
+        metrics = current_app.extensions.get('metrics')
+        if metrics is not None:
+            metrics.add_collector(cache.metrics_lines)
+    return cache
+
+
+def invalidate_project_cache():
+    """À appeler après toute écriture sur les projets"""
+    get_response_cache().invalidate('projects')
+
+
+# ============================================
+# ETAG
+# ============================================
+
+def projects_etag(projects):
+    """ETag fort dérivé des ``(id, updated_at)`` des projets servis"""
+    digest = hashlib.sha1()
+    for project in projects:
+        stamp = project.updated_at or project.created_at
+        digest.update(f'{project.id}:{stamp.isoformat() if stamp else ""};'.encode())
+    return digest.hexdigest()
+
+
+def projects_last_modified(projects):
+    stamps = [p.updated_at or p.created_at for p in projects if (p.updated_at or p.created_at)]
+    return max(stamps) if stamps else None
+
+
+# ============================================
+# DÉCORATEUR
+# ============================================
+
+def cached_response(namespace):
+    """Servir la vue depuis le cache ; la vue fixe elle-même ETag/Last-Modified"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            cache = get_response_cache()
+            key = cache.key(namespace)
+            entry = cache.lookup(key)
+            status = 'HIT'
+
+            if entry is None:
+                with use_primary() if cache.fill_from_primary(namespace) else nullcontext():
+                    response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                entry = {
+                    'body': response.get_data(as_text=True),
+                    'mimetype': response.mimetype,
+                    'headers': {name: response.headers[name] for name in CACHED_HEADERS
+                                if name in response.headers},
+                }
+                cache.store(key, entry)
+                status = 'MISS'
+
+            response = Response(entry['body'], mimetype=entry['mimetype'], headers=entry['headers'])
+            response.headers['X-Cache'] = status
+            # Revalidation systématique : le navigateur renvoie l'ETag et reçoit un 304
+            response.cache_control.public = True
+            response.cache_control.no_cache = True
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
@@ -0,0 +1,86 @@
+# backend/app/compression.py
+"""Compression des réponses négociée par ``Accept-Encoding`` (brotli, gzip).
+
+Seules les réponses 200 complètes (ni flux, ni fichiers) d'un type texte
+et d'au moins ``COMPRESSION_MIN_SIZE`` octets sont compressées : grandes
+listes JSON, métriques. Les algorithmes sont proposés dans l'ordre de
+``COMPRESSION_ALGORITHMS`` (``br`` seulement si le module ``brotli`` est
+installé ; vide = pas de compression), le client pouvant en exclure avec
+``q=0``. L'ETag d'une réponse compressée devient faible : la
+revalidation (``If-None-Match``) fonctionne pour les deux représentations.
+"""
+import gzip
+from functools import lru_cache
+
+from flask import request
+from werkzeug.datastructures import Accept
+from werkzeug.http import parse_accept_header
+
+
+COMPRESSIBLE_TYPES = ('application/json', 'text/plain', 'text/csv', 'text/html')
+
+
+@lru_cache(maxsize=16)
+def available_algorithms(setting):
+    """Algorithmes utilisables de ``COMPRESSION_ALGORITHMS``, par préférence"""
+    algorithms = []
+    for name in (setting or '').split(','):
+        name = name.strip()
+        if name == 'br':
+            try:
+                import brotli  # noqa: F401
+            except ImportError:
+                continue
+        if name in ('br', 'gzip'):
+            algorithms.append(name)
+    return tuple(algorithms)
+
+
+def negotiate(accept_encoding, algorithms):
+    """Algorithme retenu pour l'en-tête ``Accept-Encoding`` (ou ``None``)"""
+    if not accept_encoding or not algorithms:
+        return None
+    return parse_accept_header(accept_encoding, Accept).best_match(algorithms)
+
+
+def compress(body, algorithm, config):
+    if algorithm == 'br':
+        import brotli
+        return brotli.compress(body, quality=config.get('BROTLI_QUALITY', 4))
+    return gzip.compress(body, compresslevel=config.get('GZIP_LEVEL', 6), mtime=0)
+
+
+def encode_body(body, accept_encoding, config):
+    """``(corps, algorithme)`` : compressé s'il est assez grand et que le client l'accepte"""
+    if len(body) < config.get('COMPRESSION_MIN_SIZE', 1024):
+        return body, None
+    algorithm = negotiate(accept_encoding, available_algorithms(config.get('COMPRESSION_ALGORITHMS')))
+    if algorithm is None:
+        return body, None
+    return compress(body, algorithm, config), algorithm
+
+
+def compress_response(response, config, accept_encoding):
+    """Compresser ``response`` sur place si le client l'accepte"""
+    if response.mimetype not in COMPRESSIBLE_TYPES:
+        return response
+    response.vary.add('Accept-Encoding')
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    body, algorithm = encode_body(response.get_data(), accept_encoding, config)
+    if algorithm is None:
+        return response
+    response.set_data(body)
+    response.headers['Content-Encoding'] = algorithm
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_compression(app):
+    @app.after_request
+    def _compress(response):
+        return compress_response(response, app.config, request.headers.get('Accept-Encoding'))
@@ -0,0 +1,277 @@
+# backend/app/database.py
+"""Connexions à la base : pool, réplique en lecture, attente du pool.
+
+- pool configurable (``DB_POOL_SIZE``, ``DB_MAX_OVERFLOW``,
+  ``DB_POOL_TIMEOUT``, ``DB_POOL_RECYCLE``, ``DB_POOL_PRE_PING``) ; à
+  dimensionner avec gunicorn : workers × (taille + débordement) doit rester
+  sous ``max_connections`` ;
+- réplique optionnelle (``DATABASE_REPLICA_URL``, moteur dans
+  ``app.extensions['db_replica']``) : les vues marquées ``@replica_reads``
+  et les exports y envoient leurs ``SELECT`` ; les écritures restent sur
+  le primaire ;
+- lecture de ses propres écritures : après une écriture réussie (POST, PUT,
+  DELETE) sous un JWT, les lectures de cet utilisateur (identité du jeton)
+  restent sur le primaire pendant ``REPLICA_STICKY_SECONDS``. L'instant de
+  la dernière écriture est gardé par ``REPLICA_STICKY_BACKEND`` : ``memory``
+  (par processus) ou ``redis`` (partagé entre workers, ``REDIS_URL``) ;
+- le temps d'obtention d'une connexion est mesuré par le pool
+  (``db_pool_wait_seconds`` dans ``/api/metrics``).
+"""
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import current_app, g, has_app_context, has_request_context, request
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.engine import Connection
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql.expression import SelectBase
+
+
+REPLICA_BIND = 'replica'
+SAFE_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+
+
+# ============================================
+# POOL
+# ============================================
+
+class TimedQueuePool(QueuePool):
+    """``QueuePool`` qui mesure l'obtention de chaque connexion (attente comprise)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_wait = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.on_wait is not None:
+                self.on_wait(time.perf_counter() - started)
+
+    def recreate(self):
+        # engine.dispose() remplace le pool : l'observateur est conservé
+        pool = super().recreate()
+        pool.on_wait = self.on_wait
+        return pool
+
+
+def engine_options(url, config, poolclass=TimedQueuePool):
+    """Options du moteur pour ``url`` (rien pour SQLite en mémoire, pool statique)"""
+    url = make_url(url)
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return {}
+    options = {
+        'pool_size': config['DB_POOL_SIZE'],
+        'max_overflow': config['DB_MAX_OVERFLOW'],
+        'pool_timeout': config['DB_POOL_TIMEOUT'],
+        'pool_recycle': config['DB_POOL_RECYCLE'],
+        'pool_pre_ping': config['DB_POOL_PRE_PING'],
+    }
+    if poolclass is not None:
+        options['poolclass'] = poolclass
+    return options
+
+
+# ============================================
+# ROUTAGE PRIMAIRE / RÉPLIQUE
+# ============================================
+
+class RoutingSession(Session):
+    """Session qui envoie les ``SELECT`` sur la réplique dans un bloc ``use_replica``
+
+    Une session ouverte sur une connexion (``bind=connection``) s'y tient,
+    comme une session SQLAlchemy ordinaire : transaction externe des tests.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and isinstance(self.bind, Connection):
+            return self.bind
+        if (bind is None and not self._flushing and _replica_requested()
+                and isinstance(clause, SelectBase)
+                and getattr(clause, '_for_update_arg', None) is None):
+            replica = current_app.extensions.get('db_replica')
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _replica_requested():
+    return has_app_context() and g.get('_db_replica', False)
+
+
+def replica_configured(app=None):
+    app = app or current_app
+    return 'db_replica' in app.extensions
+
+
+def request_identity():
+    """Identité du JWT de la requête ; ``None`` si anonyme ou jeton invalide"""
+    try:
+        verify_jwt_in_request(optional=True)
+    except Exception:
+        return None  # la vue répondra elle-même 401/422
+    return get_jwt_identity()
+
+
+def replica_available():
+    """Réplique configurée, hors ``use_primary``, et l'utilisateur n'a pas écrit récemment"""
+    if not replica_configured() or g.get('_db_primary', False):
+        return False
+    if not has_request_context():
+        return True
+    identity = request_identity()
+    return identity is None or not current_app.extensions['db_write_marks'].recent(identity)
+
+
+@contextmanager
+def use_replica():
+    """Lectures du bloc sur la réplique (si disponible)"""
+    previous = g.get('_db_replica', False)
+    g._db_replica = replica_available()
+    try:
+        yield
+    finally:
+        g._db_replica = previous
+
+
+@contextmanager
+def use_primary():
+    """Lectures du bloc sur le primaire, même sous ``@replica_reads``"""
+    previous = g.get('_db_primary', False)
+    g._db_primary = True
+    try:
+        yield
+    finally:
+        g._db_primary = previous
+
+
+def replica_reads(view):
+    """Vue en lecture seule : ses requêtes partent sur la réplique"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        with use_replica():
+            return view(*args, **kwargs)
+    return wrapper
+
+
+# ============================================
+# DERNIÈRES ÉCRITURES
+# ============================================
+
+class WriteMarks:
+    """Utilisateurs ayant écrit depuis moins de ``sticky_seconds``, en mémoire du processus"""
+
+    def __init__(self, sticky_seconds, clock=time.monotonic):
+        self.sticky_seconds = sticky_seconds
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._until = {}
+
+    def mark(self, identity):
+        now = self.clock()
+        with self._lock:
+            if len(self._until) > 1024:
+                self._until = {key: until for key, until in self._until.items() if until > now}
+            self._until[str(identity)] = now + self.sticky_seconds
+
+    def recent(self, identity):
+        with self._lock:
+            until = self._until.get(str(identity))
+        return until is not None and until > self.clock()
+
+
+class RedisWriteMarks:
+    """Dernières écritures partagées entre workers (clé expirant avec la fenêtre)"""
+
+    def __init__(self, client, sticky_seconds, prefix='db_primary:'):
+        self.client = client
+        self.sticky_seconds = sticky_seconds
+        self.prefix = prefix
+
+    def mark(self, identity):
+        if self.sticky_seconds > 0:
+            self.client.set(f'{self.prefix}{identity}', '1', ex=self.sticky_seconds)
+
+    def recent(self, identity):
+        return bool(self.client.exists(f'{self.prefix}{identity}'))
+
+
+def create_write_marks(config):
+    sticky = config.get('REPLICA_STICKY_SECONDS', 10)
+    backend = config.get('REPLICA_STICKY_BACKEND', 'memory')
+    if backend == 'redis':
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError('REPLICA_STICKY_BACKEND=redis requires redis (pip install redis)')
+        return RedisWriteMarks(redis.Redis.from_url(config['REDIS_URL']), sticky)
+    if backend == 'memory':
+        return WriteMarks(sticky)
+    raise RuntimeError(f'Unknown REPLICA_STICKY_BACKEND: {backend}')
+
+
+# ============================================
+# INITIALISATION
+# ============================================
+
+def _pool_lines(engines):
+    lines = []
+    for name, help_text, read in (
+        ('db_pool_size', 'Configured pool size.', lambda pool: pool.size()),
+        ('db_pool_checked_out', 'Connections currently checked out.', lambda pool: pool.checkedout()),
+        ('db_pool_overflow', 'Connections opened beyond the pool size.', lambda pool: max(pool.overflow(), 0)),
+    ):
+        lines.extend([f'# HELP {name} {help_text}', f'# TYPE {name} gauge'])
+        for bind, engine in engines.items():
+            if isinstance(engine.pool, QueuePool):
+                lines.append(f'{name}{{bind="{bind}"}} {read(engine.pool)}')
+    return lines
+
+
+def all_engines(app):
+    """Moteurs de ``app`` par nom : ``default`` (primaire), ``replica``..."""
+    from . import db
+
+    with app.app_context():
+        engines = {key or 'default': engine for key, engine in db.engines.items()}
+    if 'db_replica' in app.extensions:
+        engines[REPLICA_BIND] = app.extensions['db_replica']
+    return engines
+
+
+def dispose_engines(app, close=True):
+    """Fermer les pools (``close=False`` dans un processus fils après fork)"""
+    for engine in all_engines(app).values():
+        engine.dispose(close=close)
+
+
+def init_database(app, registry):
+    """Moteur de la réplique, mesure des pools et lecture de ses écritures sur le primaire"""
+    url = app.config.get('DATABASE_REPLICA_URL')
+    if url:
+        app.extensions['db_replica'] = create_engine(url, **engine_options(url, app.config))
+
+    engines = all_engines(app)
+    for bind, engine in engines.items():
+        if isinstance(engine.pool, TimedQueuePool):
+            engine.pool.on_wait = lambda seconds, bind=bind: registry.observe_pool_wait(bind, seconds)
+    registry.add_collector(lambda: _pool_lines(engines))
+
+    if not replica_configured(app):
+        return
+
+    app.extensions['db_write_marks'] = create_write_marks(app.config)
+
+    @app.after_request
+    def _stick_to_primary(response):
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            identity = request_identity()
+            if identity is not None:
+                app.extensions['db_write_marks'].mark(identity)
+        return response
@@ -0,0 +1,148 @@
+# backend/app/documents.py
+"""Téléchargement des documents d'offres : fichier unique et archive ZIP."""
+import zipfile
+from contextlib import closing
+
+from flask import Response, current_app, redirect, request, send_file, stream_with_context
+from werkzeug.utils import secure_filename
+
+from .storage import key_sha256
+
+
+# ============================================
+# FICHIER UNIQUE
+# ============================================
+
+def document_response(storage, key, file_name):
+    """Réponse de téléchargement pour le document stocké sous ``key``.
+
+    - ETag fort = SHA-256 du contenu ; ``If-None-Match`` répond 304 ;
+    - ``Range`` géré par ``send_file(conditional=True)`` (206) ;
+    - si ``DOCUMENT_ACCEL_REDIRECT`` est défini, le corps est délégué au
+      proxy (nginx ``X-Accel-Redirect``) ; sinon ``send_file`` passe par
+      ``wsgi.file_wrapper`` (sendfile) sans copier le fichier en Python.
+    """
+    etag = key_sha256(key)
+    path = storage.local_path(key)
+
+    if path is None:
+        url = storage.download_url(key, file_name)
+        if url is None:
+            return _stream_response(storage, key, file_name, etag)
+        return redirect(url)
+
+    accel_prefix = current_app.config.get('DOCUMENT_ACCEL_REDIRECT')
+    if accel_prefix and etag:
+        response = Response(mimetype='application/octet-stream')
+        response.headers['X-Accel-Redirect'] = accel_prefix.rstrip('/') + '/' + key
+        response.headers['Content-Disposition'] = f'attachment; filename="{file_name}"'
+        response.set_etag(etag)
+        response.cache_control.private = True
+        return response.make_conditional(request)
+
+    response = send_file(
+        path,
+        as_attachment=True,
+        download_name=file_name,
+        conditional=True,
+        etag=etag if etag else True
+    )
+    response.cache_control.private = True
+    return response
+
+
+def _stream_response(storage, key, file_name, etag):
+    """Backend sans URL directe : relais du contenu par blocs"""
+    chunk_size = storage.chunk_size
+
+    def generate():
+        with closing(storage.open(key)) as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    response = Response(generate(), mimetype='application/octet-stream')
+    response.headers['Content-Disposition'] = f'attachment; filename="{file_name}"'
+    if etag:
+        response.set_etag(etag)
+    response.cache_control.private = True
+    return response.make_conditional(request)
+
+
+# ============================================
+# ARCHIVE ZIP
+# ============================================
+
+class _ZipBuffer:
+    """Tampon en écriture seule vidé à chaque bloc produit par le générateur"""
+
+    def __init__(self):
+        self._chunks = []
+        self._offset = 0
+        self.pending = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._offset += len(data)
+        self.pending += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._offset
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        self.pending = 0
+        return data
+
+
+def zip_archive_name(company_name, document_type, file_name, used):
+    """Nom unique dans l'archive : ``<entreprise>/<type>_<fichier>``"""
+    folder = secure_filename(company_name or '') or 'candidate'
+    base = f'{folder}/{secure_filename(document_type)}_{secure_filename(file_name) or "document"}'
+    name = base
+    counter = 1
+    while name in used:
+        counter += 1
+        stem, dot, ext = base.rpartition('.')
+        name = f'{stem}_{counter}.{ext}' if dot else f'{base}_{counter}'
+    used.add(name)
+    return name
+
+
+def stream_zip(storage, entries):
+    """Générateur d'une archive ZIP sans la construire en mémoire.
+
+    ``entries`` : liste de ``(arcname, key)``. Chaque fichier est recopié par
+    blocs ; ``zipfile`` écrit des descripteurs de données puisque le flux
+    n'est pas repositionnable. Les documents (PDF) sont stockés sans
+    recompression.
+    """
+    buffer = _ZipBuffer()
+    with zipfile.ZipFile(buffer, mode='w', compression=zipfile.ZIP_STORED) as archive:
+        for arcname, key in entries:
+            with closing(storage.open(key)) as source, archive.open(arcname, mode='w', force_zip64=True) as target:
+                while True:
+                    chunk = source.read(storage.chunk_size)
+                    if not chunk:
+                        break
+                    target.write(chunk)
+                    yield buffer.drain()
+            yield buffer.drain()
+    yield buffer.drain()
+
+
+def zip_response(storage, entries, download_name):
+    response = Response(
+        stream_with_context(chunk for chunk in stream_zip(storage, entries) if chunk),
+        mimetype='application/zip'
+    )
+    response.headers['Content-Disposition'] = f'attachment; filename="{download_name}"'
+    response.cache_control.private = True
+    return response
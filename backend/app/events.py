@@ -0,0 +1,359 @@
+# backend/app/events.py
+"""Notifications temps réel (Server-Sent Events).
+
+Les routes publient des événements (``publish``) dans la transaction de
+l'écriture ; ils ne partent qu'au commit, et sont oubliés en cas de
+rollback. Canaux :
+
+- ``candidate:<id>`` : changements de statut des offres du candidat, et des
+  projets sur lesquels il a soumis une offre ;
+- ``admin`` : nouvelles offres et mises à jour de projets.
+
+Diffusion (``EVENTS_BACKEND``) :
+
+- ``memory`` : bus du processus, remis directement au commit ;
+- ``postgres`` : ``pg_notify`` dans la transaction, puis ``LISTEN`` dans
+  chaque processus abonné, qui alimente son bus local (tous les workers
+  reçoivent tous les événements) ;
+- ``auto`` : ``postgres`` sous PostgreSQL, ``memory`` sinon.
+
+Chaque bus garde les ``SSE_HISTORY_SIZE`` derniers événements pour la
+reprise (``Last-Event-ID``) ; chaque connexion a une file bornée
+(``SSE_BUFFER_SIZE``) : un client trop lent reçoit ``reset`` et doit
+relire ses listes.
+"""
+import asyncio
+import itertools
+import json
+import queue
+import select
+import threading
+import time
+from collections import deque
+
+from flask import current_app
+from sqlalchemy import event as sa_event, func
+from sqlalchemy.orm import Session
+
+from . import db
+
+
+PG_CHANNEL = 'tender_events'
+
+
+class Event:
+    __slots__ = ('id', 'channel', 'type', 'data')
+
+    _ids = itertools.count(1)
+
+    def __init__(self, channel, type, data, id=None):
+        # Horodatage + compteur : unique par processus, lisible dans les journaux
+        self.id = id or f'{time.time_ns():x}-{next(self._ids):x}'
+        self.channel = channel
+        self.type = type
+        self.data = data
+
+    def to_json(self):
+        return json.dumps({'id': self.id, 'channel': self.channel, 'type': self.type, 'data': self.data})
+
+    @classmethod
+    def from_json(cls, raw):
+        item = json.loads(raw)
+        return cls(item['channel'], item['type'], item['data'], id=item['id'])
+
+    def encode(self):
+        """Bloc ``text/event-stream``"""
+        return f'id: {self.id}\nevent: {self.type}\ndata: {json.dumps(self.data)}\n\n'
+
+
+# ============================================
+# BUS DU PROCESSUS
+# ============================================
+
+class Subscription:
+    """File bornée d'une connexion SSE"""
+
+    def __init__(self, channels, project_id=None, buffer_size=100):
+        self.channels = frozenset(channels)
+        self.project_id = project_id
+        self.queue = queue.Queue(maxsize=buffer_size)
+        self.overflowed = False
+
+    def matches(self, event):
+        if event.channel not in self.channels:
+            return False
+        return self.project_id is None or event.data.get('project_id') == self.project_id
+
+    def offer(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            self.overflowed = True
+
+    def get(self, timeout):
+        """Prochain événement, ou ``None`` après ``timeout`` secondes"""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class AsyncSubscription(Subscription):
+    """Variante attendue par une boucle asyncio (mode ASGI), sans thread bloqué"""
+
+    def __init__(self, channels, project_id=None, buffer_size=100):
+        super().__init__(channels, project_id, buffer_size)
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+
+    def offer(self, event):
+        super().offer(event)
+        # Appelé depuis un thread (commit, écoute PostgreSQL) : réveil de la boucle
+        try:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        except RuntimeError:
+            pass  # boucle fermée, la connexion est terminée
+
+    async def aget(self, timeout):
+        self._ready.clear()
+        item = self.get(timeout=0) if not self.queue.empty() else None
+        if item is not None:
+            return item
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        return self.get(timeout=0) if not self.queue.empty() else None
+
+
+class EventBus:
+    """Abonnés et historique récent d'un processus"""
+
+    def __init__(self, history_size=1000):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._history = deque(maxlen=history_size)
+
+    def dispatch(self, event):
+        with self._lock:
+            self._history.append(event)
+            subscribers = [s for s in self._subscribers if s.matches(event)]
+        for subscription in subscribers:
+            subscription.offer(event)
+
+    def subscribe(self, subscription, last_event_id=None):
+        """Inscrire ``subscription`` ; ``False`` si la reprise est impossible.
+
+        Les événements postérieurs à ``last_event_id`` sont remis dans la file
+        sous le même verrou que l'inscription : rien n'est perdu entre les deux.
+        """
+        with self._lock:
+            resumed = True
+            if last_event_id:
+                ids = [e.id for e in self._history]
+                if last_event_id in ids:
+                    missed = itertools.islice(self._history, ids.index(last_event_id) + 1, None)
+                    for event in missed:
+                        if subscription.matches(event):
+                            subscription.offer(event)
+                else:
+                    resumed = False
+            self._subscribers.add(subscription)
+        return resumed
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+
+class PostgresListener:
+    """Thread ``LISTEN`` qui relaie les notifications vers le bus local"""
+
+    def __init__(self, app, bus, poll_interval=5.0):
+        self.app = app
+        self.bus = bus
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _listen(self):
+        with self.app.app_context():
+            # Connexion dédiée, retirée du pool : elle reste en LISTEN
+            connection = db.engine.raw_connection()
+            connection.detach()
+        raw = connection.driver_connection
+        try:
+            raw.autocommit = True
+            with raw.cursor() as cursor:
+                cursor.execute(f'LISTEN {PG_CHANNEL}')
+            while not self._stop.is_set():
+                if select.select([raw], [], [], self.poll_interval) == ([], [], []):
+                    continue
+                raw.poll()
+                while raw.notifies:
+                    notification = raw.notifies.pop(0)
+                    self.bus.dispatch(Event.from_json(notification.payload))
+        finally:
+            connection.close()
+
+    def _loop(self):
+        backoff = 1
+        while not self._stop.is_set():
+            try:
+                self._listen()
+                backoff = 1
+            except Exception:
+                self.app.logger.exception('Event listener failed, reconnecting in %ss', backoff)
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, name='event-listener', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+# ============================================
+# ACCÈS
+# ============================================
+
+def events_backend(app=None):
+    app = app or current_app
+    backend = app.config.get('EVENTS_BACKEND', 'auto')
+    if backend == 'auto':
+        return 'postgres' if db.engine.dialect.name == 'postgresql' else 'memory'
+    if backend not in ('memory', 'postgres'):
+        raise RuntimeError(f'Unknown EVENTS_BACKEND: {backend}')
+    return backend
+
+
+def get_bus():
+    """Bus du processus ; démarre l'écoute PostgreSQL au premier appel"""
+    bus = current_app.extensions.get('event_bus')
+    if bus is None:
+        app = current_app._get_current_object()
+        bus = app.extensions['event_bus'] = EventBus(app.config.get('SSE_HISTORY_SIZE', 1000))
+        if events_backend(app) == 'postgres':
+            app.extensions['event_listener'] = PostgresListener(app, bus).start()
+    return bus
+
+
+def publish(channel, event_type, data):
+    """Publier au commit de la transaction courante"""
+    db.session.info.setdefault('pending_events', []).append(Event(channel, event_type, data))
+
+
+def publish_bid_status(bids):
+    """``bids`` : tuples ``(bid_id, project_id, candidate_id, status)``"""
+    for bid_id, project_id, candidate_id, status in bids:
+        publish(f'candidate:{candidate_id}', 'bid.status',
+                {'bid_id': bid_id, 'project_id': project_id, 'status': status})
+
+
+def publish_project_status(project_id, status, candidate_ids):
+    """Nouveau statut d'un projet, pour l'administration et ses soumissionnaires"""
+    data = {'project_id': project_id, 'status': status}
+    publish('admin', 'project.status', data)
+    for candidate_id in candidate_ids:
+        publish(f'candidate:{candidate_id}', 'project.status', data)
+
+
+@sa_event.listens_for(Session, 'before_commit')
+def _notify_in_transaction(session):
+    pending = session.info.get('pending_events')
+    if pending and events_backend() == 'postgres':
+        for item in pending:
+            session.execute(func.pg_notify(PG_CHANNEL, item.to_json()).select())
+
+
+@sa_event.listens_for(Session, 'after_commit')
+def _dispatch_committed(session):
+    pending = session.info.pop('pending_events', None)
+    if pending and events_backend() == 'memory':
+        bus = get_bus()
+        for item in pending:
+            bus.dispatch(item)
+
+
+@sa_event.listens_for(Session, 'after_rollback')
+def _discard_rolled_back(session):
+    session.info.pop('pending_events', None)
+
+
+# ============================================
+# FLUX SSE
+# ============================================
+
+def _reset(reason):
+    # Sans ``id`` : le client garde son dernier identifiant valide
+    return f'event: reset\ndata: {json.dumps({"reason": reason})}\n\n'
+
+
+def stream_events(subscription, last_event_id=None, max_duration=None):
+    """Générateur ``text/event-stream`` pour ``subscription``"""
+    config = current_app.config
+    heartbeat = config.get('SSE_HEARTBEAT', 15)
+    max_duration = config.get('SSE_MAX_DURATION', 300) if max_duration is None else max_duration
+    bus = get_bus()
+    resumed = bus.subscribe(subscription, last_event_id)
+
+    def generate():
+        deadline = time.monotonic() + max_duration
+        try:
+            yield f'retry: {int(config.get("SSE_RETRY_MS", 3000))}\n\n'
+            if not resumed:
+                # Historique dépassé : le client relit ses listes
+                yield _reset('history')
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 and subscription.queue.empty():
+                    return
+                if subscription.overflowed:
+                    yield _reset('overflow')
+                    return
+                item = subscription.get(timeout=max(min(heartbeat, remaining), 0))
+                if item is None:
+                    if remaining > 0:
+                        yield ': keepalive\n\n'
+                    continue
+                yield item.encode()
+        finally:
+            bus.unsubscribe(subscription)
+
+    return generate()
+
+
+async def astream_events(subscription, bus, config, last_event_id=None, max_duration=None):
+    """Équivalent asynchrone de ``stream_events`` pour une ``AsyncSubscription``"""
+    heartbeat = config.get('SSE_HEARTBEAT', 15)
+    max_duration = config.get('SSE_MAX_DURATION', 300) if max_duration is None else max_duration
+    resumed = bus.subscribe(subscription, last_event_id)
+    deadline = time.monotonic() + max_duration
+    try:
+        yield f'retry: {int(config.get("SSE_RETRY_MS", 3000))}\n\n'
+        if not resumed:
+            yield _reset('history')
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 and subscription.queue.empty():
+                return
+            if subscription.overflowed:
+                yield _reset('overflow')
+                return
+            item = await subscription.aget(timeout=max(min(heartbeat, remaining), 0))
+            if item is None:
+                if remaining > 0:
+                    yield ': keepalive\n\n'
+                continue
+            yield item.encode()
+    finally:
+        bus.unsubscribe(subscription)
@@ -0,0 +1,360 @@
+# backend/app/exports.py
+"""Exports des offres pour les auditeurs : CSV ou XLSX produits en flux.
+
+Les lignes sont lues par lots (``yield_per`` : curseur côté serveur sous
+PostgreSQL) et écrites au fil de l'eau dans la réponse : la mémoire reste
+constante quel que soit le nombre d'offres. La liste des documents de
+chaque offre est agrégée par la base (sous-requête corrélée sur
+``ix_documents_bid_id``), sans requête par ligne.
+
+Le XLSX est un classeur minimal (une feuille, chaînes en ligne) écrit
+directement dans un ZIP en flux, sans dépendance supplémentaire.
+
+Pour les grandes périodes, ``request_export`` met la production en file :
+le fichier est écrit dans le stockage et téléchargé ensuite.
+"""
+import csv
+import io
+import re
+import tempfile
+import zipfile
+from datetime import datetime, timedelta
+from xml.sax.saxutils import escape
+
+from flask import Response, stream_with_context
+from sqlalchemy import func, literal, select
+
+from . import db
+from .database import use_replica
+from .documents import _ZipBuffer
+from .jobs import enqueue, job
+from .models import Bid, Candidate, Document, Export, Project
+from .pagination import InvalidQuery, parse_datetime, parse_int
+from .storage import get_storage
+
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+EXPORT_COLUMNS = ('bid_id', 'project_id', 'project_title', 'company_name', 'proposed_amount',
+                  'proposed_timeline', 'status', 'submitted_at', 'reviewed_at', 'documents')
+
+EXPORT_BATCH_SIZE = 1000   # lignes lues par aller-retour
+FLUSH_BYTES = 64 * 1024    # taille approximative des blocs envoyés
+
+
+# ============================================
+# REQUÊTE
+# ============================================
+
+def parse_export_filters(args):
+    """Filtres d'export (paramètres GET ou corps JSON), sérialisables en JSON"""
+    date_from = parse_datetime(args, 'date_from')
+    date_to = parse_datetime(args, 'date_to')
+    if date_from and date_to and date_from > date_to:
+        raise InvalidQuery('date_from must be before date_to')
+    return {
+        'project_id': parse_int(args, 'project_id'),
+        'status': args.get('status') or None,
+        'date_from': date_from.isoformat() if date_from else None,
+        'date_to': date_to.isoformat() if date_to else None,
+        # Une date seule (AAAA-MM-JJ) couvre toute la journée
+        'date_to_whole_day': bool(date_to and len(str(args.get('date_to'))) == 10),
+    }
+
+
+def _documents_column():
+    """``type:fichier; type:fichier`` des documents de l'offre courante"""
+    label = Document.document_type + literal(':') + Document.file_name
+    if db.engine.dialect.name == 'postgresql':
+        aggregate = func.string_agg(label, literal('; '))
+    else:
+        aggregate = func.group_concat(label, '; ')
+    return (
+        select(aggregate)
+        .where(Document.bid_id == Bid.id)
+        .correlate(Bid)
+        .scalar_subquery()
+    )
+
+
+def export_query(filters):
+    statement = (
+        select(
+            Bid.id.label('bid_id'),
+            Bid.project_id,
+            Project.title.label('project_title'),
+            Candidate.company_name,
+            Bid.proposed_amount,
+            Bid.proposed_timeline,
+            Bid.status,
+            Bid.submitted_at,
+            Bid.reviewed_at,
+            _documents_column().label('documents'),
+        )
+        .outerjoin(Project, Bid.project_id == Project.id)
+        .outerjoin(Candidate, Bid.candidate_id == Candidate.id)
+    )
+
+    if filters.get('project_id') is not None:
+        statement = statement.where(Bid.project_id == filters['project_id'])
+    if filters.get('status'):
+        statement = statement.where(Bid.status == filters['status'])
+    if filters.get('date_from'):
+        statement = statement.where(Bid.submitted_at >= datetime.fromisoformat(filters['date_from']))
+    if filters.get('date_to'):
+        date_to = datetime.fromisoformat(filters['date_to'])
+        if filters.get('date_to_whole_day'):
+            statement = statement.where(Bid.submitted_at < date_to + timedelta(days=1))
+        else:
+            statement = statement.where(Bid.submitted_at <= date_to)
+
+    return statement.order_by(Bid.submitted_at, Bid.id)
+
+
+def iter_export_rows(filters):
+    """Lignes de l'export, lues par lots de ``EXPORT_BATCH_SIZE``"""
+    with use_replica():
+        result = db.session.execute(
+            export_query(filters).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+    try:
+        for row in result:
+            yield row
+    finally:
+        result.close()
+
+
+def _cells(row):
+    cells = []
+    for name in EXPORT_COLUMNS:
+        value = getattr(row, name)
+        if isinstance(value, datetime):
+            value = value.isoformat(sep=' ', timespec='seconds')
+        cells.append(value)
+    return cells
+
+
+# ============================================
+# CSV
+# ============================================
+
+def _neutralize(value):
+    """Empêcher l'interprétation d'une cellule texte comme formule (Excel)"""
+    if isinstance(value, str) and value[:1] in ('=', '+', '-', '@'):
+        return "'" + value
+    return value
+
+
+def stream_csv(rows):
+    """Générateur CSV UTF-8 (avec BOM, pour Excel), par blocs d'environ 64 Ko"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write('\ufeff')
+    writer.writerow(EXPORT_COLUMNS)
+
+    for row in rows:
+        writer.writerow(['' if value is None else _neutralize(value) for value in _cells(row)])
+        if buffer.tell() >= FLUSH_BYTES:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue().encode('utf-8')
+
+
+# ============================================
+# XLSX
+# ============================================
+
+XLSX_PARTS = (
+    ('[Content_Types].xml',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+     '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+     '<Default Extension="xml" ContentType="application/xml"/>'
+     '<Override PartName="/xl/workbook.xml" '
+     'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+     '<Override PartName="/xl/worksheets/sheet1.xml" '
+     'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+     '</Types>'),
+    ('_rels/.rels',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+     '<Relationship Id="rId1" '
+     'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+     'Target="xl/workbook.xml"/>'
+     '</Relationships>'),
+    ('xl/workbook.xml',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+     'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+     '<sheets><sheet name="Bids" sheetId="1" r:id="rId1"/></sheets>'
+     '</workbook>'),
+    ('xl/_rels/workbook.xml.rels',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+     '<Relationship Id="rId1" '
+     'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+     'Target="worksheets/sheet1.xml"/>'
+     '</Relationships>'),
+)
+
+SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+SHEET_TAIL = '</sheetData></worksheet>'
+
+# Caractères interdits en XML 1.0
+XML_INVALID = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _column_letter(index):
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+COLUMN_LETTERS = [_column_letter(i) for i in range(len(EXPORT_COLUMNS))]
+
+
+def _xlsx_row(number, values):
+    cells = []
+    for letter, value in zip(COLUMN_LETTERS, values):
+        ref = f'{letter}{number}'
+        if value is None:
+            continue
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            cells.append(f'<c r="{ref}"><v>{value}</v></c>')
+        else:
+            text = escape(XML_INVALID.sub('', str(value)))
+            cells.append(f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+    return f'<row r="{number}">{"".join(cells)}</row>'
+
+
+def stream_xlsx(rows):
+    """Générateur d'un classeur XLSX : la feuille est compressée au fil de l'eau"""
+    buffer = _ZipBuffer()
+    with zipfile.ZipFile(buffer, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in XLSX_PARTS:
+            archive.writestr(name, content)
+        yield buffer.drain()
+
+        with archive.open('xl/worksheets/sheet1.xml', mode='w', force_zip64=True) as sheet:
+            sheet.write(SHEET_HEAD.encode())
+            sheet.write(_xlsx_row(1, EXPORT_COLUMNS).encode())
+            for number, row in enumerate(rows, start=2):
+                sheet.write(_xlsx_row(number, _cells(row)).encode('utf-8'))
+                if buffer.pending >= FLUSH_BYTES:
+                    yield buffer.drain()
+            sheet.write(SHEET_TAIL.encode())
+        yield buffer.drain()
+    yield buffer.drain()
+
+
+STREAMERS = {'csv': stream_csv, 'xlsx': stream_xlsx}
+
+
+def parse_export_format(value):
+    fmt = (value or 'csv').lower()
+    if fmt not in EXPORT_FORMATS:
+        raise InvalidQuery('format must be csv or xlsx')
+    return fmt
+
+
+def export_file_name(fmt, filters, export_id=None):
+    if export_id is not None:
+        scope = f'export_{export_id}'
+    elif filters.get('project_id') is not None:
+        scope = f'project_{filters["project_id"]}'
+    else:
+        scope = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+    return f'bids_{scope}.{fmt}'
+
+
+def export_response(fmt, filters):
+    """Réponse en flux (chunked) : en-têtes envoyés avant la première ligne"""
+    chunks = STREAMERS[fmt](iter_export_rows(filters))
+    response = Response(
+        stream_with_context(chunk for chunk in chunks if chunk),
+        mimetype=EXPORT_FORMATS[fmt]
+    )
+    response.headers['Content-Disposition'] = f'attachment; filename="{export_file_name(fmt, filters)}"'
+    response.cache_control.private = True
+    response.cache_control.no_store = True
+    return response
+
+
+# ============================================
+# EXPORT DIFFÉRÉ
+# ============================================
+
+def request_export(fmt, filters, requested_by=None):
+    """Enregistrer une demande d'export et la mettre en file"""
+    export = Export(format=fmt, filters=filters, status='pending', requested_by=requested_by)
+    db.session.add(export)
+    db.session.flush()
+    enqueue('export_bids', export_id=export.id)
+    db.session.commit()
+    return export
+
+
+@job('export_bids')
+def build_export(export_id):
+    """Écrire l'export dans un fichier temporaire puis le déposer dans le stockage"""
+    export = db.session.get(Export, export_id)
+    if export is None:
+        return
+    export.status = 'running'
+    export.error = None
+    db.session.commit()
+
+    counted = {'rows': 0}
+
+    def rows():
+        for row in iter_export_rows(export.filters):
+            counted['rows'] += 1
+            yield row
+
+    try:
+        storage = get_storage()
+        with tempfile.TemporaryFile() as f:
+            for chunk in STREAMERS[export.format](rows()):
+                f.write(chunk)
+            f.seek(0)
+            stored = storage.save(f)
+
+        export.status = 'ready'
+        export.file_key = stored.key
+        export.file_size = stored.size
+        export.row_count = counted['rows']
+        export.finished_at = datetime.utcnow()
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        export = db.session.get(Export, export_id)
+        export.status = 'failed'
+        export.error = str(e)
+        db.session.commit()
+        raise
+
+
+def serialize_export(export):
+    return {
+        'id': export.id,
+        'format': export.format,
+        'filters': {key: value for key, value in export.filters.items() if key != 'date_to_whole_day'},
+        'status': export.status,
+        'row_count': export.row_count,
+        'file_size': export.file_size,
+        'error': export.error,
+        'created_at': export.created_at.isoformat() if export.created_at else None,
+        'finished_at': export.finished_at.isoformat() if export.finished_at else None,
+        'download_url': f'/api/admin/exports/{export.id}/download' if export.status == 'ready' else None,
+    }
@@ -0,0 +1,84 @@
+# backend/app/idempotency.py
+"""Clés d'idempotence (en-tête ``Idempotency-Key``) des écritures rejouables.
+
+Le client choisit une clé par opération et la renvoie à chaque nouvel
+essai. La réponse de la première exécution réussie est enregistrée dans la
+même transaction que l'écriture (``remember``) : la clé n'existe que si
+l'écriture a été validée, et l'index unique (utilisateur, clé) empêche deux
+envois concurrents de l'enregistrer tous les deux.
+
+Sur le chemin nominal, aucune lecture supplémentaire : la clé n'est
+cherchée (``replay``) que lorsque l'écriture échoue (doublon, conflit,
+projet fermé entre-temps...). Une clé rejouée renvoie la réponse d'origine
+avec ``Idempotent-Replayed: true`` ; réutilisée pour une autre requête,
+elle est refusée (422). Les clés expirent après ``IDEMPOTENCY_KEY_TTL``
+secondes (purge par le planificateur).
+"""
+import hashlib
+import json
+from datetime import timedelta
+
+from flask import current_app, jsonify, request
+from sqlalchemy import delete
+
+from . import db
+from .models import IdempotencyKey
+from .pagination import InvalidQuery
+
+
+HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+
+
+def request_fingerprint(fields):
+    """SHA-256 de la méthode, du chemin et des champs de la requête"""
+    canonical = json.dumps([request.method, request.path, sorted(fields.items())], default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class IdempotentRequest:
+    def __init__(self, user_id, key, fingerprint):
+        self.user_id = user_id
+        self.key = key
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def from_request(cls, user_id, fields):
+        """``None`` sans en-tête ; ``fields`` : ce qui identifie l'opération"""
+        key = (request.headers.get(HEADER) or '').strip()
+        if not key:
+            return None
+        if len(key) > MAX_KEY_LENGTH:
+            raise InvalidQuery(f'{HEADER} must be at most {MAX_KEY_LENGTH} characters')
+        return cls(user_id, key, request_fingerprint(fields))
+
+    def remember(self, status_code, body):
+        """Enregistrer la réponse avec l'écriture (même transaction)"""
+        db.session.add(IdempotencyKey(user_id=self.user_id, key=self.key, fingerprint=self.fingerprint,
+                                      status_code=status_code, response=body))
+
+    def replay(self):
+        """Réponse d'origine si la clé est connue, sinon ``None``"""
+        stored = (
+            db.session.query(IdempotencyKey)
+            .filter_by(user_id=self.user_id, key=self.key)
+            .first()
+        )
+        if stored is None:
+            return None
+        if stored.fingerprint != self.fingerprint:
+            return jsonify({'message': f'{HEADER} was already used for a different request'}), 422
+        response = jsonify(stored.response)
+        response.headers['Idempotent-Replayed'] = 'true'
+        return response, stored.status_code
+
+
+def purge_idempotency_keys(now):
+    """Supprimer les clés expirées ; nombre de clés supprimées"""
+    ttl = current_app.config.get('IDEMPOTENCY_KEY_TTL', 86400)
+    result = db.session.execute(
+        delete(IdempotencyKey)
+        .where(IdempotencyKey.created_at < now - timedelta(seconds=ttl))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
@@ -0,0 +1,228 @@
+# backend/app/instrumentation.py
+"""Instrumentation des requêtes : durée, nombre de requêtes SQL, temps base.
+
+- chaque requête HTTP mesure sa durée totale, le nombre d'instructions SQL
+  et le temps cumulé passé en base (événements moteur SQLAlchemy) ;
+- la réponse porte un en-tête ``Server-Timing`` (visible dans les outils
+  de développement du navigateur) ;
+- les requêtes HTTP et SQL lentes sont journalisées (``SLOW_REQUEST_MS``,
+  ``SLOW_QUERY_MS``), avec le texte de l'instruction ;
+- ``/api/metrics`` expose des histogrammes de latence par route au format
+  texte Prometheus (compteurs propres à chaque processus worker).
+"""
+import logging
+import threading
+import time
+
+from flask import g, has_app_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+logger = logging.getLogger('app.perf')
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+# ============================================
+# MÉTRIQUES
+# ============================================
+
+class Histogram:
+    """Histogramme cumulatif à étiquettes, au sens Prometheus"""
+
+    def __init__(self, name, help_text, label_names, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series = {}
+
+    def observe(self, labels, value):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = {'counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series['counts'][i] += 1
+        series['sum'] += value
+        series['count'] += 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        for labels, series in sorted(self._series.items()):
+            base = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, labels))
+            for bound, count in zip(self.buckets, series['counts']):
+                lines.append(f'{self.name}_bucket{{{base},le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{base},le="+Inf"}} {series["count"]}')
+            lines.append(f'{self.name}_sum{{{base}}} {series["sum"]}')
+            lines.append(f'{self.name}_count{{{base}}} {series["count"]}')
+        return lines
+
+
+class Counter:
+    def __init__(self, name, help_text, label_names):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values = {}
+
+    def inc(self, labels, amount=1):
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        for labels, value in sorted(self._values.items()):
+            base = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, labels))
+            lines.append(f'{self.name}{{{base}}} {value}')
+        return lines
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MetricsRegistry:
+    """Métriques HTTP de l'application (processus courant)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.request_latency = Histogram(
+            'http_request_duration_seconds', 'HTTP request latency by route.',
+            ('method', 'route'), LATENCY_BUCKETS)
+        self.request_queries = Histogram(
+            'http_request_db_queries', 'SQL statements executed per HTTP request.',
+            ('method', 'route'), QUERY_BUCKETS)
+        self.request_db_time = Counter(
+            'http_request_db_seconds_total', 'Cumulative database time by route.',
+            ('method', 'route'))
+        self.responses = Counter(
+            'http_responses_total', 'HTTP responses by route and status code.',
+            ('method', 'route', 'status'))
+        self.slow_queries = Counter(
+            'db_slow_queries_total', 'SQL statements slower than SLOW_QUERY_MS.', ('route',))
+        self.pool_wait = Histogram(
+            'db_pool_wait_seconds', 'Time to obtain a connection from the pool (waiting included).',
+            ('bind',), POOL_WAIT_BUCKETS)
+        self._extra = []
+
+    def add_collector(self, collector):
+        """Ajouter une source ``collector() -> [lignes]`` au rendu (caches, pools...)"""
+        self._extra.append(collector)
+
+    def observe_request(self, method, route, status, duration, queries, db_time):
+        labels = (method, route)
+        with self._lock:
+            self.request_latency.observe(labels, duration)
+            self.request_queries.observe(labels, queries)
+            self.request_db_time.inc(labels, db_time)
+            self.responses.inc((method, route, str(status)))
+
+    def observe_slow_query(self, route):
+        with self._lock:
+            self.slow_queries.inc((route,))
+
+    def observe_pool_wait(self, bind, seconds):
+        with self._lock:
+            self.pool_wait.observe((bind,), seconds)
+
+    def render(self):
+        with self._lock:
+            lines = []
+            for metric in (self.request_latency, self.request_queries, self.request_db_time,
+                           self.responses, self.slow_queries, self.pool_wait):
+                lines.extend(metric.render())
+        for collector in self._extra:
+            lines.extend(collector())
+        return '\n'.join(lines) + '\n'
+
+
+# ============================================
+# ÉVÉNEMENTS
+# ============================================
+
+def _current_stats():
+    if has_app_context():
+        return g.get('_perf')
+    return None
+
+
+def _route_label():
+    rule = getattr(request, 'url_rule', None)
+    return rule.rule if rule is not None else 'unmatched'
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('_query_started', []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info['_query_started'].pop()
+    duration = time.perf_counter() - started
+
+    stats = _current_stats()
+    if stats is None:
+        return
+    stats['queries'] += 1
+    stats['db_time'] += duration
+
+    if duration * 1000 >= stats['slow_query_ms']:
+        logger.warning('Slow query (%.1f ms) on %s: %s', duration * 1000, stats['route'], statement)
+        stats['registry'].observe_slow_query(stats['route'])
+
+
+@event.listens_for(Engine, 'handle_error')
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get('_query_started'):
+        conn.info['_query_started'].pop()
+
+
+def init_instrumentation(app):
+    """Brancher la mesure des requêtes sur ``app``"""
+    registry = app.extensions['metrics'] = MetricsRegistry()
+
+    @app.before_request
+    def _start_timer():
+        g._perf = {
+            'started': time.perf_counter(),
+            'queries': 0,
+            'db_time': 0.0,
+            'route': _route_label(),
+            'slow_query_ms': app.config.get('SLOW_QUERY_MS', 100),
+            'registry': registry,
+        }
+
+    @app.after_request
+    def _record(response):
+        stats = g.pop('_perf', None)
+        if stats is None:
+            return response
+
+        duration = time.perf_counter() - stats['started']
+        registry.observe_request(request.method, stats['route'], response.status_code,
+                                 duration, stats['queries'], stats['db_time'])
+
+        if app.config.get('SERVER_TIMING', True):
+            response.headers.add(
+                'Server-Timing',
+                f'app;dur={duration * 1000:.1f}, '
+                f'db;dur={stats["db_time"] * 1000:.1f};desc="{stats["queries"]} queries"'
+            )
+
+        if duration * 1000 >= app.config.get('SLOW_REQUEST_MS', 500):
+            logger.warning('Slow request %s %s: %.1f ms, %d queries, %.1f ms in database',
+                           request.method, request.path, duration * 1000,
+                           stats['queries'], stats['db_time'] * 1000)
+        return response
+
+    return registry
+
+
+def render_metrics(app):
+    """Texte Prometheus des métriques de ``app``"""
+    return app.extensions['metrics'].render()
@@ -0,0 +1,401 @@
+# backend/app/jobs.py
+"""Travaux en arrière-plan : file d'attente, workers, reprises.
+
+Les routes mettent en file (``enqueue``) et répondent immédiatement ; un
+pool de workers exécute ensuite les traitements enregistrés avec
+``@job('nom')``. Deux files sont disponibles (``JOB_QUEUE_BACKEND``) :
+
+- ``database`` : table ``jobs`` scrutée avec ``SELECT … FOR UPDATE SKIP
+  LOCKED`` (plusieurs workers sans double exécution), lancée par
+  ``flask jobs worker`` ;
+- ``memory`` : file en mémoire du processus, pour les tests et le
+  développement local (workers en threads si ``JOB_WORKERS`` > 0).
+
+Un échec est retenté jusqu'à ``max_attempts`` avec un délai exponentiel
+(``JOB_RETRY_BACKOFF`` × 2^(essai-1) secondes). Un travail réservé porte
+un bail (``locked_at``) : si son worker meurt, il est repris après
+``JOB_VISIBILITY_TIMEOUT`` secondes et compte pour un essai ; les
+traitements doivent donc pouvoir être rejoués. La durée de chaque travail
+est enregistrée sur la ligne et agrégée par type dans ``JobMetrics``.
+"""
+import itertools
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import and_, func, or_
+
+from . import db
+from .models import Job
+
+
+HANDLERS = {}
+
+
+def job(kind):
+    """Enregistrer ``fn(**payload)`` comme traitement du type ``kind``"""
+    def decorator(fn):
+        HANDLERS[kind] = fn
+        return fn
+    return decorator
+
+
+# ============================================
+# MÉTRIQUES
+# ============================================
+
+class JobMetrics:
+    """Compteurs et durées par type de travail (processus courant)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_kind = {}
+
+    def record(self, kind, duration_ms, succeeded):
+        with self._lock:
+            stats = self._by_kind.setdefault(kind, {
+                'runs': 0, 'failures': 0, 'total_ms': 0.0, 'max_ms': 0.0
+            })
+            stats['runs'] += 1
+            stats['total_ms'] += duration_ms
+            stats['max_ms'] = max(stats['max_ms'], duration_ms)
+            if not succeeded:
+                stats['failures'] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                kind: {
+                    **stats,
+                    'avg_ms': stats['total_ms'] / stats['runs'] if stats['runs'] else 0.0,
+                }
+                for kind, stats in self._by_kind.items()
+            }
+
+
+# ============================================
+# FILES
+# ============================================
+
+class DatabaseQueue:
+    """File persistée dans la table ``jobs``"""
+
+    def __init__(self, visibility_timeout=600):
+        self.visibility_timeout = visibility_timeout
+
+    def enqueue(self, kind, payload, max_attempts):
+        # Ajout dans la transaction de l'appelant : la mise en file est
+        # validée (ou annulée) avec les données qui l'ont provoquée
+        entry = Job(kind=kind, payload=payload, status='queued',
+                    attempts=0, max_attempts=max_attempts, run_after=datetime.utcnow())
+        db.session.add(entry)
+        return entry
+
+    def claim(self):
+        """Réserver le prochain travail prêt ; ``None`` si la file est vide
+
+        Un travail ``running`` dont le bail (``locked_at``) a dépassé
+        ``visibility_timeout`` secondes appartenait à un worker disparu : il
+        est repris, ou marqué ``failed`` s'il a épuisé ses essais.
+        """
+        while True:
+            now = datetime.utcnow()
+            entry = (
+                Job.query
+                .filter(or_(
+                    and_(Job.status == 'queued', Job.run_after <= now),
+                    and_(Job.status == 'running',
+                         Job.locked_at < now - timedelta(seconds=self.visibility_timeout)),
+                ))
+                .order_by(Job.run_after, Job.id)
+                .with_for_update(skip_locked=True)
+                .limit(1)
+                .first()
+            )
+            if entry is None:
+                db.session.rollback()
+                return None
+
+            if entry.status == 'running' and entry.attempts >= entry.max_attempts:
+                entry.status = 'failed'
+                entry.last_error = f'Worker lost: no result after {self.visibility_timeout:g}s'
+                entry.finished_at = now
+                db.session.commit()
+                continue
+
+            entry.status = 'running'
+            entry.attempts += 1
+            entry.started_at = entry.locked_at = now
+            db.session.commit()
+            return entry
+
+    def finish(self, entry):
+        db.session.commit()
+
+    def abandon(self):
+        db.session.rollback()
+
+    def depth(self):
+        by_status = dict(
+            db.session.query(Job.status, func.count()).group_by(Job.status).all()
+        )
+        by_kind = dict(
+            db.session.query(Job.kind, func.count())
+            .filter(Job.status == 'queued')
+            .group_by(Job.kind)
+            .all()
+        )
+        oldest = (
+            db.session.query(func.min(Job.run_after))
+            .filter(Job.status == 'queued')
+            .scalar()
+        )
+        return by_status, by_kind, oldest
+
+
+class MemoryQueue:
+    """File en mémoire du processus (tests, développement)"""
+
+    def __init__(self, app=None, workers=0, poll_interval=0.5):
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._queued = deque()
+        self._finished = []
+        self._running = 0
+        self._app = app
+        self._workers = workers
+        self._poll_interval = poll_interval
+        self._worker = None
+
+    def enqueue(self, kind, payload, max_attempts):
+        entry = SimpleNamespace(
+            id=next(self._ids), kind=kind, payload=payload, status='queued',
+            attempts=0, max_attempts=max_attempts, run_after=datetime.utcnow(),
+            last_error=None, duration_ms=None, created_at=datetime.utcnow(),
+            started_at=None, locked_at=None, finished_at=None
+        )
+        with self._lock:
+            self._queued.append(entry)
+        if self._workers and self._worker is None and self._app is not None:
+            self._worker = Worker(self._app, self, self._workers, self._poll_interval).start()
+        return entry
+
+    def claim(self):
+        now = datetime.utcnow()
+        with self._lock:
+            for entry in self._queued:
+                if entry.run_after <= now:
+                    self._queued.remove(entry)
+                    entry.status = 'running'
+                    entry.attempts += 1
+                    entry.started_at = entry.locked_at = now
+                    self._running += 1
+                    return entry
+        return None
+
+    def finish(self, entry):
+        with self._lock:
+            self._running -= 1
+            if entry.status == 'queued':
+                self._queued.append(entry)
+            else:
+                self._finished.append(entry)
+
+    def abandon(self):
+        pass
+
+    def jobs(self):
+        with self._lock:
+            return list(self._queued) + list(self._finished)
+
+    def depth(self):
+        with self._lock:
+            by_status = {'queued': len(self._queued), 'running': self._running}
+            for entry in self._finished:
+                by_status[entry.status] = by_status.get(entry.status, 0) + 1
+            by_kind = {}
+            for entry in self._queued:
+                by_kind[entry.kind] = by_kind.get(entry.kind, 0) + 1
+            oldest = min((entry.run_after for entry in self._queued), default=None)
+        return by_status, by_kind, oldest
+
+
+# ============================================
+# EXÉCUTION
+# ============================================
+
+def run_job(queue, entry, metrics):
+    """Exécuter un travail réservé et consigner son résultat"""
+    handler = HANDLERS.get(entry.kind)
+    started = time.perf_counter()
+    error = None
+
+    try:
+        if handler is None:
+            raise LookupError(f'No handler registered for job kind {entry.kind!r}')
+        handler(**(entry.payload or {}))
+        # Écritures du travail validées ici, quelle que soit la file : un
+        # échec du commit compte comme un échec du travail
+        db.session.commit()
+    except Exception:
+        queue.abandon()
+        error = traceback.format_exc(limit=5)
+
+    duration_ms = (time.perf_counter() - started) * 1000
+    entry.duration_ms = duration_ms
+    entry.finished_at = datetime.utcnow()
+
+    if error is None:
+        entry.status = 'done'
+        entry.last_error = None
+    elif entry.attempts < entry.max_attempts:
+        backoff = current_app.config.get('JOB_RETRY_BACKOFF', 5)
+        entry.status = 'queued'
+        entry.last_error = error
+        entry.run_after = datetime.utcnow() + timedelta(seconds=backoff * 2 ** (entry.attempts - 1))
+    else:
+        entry.status = 'failed'
+        entry.last_error = error
+
+    queue.finish(entry)
+    metrics.record(entry.kind, duration_ms, error is None)
+    return entry
+
+
+def process_jobs(max_jobs=None):
+    """Vider la file (ou ``max_jobs`` travaux) ; retourne le nombre traité"""
+    queue = get_queue()
+    metrics = get_metrics()
+    processed = 0
+    while max_jobs is None or processed < max_jobs:
+        entry = queue.claim()
+        if entry is None:
+            break
+        run_job(queue, entry, metrics)
+        processed += 1
+    return processed
+
+
+class Worker:
+    """Pool de threads qui scrutent la file tant que ``stop()`` n'est pas appelé"""
+
+    def __init__(self, app, queue, concurrency=2, poll_interval=1.0):
+        self.app = app
+        self.queue = queue
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._threads = []
+
+    def _loop(self):
+        with self.app.app_context():
+            metrics = get_metrics()
+            while not self._stop.is_set():
+                try:
+                    entry = self.queue.claim()
+                except Exception:
+                    self.queue.abandon()
+                    self.app.logger.exception('Job queue poll failed')
+                    entry = None
+                if entry is None:
+                    self._stop.wait(self.poll_interval)
+                    continue
+                run_job(self.queue, entry, metrics)
+                db.session.remove()
+
+    def start(self):
+        for i in range(self.concurrency):
+            thread = threading.Thread(target=self._loop, name=f'job-worker-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def join(self):
+        for thread in self._threads:
+            thread.join()
+
+
+# ============================================
+# ACCÈS
+# ============================================
+
+def create_queue(app):
+    backend = app.config.get('JOB_QUEUE_BACKEND', 'database')
+    if backend == 'database':
+        return DatabaseQueue(app.config.get('JOB_VISIBILITY_TIMEOUT', 600))
+    if backend == 'memory':
+        return MemoryQueue(app, workers=app.config.get('JOB_WORKERS', 0),
+                           poll_interval=app.config.get('JOB_POLL_INTERVAL', 1.0))
+    raise RuntimeError(f'Unknown JOB_QUEUE_BACKEND: {backend}')
+
+
+def get_queue():
+    queue = current_app.extensions.get('job_queue')
+    if queue is None:
+        queue = current_app.extensions['job_queue'] = create_queue(current_app._get_current_object())
+    return queue
+
+
+def get_metrics():
+    return current_app.extensions.setdefault('job_metrics', JobMetrics())
+
+
+def enqueue(kind, max_attempts=None, **payload):
+    """Mettre un travail en file ; ``payload`` doit être sérialisable en JSON"""
+    if max_attempts is None:
+        max_attempts = current_app.config.get('JOB_MAX_ATTEMPTS', 3)
+    return get_queue().enqueue(kind, payload, max_attempts)
+
+
+def queue_status():
+    """Profondeur de la file et métriques, pour l'endpoint d'administration"""
+    by_status, by_kind, oldest = get_queue().depth()
+    return {
+        'backend': current_app.config.get('JOB_QUEUE_BACKEND', 'database'),
+        'depth': by_status.get('queued', 0),
+        'by_status': by_status,
+        'queued_by_kind': by_kind,
+        'oldest_queued_age_seconds': (
+            (datetime.utcnow() - oldest).total_seconds() if oldest else 0.0
+        ),
+        'metrics': get_metrics().snapshot(),
+    }
+
+
+# ============================================
+# CLI
+# ============================================
+
+jobs_cli = AppGroup('jobs', help='Background job queue.')
+
+
+@jobs_cli.command('worker')
+@click.option('--concurrency', default=None, type=int, help='Number of worker threads.')
+def worker_command(concurrency):
+    """Lancer un pool de workers sur la file de l'application"""
+    app = current_app._get_current_object()
+    concurrency = concurrency or app.config.get('JOB_WORKERS') or 2
+    worker = Worker(app, get_queue(), concurrency, app.config.get('JOB_POLL_INTERVAL', 1.0))
+    click.echo(f'Job worker started ({concurrency} threads)')
+    worker.start()
+    try:
+        worker.join()
+    except KeyboardInterrupt:
+        worker.stop()
+
+
+@jobs_cli.command('run')
+def run_command():
+    """Exécuter les travaux prêts puis rendre la main"""
+    click.echo(f'{process_jobs()} job(s) processed')
@@ -1,6 +1,7 @@
 from app import db
 from datetime import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
+
+BID_STATUSES = ('submitted', 'under_review', 'accepted', 'rejected')
 
 class User(db.Model):
     __tablename__ = 'users'
@@ -16,13 +17,18 @@ class User(db.Model):
     candidate = db.relationship('Candidate', backref='user', uselist=False)
     
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        from .passwords import hash_password
+        self.password_hash = hash_password(password)
     
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        from .passwords import get_hasher
+        return get_hasher().verify(self.password_hash, password)
 
 class Candidate(db.Model):
     __tablename__ = 'candidates'
+    __table_args__ = (
+        db.Index('ix_candidates_user_id', 'user_id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -37,6 +43,13 @@ class Candidate(db.Model):
 
 class Project(db.Model):
     __tablename__ = 'projects'
+    __table_args__ = (
+        # Listes publiques : tri (created_at, id), avec ou sans filtre de statut
+        db.Index('ix_projects_created_at_id', 'created_at', 'id'),
+        db.Index('ix_projects_status_created_at_id', 'status', 'created_at', 'id'),
+        # Planificateur : projets d'un statut, par échéance
+        db.Index('ix_projects_status_deadline', 'status', 'deadline'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
@@ -52,6 +65,13 @@ class Project(db.Model):
 
 class Bid(db.Model):
     __tablename__ = 'bids'
+    __table_args__ = (
+        # Une seule offre par candidat et par projet (garanti par la base)
+        db.Index('uq_bids_project_candidate', 'project_id', 'candidate_id', unique=True),
+        db.Index('ix_bids_candidate_submitted_at_id', 'candidate_id', 'submitted_at', 'id'),
+        db.Index('ix_bids_submitted_at_id', 'submitted_at', 'id'),
+        db.Index('ix_bids_status', 'status'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     project_id = db.Column(db.Integer, db.ForeignKey('projects.id'), nullable=False)
@@ -62,11 +82,15 @@ class Bid(db.Model):
     notes = db.Column(db.Text)
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
     reviewed_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     documents = db.relationship('Document', backref='bid', lazy=True, cascade='all, delete-orphan')
 
 class Document(db.Model):
     __tablename__ = 'documents'
+    __table_args__ = (
+        db.Index('ix_documents_bid_id', 'bid_id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     bid_id = db.Column(db.Integer, db.ForeignKey('bids.id'), nullable=False)
@@ -76,4 +100,66 @@ class Document(db.Model):
     file_size = db.Column(db.Integer)
     uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)
     verified = db.Column(db.Boolean, default=False)
-    verification_notes = db.Column(db.Text)
\ No newline at end of file
+    verification_notes = db.Column(db.Text)
+
+class Job(db.Model):
+    __tablename__ = 'jobs'
+    __table_args__ = (
+        # Scrutation des workers : prochains travaux prêts, dans l'ordre
+        db.Index('ix_jobs_status_run_after', 'status', 'run_after', 'id'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(50), nullable=False)
+    payload = db.Column(db.JSON, nullable=False, default=dict)
+    status = db.Column(db.String(20), nullable=False, default='queued')  # queued, running, done, failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=3)
+    run_after = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_error = db.Column(db.Text)
+    duration_ms = db.Column(db.Float)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    locked_at = db.Column(db.DateTime)  # bail du worker ; expiré = travail repris
+    finished_at = db.Column(db.DateTime)
+
+class Export(db.Model):
+    __tablename__ = 'exports'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    requested_by = db.Column(db.Integer, db.ForeignKey('users.id'))
+    format = db.Column(db.String(10), nullable=False)  # csv ou xlsx
+    filters = db.Column(db.JSON, nullable=False, default=dict)
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, running, ready, failed
+    file_key = db.Column(db.String(500))
+    file_size = db.Column(db.Integer)
+    row_count = db.Column(db.Integer)
+    error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime)
+
+class IdempotencyKey(db.Model):
+    __tablename__ = 'idempotency_keys'
+    __table_args__ = (
+        # Une clé par utilisateur : deux envois concurrents ne peuvent pas l'enregistrer tous les deux
+        db.Index('uq_idempotency_keys_user_key', 'user_id', 'key', unique=True),
+        db.Index('ix_idempotency_keys_created_at', 'created_at'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    key = db.Column(db.String(255), nullable=False)
+    fingerprint = db.Column(db.String(64), nullable=False)  # SHA-256 de la requête d'origine
+    status_code = db.Column(db.Integer, nullable=False)
+    response = db.Column(db.JSON, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+
+class RevokedToken(db.Model):
+    __tablename__ = 'revoked_tokens'
+    __table_args__ = (
+        db.Index('ix_revoked_tokens_expires_at', 'expires_at'),
+    )
+    
+    jti = db.Column(db.String(64), primary_key=True)
+    expires_at = db.Column(db.DateTime, nullable=False)  # expiration du jeton (UTC) : purgé ensuite
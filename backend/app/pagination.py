@@ -0,0 +1,134 @@
+# backend/app/pagination.py
+"""Pagination par curseur (keyset) et filtres communs des listes."""
+import base64
+import json
+from datetime import datetime
+
+from flask import current_app
+from sqlalchemy import and_, or_
+
+
+class InvalidQuery(ValueError):
+    """Paramètre de liste invalide (curseur, filtre, limite) -> 400"""
+
+
+# ============================================
+# CURSEURS
+# ============================================
+
+def encode_cursor(sort_value, row_id):
+    """Curseur opaque pour la position ``(sort_value, id)``"""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([sort_value, row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, parse=datetime.fromisoformat):
+    """Inverse de ``encode_cursor``; lève ``InvalidQuery`` si illisible"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return parse(sort_value), int(row_id)
+    except (ValueError, TypeError):
+        raise InvalidQuery('Invalid cursor')
+
+
+# ============================================
+# PARAMÈTRES
+# ============================================
+
+def parse_limit(args):
+    """Taille de page demandée, bornée par ``PAGE_SIZE_MAX``"""
+    default = current_app.config.get('PAGE_SIZE_DEFAULT', 50)
+    maximum = current_app.config.get('PAGE_SIZE_MAX', 200)
+    raw = args.get('limit')
+    if raw is None:
+        return default
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise InvalidQuery('Invalid limit')
+    if limit < 1:
+        raise InvalidQuery('Invalid limit')
+    return min(limit, maximum)
+
+
+def parse_float(args, name):
+    raw = args.get(name)
+    if raw is None or raw == '':
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        raise InvalidQuery(f'Invalid {name}')
+
+
+def parse_int(args, name):
+    raw = args.get(name)
+    if raw is None or raw == '':
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        raise InvalidQuery(f'Invalid {name}')
+
+
+def parse_datetime(args, name):
+    raw = args.get(name)
+    if raw is None or raw == '':
+        return None
+    try:
+        return datetime.fromisoformat(raw)
+    except ValueError:
+        raise InvalidQuery(f'Invalid {name}')
+
+
+# ============================================
+# PAGINATION
+# ============================================
+
+def keyset(query, sort_column, id_column, cursor=None, limit=50):
+    """Tri stable ``(sort_column, id) DESC``, curseur et ``limit + 1`` lignes.
+
+    ``query`` est une ``Query`` ORM ou un ``select()`` (session asynchrone).
+    """
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            sort_column < sort_value,
+            and_(sort_column == sort_value, id_column < row_id)
+        ))
+
+    return (query
+            .order_by(None)
+            .order_by(sort_column.desc(), id_column.desc())
+            .limit(limit + 1))
+
+
+def page(rows, sort_column, id_column, limit):
+    """Retirer la ligne en trop et calculer le curseur suivant"""
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    return rows, next_cursor
+
+
+def paginate(query, sort_column, id_column, cursor=None, limit=50):
+    """Appliquer le tri stable ``(sort_column, id) DESC`` et le curseur.
+
+    Retourne ``(rows, next_cursor)``. On lit ``limit + 1`` lignes pour savoir
+    s'il reste une page, sans ``COUNT`` ni ``OFFSET`` : chaque page coûte un
+    parcours d'index de taille fixe.
+    """
+    rows = keyset(query, sort_column, id_column, cursor, limit).all()
+    return page(rows, sort_column, id_column, limit)
+
+
+def with_next_cursor(response, next_cursor):
+    """Exposer le curseur suivant sans changer la forme (liste) du corps"""
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
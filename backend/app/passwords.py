@@ -0,0 +1,114 @@
+# backend/app/passwords.py
+"""Hachage des mots de passe : paramètres réglables, re-hachage, exécuteur borné.
+
+- ``PASSWORD_HASH_METHOD`` : méthode Werkzeug (``scrypt:32768:8:1`` par
+  défaut, ``scrypt:16384:8:1``, ``pbkdf2:sha256:600000``...) ; chaque
+  déploiement choisit son coût ;
+- à la connexion, un hash stocké avec d'autres paramètres est recalculé
+  avec les paramètres courants (le mot de passe en clair n'est connu qu'à
+  ce moment-là) ;
+- les calculs passent par un pool de ``PASSWORD_HASH_WORKERS`` threads
+  (hashlib relâche le GIL) : au plus autant de hachages simultanés par
+  processus, donc CPU et mémoire bornés (32 Mo par calcul scrypt par
+  défaut), et les autres requêtes du worker continuent d'être servies.
+  Au-delà de ``PASSWORD_HASH_QUEUE`` demandes en attente pendant
+  ``PASSWORD_HASH_TIMEOUT`` secondes : ``HashingBusy`` (503).
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+
+from . import db
+
+
+DEFAULT_METHOD = 'scrypt:32768:8:1'
+
+
+class HashingBusy(Exception):
+    """Trop de hachages en attente -> 503"""
+
+
+def normalize_method(method):
+    """Forme complète d'une méthode, telle que Werkzeug l'écrit dans le hash"""
+    name, *args = method.split(':')
+    if name == 'scrypt':
+        if args and len(args) != 3:
+            raise ValueError("'scrypt' takes 3 arguments (n:r:p)")
+        n, r, p = map(int, args) if args else (2 ** 15, 8, 1)
+        return f'scrypt:{n}:{r}:{p}'
+    if name == 'pbkdf2':
+        if len(args) > 2:
+            raise ValueError("'pbkdf2' takes 2 arguments (hash:iterations)")
+        hash_name = args[0] if args else 'sha256'
+        iterations = int(args[1]) if len(args) == 2 else DEFAULT_PBKDF2_ITERATIONS
+        return f'pbkdf2:{hash_name}:{iterations}'
+    raise ValueError(f'Unsupported password hash method: {method}')
+
+
+class PasswordHasher:
+    def __init__(self, method=DEFAULT_METHOD, workers=2, queue_size=16, timeout=10.0):
+        self.method = normalize_method(method)
+        self.timeout = timeout
+        # 0 : calcul dans le thread appelant (scripts, tests)
+        self._executor = None
+        if workers > 0:
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hash')
+        self._slots = threading.BoundedSemaphore(workers + queue_size) if workers > 0 else None
+
+    def _run(self, fn, *args):
+        if self._executor is None:
+            return fn(*args)
+        if not self._slots.acquire(timeout=self.timeout):
+            raise HashingBusy()
+        try:
+            return self._executor.submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """Hash calculé avec d'autres paramètres que ceux configurés"""
+        return password_hash.split('$', 1)[0] != self.method
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+
+def create_hasher(config):
+    return PasswordHasher(
+        config.get('PASSWORD_HASH_METHOD', DEFAULT_METHOD),
+        workers=config.get('PASSWORD_HASH_WORKERS', 2),
+        queue_size=config.get('PASSWORD_HASH_QUEUE', 16),
+        timeout=config.get('PASSWORD_HASH_TIMEOUT', 10.0),
+    )
+
+
+def get_hasher():
+    """Hacheur de l'application courante (créé à la demande)"""
+    hasher = current_app.extensions.get('password_hasher')
+    if hasher is None:
+        hasher = current_app.extensions['password_hasher'] = create_hasher(current_app.config)
+    return hasher
+
+
+def hash_password(password):
+    return get_hasher().hash(password)
+
+
+def verify_password(user, password):
+    """Vérifier ``password`` ; re-hacher et enregistrer si les paramètres ont changé"""
+    hasher = get_hasher()
+    if not hasher.verify(user.password_hash, password):
+        return False
+    if hasher.needs_rehash(user.password_hash):
+        user.password_hash = hasher.hash(password)
+        db.session.commit()
+    return True
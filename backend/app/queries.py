@@ -0,0 +1,105 @@
+# backend/app/queries.py
+"""Requêtes partagées par les routes (listes d'offres, dépôt d'offre, etc.).
+
+Les lectures servent aussi au mode ASGI : ``query.statement`` donne le
+``select()`` équivalent, exécuté par la session asynchrone. Les listes ne
+sélectionnent que les colonnes sérialisées (voir ``serializers.py``).
+"""
+from sqlalchemy.dialects import postgresql, sqlite
+
+from . import db
+from .models import Bid, Candidate, Project
+from .pagination import parse_datetime, parse_float
+from .serializers import PROJECT_COLUMNS
+
+
+# ============================================
+# LISTE DES PROJETS
+# ============================================
+
+def project_listing_query(args):
+    """Projets filtrés par les paramètres de ``GET /api/projects`` (lignes, pas d'objets ORM)"""
+    query = db.session.query(*PROJECT_COLUMNS)
+
+    if args.get('status'):
+        query = query.filter(Project.status == args['status'])
+    if args.get('project_type'):
+        query = query.filter(Project.project_type == args['project_type'])
+
+    min_budget = parse_float(args, 'min_budget')
+    max_budget = parse_float(args, 'max_budget')
+    if min_budget is not None:
+        query = query.filter(Project.budget >= min_budget)
+    if max_budget is not None:
+        query = query.filter(Project.budget <= max_budget)
+
+    deadline_after = parse_datetime(args, 'deadline_after')
+    deadline_before = parse_datetime(args, 'deadline_before')
+    if deadline_after is not None:
+        query = query.filter(Project.deadline >= deadline_after)
+    if deadline_before is not None:
+        query = query.filter(Project.deadline <= deadline_before)
+
+    return query
+
+
+# ============================================
+# LISTE DES OFFRES
+# ============================================
+
+def bid_listing_query(project_id=None, candidate_id=None, status=None):
+    """Offres avec titre du projet et raison sociale, en une seule requête.
+
+    Les jointures passent par les backrefs ``Bid.project`` / ``Bid.candidate``
+    et seules les colonnes nécessaires au JSON sont sélectionnées : le coût
+    est d'une requête SQL quel que soit le nombre d'offres (pas de N+1).
+    """
+    query = (
+        db.session.query(
+            Bid.id,
+            Bid.project_id,
+            Project.title.label('project_title'),
+            Candidate.company_name,
+            Bid.proposed_amount,
+            Bid.proposed_timeline,
+            Bid.status,
+            Bid.notes,
+            Bid.submitted_at,
+            Bid.updated_at,
+            Project.updated_at.label('project_updated_at'),
+        )
+        .outerjoin(Bid.project)
+        .outerjoin(Bid.candidate)
+    )
+
+    if project_id is not None:
+        query = query.filter(Bid.project_id == project_id)
+    if candidate_id is not None:
+        query = query.filter(Bid.candidate_id == candidate_id)
+    if status is not None:
+        query = query.filter(Bid.status == status)
+
+    return query.order_by(Bid.submitted_at.desc(), Bid.id.desc())
+
+
+# ============================================
+# DÉPÔT D'OFFRE
+# ============================================
+
+UPSERT_DIALECTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+
+def insert_bid(**values):
+    """Créer l'offre, ou rien si (projet, candidat) en a déjà une : id ou ``None``.
+
+    ``INSERT ... ON CONFLICT DO NOTHING RETURNING id`` : l'index unique
+    tranche entre deux soumissions concurrentes, sans exception ni rollback.
+    """
+    insert = UPSERT_DIALECTS[db.engine.dialect.name]
+    statement = (
+        insert(Bid)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=[Bid.project_id, Bid.candidate_id])
+        .returning(Bid.id)
+    )
+    return db.session.execute(statement).scalar()
@@ -0,0 +1,357 @@
+# backend/app/ratelimit.py
+"""Limitation de débit (seaux à jetons) et contrôle d'admission.
+
+Limites par route (``@rate_limit``), par adresse IP ou par utilisateur :
+``RATE_LIMIT_LOGIN``, ``RATE_LIMIT_REGISTER``, ``RATE_LIMIT_SUBMIT_BID``
+sous la forme ``"20/minute"`` (20 requêtes d'affilée au plus, puis une
+toutes les 3 s). Le seau est tenu par l'algorithme GCRA : une seule valeur
+par clé (l'instant théorique d'arrivée), mise à jour atomiquement.
+
+Backends (``RATE_LIMIT_BACKEND``) : ``memory`` (par processus) ou
+``redis`` (partagé entre workers, script Lua ; tout client compatible
+redis-py exposant ``eval``).
+
+Contrôle d'admission : avant que la latence ne s'effondre pour tout le
+monde, le processus refuse les nouvelles requêtes (429 + ``Retry-After``)
+quand ``ADMISSION_MAX_INFLIGHT`` requêtes sont déjà en cours, et une part
+d'entre elles quand le p99 des ``ADMISSION_WINDOW`` dernières secondes
+dépasse ``ADMISSION_P99_MS`` : part proportionnelle au dépassement, au
+plus ``ADMISSION_MAX_SHED`` (latence jusqu'aux en-têtes : les réponses en
+flux comptent dans les requêtes en cours jusqu'à leur fin, pas dans le
+p99). Les flux SSE (``/api/events``, ouverts plusieurs minutes) peuvent
+être refusés mais ne comptent ni dans les requêtes en cours ni dans le
+p99. ``/api/health`` et ``/api/metrics`` ne sont jamais refusées. Les
+routes asynchrones de ``asgi.py`` passent par le même contrôle.
+"""
+import math
+import random
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+from flask import current_app, g, jsonify, request
+from flask_jwt_extended import get_jwt_identity
+
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+EXEMPT_PATHS = ('/api/health', '/api/metrics')
+STREAM_PATHS = ('/api/events',)
+
+
+def parse_limit(value):
+    """``"20/minute"`` -> (20, 60) ; vide ou ``0`` : pas de limite"""
+    if not value or value.strip() in ('0', 'none'):
+        return None
+    count, _, period = value.strip().partition('/')
+    try:
+        count = int(count)
+        seconds = PERIODS[period.strip() or 'second']
+    except (KeyError, ValueError):
+        raise ValueError(f'Invalid rate limit: {value!r} (expected e.g. "20/minute")')
+    if count <= 0:
+        raise ValueError(f'Invalid rate limit: {value!r}')
+    return count, seconds
+
+
+def gcra(tat, now, interval, burst):
+    """Une demande sur un seau de ``burst`` jetons rechargé tous les ``interval``
+
+    ``tat`` : instant théorique d'arrivée enregistré (ou ``None``). Retourne
+    ``(nouveau tat, 0)`` si la demande passe, ``(tat, secondes d'attente)``
+    sinon.
+    """
+    tat = max(tat or now, now)
+    allow_at = tat + interval - burst * interval
+    if now < allow_at:
+        return tat, allow_at - now
+    return tat + interval, 0.0
+
+
+# ============================================
+# BACKENDS
+# ============================================
+
+class MemoryBuckets:
+    """Seaux du processus courant ; les clés pleines sont oubliées"""
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._tats = {}
+        self._lock = threading.Lock()
+
+    def take(self, key, interval, burst, now):
+        with self._lock:
+            tat, wait = gcra(self._tats.get(key), now, interval, burst)
+            if not wait:
+                if len(self._tats) >= self.max_keys and key not in self._tats:
+                    self._prune(now)
+                self._tats[key] = tat
+            return wait
+
+    def _prune(self, now):
+        # Un seau dont le tat est passé est plein : équivalent à une clé absente
+        for key in [k for k, tat in self._tats.items() if tat <= now]:
+            del self._tats[key]
+
+
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local burst = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1]) or ARGV[1])
+if tat < now then tat = now end
+local allow_at = tat + interval - burst * interval
+if now < allow_at then return tostring(allow_at - now) end
+redis.call('SET', KEYS[1], tostring(tat + interval), 'PX', math.ceil((tat + interval - now) * 1000))
+return '0'
+"""
+
+
+class RedisBuckets:
+    """Seaux partagés sur un serveur compatible Redis (mise à jour atomique en Lua)"""
+
+    def __init__(self, client, prefix='tender:ratelimit:'):
+        self.client = client
+        self.prefix = prefix
+
+    def take(self, key, interval, burst, now):
+        wait = self.client.eval(GCRA_SCRIPT, 1, self.prefix + key, repr(now), repr(interval), burst)
+        return float(wait)
+
+
+def create_buckets(config):
+    backend = config.get('RATE_LIMIT_BACKEND', 'memory')
+    if backend == 'memory':
+        return MemoryBuckets(max_keys=config.get('RATE_LIMIT_MAX_KEYS', 100000))
+    if backend == 'redis':
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError('RATE_LIMIT_BACKEND=redis requires redis (pip install redis)')
+        return RedisBuckets(redis.Redis.from_url(config['REDIS_URL']))
+    raise RuntimeError(f'Unknown RATE_LIMIT_BACKEND: {backend}')
+
+
+# ============================================
+# LIMITES PAR ROUTE
+# ============================================
+
+class RateLimiter:
+    def __init__(self, buckets, clock=time.time):
+        self.buckets = buckets
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.rejected = {}
+
+    def hit(self, rule, key, limit):
+        """Secondes d'attente avant la prochaine demande admise (0 : admise)"""
+        count, seconds = limit
+        wait = self.buckets.take(f'{rule}:{key}', seconds / count, count, self.clock())
+        if wait:
+            with self._lock:
+                self.rejected[rule] = self.rejected.get(rule, 0) + 1
+        return wait
+
+    def metrics_lines(self):
+        with self._lock:
+            rejected = sorted(self.rejected.items())
+        lines = ['# TYPE rate_limited_total counter']
+        lines.extend(f'rate_limited_total{{rule="{rule}"}} {count}' for rule, count in rejected)
+        return lines
+
+
+def create_rate_limiter(config):
+    return RateLimiter(create_buckets(config))
+
+
+def get_rate_limiter():
+    limiter = current_app.extensions.get('rate_limiter')
+    if limiter is None:
+        limiter = current_app.extensions['rate_limiter'] = create_rate_limiter(current_app.config)
+    return limiter
+
+
+def client_ip():
+    """Adresse du client ; ``TRUSTED_PROXIES`` mandataires devant l'application"""
+    hops = current_app.config.get('TRUSTED_PROXIES', 0)
+    if hops:
+        forwarded = [v.strip() for v in request.headers.get('X-Forwarded-For', '').split(',') if v.strip()]
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    return request.remote_addr or 'unknown'
+
+
+def too_many_requests(wait, message='Too many requests, retry later'):
+    response = jsonify({'message': message})
+    response.headers['Retry-After'] = str(max(1, math.ceil(wait)))
+    return response, 429
+
+
+def login_email():
+    """Compte visé par une tentative de connexion"""
+    data = request.get_json(silent=True) or {}
+    return f'email:{str(data.get("email", "")).strip().lower()}'
+
+
+def rate_limit(rule, per='ip'):
+    """Limiter la vue selon ``RATE_LIMIT_<RULE>``
+
+    ``per`` : ``'ip'``, ``'user'`` (sous ``@jwt_required``, identité du
+    jeton) ou une fonction retournant la clé.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            config = current_app.config
+            limit = parse_limit(config.get(f'RATE_LIMIT_{rule.upper()}'))
+            if limit and config.get('RATE_LIMIT_ENABLED', True):
+                if callable(per):
+                    key = per()
+                elif per == 'user':
+                    key = f'user:{get_jwt_identity()}'
+                else:
+                    key = f'ip:{client_ip()}'
+                wait = get_rate_limiter().hit(rule, key, limit)
+                if wait:
+                    return too_many_requests(wait)
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ============================================
+# CONTRÔLE D'ADMISSION
+# ============================================
+
+class AdmissionControl:
+    """Requêtes en cours et p99 glissant du processus"""
+
+    def __init__(self, max_inflight=0, p99_ms=0, window=10.0, min_samples=50, max_shed=0.9,
+                 clock=time.monotonic, random=random.random):
+        self.max_inflight = max_inflight
+        self.p99 = p99_ms / 1000
+        self.window = window
+        self.min_samples = min_samples
+        self.max_shed = max_shed
+        self.clock = clock
+        self.random = random
+        self.inflight = 0
+        self.shed = {}
+        self._samples = deque(maxlen=10000)
+        self._p99_value = None
+        self._p99_at = None
+        self._lock = threading.Lock()
+
+    def admit(self, track=True):
+        """``None`` si la requête est admise, sinon la raison du refus
+
+        ``track=False`` : requête admise sans entrer dans les requêtes en
+        cours (pas de ``release``), pour les flux de longue durée.
+        """
+        with self._lock:
+            reason = None
+            if self.max_inflight and self.inflight >= self.max_inflight:
+                reason = 'inflight'
+            elif self.p99 and self.random() < self._shed_ratio():
+                reason = 'latency'
+            if reason:
+                self.shed[reason] = self.shed.get(reason, 0) + 1
+                return reason
+            if track:
+                self.inflight += 1
+            return None
+
+    def release(self, duration):
+        """Fin de la requête ; ``duration`` : délai jusqu'aux en-têtes de la réponse"""
+        with self._lock:
+            self.inflight -= 1
+            self._samples.append((self.clock(), duration))
+
+    def _shed_ratio(self):
+        # Part refusée proportionnelle au dépassement (p99 à 1,5× le seuil :
+        # la moitié) ; les requêtes encore admises renouvellent la mesure
+        p99 = self._current_p99()
+        if p99 is None or p99 <= self.p99:
+            return 0.0
+        return min(self.max_shed, (p99 - self.p99) / self.p99)
+
+    def _current_p99(self):
+        # Recalcul au plus une fois par seconde ; les requêtes refusées ne
+        # sont pas mesurées
+        now = self.clock()
+        if self._p99_at is not None and now - self._p99_at < 1.0:
+            return self._p99_value
+        while self._samples and self._samples[0][0] < now - self.window:
+            self._samples.popleft()
+        durations = sorted(duration for _, duration in self._samples)
+        if len(durations) < self.min_samples:
+            self._p99_value = None
+        else:
+            self._p99_value = durations[min(len(durations) - 1, int(len(durations) * 0.99))]
+        self._p99_at = now
+        return self._p99_value
+
+    def metrics_lines(self):
+        with self._lock:
+            inflight = self.inflight
+            shed = sorted(self.shed.items())
+            p99 = self._p99_value
+        lines = ['# TYPE http_requests_in_flight gauge', f'http_requests_in_flight {inflight}',
+                 '# TYPE admission_shed_total counter']
+        lines.extend(f'admission_shed_total{{reason="{reason}"}} {count}' for reason, count in shed)
+        if p99 is not None:
+            lines.extend(['# TYPE admission_latency_p99_seconds gauge', f'admission_latency_p99_seconds {p99}'])
+        return lines
+
+
+def create_admission(config):
+    return AdmissionControl(
+        max_inflight=config.get('ADMISSION_MAX_INFLIGHT', 0),
+        p99_ms=config.get('ADMISSION_P99_MS', 0),
+        window=config.get('ADMISSION_WINDOW', 10.0),
+        min_samples=config.get('ADMISSION_MIN_SAMPLES', 50),
+        max_shed=config.get('ADMISSION_MAX_SHED', 0.9),
+    )
+
+
+def init_rate_limiting(app, registry):
+    """Limiteur et contrôle d'admission de ``app``"""
+    limiter = app.extensions['rate_limiter'] = create_rate_limiter(app.config)
+    registry.add_collector(lambda: app.extensions['rate_limiter'].metrics_lines())
+
+    app.extensions['admission'] = create_admission(app.config)
+    registry.add_collector(lambda: app.extensions['admission'].metrics_lines())
+
+    @app.before_request
+    def _admit():
+        if request.method == 'OPTIONS' or request.path in EXEMPT_PATHS:
+            return None
+        stream = request.path in STREAM_PATHS
+        if app.extensions['admission'].admit(track=not stream):
+            return too_many_requests(app.config.get('ADMISSION_RETRY_AFTER', 1),
+                                     'Server is overloaded, retry shortly')
+        if not stream:
+            g._admitted_at = time.perf_counter()
+        return None
+
+    @app.after_request
+    def _measure(response):
+        # Latence mesurée jusqu'aux en-têtes : un export ou une archive en
+        # flux garde la requête ouverte le temps du téléchargement, qui ne
+        # dit rien de la charge du processus
+        started = g.get('_admitted_at')
+        if started is not None:
+            g._admission_latency = time.perf_counter() - started
+        return response
+
+    @app.teardown_request
+    def _release(exc=None):
+        started = g.pop('_admitted_at', None)
+        if started is not None:
+            latency = g.pop('_admission_latency', None)
+            if latency is None:  # exception avant la réponse
+                latency = time.perf_counter() - started
+            app.extensions['admission'].release(latency)
+
+    return limiter
@@ -0,0 +1,15 @@
+# backend/app/routes/__init__.py
+"""Routes de l'API, un blueprint par domaine.
+
+Les blueprints ne dépendent d'aucune application à l'import : ils
+s'enregistrent sur autant d'applications que nécessaire
+(``register_blueprints(app)`` dans ``create_app``).
+"""
+from . import admin, auth, bids, documents, exports, projects, system
+
+BLUEPRINTS = (auth.bp, projects.bp, bids.bp, documents.bp, admin.bp, exports.bp, system.bp)
+
+
+def register_blueprints(app):
+    for blueprint in BLUEPRINTS:
+        app.register_blueprint(blueprint)
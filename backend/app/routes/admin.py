@@ -0,0 +1,191 @@
+# backend/app/routes/admin.py
+"""Administration : tableau de bord, offres, évaluation, attribution, comptes, file"""
+from flask import Blueprint, request, jsonify
+from datetime import datetime
+
+from .. import db
+from ..models import User, Project, Bid
+from ..auth import deactivate_user, role_required
+from ..queries import bid_listing_query
+from ..adjudication import apply_bid_status_changes, award_project
+from ..cache import invalidate_project_cache
+from ..database import replica_reads
+from ..events import publish_bid_status
+from ..jobs import queue_status
+from ..serializers import encode_rows, json_response, serialize_bid_row
+from ..stats import dashboard_stats, invalidate_dashboard_stats
+from ..scoring import InvalidWeights, default_weights, evaluate_project, parse_weights
+from ..pagination import InvalidQuery, paginate, parse_float, parse_int, parse_limit, with_next_cursor
+
+bp = Blueprint('admin', __name__)
+
+# ============================================
+# ADMIN - DASHBOARD
+# ============================================
+
+@bp.route('/api/admin/dashboard', methods=['GET'])
+@role_required('admin')
+def get_dashboard_stats():
+    """Statistiques pour le dashboard admin"""
+    try:
+        stats = dashboard_stats()
+        
+        return jsonify(stats), 200
+        
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+
+
+# ============================================
+# ADMIN - OFFRES
+# ============================================
+
+@bp.route('/api/admin/bids', methods=['GET'])
+@role_required('admin')
+@replica_reads
+def get_all_bids():
+    """Récupérer toutes les offres (admin)"""
+    try:
+        args = request.args
+        query = bid_listing_query(
+            project_id=parse_int(args, 'project_id'),
+            status=args.get('status') or None
+        )
+        rows, next_cursor = paginate(
+            query, Bid.submitted_at, Bid.id,
+            cursor=args.get('cursor'), limit=parse_limit(args)
+        )
+        
+        body = encode_rows('bid', rows, serialize_bid_row)
+        
+        return with_next_cursor(json_response(body), next_cursor), 200
+        
+    except InvalidQuery as e:
+        return jsonify({'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/admin/bids/<int:bid_id>/status', methods=['PUT'])
+@role_required('admin')
+def update_bid_status(bid_id):
+    """Mettre à jour le statut d'une offre (admin)"""
+    try:
+        bid = Bid.query.get_or_404(bid_id)
+        data = request.get_json()
+        
+        bid.status = data['status']
+        if 'notes' in data:
+            bid.notes = data['notes']
+        bid.reviewed_at = datetime.utcnow()
+        publish_bid_status([(bid.id, bid.project_id, bid.candidate_id, bid.status)])
+        
+        db.session.commit()
+        invalidate_dashboard_stats()
+        
+        return jsonify({'message': 'Bid status updated successfully'}), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/admin/bids/status', methods=['PUT'])
+@role_required('admin')
+def update_bid_statuses():
+    """Changer le statut de plusieurs offres en une transaction (admin)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        changes = data.get('updates')
+        if not isinstance(changes, list) or not changes:
+            return jsonify({'message': 'updates must be a non-empty list'}), 400
+        
+        results = apply_bid_status_changes(changes)
+        db.session.commit()
+        invalidate_dashboard_stats()
+        
+        return jsonify({
+            'updated': sum(1 for r in results if r['result'] == 'updated'),
+            'results': results
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/admin/projects/<int:project_id>/evaluation', methods=['GET'])
+@role_required('admin')
+def evaluate_project_bids(project_id):
+    """Classement des offres d'un projet selon les critères pondérés (admin)"""
+    try:
+        project = db.session.get(Project, project_id)
+        if project is None:
+            return jsonify({'message': 'Project not found'}), 404
+        
+        args = request.args
+        weights = parse_weights(args.get('weights'), default_weights())
+        k = parse_float(args, 'k')
+        
+        return jsonify(evaluate_project(project, weights=weights, k=k)), 200
+        
+    except (InvalidQuery, InvalidWeights) as e:
+        return jsonify({'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/admin/projects/<int:project_id>/award', methods=['POST'])
+@role_required('admin')
+def award_project_bid(project_id):
+    """Attribuer un marché : offre retenue acceptée, les autres rejetées (admin)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        bid_id = data.get('bid_id')
+        if not isinstance(bid_id, int) or isinstance(bid_id, bool):
+            return jsonify({'message': 'bid_id is required'}), 400
+        
+        rejected = award_project(project_id, bid_id, notes=data.get('notes'))
+        if rejected is None:
+            return jsonify({'message': 'Bid not found for this project'}), 404
+        
+        db.session.commit()
+        invalidate_dashboard_stats()
+        invalidate_project_cache()
+        
+        return jsonify({
+            'message': 'Project awarded successfully',
+            'accepted_bid_id': bid_id,
+            'rejected_bids': rejected
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/admin/users/<int:user_id>/deactivate', methods=['POST'])
+@role_required('admin')
+def deactivate_user_account(user_id):
+    """Désactiver un compte (admin) : ses jetons sont refusés"""
+    try:
+        user = db.get_or_404(User, user_id)
+        deactivate_user(user)
+        db.session.commit()
+        
+        return jsonify({'message': 'User deactivated successfully'}), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/admin/jobs', methods=['GET'])
+@role_required('admin')
+def get_job_queue_status():
+    """Profondeur de la file de travaux et durées d'exécution (admin)"""
+    try:
+        return jsonify(queue_status()), 200
+        
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
@@ -0,0 +1,113 @@
+# backend/app/routes/auth.py
+"""Inscription, connexion, déconnexion"""
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required
+
+from .. import db
+from ..models import User, Candidate
+from ..auth import issue_access_token, revoke_current_token
+from ..passwords import HashingBusy, hash_password, verify_password
+from ..ratelimit import login_email, rate_limit
+
+bp = Blueprint('auth', __name__)
+
+# ============================================
+# AUTHENTIFICATION
+# ============================================
+
+@bp.route('/api/auth/register', methods=['POST'])
+@rate_limit('register')
+def register():
+    """Inscription d'un nouveau candidat"""
+    try:
+        data = request.get_json()
+        
+        # Vérifier si l'email existe déjà
+        if User.query.filter_by(email=data['email']).first():
+            return jsonify({'message': 'Email already registered'}), 400
+        
+        # Créer l'utilisateur
+        user = User(
+            username=data['username'],
+            email=data['email'],
+            password_hash=hash_password(data['password']),
+            role='candidate'
+        )
+        db.session.add(user)
+        db.session.flush()
+        
+        # Créer le profil candidat
+        candidate = Candidate(
+            user_id=user.id,
+            company_name=data.get('company_name'),
+            phone=data.get('phone'),
+            address=data.get('address'),
+            registration_number=data.get('registration_number')
+        )
+        db.session.add(candidate)
+        db.session.commit()
+        
+        return jsonify({'message': 'User registered successfully'}), 201
+        
+    except HashingBusy:
+        db.session.rollback()
+        return _hashing_busy()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/auth/login', methods=['POST'])
+@rate_limit('login')
+@rate_limit('login_account', per=login_email)
+def login():
+    """Connexion"""
+    try:
+        data = request.get_json()
+        user = User.query.filter_by(email=data['email']).first()
+        
+        # Re-hachage transparent si les paramètres de hachage ont changé
+        if not user or not verify_password(user, data['password']):
+            return jsonify({'message': 'Invalid credentials'}), 401
+        
+        if user.is_active is False:
+            return jsonify({'message': 'Account is disabled'}), 403
+        
+        # Rôle et candidat dans le jeton : plus de lecture User par requête
+        access_token = issue_access_token(user)
+        
+        return jsonify({
+            'access_token': access_token,
+            'user': {
+                'id': user.id,
+                'username': user.username,
+                'email': user.email,
+                'role': user.role
+            }
+        }), 200
+        
+    except HashingBusy:
+        return _hashing_busy()
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+
+
+def _hashing_busy():
+    """Hachages en attente saturés : réessayer un peu plus tard"""
+    response = jsonify({'message': 'Authentication service busy, retry shortly'})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
+
+@bp.route('/api/auth/logout', methods=['POST'])
+@jwt_required()
+def logout():
+    """Déconnexion : révoquer le jeton courant (tous les workers)"""
+    try:
+        revoke_current_token()
+        db.session.commit()
+        return jsonify({'message': 'Logged out'}), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'message': str(e)}), 500
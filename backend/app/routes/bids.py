@@ -0,0 +1,181 @@
+# backend/app/routes/bids.py
+"""Offres du candidat : soumission, liste des siennes"""
+from flask import Blueprint, current_app, request, jsonify
+from flask_jwt_extended import get_jwt_identity
+from datetime import datetime
+from werkzeug.utils import secure_filename
+from sqlalchemy.exc import IntegrityError
+
+from .. import db
+from ..models import Project, Bid, Document
+from ..auth import current_candidate_id, role_required
+from ..queries import bid_listing_query, insert_bid
+from ..database import replica_reads
+from ..idempotency import IdempotentRequest
+from ..events import publish
+from ..jobs import enqueue
+from ..ratelimit import rate_limit
+from ..storage import get_storage
+from ..serializers import encode_rows, json_response, serialize_bid_row
+from ..stats import invalidate_dashboard_stats
+from ..scoring import record_bids
+from ..pagination import InvalidQuery, paginate, parse_int, parse_limit, with_next_cursor
+
+bp = Blueprint('bids', __name__)
+
+# ============================================
+# OFFRES (BIDS) - CANDIDAT
+# ============================================
+
+@bp.route('/api/projects/<int:project_id>/bids', methods=['POST'])
+@role_required('candidate')
+@rate_limit('submit_bid', per='user')
+def submit_bid(project_id):
+    """Soumettre une offre pour un projet (rejouable avec ``Idempotency-Key``)"""
+    staged = []
+    try:
+        candidate_id = current_candidate_id()
+        if candidate_id is None:
+            return jsonify({'message': 'Candidate profile not found'}), 404
+        
+        # Les champs arrivent en multipart (frontend) ou en JSON
+        form = request.form if request.form else (request.get_json(silent=True) or {})
+        fields = dict(form.items())
+        fields.update({name: file.filename for name, file in request.files.items()})
+        idempotency = IdempotentRequest.from_request(int(get_jwt_identity()), fields)
+        
+        def reject(message, status=400):
+            # Échec après un premier envoi réussi (projet clos depuis, doublon) : on le rejoue
+            replay = idempotency.replay() if idempotency else None
+            return replay or (jsonify({'message': message}), status)
+        
+        # Vérifier que le projet existe et est ouvert
+        project = db.session.get(Project, project_id)
+        if project is None:
+            return reject('Project not found', 404)
+        if project.status != 'open':
+            return reject('Project is not open for bidding')
+        # Échéance dépassée mais pas encore clôturée par le planificateur
+        if project.deadline <= datetime.utcnow():
+            return reject('The bidding deadline has passed')
+        
+        if form.get('proposed_amount') in (None, ''):
+            return jsonify({'message': 'proposed_amount is required'}), 400
+        
+        # L'index unique (project_id, candidate_id) refuse les doublons,
+        # y compris entre deux soumissions concurrentes (ON CONFLICT DO NOTHING)
+        bid_id = insert_bid(
+            project_id=project_id,
+            candidate_id=candidate_id,
+            proposed_amount=form.get('proposed_amount'),
+            proposed_timeline=form.get('proposed_timeline'),
+            notes=form.get('notes'),
+            status='submitted'
+        )
+        if bid_id is None:
+            db.session.rollback()
+            return reject('You have already submitted a bid for this project')
+        
+        # Fichiers en zone de transit : publiés seulement après le commit
+        storage = get_storage()
+        documents = []
+        for document_type in ('technical_proposal', 'financial_proposal'):
+            file = request.files.get(document_type)
+            if file and file.filename:
+                staged.append(storage.stage(file.stream))
+                
+                doc = Document(
+                    bid_id=bid_id,
+                    document_type=document_type,
+                    file_name=secure_filename(file.filename),
+                    file_path=staged[-1].key,
+                    file_size=staged[-1].size
+                )
+                db.session.add(doc)
+                documents.append(doc)
+        
+        db.session.flush()
+        document_ids = [doc.id for doc in documents]
+        
+        body = {'message': 'Bid submitted successfully', 'bid_id': bid_id}
+        if idempotency:
+            idempotency.remember(201, body)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Clé enregistrée entre-temps par un envoi concurrent
+            db.session.rollback()
+            for item in staged:
+                storage.discard(item)
+            return reject('A request with this Idempotency-Key is already being processed', 409)
+        
+        for item in staged:
+            storage.promote(item)
+        staged = []  # publiés : plus rien à abandonner
+        
+        # Offre validée : vérifications en arrière-plan, la réponse n'attend
+        # pas leur exécution, et notification de l'administration
+        try:
+            for document_id in document_ids:
+                enqueue('verify_document', document_id=document_id)
+            publish('admin', 'bid.submitted', {
+                'bid_id': bid_id,
+                'project_id': project_id,
+                'candidate_id': candidate_id,
+                'documents': len(document_ids)
+            })
+            db.session.commit()
+        except Exception:
+            # L'offre reste enregistrée ; ses documents restent non vérifiés
+            db.session.rollback()
+            current_app.logger.exception('Could not enqueue verification for bid %s', bid_id)
+        
+        invalidate_dashboard_stats()
+        record_bids(project_id, [bid_id])
+        
+        return jsonify(body), 201
+        
+    except InvalidQuery as e:
+        return jsonify({'message': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        for item in staged:
+            get_storage().discard(item)
+        current_app.logger.exception('Error in submit_bid')
+        return jsonify({'message': str(e)}), 500
+
+
+# ============================================
+# CANDIDAT - MES OFFRES
+# ============================================
+
+@bp.route('/api/bids', methods=['GET'])
+@bp.route('/api/bids/mine', methods=['GET'])
+@role_required('candidate')
+@replica_reads
+def get_my_bids():
+    """Récupérer les offres du candidat connecté"""
+    try:
+        candidate_id = current_candidate_id()
+        if candidate_id is None:
+            return jsonify([]), 200
+        
+        args = request.args
+        query = bid_listing_query(
+            candidate_id=candidate_id,
+            project_id=parse_int(args, 'project_id'),
+            status=args.get('status') or None
+        )
+        rows, next_cursor = paginate(
+            query, Bid.submitted_at, Bid.id,
+            cursor=args.get('cursor'), limit=parse_limit(args)
+        )
+        
+        body = encode_rows('bid', rows, serialize_bid_row)
+        
+        return with_next_cursor(json_response(body), next_cursor), 200
+        
+    except InvalidQuery as e:
+        return jsonify({'message': str(e)}), 400
+    except Exception as e:
+        current_app.logger.exception('Error in get_my_bids')
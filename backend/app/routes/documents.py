@@ -0,0 +1,66 @@
+# backend/app/routes/documents.py
+"""Téléchargement des documents d'offre, à l'unité ou en archive"""
+from flask import Blueprint, jsonify
+
+from .. import db
+from ..models import Candidate, Bid, Document
+from ..auth import current_candidate_id, current_role, role_required
+from ..documents import document_response, zip_archive_name, zip_response
+from ..storage import get_storage
+
+bp = Blueprint('documents', __name__)
+
+# ============================================
+# DOCUMENTS
+# ============================================
+
+@bp.route('/api/documents/<int:document_id>', methods=['GET'])
+@role_required('admin', 'candidate')
+def download_document(document_id):
+    """Télécharger un document d'offre (admin, ou candidat propriétaire)"""
+    try:
+        document = (
+            db.session.query(Document.file_name, Document.file_path, Bid.candidate_id)
+            .join(Document.bid)
+            .filter(Document.id == document_id)
+            .first()
+        )
+        if document is None:
+            return jsonify({'message': 'Document not found'}), 404
+        
+        if current_role() != 'admin' and document.candidate_id != current_candidate_id():
+            return jsonify({'message': 'Unauthorized'}), 403
+        
+        return document_response(get_storage(), document.file_path, document.file_name)
+        
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/admin/projects/<int:project_id>/documents/archive', methods=['GET'])
+@role_required('admin')
+def download_project_documents(project_id):
+    """Tous les documents d'un projet, en archive ZIP produite en flux (admin)"""
+    try:
+        documents = (
+            db.session.query(
+                Document.document_type, Document.file_name, Document.file_path,
+                Candidate.company_name
+            )
+            .join(Document.bid)
+            .join(Bid.candidate)
+            .filter(Bid.project_id == project_id)
+            .order_by(Candidate.company_name, Document.id)
+            .all()
+        )
+        
+        used = set()
+        entries = [
+            (zip_archive_name(d.company_name, d.document_type, d.file_name, used), d.file_path)
+            for d in documents
+        ]
+        
+        return zip_response(get_storage(), entries, f'project_{project_id}_documents.zip')
+        
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
@@ -0,0 +1,93 @@
+# backend/app/routes/exports.py
+"""Exports des offres : en flux, ou préparés en arrière-plan (admin)"""
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import get_jwt_identity
+
+from .. import db
+from ..models import Export
+from ..auth import role_required
+from ..database import replica_reads
+from ..documents import document_response
+from ..exports import (
+    export_file_name, export_response, parse_export_filters, parse_export_format, request_export,
+    serialize_export
+)
+from ..storage import get_storage
+from ..pagination import InvalidQuery
+
+bp = Blueprint('exports', __name__)
+
+# ============================================
+# ADMIN - EXPORTS
+# ============================================
+
+@bp.route('/api/admin/exports/bids', methods=['GET'])
+@role_required('admin')
+@replica_reads
+def export_bids():
+    """Export CSV/XLSX des offres, produit en flux (admin)"""
+    try:
+        fmt = parse_export_format(request.args.get('format'))
+        filters = parse_export_filters(request.args)
+        
+        return export_response(fmt, filters)
+        
+    except InvalidQuery as e:
+        return jsonify({'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/admin/exports', methods=['POST'])
+@role_required('admin')
+def create_export():
+    """Préparer un export en arrière-plan, pour les grandes périodes (admin)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        fmt = parse_export_format(data.get('format'))
+        filters = parse_export_filters(data)
+        
+        export = request_export(fmt, filters, requested_by=int(get_jwt_identity()))
+        
+        response = jsonify(serialize_export(export))
+        response.headers['Location'] = f'/api/admin/exports/{export.id}'
+        return response, 202
+        
+    except InvalidQuery as e:
+        return jsonify({'message': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/admin/exports/<int:export_id>', methods=['GET'])
+@role_required('admin')
+def get_export(export_id):
+    """État d'un export préparé (admin)"""
+    try:
+        export = db.session.get(Export, export_id)
+        if export is None:
+            return jsonify({'message': 'Export not found'}), 404
+        
+        return jsonify(serialize_export(export)), 200
+        
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/admin/exports/<int:export_id>/download', methods=['GET'])
+@role_required('admin')
+def download_export(export_id):
+    """Télécharger un export préparé (admin)"""
+    try:
+        export = db.session.get(Export, export_id)
+        if export is None:
+            return jsonify({'message': 'Export not found'}), 404
+        if export.status != 'ready':
+            return jsonify({'message': 'Export is not ready', 'status': export.status}), 409
+        
+        return document_response(get_storage(), export.file_key,
+                                 export_file_name(export.format, export.filters, export.id))
+        
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
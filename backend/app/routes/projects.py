@@ -0,0 +1,193 @@
+# backend/app/routes/projects.py
+"""Projets : consultation publique (listes en cache), gestion (admin)"""
+from flask import Blueprint, request, jsonify
+from datetime import datetime
+
+from .. import db
+from ..models import Bid, Project
+from ..auth import role_required
+from ..queries import project_listing_query
+from ..cache import cached_response, invalidate_project_cache, projects_etag, projects_last_modified
+from ..database import replica_reads
+from ..events import publish_project_status
+from ..search import search_projects
+from ..serializers import (
+    PROJECT_COLUMNS, encode_row, encode_rows, json_response, serialize_project, serialize_search_result
+)
+from ..stats import invalidate_dashboard_stats
+from ..scoring import invalidate_bid_scores
+from ..pagination import InvalidQuery, paginate, parse_limit, with_next_cursor
+
+bp = Blueprint('projects', __name__)
+
+# ============================================
+# PROJETS (PUBLIC)
+# ============================================
+
+@bp.route('/api/projects', methods=['GET'])
+@cached_response('projects')
+@replica_reads
+def get_projects():
+    """Récupérer les projets, filtrés et paginés par curseur"""
+    try:
+        args = request.args
+        query = project_listing_query(args)
+        
+        projects, next_cursor = paginate(
+            query, Project.created_at, Project.id,
+            cursor=args.get('cursor'), limit=parse_limit(args)
+        )
+        
+        response = json_response(encode_rows('project', projects, serialize_project))
+        response.set_etag(projects_etag(projects))
+        response.last_modified = projects_last_modified(projects)
+        
+        return with_next_cursor(response, next_cursor), 200
+        
+    except InvalidQuery as e:
+        return jsonify({'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/projects/search', methods=['GET'])
+@cached_response('projects')
+@replica_reads
+def search_projects_view():
+    """Recherche plein texte (titre, description), triée par pertinence"""
+    try:
+        args = request.args
+        terms = (args.get('q') or '').strip()
+        if not terms:
+            return jsonify({'message': 'Search query is required'}), 400
+        
+        rows, next_cursor = search_projects(
+            terms,
+            status=args.get('status'),
+            project_type=args.get('project_type'),
+            cursor=args.get('cursor'),
+            limit=parse_limit(args)
+        )
+        
+        # Rang et extrait propres à la recherche : pas de fragments en cache
+        response = json_response(encode_rows('search', rows, serialize_search_result, cache=False))
+        response.set_etag(projects_etag(rows))
+        response.last_modified = projects_last_modified(rows)
+        
+        return with_next_cursor(response, next_cursor), 200
+        
+    except InvalidQuery as e:
+        return jsonify({'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/projects/<int:project_id>', methods=['GET'])
+@cached_response('projects')
+@replica_reads
+def get_project(project_id):
+    """Récupérer un projet spécifique"""
+    try:
+        project = db.session.query(*PROJECT_COLUMNS).filter(Project.id == project_id).first()
+        if project is None:
+            return jsonify({'message': 'Project not found'}), 404
+        
+        response = json_response(encode_row('project', project, serialize_project))
+        response.set_etag(projects_etag([project]))
+        response.last_modified = projects_last_modified([project])
+        
+        return response, 200
+        
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+
+
+# ============================================
+# ADMIN - PROJETS
+# ============================================
+
+@bp.route('/api/projects', methods=['POST'])
+@role_required('admin')
+def create_project():
+    """Créer un nouveau projet (admin)"""
+    try:
+        data = request.get_json()
+        
+        project = Project(
+            title=data['title'],
+            description=data['description'],
+            project_type=data['project_type'],
+            budget=data['budget'],
+            deadline=datetime.fromisoformat(data['deadline']),
+            status='open'
+        )
+        
+        db.session.add(project)
+        db.session.commit()
+        invalidate_dashboard_stats()
+        invalidate_project_cache()
+        
+        return jsonify({
+            'message': 'Project created successfully',
+            'id': project.id,
+            'project_id': project.id
+        }), 201
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/projects/<int:project_id>', methods=['PUT'])
+@role_required('admin')
+def update_project(project_id):
+    """Mettre à jour un projet (admin)"""
+    try:
+        project = Project.query.get_or_404(project_id)
+        data = request.get_json()
+        
+        if 'title' in data:
+            project.title = data['title']
+        if 'description' in data:
+            project.description = data['description']
+        if 'project_type' in data:
+            project.project_type = data['project_type']
+        if 'budget' in data:
+            project.budget = data['budget']
+        if 'deadline' in data:
+            project.deadline = datetime.fromisoformat(data['deadline'])
+        status_changed = 'status' in data and data['status'] != project.status
+        if 'status' in data:
+            project.status = data['status']
+        if status_changed:
+            bidders = db.session.query(Bid.candidate_id).filter(Bid.project_id == project_id)
+            publish_project_status(project_id, project.status, [c for (c,) in bidders])
+        
+        db.session.commit()
+        invalidate_dashboard_stats()
+        invalidate_project_cache()
+        
+        return jsonify({'message': 'Project updated successfully'}), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'message': str(e)}), 500
+
+
+@bp.route('/api/projects/<int:project_id>', methods=['DELETE'])
+@role_required('admin')
+def delete_project(project_id):
+    """Supprimer un projet (admin)"""
+    try:
+        project = Project.query.get_or_404(project_id)
+        db.session.delete(project)
+        db.session.commit()
+        invalidate_dashboard_stats()
+        invalidate_project_cache()
+        invalidate_bid_scores(project_id)
+        
+        return jsonify({'message': 'Project deleted successfully'}), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'message': str(e)}), 500
@@ -0,0 +1,82 @@
+# backend/app/routes/system.py
+"""Notifications temps réel (SSE), santé et métriques du processus"""
+import hmac
+
+from flask import Blueprint, Response, current_app, request, jsonify
+from flask_jwt_extended import verify_jwt_in_request
+
+from ..auth import current_candidate_id, current_role
+from ..events import Subscription, stream_events
+from ..instrumentation import render_metrics
+from ..pagination import InvalidQuery, parse_float, parse_int
+
+bp = Blueprint('system', __name__)
+
+# ============================================
+# NOTIFICATIONS TEMPS RÉEL
+# ============================================
+
+@bp.route('/api/events', methods=['GET'])
+def stream_notifications():
+    """Flux SSE : statut de mes offres (candidat), nouvelles offres (admin)"""
+    # EventSource ne sait pas envoyer d'en-tête : jeton accepté en ?jwt=
+    verify_jwt_in_request(locations=['headers', 'query_string'])
+    try:
+        args = request.args
+        role = current_role()
+        if role == 'admin':
+            channels = ['admin']
+            project_id = parse_int(args, 'project_id')
+        else:
+            candidate_id = current_candidate_id()
+            if candidate_id is None:
+                return jsonify({'message': 'Candidate profile not found'}), 404
+            channels = [f'candidate:{candidate_id}']
+            project_id = None
+        
+        max_duration = parse_float(args, 'max_duration')
+        if max_duration is not None:
+            max_duration = min(max(max_duration, 0), current_app.config['SSE_MAX_DURATION'])
+        
+        subscription = Subscription(channels, project_id, current_app.config['SSE_BUFFER_SIZE'])
+        last_event_id = request.headers.get('Last-Event-ID') or args.get('last_event_id')
+        
+        return Response(
+            stream_events(subscription, last_event_id, max_duration),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+        
+    except InvalidQuery as e:
+        return jsonify({'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+
+
+# ============================================
+# HEALTH CHECK
+# ============================================
+
+@bp.route('/api/health', methods=['GET'])
+def health_check():
+    """Health check endpoint"""
+    return jsonify({'status': 'healthy'}), 200
+
+
+def _metrics_token_valid():
+    """En-tête ``Authorization: Bearer <METRICS_TOKEN>`` du collecteur"""
+    expected = current_app.config.get('METRICS_TOKEN')
+    header = request.headers.get('Authorization', '')
+    if not expected or not header.startswith('Bearer '):
+        return False
+    return hmac.compare_digest(header[7:].encode(), expected.encode())
+
+
+@bp.route('/api/metrics', methods=['GET'])
+def metrics():
+    """Métriques au format texte Prometheus : collecteur (``METRICS_TOKEN``) ou admin"""
+    if not _metrics_token_valid():
+        verify_jwt_in_request()
+        if current_role() != 'admin':
+            return jsonify({'message': 'Unauthorized'}), 403
+    return Response(render_metrics(current_app), mimetype='text/plain; version=0.0.4')
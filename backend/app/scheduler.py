@@ -0,0 +1,245 @@
+# backend/app/scheduler.py
+"""Tâches planifiées : clôture des appels d'offres échus, balayages.
+
+Toutes les ``SCHEDULER_INTERVAL`` secondes, un tick passe en ``closed``
+les projets ``open`` dont la date limite est dépassée, en un seul
+``UPDATE`` ensembliste. L'index ``ix_projects_status_deadline`` range les
+projets de chaque statut par échéance : un tick parcourt seulement la
+plage des projets ouverts échus, quel que soit le nombre total de projets.
+Chaque projet clôturé est annoncé (``project.status``) à l'administration
+et à ses soumissionnaires, au commit du tick, comme une clôture manuelle.
+
+Le planificateur tourne dans chaque worker gunicorn (``gunicorn.conf.py``)
+ou dans un processus dédié (``flask scheduler run``). Sous PostgreSQL, un
+verrou consultatif de transaction élit un seul exécutant par tick ; sous
+SQLite, l'écriture est déjà sérialisée par la base et l'``UPDATE`` est
+idempotent.
+
+Après chaque tick, ``sweep`` purge les clés d'idempotence et les
+révocations de jetons expirées, et reprend les fichiers de dépôt restés
+en zone de transit (processus interrompu entre le commit et la
+publication, ou transaction échouée). La zone de transit
+(``UPLOAD_FOLDER/.staging``) est commune à tous les workers : le balayage
+prend le même verrou consultatif que le tick. Sous SQLite, sans verrou,
+deux balayages peuvent se croiser : un fichier déjà promu ou supprimé par
+l'autre est simplement ignoré.
+"""
+import threading
+import time
+from datetime import datetime
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import func, select, update
+
+from . import db
+from .auth import purge_revoked_tokens
+from .cache import invalidate_project_cache
+from .jobs import get_metrics
+from .events import publish_project_status
+from .idempotency import purge_idempotency_keys
+from .models import Bid, Document, Project
+from .stats import invalidate_dashboard_stats
+from .storage import get_storage
+
+
+# Clé du verrou consultatif PostgreSQL (arbitraire, propre à l'application)
+LEADER_LOCK_KEY = 0x7E4DE401
+
+
+def acquire_leader_lock():
+    """Élire l'exécutant du tick ; le verrou est libéré à la fin de la transaction"""
+    if db.engine.dialect.name != 'postgresql':
+        return True
+    return bool(db.session.execute(select(func.pg_try_advisory_xact_lock(LEADER_LOCK_KEY))).scalar())
+
+
+def close_expired_projects(now):
+    """Clôturer en une requête les projets ouverts échus ; retourne leurs ``id``"""
+    return db.session.scalars(
+        update(Project)
+        .where(Project.status == 'open', Project.deadline <= now)
+        .values(status='closed', updated_at=now)
+        .returning(Project.id)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+
+def publish_closed_projects(project_ids):
+    """``project.status`` de chaque projet clôturé, envoyé au commit"""
+    bidders = {project_id: set() for project_id in project_ids}
+    rows = db.session.execute(
+        select(Bid.project_id, Bid.candidate_id).where(Bid.project_id.in_(project_ids))
+    )
+    for project_id, candidate_id in rows:
+        bidders[project_id].add(candidate_id)
+    for project_id, candidate_ids in bidders.items():
+        publish_project_status(project_id, 'closed', candidate_ids)
+
+
+def tick(now=None):
+    """Un passage du planificateur ; ``None`` si un autre worker a la main"""
+    now = now or datetime.utcnow()
+    started = time.perf_counter()
+    try:
+        if not acquire_leader_lock():
+            db.session.rollback()
+            return None
+        closed = close_expired_projects(now)
+        if closed:
+            publish_closed_projects(closed)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        get_metrics().record('scheduler_tick', (time.perf_counter() - started) * 1000, False)
+        raise
+
+    if closed:
+        invalidate_project_cache()
+        invalidate_dashboard_stats()
+    get_metrics().record('scheduler_tick', (time.perf_counter() - started) * 1000, True)
+    return {'closed_projects': len(closed)}
+
+
+def sweep_staged_uploads(max_age):
+    """Fichiers de transit abandonnés : ``(promus, supprimés)``.
+
+    Si un document validé y fait référence, seule la publication manquait :
+    elle est refaite. Sinon la transaction a échoué et le fichier est supprimé.
+    """
+    storage = get_storage()
+    stale = list(storage.stale_staged(max_age))
+    keys = {staged.key for staged in stale if staged.key}
+    referenced = set()
+    if keys:
+        referenced = set(db.session.scalars(
+            select(Document.file_path).where(Document.file_path.in_(keys))
+        ))
+    promoted = discarded = 0
+    for staged in stale:
+        if staged.key in referenced:
+            try:
+                storage.promote(staged)
+            except FileNotFoundError:
+                continue  # déjà repris par un autre balayage
+            promoted += 1
+        else:
+            storage.discard(staged)
+            discarded += 1
+    return promoted, discarded
+
+
+def sweep(now=None):
+    """Purger les clés d'idempotence et révocations expirées, et la zone de transit
+
+    ``None`` si un autre worker a la main.
+    """
+    now = now or datetime.utcnow()
+    started = time.perf_counter()
+    try:
+        if not acquire_leader_lock():
+            db.session.rollback()
+            return None
+        expired_keys = purge_idempotency_keys(now)
+        expired_tokens = purge_revoked_tokens(now)
+        # Fichiers traités sous le verrou, validé avec la purge
+        promoted, discarded = sweep_staged_uploads(current_app.config.get('STAGING_MAX_AGE', 3600))
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        get_metrics().record('scheduler_sweep', (time.perf_counter() - started) * 1000, False)
+        raise
+    get_metrics().record('scheduler_sweep', (time.perf_counter() - started) * 1000, True)
+    return {'expired_keys': expired_keys, 'expired_tokens': expired_tokens,
+            'promoted_files': promoted, 'discarded_files': discarded}
+
+
+class Scheduler:
+    """Thread qui appelle ``tick()`` à intervalle régulier"""
+
+    def __init__(self, app, interval=60.0):
+        self.app = app
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _loop(self):
+        with self.app.app_context():
+            while not self._stop.is_set():
+                try:
+                    result = tick()
+                    if result and result['closed_projects']:
+                        self.app.logger.info('Closed %d expired project(s)', result['closed_projects'])
+                    swept = sweep()
+                    if swept and (swept['promoted_files'] or swept['discarded_files']):
+                        self.app.logger.info('Staged uploads: %d promoted, %d discarded',
+                                             swept['promoted_files'], swept['discarded_files'])
+                except Exception:
+                    self.app.logger.exception('Scheduler tick failed')
+                finally:
+                    db.session.remove()
+                self._stop.wait(self.interval)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, name='scheduler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def join(self):
+        self._thread.join()
+
+
+def start_scheduler(app):
+    """Démarrer le planificateur du processus si ``SCHEDULER_ENABLED``"""
+    if not app.config.get('SCHEDULER_ENABLED'):
+        return None
+    scheduler = app.extensions.get('scheduler')
+    if scheduler is None:
+        scheduler = app.extensions['scheduler'] = Scheduler(
+            app, app.config.get('SCHEDULER_INTERVAL', 60.0)
+        ).start()
+    return scheduler
+
+
+# ============================================
+# CLI
+# ============================================
+
+scheduler_cli = AppGroup('scheduler', help='Periodic maintenance tasks.')
+
+
+@scheduler_cli.command('run')
+def run_command():
+    """Lancer le planificateur au premier plan"""
+    app = current_app._get_current_object()
+    interval = app.config.get('SCHEDULER_INTERVAL', 60.0)
+    scheduler = Scheduler(app, interval)
+    click.echo(f'Scheduler started (every {interval:g}s)')
+    scheduler.start()
+    try:
+        scheduler.join()
+    except KeyboardInterrupt:
+        scheduler.stop()
+
+
+@scheduler_cli.command('tick')
+def tick_command():
+    """Exécuter un seul passage (cron) puis rendre la main"""
+    result = tick()
+    if result is None:
+        click.echo('Another worker holds the scheduler lock')
+    else:
+        click.echo(f"{result['closed_projects']} expired project(s) closed")
+    swept = sweep()
+    if swept is None:
+        click.echo('Another worker holds the sweep lock')
+        return
+    click.echo(f"{swept['expired_keys']} expired idempotency key(s) and "
+               f"{swept['expired_tokens']} expired token revocation(s) purged, "
+               f"{swept['promoted_files']} staged file(s) promoted, {swept['discarded_files']} discarded")
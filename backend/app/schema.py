@@ -0,0 +1,89 @@
+# backend/app/schema.py
+"""Schéma de la base : migrations et commandes ``flask schema``.
+
+Ni l'import ni ``create_app`` n'ouvrent de connexion : le schéma se met à
+jour par une commande explicite, une fois par déploiement, avant de lancer
+les serveurs (voir ``Procfile`` et ``Dockerfile``) :
+
+    flask --app run schema upgrade   # migrations en attente
+    flask --app run schema create    # base jetable : tables des modèles, marquée à jour
+
+Flask-Migrate (et Alembic, long à importer) n'est chargé que par ces
+commandes et par ``flask db ...`` : les workers ne le paient pas.
+"""
+import os
+
+import click
+from flask import current_app
+from flask.cli import AppGroup, ScriptInfo
+from sqlalchemy import inspect
+
+from . import db
+
+
+MIGRATIONS_DIRECTORY = os.path.join(os.path.dirname(__file__), '..', 'migrations')
+LEGACY_REVISION = '0001_initial_schema'
+
+
+def init_migrations(app):
+    """Flask-Migrate sur ``app`` (une seule fois)"""
+    if 'migrate' not in app.extensions:
+        from flask_migrate import Migrate
+        from .search import include_object
+        Migrate(app, db, directory=MIGRATIONS_DIRECTORY, include_object=include_object)
+    return app.extensions['migrate']
+
+
+class CommandGroup(AppGroup):
+    """``app.cli`` : la commande ``flask db`` n'est chargée qu'à son appel"""
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | {'db'})
+
+    def get_command(self, ctx, name):
+        if name == 'db':
+            init_migrations(ctx.ensure_object(ScriptInfo).load_app())
+        return super().get_command(ctx, name)
+
+
+def upgrade_schema():
+    """Appliquer les migrations en attente.
+
+    Une base créée par l'ancien ``db.create_all()`` n'a pas de table
+    ``alembic_version`` : on la marque d'abord à la révision initiale.
+    """
+    init_migrations(current_app._get_current_object())
+    from flask_migrate import stamp, upgrade
+    tables = inspect(db.engine).get_table_names()
+    if 'users' in tables and 'alembic_version' not in tables:
+        stamp(revision=LEGACY_REVISION)
+    upgrade()
+
+
+def create_schema():
+    """Tables des modèles créées directement, base marquée à la dernière révision"""
+    init_migrations(current_app._get_current_object())
+    from flask_migrate import stamp
+    db.create_all()
+    stamp()
+
+
+# ============================================
+# CLI
+# ============================================
+
+schema_cli = AppGroup('schema', help='Create or upgrade the database schema.')
+
+
+@schema_cli.command('upgrade')
+def upgrade_command():
+    """Apply pending migrations (stamps databases created before migrations)."""
+    upgrade_schema()
+    click.echo('Database schema up to date')
+
+
+@schema_cli.command('create')
+def create_command():
+    """Create all tables from the models (scratch databases) and stamp them."""
+    create_schema()
+    click.echo('Database schema created')
@@ -0,0 +1,325 @@
+# backend/app/scoring.py
+"""Évaluation et classement des offres d'un projet.
+
+Quatre critères pondérés (``SCORING_WEIGHTS``), chacun ramené à [0, 1] :
+
+- ``price`` : offre la plus basse / offre (formule proportionnelle),
+  pénalisée par budget / offre au-delà de ``Project.budget`` ;
+- ``timeline`` : délai le plus court / délai (``proposed_timeline`` lu en
+  jours : « 6 mois », « 90 jours », « 3 weeks »...) ; 0 si illisible ;
+- ``completeness`` : part des pièces obligatoires présentes ;
+- ``verification`` : part des documents vérifiés (``Document.verified``),
+  parmi ceux dont la vérification a abouti.
+
+Une offre est anormalement basse si son montant est inférieur à
+moyenne − k·σ des offres du projet (``SCORING_ABNORMAL_K``, cohorte d'au
+moins ``MIN_COHORT`` offres).
+
+Les caractéristiques des offres sont chargées une fois par projet (deux
+requêtes) puis gardées en cache ; une nouvelle offre est ajoutée au cache
+sans relire les autres. Le calcul des notes porte sur toute la cohorte à
+la fois (tableaux NumPy), sans boucle Python par offre. NumPy n'est
+importé qu'au premier calcul : le démarrage du processus ne le paie pas.
+"""
+import re
+import threading
+import time
+from functools import lru_cache
+
+from flask import current_app
+from sqlalchemy import case, func
+
+from . import db
+from .models import Bid, Candidate, Document
+
+
+CRITERIA = ('price', 'timeline', 'completeness', 'verification')
+DEFAULT_WEIGHTS = {'price': 0.5, 'timeline': 0.2, 'completeness': 0.15, 'verification': 0.15}
+REQUIRED_DOCUMENTS = ('technical_proposal', 'financial_proposal')
+MIN_COHORT = 3
+
+TIMELINE_UNITS = (
+    (re.compile(r'^(jour|day|j$|d$)'), 1),
+    (re.compile(r'^(semaine|week|sem$|w$)'), 7),
+    (re.compile(r'^(mois|month|m$)'), 30),
+    (re.compile(r'^(an|année|annee|year|y$)'), 365),
+)
+TIMELINE_PATTERN = re.compile(r'(\d+(?:[.,]\d+)?)\s*([a-zéû]*)')
+
+
+class InvalidWeights(ValueError):
+    """Pondérations demandées invalides -> 400"""
+
+
+# ============================================
+# CARACTÉRISTIQUES
+# ============================================
+
+@lru_cache(maxsize=4096)
+def parse_timeline_days(text):
+    """Délai en jours, ou ``nan`` si illisible (« 6 mois » -> 180)"""
+    if not text:
+        return float('nan')
+    match = TIMELINE_PATTERN.search(text.strip().lower())
+    if match is None:
+        return float('nan')
+    value = float(match.group(1).replace(',', '.'))
+    unit = match.group(2)
+    if not unit:
+        return value  # nombre seul : jours
+    for pattern, days in TIMELINE_UNITS:
+        if pattern.match(unit):
+            return value * days
+    return float('nan')
+
+
+class Cohort:
+    """Caractéristiques des offres d'un projet, en colonnes NumPy"""
+
+    FIELDS = ('ids', 'amounts', 'timeline_days', 'completeness', 'verification')
+
+    def __init__(self, budget, ids, amounts, timeline_days, completeness, verification, companies):
+        import numpy as np
+        self.budget = budget
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.amounts = np.asarray(amounts, dtype=np.float64)
+        self.timeline_days = np.asarray(timeline_days, dtype=np.float64)
+        self.completeness = np.asarray(completeness, dtype=np.float64)
+        self.verification = np.asarray(verification, dtype=np.float64)
+        self.companies = list(companies)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def merge(self, other):
+        """Nouvelle cohorte : ``other`` remplace ou complète les offres existantes"""
+        import numpy as np
+        keep = ~np.isin(self.ids, other.ids)
+        return Cohort(
+            self.budget,
+            *(np.concatenate([getattr(self, name)[keep], getattr(other, name)]) for name in self.FIELDS),
+            [c for c, k in zip(self.companies, keep) if k] + other.companies
+        )
+
+
+def load_cohort(project_id, budget, bid_ids=None):
+    """Offres du projet (ou seulement ``bid_ids``) : deux requêtes au total"""
+    bids = (
+        db.session.query(Bid.id, Bid.proposed_amount, Bid.proposed_timeline, Candidate.company_name)
+        .outerjoin(Bid.candidate)
+        .filter(Bid.project_id == project_id)
+    )
+    documents = (
+        db.session.query(
+            Document.bid_id,
+            func.count(func.distinct(case(
+                (Document.document_type.in_(REQUIRED_DOCUMENTS), Document.document_type)
+            ))).label('required'),
+            func.count(Document.id).label('total'),
+            func.sum(case((Document.verified.is_(True), 1), else_=0)).label('verified'),
+            func.count(Document.verified).label('checked'),  # hors vérifications indéterminées
+        )
+        .join(Document.bid)
+        .filter(Bid.project_id == project_id)
+        .group_by(Document.bid_id)
+    )
+    if bid_ids is not None:
+        bids = bids.filter(Bid.id.in_(bid_ids))
+        documents = documents.filter(Document.bid_id.in_(bid_ids))
+
+    rows = bids.order_by(Bid.id).all()
+    stats = {row.bid_id: row for row in documents.all()}
+
+    def document_ratio(bid_id, field):
+        row = stats.get(bid_id)
+        if row is None:
+            return 0.0
+        if field == 'required':
+            return row.required / len(REQUIRED_DOCUMENTS)
+        return (row.verified or 0) / row.checked if row.checked else 0.0
+
+    return Cohort(
+        budget,
+        [row.id for row in rows],
+        [row.proposed_amount for row in rows],
+        [parse_timeline_days(row.proposed_timeline) for row in rows],
+        [document_ratio(row.id, 'required') for row in rows],
+        [document_ratio(row.id, 'verified') for row in rows],
+        [row.company_name for row in rows],
+    )
+
+
+# ============================================
+# CALCUL
+# ============================================
+
+def _ratio_to_best(values):
+    """meilleur (plus petit) / valeur, 0 là où la valeur est absente ou nulle"""
+    import numpy as np
+    valid = np.isfinite(values) & (values > 0)
+    if not valid.any():
+        return np.zeros_like(values)
+    best = values[valid].min()
+    return np.where(valid, best / np.where(valid, values, 1.0), 0.0)
+
+
+def score_cohort(cohort, weights, k):
+    """Notes, rangs et alertes de toute la cohorte, en opérations vectorielles"""
+    import numpy as np
+    amounts = cohort.amounts
+    n = len(cohort)
+
+    price = _ratio_to_best(amounts)
+    over_budget = np.zeros(n, dtype=bool)
+    if cohort.budget:
+        over_budget = amounts > cohort.budget
+        price = np.where(over_budget, price * cohort.budget / np.maximum(amounts, 1e-9), price)
+
+    scores = np.vstack([
+        price,
+        _ratio_to_best(cohort.timeline_days),
+        cohort.completeness,
+        cohort.verification,
+    ])
+    weight_vector = np.array([weights[name] for name in CRITERIA])
+    totals = 100 * weight_vector @ scores
+
+    mean = float(amounts.mean()) if n else None
+    std = float(amounts.std()) if n else None
+    threshold = mean - k * std if n >= MIN_COHORT else None
+    abnormally_low = amounts < threshold if threshold is not None else np.zeros(n, dtype=bool)
+
+    # Meilleure note d'abord ; à égalité, le moins cher puis le plus ancien
+    order = np.lexsort((cohort.ids, amounts, -totals))
+    ranks = np.empty(n, dtype=np.int64)
+    ranks[order] = np.arange(1, n + 1)
+
+    bids = [
+        {
+            'rank': int(ranks[i]),
+            'bid_id': int(cohort.ids[i]),
+            'company_name': cohort.companies[i] or 'Unknown',
+            'proposed_amount': float(amounts[i]),
+            'timeline_days': None if np.isnan(cohort.timeline_days[i]) else float(cohort.timeline_days[i]),
+            'scores': {name: round(float(scores[j, i]), 4) for j, name in enumerate(CRITERIA)},
+            'total': round(float(totals[i]), 2),
+            'abnormally_low': bool(abnormally_low[i]),
+            'over_budget': bool(over_budget[i]),
+        }
+        for i in order
+    ]
+    return {
+        'weights': weights,
+        'k': k,
+        'cohort': {
+            'count': n,
+            'mean_amount': mean,
+            'std_amount': std,
+            'abnormally_low_threshold': threshold,
+        },
+        'bids': bids,
+    }
+
+
+def parse_weights(raw, defaults):
+    """``price:0.6,timeline:0.4`` -> pondérations normalisées (somme 1)"""
+    weights = dict(defaults)
+    if raw:
+        for item in raw.split(','):
+            name, _, value = item.partition(':')
+            name = name.strip()
+            if name not in CRITERIA:
+                raise InvalidWeights(f'Unknown criterion: {name}')
+            try:
+                weights[name] = float(value)
+            except ValueError:
+                raise InvalidWeights(f'Invalid weight for {name}')
+    if any(value < 0 for value in weights.values()) or sum(weights.values()) <= 0:
+        raise InvalidWeights('Weights must be positive')
+    total = sum(weights.values())
+    return {name: weights.get(name, 0.0) / total for name in CRITERIA}
+
+
+# ============================================
+# CACHE
+# ============================================
+
+class ScoreCache:
+    """Cohortes par projet (processus courant), avec TTL et ajouts incrémentaux.
+
+    Le TTL rattrape les changements faits ailleurs (vérification des
+    documents par un worker, autre processus web).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self, project_id):
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is not None and time.monotonic() < entry['expires_at']:
+                return entry['cohort']
+        return None
+
+    def put(self, project_id, cohort, ttl):
+        with self._lock:
+            self._entries[project_id] = {'cohort': cohort, 'expires_at': time.monotonic() + ttl}
+
+    def update(self, project_id, fn):
+        """Remplacer la cohorte en cache par ``fn(cohort)``, si elle y est"""
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is not None:
+                entry['cohort'] = fn(entry['cohort'])
+
+    def invalidate(self, project_id=None):
+        with self._lock:
+            if project_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(project_id, None)
+
+
+def _cache():
+    return current_app.extensions.setdefault('bid_scores', ScoreCache())
+
+
+def default_weights():
+    """Pondérations configurées (``SCORING_WEIGHTS``), normalisées"""
+    return parse_weights(current_app.config.get('SCORING_WEIGHTS'), DEFAULT_WEIGHTS)
+
+
+def evaluate_project(project, weights=None, k=None):
+    """Classement des offres de ``project`` (cohorte lue en cache si possible)"""
+    config = current_app.config
+    ttl = config.get('SCORING_CACHE_TTL', 300)
+    weights = weights or default_weights()
+    k = config.get('SCORING_ABNORMAL_K', 1.5) if k is None else k
+
+    cohort = _cache().get(project.id) if ttl > 0 else None
+    # Budget modifié depuis la mise en cache : la cohorte est rechargée
+    if cohort is None or cohort.budget != project.budget:
+        cohort = load_cohort(project.id, project.budget)
+        if ttl > 0:
+            _cache().put(project.id, cohort, ttl)
+
+    result = score_cohort(cohort, weights, k)
+    result['project_id'] = project.id
+    result['budget'] = project.budget
+    return result
+
+
+def record_bids(project_id, bid_ids):
+    """Ajouter (ou rafraîchir) des offres dans la cohorte en cache, sans relire les autres"""
+    cache = _cache()
+    cohort = cache.get(project_id)
+    if cohort is None:
+        return
+    fresh = load_cohort(project_id, cohort.budget, bid_ids=list(bid_ids))
+    cache.update(project_id, lambda current: current.merge(fresh))
+
+
+def invalidate_bid_scores(project_id=None):
+    """À appeler quand le budget du projet change ou que des offres disparaissent"""
+    _cache().invalidate(project_id)
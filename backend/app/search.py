@@ -0,0 +1,197 @@
+# backend/app/search.py
+"""Recherche plein texte sur les projets (titre + description).
+
+L'index est maintenu par la base elle-même, jamais par l'application :
+
+- PostgreSQL : colonne générée ``search_vector`` (``tsvector``, configuration
+  ``french_unaccent`` = racinisation française + suppression des accents)
+  indexée en GIN ; classement ``ts_rank_cd``, extraits ``ts_headline`` ;
+- SQLite (tests, développement) : table FTS5 ``projects_fts`` à contenu
+  externe, tenue à jour par triggers ; tokenizer ``unicode61`` sans
+  diacritiques, classement ``bm25``, extraits ``snippet``.
+
+Les résultats sont paginés par curseur sur ``(rank, id) DESC``, comme les
+autres listes. Aucun ``LIKE '%…%'`` : chaque requête passe par l'index.
+"""
+import html
+import re
+
+from sqlalchemy import DDL, DateTime, Float, String, event, text
+
+from . import db
+from .models import Project
+from .pagination import decode_cursor, encode_cursor
+from .serializers import PROJECT_COLUMNS
+
+
+# Marqueurs internes des extraits, remplacés par <mark> après échappement HTML
+MARK_START = '\ue000'
+MARK_END = '\ue001'
+
+SNIPPET_WORDS = 12
+
+
+# ============================================
+# SCHÉMA
+# ============================================
+
+SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5("
+    "title, description, content='projects', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS projects_fts_insert AFTER INSERT ON projects BEGIN "
+    "INSERT INTO projects_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS projects_fts_delete AFTER DELETE ON projects BEGIN "
+    "INSERT INTO projects_fts(projects_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS projects_fts_update AFTER UPDATE OF title, description ON projects BEGIN "
+    "INSERT INTO projects_fts(projects_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO projects_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+)
+
+SQLITE_DROP = (
+    'DROP TRIGGER IF EXISTS projects_fts_insert',
+    'DROP TRIGGER IF EXISTS projects_fts_delete',
+    'DROP TRIGGER IF EXISTS projects_fts_update',
+    'DROP TABLE IF EXISTS projects_fts',
+)
+
+POSTGRES_DDL = (
+    'CREATE EXTENSION IF NOT EXISTS unaccent',
+    "DO $$ BEGIN "
+    "IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'french_unaccent') THEN "
+    "CREATE TEXT SEARCH CONFIGURATION french_unaccent (COPY = french); "
+    "ALTER TEXT SEARCH CONFIGURATION french_unaccent "
+    "ALTER MAPPING FOR hword, hword_part, word WITH unaccent, french_stem; "
+    "END IF; END $$",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('french_unaccent', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('french_unaccent', coalesce(description, '')), 'B')"
+    ") STORED",
+    'CREATE INDEX IF NOT EXISTS ix_projects_search_vector ON projects USING gin (search_vector)',
+)
+
+for _statement in SQLITE_DDL:
+    event.listen(Project.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+for _statement in SQLITE_DROP:
+    event.listen(Project.__table__, 'before_drop', DDL(_statement).execute_if(dialect='sqlite'))
+for _statement in POSTGRES_DDL:
+    event.listen(Project.__table__, 'after_create', DDL(_statement).execute_if(dialect='postgresql'))
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """Masquer à l'autogénération Alembic les objets gérés ici (hors modèles)"""
+    if type_ == 'table' and name.startswith('projects_fts'):
+        return False
+    if type_ == 'column' and name == 'search_vector':
+        return False
+    if type_ == 'index' and name == 'ix_projects_search_vector':
+        return False
+    return True
+
+
+# ============================================
+# REQUÊTES
+# ============================================
+
+SQLITE_SEARCH = """
+SELECT {columns}, hits.rank AS rank, hits.snippet AS snippet
+FROM (
+    SELECT rowid AS id,
+           -bm25(projects_fts, 2.0, 1.0) AS rank,
+           snippet(projects_fts, -1, :mark_start, :mark_end, '…', :snippet_words) AS snippet
+    FROM projects_fts
+    WHERE projects_fts MATCH :query
+) AS hits
+JOIN projects AS p ON p.id = hits.id
+WHERE {filters}
+ORDER BY hits.rank DESC, hits.id DESC
+LIMIT :limit
+"""
+
+POSTGRES_SEARCH = """
+WITH hits AS (
+    SELECT p.id, ts_rank_cd(p.search_vector, q.query)::float8 AS rank, q.query
+    FROM projects AS p, websearch_to_tsquery('french_unaccent', :query) AS q(query)
+    WHERE p.search_vector @@ q.query AND {filters}
+    ORDER BY rank DESC, p.id DESC
+    LIMIT :limit
+)
+SELECT {columns}, hits.rank AS rank,
+       ts_headline('french_unaccent', p.title || ' — ' || p.description, hits.query, :headline_options) AS snippet
+FROM hits
+JOIN projects AS p ON p.id = hits.id
+ORDER BY hits.rank DESC, hits.id DESC
+"""
+
+
+def sqlite_match_expression(terms):
+    """Requête FTS5 sûre : chaque mot entre guillemets, en préfixe, tous requis"""
+    tokens = re.findall(r'\w+', terms)
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def render_snippet(raw):
+    """Échapper l'extrait puis poser les balises <mark> autour des termes trouvés"""
+    if raw is None:
+        return None
+    return html.escape(raw).replace(MARK_START, '<mark>').replace(MARK_END, '</mark>')
+
+
+def search_projects(terms, status=None, project_type=None, cursor=None, limit=50):
+    """Projets correspondant à ``terms``, du plus pertinent au moins pertinent.
+
+    Retourne ``(rows, next_cursor)`` ; chaque ligne porte les colonnes du
+    projet, ``rank`` et ``snippet`` (brut, à passer par ``render_snippet``).
+    Une requête sans mot exploitable donne une liste vide.
+    """
+    dialect = db.engine.dialect.name
+    params = {'limit': limit + 1}
+
+    if dialect == 'postgresql':
+        params['query'] = terms
+        params['headline_options'] = (
+            f'StartSel={MARK_START}, StopSel={MARK_END}, '
+            f'MaxWords={SNIPPET_WORDS * 2}, MinWords={SNIPPET_WORDS // 2}, MaxFragments=2'
+        )
+        template = POSTGRES_SEARCH
+        rank = 'ts_rank_cd(p.search_vector, q.query)::float8'
+    elif dialect == 'sqlite':
+        params['query'] = sqlite_match_expression(terms)
+        if not params['query']:
+            return [], None
+        params.update(mark_start=MARK_START, mark_end=MARK_END, snippet_words=SNIPPET_WORDS)
+        template = SQLITE_SEARCH
+        rank = 'hits.rank'
+    else:
+        raise RuntimeError(f'Full-text search is not supported on {dialect}')
+
+    filters = ['1 = 1']
+    if status:
+        filters.append('p.status = :status')
+        params['status'] = status
+    if project_type:
+        filters.append('p.project_type = :project_type')
+        params['project_type'] = project_type
+    if cursor:
+        params['cursor_rank'], params['cursor_id'] = decode_cursor(cursor, parse=float)
+        filters.append(f'({rank} < :cursor_rank OR ({rank} = :cursor_rank AND p.id < :cursor_id))')
+
+    statement = text(template.format(
+        columns=', '.join(f'p.{column.key}' for column in PROJECT_COLUMNS),
+        filters=' AND '.join(filters),
+    )).columns(
+        deadline=DateTime, created_at=DateTime, updated_at=DateTime,
+        rank=Float, snippet=String,
+    )
+    rows = db.session.execute(statement, params).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].rank, rows[-1].id)
+    return rows, next_cursor
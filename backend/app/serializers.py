@@ -0,0 +1,211 @@
+# backend/app/serializers.py
+"""Sérialisation JSON des réponses : lignes projetées, encodeur, fragments en cache.
+
+- Une fonction par modèle (``serialize_project``, ``serialize_bid_row``...)
+  lit une ligne de requête projetée sur les seules colonnes utiles
+  (``PROJECT_COLUMNS``, ``bid_listing_query``) : aucun objet ORM n'est
+  construit pour une liste.
+- Encodeur (``JSON_BACKEND``) : ``orjson`` s'il est installé (``auto``),
+  sinon le module ``json`` ; mêmes conversions que Flask dans les deux cas
+  (dates au format HTTP, ``Decimal`` en chaîne...). Il sert aussi à
+  ``jsonify`` et à ``request.get_json``.
+- Fragments : le JSON de chaque ligne est gardé (``PAYLOAD_CACHE_SIZE``
+  entrées par processus) sous la clé de ses valeurs ; une entité inchangée
+  n'est pas ré-encodée, une entité modifiée donne une autre clé. Une liste
+  est la concaténation de ses fragments.
+"""
+import threading
+from collections import OrderedDict
+
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider
+
+from .models import Project
+
+
+PROJECT_COLUMNS = (
+    Project.id, Project.title, Project.description, Project.project_type, Project.budget,
+    Project.deadline, Project.status, Project.created_at, Project.updated_at,
+)
+
+
+# ============================================
+# SÉRIALISEURS
+# ============================================
+
+def serialize_project(row):
+    return {
+        'id': row.id,
+        'title': row.title,
+        'description': row.description,
+        'project_type': row.project_type,
+        'budget': row.budget,
+        'deadline': row.deadline.isoformat(),
+        'status': row.status,
+        'created_at': row.created_at.isoformat()
+    }
+
+
+def serialize_search_result(row):
+    """Projet trouvé par ``search_projects`` : pertinence et extrait en plus"""
+    from .search import render_snippet
+    result = serialize_project(row)
+    result['rank'] = row.rank
+    result['snippet'] = render_snippet(row.snippet)
+    return result
+
+
+def serialize_bid_row(row):
+    """Convertir une ligne de ``bid_listing_query`` en dict JSON"""
+    return {
+        'id': row.id,
+        'project_id': row.project_id,
+        'project_title': row.project_title or 'Unknown',
+        'company_name': row.company_name or 'Unknown',
+        'proposed_amount': float(row.proposed_amount) if row.proposed_amount is not None else None,
+        'proposed_timeline': row.proposed_timeline,
+        'status': row.status,
+        'notes': row.notes,
+        'created_at': row.submitted_at.isoformat() if row.submitted_at else None
+    }
+
+
+# ============================================
+# ENCODEURS
+# ============================================
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """Encodeur par défaut de Flask, avec ``encode`` (octets compacts)"""
+
+    def encode(self, obj):
+        return self.dumps(obj, separators=(',', ':')).encode()
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """``orjson`` ; les types que Flask convertit lui-même passent par ``default``"""
+
+    def __init__(self, app):
+        import orjson
+        super().__init__(app)
+        self._orjson = orjson
+        # Dates au format HTTP comme jsonify, et non RFC 3339
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def encode(self, obj, indent=False):
+        options = self._options | (self._orjson.OPT_INDENT_2 if indent else 0)
+        return self._orjson.dumps(obj, default=self.default, option=options)
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self.encode(obj).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return self._orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(self.encode(obj, indent=indent), mimetype=self.mimetype)
+
+
+def create_json_provider(app):
+    backend = app.config.get('JSON_BACKEND', 'auto')
+    if backend in ('auto', 'orjson'):
+        try:
+            return OrjsonProvider(app)
+        except ImportError:
+            if backend == 'orjson':
+                raise RuntimeError('JSON_BACKEND=orjson requires orjson (pip install orjson)')
+    elif backend != 'stdlib':
+        raise RuntimeError(f'Unknown JSON_BACKEND: {backend}')
+    return StdlibJSONProvider(app)
+
+
+# ============================================
+# FRAGMENTS EN CACHE
+# ============================================
+
+# Version d'une ligne, avec son ``id`` dans la clé du cache : le fragment
+# est ré-encodé quand elle change
+ROW_VERSIONS = {
+    'project': lambda row: row.updated_at,
+    # L'offre, ou son projet (titre repris dans la ligne)
+    'bid': lambda row: (row.updated_at, row.project_updated_at),
+}
+
+
+class PayloadCache:
+    """JSON encodé des lignes déjà servies, LRU borné"""
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def encode(self, key, row, serializer, encode):
+        """Fragment de ``row`` sous ``key`` (type, ``id``, version)"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return payload
+            self.misses += 1
+        payload = encode(serializer(row))
+        with self._lock:
+            self._entries[key] = payload
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return payload
+
+    def metrics_lines(self):
+        with self._lock:
+            hits, misses, entries = self.hits, self.misses, len(self._entries)
+        return ['# TYPE payload_cache_hits_total counter', f'payload_cache_hits_total {hits}',
+                '# TYPE payload_cache_misses_total counter', f'payload_cache_misses_total {misses}',
+                '# TYPE payload_cache_entries gauge', f'payload_cache_entries {entries}']
+
+
+def get_payload_cache():
+    cache = current_app.extensions.get('payload_cache')
+    if cache is None:
+        cache = current_app.extensions['payload_cache'] = PayloadCache(
+            maxsize=current_app.config.get('PAYLOAD_CACHE_SIZE', 10000))
+        metrics = current_app.extensions.get('metrics')
+        if metrics is not None:
+            metrics.add_collector(cache.metrics_lines)
+    return cache
+
+
+def _encoder():
+    provider = current_app.json
+    if hasattr(provider, 'encode'):
+        return provider.encode
+    return lambda obj: provider.dumps(obj).encode()
+
+
+def encode_rows(kind, rows, serializer, cache=True):
+    """Tableau JSON (octets) des lignes ; les fragments inchangés viennent du cache"""
+    encode = _encoder()
+    version = ROW_VERSIONS.get(kind)
+    if cache and version is not None and current_app.config.get('PAYLOAD_CACHE_SIZE', 10000):
+        payloads = get_payload_cache()
+        fragments = [payloads.encode((kind, row.id, version(row)), row, serializer, encode) for row in rows]
+    else:
+        fragments = [encode(serializer(row)) for row in rows]
+    return b'[' + b','.join(fragments) + b']'
+
+
+def encode_row(kind, row, serializer, cache=True):
+    """JSON (octets) d'une seule ligne"""
+    return encode_rows(kind, [row], serializer, cache)[1:-1]
+
+
+def json_response(body):
+    """Réponse ``application/json`` d'un corps déjà encodé"""
+    return current_app.response_class(body, mimetype=current_app.json.mimetype)
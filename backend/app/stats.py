@@ -0,0 +1,133 @@
+# backend/app/stats.py
+"""Statistiques du dashboard admin : une requête agrégée + cache TTL."""
+import threading
+import time
+
+from flask import current_app
+from sqlalchemy import func, literal, null, union_all
+
+from . import db
+from .models import Bid, Project
+
+
+# ============================================
+# CALCUL
+# ============================================
+
+def _month(column):
+    """Expression ``YYYY-MM`` pour le dialecte courant"""
+    if db.engine.dialect.name == 'postgresql':
+        return func.to_char(column, 'YYYY-MM')
+    return func.strftime('%Y-%m', column)
+
+
+def compute_dashboard_stats():
+    """Toutes les statistiques en un seul aller-retour SQL.
+
+    Les deux tables sont agrégées par ``GROUP BY`` puis réunies par
+    ``UNION ALL`` ; les totaux et ventilations sont recomposés en Python à
+    partir de quelques dizaines de lignes, quel que soit l'historique.
+    """
+    projects = (
+        db.select(
+            literal('project').label('kind'),
+            Project.status.label('status'),
+            Project.project_type.label('project_type'),
+            _month(Project.created_at).label('month'),
+            func.count().label('total'),
+        )
+        .group_by(Project.status, Project.project_type, _month(Project.created_at))
+    )
+    bids = (
+        db.select(
+            literal('bid').label('kind'),
+            Bid.status.label('status'),
+            null().label('project_type'),
+            _month(Bid.submitted_at).label('month'),
+            func.count().label('total'),
+        )
+        .group_by(Bid.status, _month(Bid.submitted_at))
+    )
+
+    projects_by_status = {}
+    projects_by_type = {}
+    projects_by_month = {}
+    bids_by_status = {}
+    bids_by_month = {}
+
+    for row in db.session.execute(union_all(projects, bids)):
+        status = row.status or 'unknown'
+        month = row.month or 'unknown'
+        if row.kind == 'project':
+            project_type = row.project_type or 'unknown'
+            projects_by_status[status] = projects_by_status.get(status, 0) + row.total
+            projects_by_type[project_type] = projects_by_type.get(project_type, 0) + row.total
+            projects_by_month[month] = projects_by_month.get(month, 0) + row.total
+        else:
+            bids_by_status[status] = bids_by_status.get(status, 0) + row.total
+            bids_by_month[month] = bids_by_month.get(month, 0) + row.total
+
+    return {
+        'total_projects': sum(projects_by_status.values()),
+        'open_projects': projects_by_status.get('open', 0),
+        'total_bids': sum(bids_by_status.values()),
+        'pending_bids': bids_by_status.get('submitted', 0),
+        'accepted_bids': bids_by_status.get('accepted', 0),
+        'rejected_bids': bids_by_status.get('rejected', 0),
+        'projects_by_status': projects_by_status,
+        'projects_by_type': projects_by_type,
+        'projects_by_month': dict(sorted(projects_by_month.items())),
+        'bids_by_status': bids_by_status,
+        'bids_by_month': dict(sorted(bids_by_month.items())),
+    }
+
+
+# ============================================
+# CACHE
+# ============================================
+
+class StatsCache:
+    """Cache en mémoire (par processus) des statistiques, avec TTL"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = None
+        self._expires_at = 0.0
+        self._generation = 0
+
+    def get(self, ttl):
+        if ttl <= 0:
+            return compute_dashboard_stats()
+
+        with self._lock:
+            if self._value is not None and time.monotonic() < self._expires_at:
+                return self._value
+            generation = self._generation
+
+        value = compute_dashboard_stats()
+        with self._lock:
+            # Une écriture survenue pendant le calcul rend la valeur périmée
+            if generation == self._generation:
+                self._value = value
+                self._expires_at = time.monotonic() + ttl
+        return value
+
+    def invalidate(self):
+        with self._lock:
+            self._value = None
+            self._expires_at = 0.0
+            self._generation += 1
+
+
+def _cache():
+    return current_app.extensions.setdefault('dashboard_stats', StatsCache())
+
+
+def dashboard_stats():
+    """Statistiques servies depuis le cache (``DASHBOARD_STATS_TTL`` secondes)"""
+    return _cache().get(current_app.config.get('DASHBOARD_STATS_TTL', 30))
+
+
+def invalidate_dashboard_stats():
+    """À appeler après toute écriture sur les projets ou les offres"""
+    _cache().invalidate()
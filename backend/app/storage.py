@@ -0,0 +1,255 @@
+# backend/app/storage.py
+"""Stockage des documents : écriture en flux, adressage par contenu.
+
+Un fichier reçu est lu par blocs de ``STORAGE_CHUNK_SIZE`` octets, haché en
+SHA-256 au fil de l'eau et écrit dans un fichier temporaire ; il est ensuite
+déposé sous la clé ``ab/cd/abcd…`` (le hash, découpé en deux niveaux de
+répertoires). Deux offres qui joignent le même certificat partagent donc un
+seul fichier, et deux ``offre.pdf`` différents ne s'écrasent plus.
+
+Écriture en deux temps pour les dépôts d'offres : ``stage`` garde le
+fichier dans la zone de transit, ``promote`` le publie une fois la
+transaction validée, ``discard`` l'abandonne sinon. Les fichiers de transit
+laissés par un processus interrompu sont repris par ``stale_staged``
+(planificateur).
+
+Le backend est interchangeable : ``LocalStorage`` (répertoire local) ou
+``S3Storage`` (tout service compatible S3, via un client de type boto3).
+"""
+import hashlib
+import os
+import tempfile
+import time
+from collections import namedtuple
+
+from flask import current_app
+
+
+StoredFile = namedtuple('StoredFile', ['key', 'sha256', 'size'])
+# ``key`` est ``None`` pour un reste d'écriture interrompue (``.part``)
+StagedFile = namedtuple('StagedFile', ['key', 'sha256', 'size', 'path'])
+
+STAGED_SUFFIX = '.staged'
+
+
+def content_key(sha256):
+    """Clé de stockage répartie sur deux niveaux : ``ab/cd/<sha256>``"""
+    return f'{sha256[:2]}/{sha256[2:4]}/{sha256}'
+
+
+def key_sha256(key):
+    """Hash SHA-256 contenu dans une clé, ou ``None`` (chemin hérité)"""
+    name = key.rsplit('/', 1)[-1]
+    if len(name) == 64 and all(c in '0123456789abcdef' for c in name):
+        return name
+    return None
+
+
+class StorageBackend:
+    """Interface commune des backends de stockage"""
+
+    def __init__(self, staging_dir, chunk_size=64 * 1024):
+        self.staging_dir = staging_dir
+        self.chunk_size = chunk_size
+
+    # --- à implémenter par les backends ---
+
+    def exists(self, key):
+        raise NotImplementedError
+
+    def put_file(self, source_path, key):
+        """Déposer le fichier local ``source_path`` sous ``key``"""
+        raise NotImplementedError
+
+    def open(self, key):
+        """Flux binaire en lecture sur le contenu de ``key``"""
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+    def local_path(self, key):
+        """Chemin disque de ``key`` si le backend est local (sendfile), sinon ``None``"""
+        return None
+
+    def download_url(self, key, file_name):
+        """URL de téléchargement direct déléguée au backend, sinon ``None``"""
+        return None
+
+    # --- commun ---
+
+    def stage(self, stream):
+        """Écrire ``stream`` par blocs dans la zone de transit, sans le publier"""
+        os.makedirs(self.staging_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+
+        fd, temp_path = tempfile.mkstemp(dir=self.staging_dir, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                while True:
+                    chunk = stream.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+
+            sha256 = digest.hexdigest()
+            # Le hash dans le nom : le balayage sait à quelle clé le fichier était destiné
+            name = os.path.basename(temp_path)[:-len('.part')]
+            path = os.path.join(self.staging_dir, f'{sha256}-{name}{STAGED_SUFFIX}')
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        return StagedFile(key=content_key(sha256), sha256=sha256, size=size, path=path)
+
+    def promote(self, staged):
+        """Publier un fichier de transit sous sa clé"""
+        try:
+            # Contenu déjà connu : on garde l'exemplaire existant
+            if not self.exists(staged.key):
+                self.put_file(staged.path, staged.key)
+        finally:
+            self.discard(staged)
+        return StoredFile(key=staged.key, sha256=staged.sha256, size=staged.size)
+
+    def discard(self, staged):
+        """Abandonner un fichier de transit (transaction annulée)"""
+        try:
+            os.remove(staged.path)
+        except FileNotFoundError:
+            pass  # déjà promu ou supprimé par un autre processus
+
+    def stale_staged(self, max_age):
+        """Fichiers de transit plus anciens que ``max_age`` secondes"""
+        if not os.path.isdir(self.staging_dir):
+            return
+        limit = time.time() - max_age
+        for entry in os.scandir(self.staging_dir):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # promu ou abandonné entre-temps
+            if stat.st_mtime > limit:
+                continue
+            sha256 = entry.name.split('-', 1)[0] if entry.name.endswith(STAGED_SUFFIX) else None
+            if sha256 and key_sha256(sha256) is None:
+                sha256 = None
+            yield StagedFile(key=content_key(sha256) if sha256 else None, sha256=sha256,
+                             size=stat.st_size, path=entry.path)
+
+    def save(self, stream):
+        """Écrire ``stream`` par blocs et le ranger sous son hash SHA-256"""
+        return self.promote(self.stage(stream))
+
+
+class LocalStorage(StorageBackend):
+    """Backend sur un répertoire local (``UPLOAD_FOLDER``)"""
+
+    def __init__(self, root, chunk_size=64 * 1024):
+        super().__init__(os.path.join(root, '.staging'), chunk_size)
+        self.root = root
+
+    def path(self, key):
+        # Documents antérieurs au stockage par contenu : chemin absolu
+        if os.path.isabs(key):
+            return key
+        return os.path.join(self.root, *key.split('/'))
+
+    def local_path(self, key):
+        return self.path(key)
+
+    def exists(self, key):
+        return os.path.exists(self.path(key))
+
+    def put_file(self, source_path, key):
+        target = self.path(key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Même système de fichiers que la zone de transit : renommage atomique
+        os.replace(source_path, target)
+
+    def open(self, key):
+        return open(self.path(key), 'rb')
+
+    def delete(self, key):
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+
+class S3Storage(StorageBackend):
+    """Backend compatible S3.
+
+    ``client`` suit l'API boto3 (``head_object``, ``upload_file``,
+    ``get_object``, ``delete_object``) ; un bouchon local suffit en test.
+    """
+
+    def __init__(self, client, bucket, prefix='', staging_dir=None, chunk_size=64 * 1024):
+        super().__init__(staging_dir or tempfile.gettempdir(), chunk_size)
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix.strip('/')
+
+    def _object_key(self, key):
+        return f'{self.prefix}/{key}' if self.prefix else key
+
+    def exists(self, key):
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._object_key(key))
+            return True
+        except Exception as e:
+            status = getattr(e, 'response', {}).get('Error', {}).get('Code')
+            if status in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+
+    def put_file(self, source_path, key):
+        self.client.upload_file(source_path, self.bucket, self._object_key(key))
+
+    def open(self, key):
+        return self.client.get_object(Bucket=self.bucket, Key=self._object_key(key))['Body']
+
+    def delete(self, key):
+        self.client.delete_object(Bucket=self.bucket, Key=self._object_key(key))
+
+    def download_url(self, key, file_name):
+        if not hasattr(self.client, 'generate_presigned_url'):
+            return None
+        return self.client.generate_presigned_url('get_object', Params={
+            'Bucket': self.bucket,
+            'Key': self._object_key(key),
+            'ResponseContentDisposition': f'attachment; filename="{file_name}"',
+        }, ExpiresIn=300)
+
+
+def create_storage(config):
+    """Construire le backend décrit par la configuration de l'application"""
+    chunk_size = config.get('STORAGE_CHUNK_SIZE', 64 * 1024)
+    backend = config.get('STORAGE_BACKEND', 'local')
+
+    if backend == 'local':
+        return LocalStorage(config['UPLOAD_FOLDER'], chunk_size=chunk_size)
+
+    if backend == 's3':
+        try:
+            import boto3
+        except ImportError:
+            raise RuntimeError('STORAGE_BACKEND=s3 requires boto3 (pip install boto3)')
+        client = boto3.client('s3', endpoint_url=config.get('S3_ENDPOINT_URL'))
+        return S3Storage(client, config['S3_BUCKET'], prefix=config.get('S3_PREFIX', ''),
+                         staging_dir=os.path.join(config['UPLOAD_FOLDER'], '.staging'),
+                         chunk_size=chunk_size)
+
+    raise RuntimeError(f'Unknown STORAGE_BACKEND: {backend}')
+
+
+def get_storage():
+    """Backend de stockage de l'application courante (créé à la demande)"""
+    storage = current_app.extensions.get('storage')
+    if storage is None:
+        storage = current_app.extensions['storage'] = create_storage(current_app.config)
+    return storage
@@ -0,0 +1,399 @@
+# backend/app/synthetic.py
+"""Jeu de données synthétique pour les tests de charge.
+
+Génère de façon déterministe (même graine + même date de référence =
+mêmes lignes) des utilisateurs, candidats, projets, offres et documents,
+à l'échelle voulue, puis les charge en masse :
+
+- PostgreSQL : ``COPY … FROM STDIN`` (CSV en mémoire, par lots) ;
+- autres bases : ``INSERT`` en ``executemany`` par lots.
+
+Aucune ligne ne passe par ``session.add`` : les identifiants sont attribués
+ici (à la suite des identifiants existants), ce qui permet de générer les
+clés étrangères sans relire la base. Tous les comptes ont le mot de passe
+``BENCH_PASSWORD`` (haché une seule fois).
+
+    flask synthetic load --scale large --seed 42
+"""
+import csv
+import io
+import random
+from datetime import datetime, timedelta
+
+import click
+from flask.cli import AppGroup
+from sqlalchemy import func, insert, select, text
+
+from . import db
+from .models import Bid, Candidate, Document, Project, User
+from .passwords import hash_password
+
+
+BENCH_PASSWORD = 'bench123'
+BENCH_ADMIN_EMAIL = 'bench-admin@court.dz'
+
+# Volumes par défaut ; ``large`` correspond à quelques années d'exploitation
+SCALES = {
+    'tiny': {'candidates': 20, 'projects': 40, 'bids_per_project': 4, 'documents_per_bid': 2},
+    'small': {'candidates': 500, 'projects': 1000, 'bids_per_project': 10, 'documents_per_bid': 2},
+    'medium': {'candidates': 5000, 'projects': 10000, 'bids_per_project': 20, 'documents_per_bid': 2.5},
+    'large': {'candidates': 20000, 'projects': 50000, 'bids_per_project': 40, 'documents_per_bid': 2.5},
+}
+
+BATCH_SIZE = 5000
+
+WORKS = ('Réfection', 'Rénovation', 'Construction', 'Maintenance', 'Entretien',
+         'Remplacement', 'Mise aux normes', 'Installation', 'Extension')
+OBJECTS = ('de la climatisation', "de l'étanchéité de la toiture", 'des ascenseurs',
+           'du réseau électrique', 'de la plomberie', 'des menuiseries',
+           'du système de sécurité incendie', 'de la façade', 'du parking',
+           "des salles d'audience", 'du réseau informatique', 'de la vidéosurveillance')
+SITES = ('Tribunal de Blida', "Cour d'Alger", 'Tribunal de Boufarik', 'Tribunal de Koléa',
+         'Cour de Tipaza', 'Tribunal de Médéa', 'Tribunal administratif de Blida',
+         'Tribunal de Larbaâ', 'Cour de Boumerdès', "Tribunal d'El Affroun")
+DETAILS = ('Travaux à réaliser en site occupé, hors heures d\'audience.',
+           'Le titulaire fournit les matériaux et assure l\'évacuation des gravats.',
+           'Visite des lieux obligatoire avant dépôt de l\'offre.',
+           'Délai d\'exécution ferme, pénalités de retard applicables.',
+           'Garantie décennale exigée pour les travaux de gros œuvre.',
+           'Plans et cahier des charges disponibles auprès du service des marchés.')
+COMPANY_FORMS = ('SARL', 'EURL', 'SPA', 'SNC', 'ETS')
+COMPANY_WORDS = ('Bâtiment', 'Froid', 'Électricité', 'Génie Civil', 'Travaux', 'Services',
+                 'Étanchéité', 'Plomberie', 'Sécurité', 'Menuiserie', 'Réseaux')
+CITIES = ('Blida', 'Alger', 'Boufarik', 'Koléa', 'Tipaza', 'Médéa', 'Boumerdès', 'Larbaâ')
+
+PROJECT_TYPES = ('repair', 'construction', 'maintenance')
+PROJECT_STATUS_WEIGHTS = (('open', 50), ('under_review', 20), ('awarded', 20), ('closed', 10))
+DOCUMENT_TYPES = ('technical_proposal', 'financial_proposal', 'commerce_register',
+                  'certificate', 'insurance')
+
+# PDF minimal d'une page, partagé par tous les documents (stockage par contenu)
+SAMPLE_PDF = (
+    b'%PDF-1.4\n1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n'
+    b'2 0 obj << /Type /Pages /Kids [3 0 R] /Count 1 >> endobj\n'
+    b'3 0 obj << /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] >> endobj\n'
+    b'trailer << /Root 1 0 R >>\n%%EOF\n'
+)
+
+
+# ============================================
+# GÉNÉRATION
+# ============================================
+
+class SyntheticDataset:
+    """Lignes synthétiques, tables dans l'ordre des clés étrangères.
+
+    Chaque table a son propre générateur pseudo-aléatoire dérivé de la
+    graine : le contenu d'une table ne dépend pas de l'ordre de lecture.
+    """
+
+    def __init__(self, seed=42, candidates=20, projects=40, bids_per_project=4,
+                 documents_per_bid=2, reference=None, history_days=3 * 365):
+        if bids_per_project > candidates:
+            raise ValueError('bids_per_project cannot exceed the number of candidates')
+        self.seed = seed
+        self.candidates = candidates
+        self.projects = projects
+        self.bids_per_project = bids_per_project
+        self.documents_per_bid = documents_per_bid
+        self.reference = reference or datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.history_days = history_days
+
+    @classmethod
+    def from_scale(cls, scale, **overrides):
+        params = dict(SCALES[scale])
+        params.update({key: value for key, value in overrides.items() if value is not None})
+        return cls(**params)
+
+    def _random(self, table):
+        return random.Random(f'{self.seed}:{table}')
+
+    def users(self, first_id, password_hash):
+        """Un compte candidat par candidat ; e-mail unique grâce à l'id"""
+        rng = self._random('users')
+        for i in range(self.candidates):
+            user_id = first_id + i
+            yield {
+                'id': user_id,
+                'username': f'bench_{user_id}',
+                'email': f'bench-{user_id}@company.dz',
+                'password_hash': password_hash,
+                'role': 'candidate',
+                'is_active': rng.random() > 0.01,
+                'created_at': self.reference - timedelta(days=rng.uniform(0, self.history_days)),
+            }
+
+    def candidate_rows(self, first_id, first_user_id):
+        rng = self._random('candidates')
+        for i in range(self.candidates):
+            name = f'{rng.choice(COMPANY_WORDS)} {rng.choice(CITIES)} {rng.choice(COMPANY_FORMS)}'
+            yield {
+                'id': first_id + i,
+                'user_id': first_user_id + i,
+                'company_name': name,
+                'phone': f'05{rng.randrange(10 ** 8):08d}',
+                'address': f'{rng.randrange(1, 200)} rue {rng.choice(COMPANY_WORDS)}, {rng.choice(CITIES)}',
+                'registration_number': f'RC{rng.randrange(10 ** 6):06d}',
+                'status': 'active',
+                'created_at': self.reference - timedelta(days=rng.uniform(0, self.history_days)),
+            }
+
+    def project_rows(self, first_id):
+        rng = self._random('projects')
+        statuses = [status for status, _ in PROJECT_STATUS_WEIGHTS]
+        weights = [weight for _, weight in PROJECT_STATUS_WEIGHTS]
+        for i in range(self.projects):
+            status = rng.choices(statuses, weights)[0]
+            if status == 'open':
+                created_at = self.reference - timedelta(days=rng.uniform(0, 60))
+                deadline = self.reference + timedelta(days=rng.randrange(7, 120))
+            else:
+                created_at = self.reference - timedelta(days=rng.uniform(60, self.history_days))
+                deadline = created_at + timedelta(days=rng.randrange(30, 90))
+            title = f'{rng.choice(WORKS)} {rng.choice(OBJECTS)} - {rng.choice(SITES)}'
+            description = ' '.join(rng.sample(DETAILS, 3))
+            yield {
+                'id': first_id + i,
+                'title': title,
+                'description': f'{title}. {description}',
+                'project_type': rng.choice(PROJECT_TYPES),
+                'budget': round(rng.lognormvariate(15, 1), -3),
+                'deadline': deadline,
+                'status': status,
+                'created_at': created_at,
+                'updated_at': created_at,
+            }
+
+    def bid_and_document_rows(self, projects, first_candidate_id, first_bid_id, first_document_id,
+                              document_key, document_size):
+        """Offres et documents, projet par projet : ``('bids'|'documents', ligne)``"""
+        rng = self._random('bids')
+        bid_id = first_bid_id
+        document_id = first_document_id
+        whole_documents = int(self.documents_per_bid)
+        extra_document = self.documents_per_bid - whole_documents
+
+        for project in projects:
+            count = rng.randrange(self.bids_per_project // 2, self.bids_per_project * 3 // 2 + 1)
+            count = min(count, self.candidates)
+            winner = rng.randrange(count) if count else None
+            window = max((min(project['deadline'], self.reference) - project['created_at']).total_seconds(), 60)
+
+            for position, offset in enumerate(rng.sample(range(self.candidates), count)):
+                submitted_at = project['created_at'] + timedelta(seconds=rng.uniform(0, window))
+                status, reviewed_at = self._bid_status(rng, project, position == winner, submitted_at)
+                yield 'bids', {
+                    'id': bid_id,
+                    'project_id': project['id'],
+                    'candidate_id': first_candidate_id + offset,
+                    'proposed_amount': round(project['budget'] * rng.uniform(0.7, 1.2), 2),
+                    'proposed_timeline': f'{rng.randrange(1, 24)} mois',
+                    'status': status,
+                    'notes': None,
+                    'submitted_at': submitted_at,
+                    'reviewed_at': reviewed_at,
+                }
+
+                documents = whole_documents + (1 if rng.random() < extra_document else 0)
+                for kind in rng.sample(DOCUMENT_TYPES, min(documents, len(DOCUMENT_TYPES))):
+                    yield 'documents', {
+                        'id': document_id,
+                        'bid_id': bid_id,
+                        'document_type': kind,
+                        'file_name': f'{kind}_{bid_id}.pdf',
+                        'file_path': document_key,
+                        'file_size': document_size,
+                        'uploaded_at': submitted_at,
+                        'verified': rng.random() < 0.9,
+                        'verification_notes': 'Detected application/pdf, 1 page(s)',
+                    }
+                    document_id += 1
+                bid_id += 1
+
+    @staticmethod
+    def _bid_status(rng, project, is_winner, submitted_at):
+        if project['status'] == 'open':
+            return 'submitted', None
+        reviewed_at = project['deadline'] + timedelta(days=rng.uniform(1, 20))
+        if project['status'] == 'awarded':
+            return ('accepted' if is_winner else 'rejected'), reviewed_at
+        if project['status'] == 'under_review':
+            return rng.choice(('submitted', 'under_review', 'rejected')), reviewed_at
+        return 'rejected', reviewed_at
+
+
+# ============================================
+# CHARGEMENT
+# ============================================
+
+class BulkWriter:
+    """Tampon de lignes d'une table, écrit par lots (COPY ou executemany)"""
+
+    def __init__(self, table, batch_size=BATCH_SIZE, before_flush=None):
+        self.table = table
+        self.columns = [column.name for column in table.columns]
+        self.batch_size = batch_size
+        self.before_flush = before_flush
+        self.rows = []
+        self.written = 0
+        self.use_copy = db.engine.dialect.name == 'postgresql'
+
+    def add(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def extend(self, rows):
+        for row in rows:
+            self.add(row)
+        self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+        if self.before_flush is not None:
+            # Clés étrangères : la table parente doit être écrite d'abord
+            self.before_flush()
+        if self.use_copy:
+            self._copy()
+        else:
+            db.session.execute(insert(self.table), self.rows)
+        db.session.commit()
+        self.written += len(self.rows)
+        self.rows = []
+
+    def _copy(self):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in self.rows:
+            writer.writerow(['' if row.get(name) is None else _csv_value(row[name])
+                             for name in self.columns])
+        buffer.seek(0)
+        cursor = db.session.connection().connection.dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f'COPY {self.table.name} ({", ".join(self.columns)}) FROM STDIN WITH (FORMAT csv)',
+                buffer
+            )
+        finally:
+            cursor.close()
+
+
+def _csv_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    return value
+
+
+def _next_id(model):
+    return (db.session.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+
+def _reset_sequences():
+    """Après COPY avec identifiants explicites, recaler les séquences PostgreSQL"""
+    if db.engine.dialect.name != 'postgresql':
+        return
+    for model in (User, Candidate, Project, Bid, Document):
+        table = model.__tablename__
+        db.session.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"(SELECT COALESCE(MAX(id), 1) FROM {table}))"
+        ))
+    db.session.commit()
+
+
+def ensure_bench_admin(password_hash):
+    """Compte administrateur connu du banc d'essai (créé une seule fois)"""
+    admin = User.query.filter_by(email=BENCH_ADMIN_EMAIL).first()
+    if admin is None:
+        admin = User(username='bench_admin', email=BENCH_ADMIN_EMAIL,
+                     password_hash=password_hash, role='admin')
+        db.session.add(admin)
+        db.session.commit()
+    return admin
+
+
+def load_dataset(dataset, batch_size=BATCH_SIZE, progress=None):
+    """Charger ``dataset`` à la suite des données existantes ; retourne les volumes"""
+    from .cache import invalidate_project_cache
+    from .stats import invalidate_dashboard_stats
+    from .storage import get_storage
+
+    report = progress or (lambda message: None)
+    password_hash = hash_password(BENCH_PASSWORD)
+    ensure_bench_admin(password_hash)
+
+    first_user = _next_id(User)
+    first_candidate = _next_id(Candidate)
+    first_project = _next_id(Project)
+    first_bid = _next_id(Bid)
+    first_document = _next_id(Document)
+
+    users = BulkWriter(User.__table__, batch_size)
+    users.extend(dataset.users(first_user, password_hash))
+    report(f'users: {users.written}')
+
+    candidates = BulkWriter(Candidate.__table__, batch_size)
+    candidates.extend(dataset.candidate_rows(first_candidate, first_user))
+    report(f'candidates: {candidates.written}')
+
+    # Les offres ont besoin des dates et budgets des projets : on les garde
+    projects = []
+    project_writer = BulkWriter(Project.__table__, batch_size)
+    for row in dataset.project_rows(first_project):
+        projects.append({key: row[key] for key in ('id', 'created_at', 'deadline', 'budget', 'status')})
+        project_writer.add(row)
+    project_writer.flush()
+    report(f'projects: {project_writer.written}')
+
+    stored = get_storage().save(io.BytesIO(SAMPLE_PDF))
+    bids = BulkWriter(Bid.__table__, batch_size)
+    documents = BulkWriter(Document.__table__, batch_size, before_flush=bids.flush)
+    writers = {'bids': bids, 'documents': documents}
+    for table, row in dataset.bid_and_document_rows(projects, first_candidate, first_bid,
+                                                    first_document, stored.key, stored.size):
+        writers[table].add(row)
+    bids.flush()
+    documents.flush()
+    report(f'bids: {bids.written}, documents: {documents.written}')
+
+    _reset_sequences()
+    invalidate_dashboard_stats()
+    invalidate_project_cache()
+
+    return {
+        'users': users.written,
+        'candidates': candidates.written,
+        'projects': project_writer.written,
+        'bids': bids.written,
+        'documents': documents.written,
+    }
+
+
+# ============================================
+# CLI
+# ============================================
+
+synthetic_cli = AppGroup('synthetic', help='Synthetic data for load tests.')
+
+
+@synthetic_cli.command('load')
+@click.option('--scale', type=click.Choice(sorted(SCALES)), default='small', show_default=True)
+@click.option('--seed', default=42, show_default=True, type=int)
+@click.option('--candidates', type=int, help='Override the number of candidates.')
+@click.option('--projects', type=int, help='Override the number of projects.')
+@click.option('--bids-per-project', type=int, help='Override the average bids per project.')
+@click.option('--documents-per-bid', type=float, help='Override the average documents per bid.')
+@click.option('--batch-size', default=BATCH_SIZE, show_default=True, type=int)
+def load_command(scale, seed, candidates, projects, bids_per_project, documents_per_bid, batch_size):
+    """Générer et charger un jeu de données synthétique"""
+    dataset = SyntheticDataset.from_scale(
+        scale, seed=seed, candidates=candidates, projects=projects,
+        bids_per_project=bids_per_project, documents_per_bid=documents_per_bid
+    )
+    started = datetime.utcnow()
+    counts = load_dataset(dataset, batch_size=batch_size, progress=click.echo)
+    elapsed = (datetime.utcnow() - started).total_seconds()
+    click.echo(f'Loaded {sum(counts.values())} rows in {elapsed:.1f}s '
+               f'(admin: {BENCH_ADMIN_EMAIL} / {BENCH_PASSWORD}, '
+               f'candidates: bench-<id>@company.dz / {BENCH_PASSWORD})')
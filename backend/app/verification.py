@@ -0,0 +1,99 @@
+# backend/app/verification.py
+"""Vérification automatique des documents, exécutée en arrière-plan.
+
+Résultat dans ``Document.verified`` : vrai, faux (type non reconnu, PDF
+sans page) ou ``None`` quand la structure d'un PDF n'a pas pu être lue —
+indéterminé, ce document ne compte alors pas dans le critère
+« vérification » de l'évaluation.
+"""
+import tempfile
+from contextlib import closing
+
+from . import db
+from .jobs import job
+from .models import Document
+from .scoring import record_bids
+from .storage import get_storage
+
+
+# Signatures (« magic bytes ») des formats acceptés
+SIGNATURES = (
+    (b'%PDF-', 'application/pdf'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'PK\x03\x04', 'application/zip'),  # docx, xlsx, odt...
+)
+
+# Au-delà, un fichier à relire (stockage sans accès direct) passe sur disque
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+def sniff_type(head):
+    for signature, mime in SIGNATURES:
+        if head.startswith(signature):
+            return mime
+    return None
+
+
+def _seekable(stream, chunk_size, head=b''):
+    """``stream`` lui-même s'il permet l'accès direct, sinon une copie
+
+    ``head`` : octets déjà lus au début du flux, remis en tête de la copie.
+    """
+    if getattr(stream, 'seekable', None) and stream.seekable():
+        return stream
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    spool.write(head)
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+def count_pdf_pages(stream, chunk_size, head=b''):
+    """Nombre de pages déclaré par l'arbre des pages (``/Root /Pages /Count``)
+
+    Lu par pypdf à partir de la table des références : les objets rangés
+    dans des flux d'objets compressés (``/ObjStm``, PDF 1.5+) sont pris en
+    compte. ``None`` si la structure du fichier est illisible.
+    """
+    from pypdf import PdfReader
+    try:
+        return len(PdfReader(_seekable(stream, chunk_size, head), strict=False).pages)
+    except Exception:
+        return None
+
+
+@job('verify_document')
+def verify_document(document_id):
+    """Identifier le type réel du fichier et, pour un PDF, compter les pages"""
+    document = db.session.get(Document, document_id)
+    if document is None:
+        return
+
+    storage = get_storage()
+    with closing(storage.open(document.file_path)) as f:
+        head = f.read(16)
+        mime = sniff_type(head)
+        pages = None
+        if mime == 'application/pdf':
+            pages = count_pdf_pages(f, storage.chunk_size, head)
+
+    if mime is None:
+        document.verified = False
+        document.verification_notes = 'Unrecognized file type'
+    elif mime == 'application/pdf' and pages is None:
+        document.verified = None
+        document.verification_notes = 'PDF structure unreadable: verification indeterminate'
+    elif mime == 'application/pdf' and not pages:
+        document.verified = False
+        document.verification_notes = 'PDF without pages'
+    else:
+        document.verified = True
+        document.verification_notes = f'Detected {mime}' + (f', {pages} page(s)' if pages else '')
+    
+    # Critère « vérification » de l'évaluation : rafraîchir cette offre seulement
+    record_bids(document.bid.project_id, [document.bid_id])
@@ -0,0 +1,10 @@
+# backend/asgi.py
+"""Point d'entrée ASGI : ``uvicorn asgi:app --host 0.0.0.0 --port 5000 --workers 4``.
+
+Le schéma doit être à jour (``flask --app run schema upgrade``).
+"""
+from app import create_app
+from app.asgi import create_asgi_app
+
+flask_app = create_app()
+app = create_asgi_app(flask_app)
@@ -0,0 +1,11 @@
+# backend/benchmarks/__init__.py
+"""Bancs d'essai de performance (hors suite de tests).
+
+Charger d'abord un jeu de données synthétique dans une base jetable :
+
+    export DATABASE_URL=postgresql://.../tender_bench
+    flask --app run schema upgrade
+    flask --app run synthetic load --scale large
+
+puis lancer ``python -m benchmarks.harness`` (voir ``--help``).
+"""
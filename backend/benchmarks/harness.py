@@ -0,0 +1,660 @@
+# backend/benchmarks/harness.py
+"""Banc d'essai des routes de l'API.
+
+Chaque scénario couvre une route de l'application (``ROUTES`` doit rester
+exhaustif, un test le vérifie). Pour chaque scénario :
+
+1. préparation hors chronomètre des requêtes (jetons, projets jetables...) ;
+2. exécution chronométrée, séquentielle ou concurrente (``--concurrency``) ;
+3. calcul des p50/p95/p99, du débit et du nombre de requêtes SQL par
+   réponse (lu dans l'en-tête ``Server-Timing``).
+
+Deux modes : client de test Flask (par défaut, dans le processus) ou
+serveur local (``--base-url http://127.0.0.1:5000``). Dans les deux cas la
+base de ``DATABASE_URL`` doit contenir le jeu synthétique
+(``flask synthetic load``) : le banc y choisit ses identifiants et y écrit
+(inscriptions, offres, projets jetables).
+
+Les résultats peuvent être gardés comme référence et comparés :
+
+    python -m benchmarks.harness --iterations 200 --save-baseline sqlite-small
+    python -m benchmarks.harness --iterations 200 --compare sqlite-small
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), 'baselines')
+SEARCH_TERMS = ('climatisation', 'etancheite', 'ascenseurs', 'electrique', 'facade', 'plomberie')
+SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+# ============================================
+# CLIENTS
+# ============================================
+
+class Response:
+    def __init__(self, status, headers, body, elapsed):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.elapsed = elapsed
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+    @property
+    def queries(self):
+        match = SERVER_TIMING_QUERIES.search(self.headers.get('Server-Timing', ''))
+        return int(match.group(1)) if match else None
+
+
+class FlaskClient:
+    """Requêtes dans le processus, via le client de test Flask"""
+
+    def __init__(self, app):
+        self.app = app
+        self.client = app.test_client()
+
+    def drain_jobs(self):
+        """Exécuter les travaux en file (pas de worker séparé dans ce mode)"""
+        from app.jobs import process_jobs
+
+        with self.app.app_context():
+            process_jobs()
+
+    def request(self, method, path, headers=None, body=None):
+        started = time.perf_counter()
+        response = self.client.open(path, method=method, headers=headers or {}, data=body)
+        payload = response.get_data()
+        elapsed = time.perf_counter() - started
+        return Response(response.status_code, response.headers, payload, elapsed)
+
+
+class HTTPClient:
+    """Requêtes vers un serveur local (gunicorn, flask run...)"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+
+    def request(self, method, path, headers=None, body=None):
+        req = urllib.request.Request(self.base_url + path, data=body, headers=headers or {}, method=method)
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(req) as response:
+                payload = response.read()
+                status, response_headers = response.status, response.headers
+        except urllib.error.HTTPError as e:
+            payload = e.read()
+            status, response_headers = e.code, e.headers
+        elapsed = time.perf_counter() - started
+        return Response(status, response_headers, payload, elapsed)
+
+
+def json_request(method, path, payload=None, token=None, expect=(200,)):
+    headers = {'Content-Type': 'application/json'}
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    body = json.dumps(payload).encode() if payload is not None else None
+    return {'method': method, 'path': path, 'headers': headers, 'body': body, 'expect': expect}
+
+
+def multipart_request(path, fields, files, token, expect=(201,)):
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+    for name, (filename, content) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: application/pdf\r\n\r\n'.encode() + content + b'\r\n'
+        )
+    parts.append(f'--{boundary}--\r\n'.encode())
+    headers = {
+        'Content-Type': f'multipart/form-data; boundary={boundary}',
+        'Authorization': f'Bearer {token}',
+    }
+    return {'method': 'POST', 'path': path, 'headers': headers, 'body': b''.join(parts), 'expect': expect}
+
+
+# ============================================
+# CONTEXTE
+# ============================================
+
+class BenchContext:
+    """Identifiants du jeu synthétique et objets créés pendant le banc"""
+
+    def __init__(self, client, sample, seed=0):
+        self.client = client
+        self.rng = random.Random(seed)
+        self.run_id = uuid.uuid4().hex[:8]
+        self.project_ids = sample['project_ids']
+        self.bid_project_ids = sample['bid_project_ids']
+        self.document_ids = sample['document_ids']
+        self.candidate_email = sample['candidate_email']
+        self.admin_email = sample['admin_email']
+        self.password = sample['password']
+        self.created_projects = []
+        self.submitted_bids = []
+        self.export_id = None
+        self._counter = 0
+        self.admin_token = self.login(self.admin_email)
+        self.candidate_token = self.login(self.candidate_email)
+
+    def unique(self):
+        self._counter += 1
+        return f'{self.run_id}-{self._counter}'
+
+    def call(self, spec):
+        response = self.client.request(spec['method'], spec['path'], spec['headers'], spec['body'])
+        if response.status not in spec['expect']:
+            raise RuntimeError(f'{spec["method"]} {spec["path"]} -> {response.status}: {response.body[:200]!r}')
+        return response
+
+    def login(self, email):
+        response = self.call(json_request('POST', '/api/auth/login',
+                                          {'email': email, 'password': self.password}))
+        return response.json()['access_token']
+
+    def register(self):
+        spec = registration_request(self)
+        self.call(spec)
+        return json.loads(spec['body'])['email']
+
+    def create_project(self):
+        response = self.call(json_request('POST', '/api/projects', project_payload(self),
+                                          token=self.admin_token, expect=(201,)))
+        project_id = response.json()['id']
+        self.created_projects.append(project_id)
+        return project_id
+
+    def submitted_bid(self):
+        """Offre jetable (projet créé pour l'occasion) : ``(project_id, bid_id)``"""
+        if not self.submitted_bids:
+            project_id = self.create_project()
+            response = self.call(json_request('POST', f'/api/projects/{project_id}/bids',
+                                              {'proposed_amount': 1000}, token=self.candidate_token,
+                                              expect=(201,)))
+            self.submitted_bids.append((project_id, response.json()['bid_id']))
+        return self.rng.choice(self.submitted_bids)
+
+    def prepared_export(self, timeout=60):
+        """Export préparé et prêt : en mode HTTP, un worker doit tourner"""
+        response = self.call(json_request('POST', '/api/admin/exports', export_payload(self),
+                                          token=self.admin_token, expect=(202,)))
+        export_id = response.json()['id']
+        deadline = time.monotonic() + timeout
+        while True:
+            if hasattr(self.client, 'drain_jobs'):
+                self.client.drain_jobs()
+            status = self.call(json_request('GET', f'/api/admin/exports/{export_id}',
+                                            token=self.admin_token)).json()['status']
+            if status == 'ready':
+                return export_id
+            if status == 'failed' or time.monotonic() > deadline:
+                raise RuntimeError(f'Export {export_id} not ready ({status})')
+            time.sleep(0.2)
+
+
+def registration_request(ctx):
+    email = f'bench-run-{ctx.unique()}@company.dz'
+    return json_request('POST', '/api/auth/register', {
+        'username': email.split('@')[0], 'email': email, 'password': ctx.password,
+        'company_name': 'Bench Run SARL'
+    }, expect=(201,))
+
+
+def project_payload(ctx):
+    return {
+        'title': f'Bench {ctx.unique()} - Réfection de la climatisation',
+        'description': 'Projet créé par le banc d\'essai',
+        'project_type': 'repair',
+        'budget': 100000,
+        'deadline': (datetime.utcnow() + timedelta(days=30)).isoformat(),
+    }
+
+
+def export_payload(ctx):
+    return {'format': 'csv', 'project_id': ctx.rng.choice(ctx.bid_project_ids)}
+
+
+def sample_dataset(app, size=500):
+    """Choisir dans la base les identifiants utilisés par les scénarios"""
+    from sqlalchemy import func
+
+    from app import db
+    from app.models import Bid, Candidate, Document, Project, User
+    from app.synthetic import BENCH_ADMIN_EMAIL, BENCH_PASSWORD
+
+    with app.app_context():
+        def ids(query):
+            return [row[0] for row in query.order_by(func.random()).limit(size).all()]
+
+        candidate_email = (
+            db.session.query(User.email)
+            .join(Candidate, Candidate.user_id == User.id)
+            .filter(User.email.like('bench-%'), User.is_active.is_(True))
+            .order_by(func.random())
+            .limit(1)
+            .scalar()
+        )
+        sample = {
+            'project_ids': ids(db.session.query(Project.id)),
+            'bid_project_ids': ids(db.session.query(Bid.project_id).distinct()),
+            'document_ids': ids(db.session.query(Document.id)),
+            'candidate_email': candidate_email,
+            'admin_email': BENCH_ADMIN_EMAIL,
+            'password': BENCH_PASSWORD,
+        }
+        counts = {model.__tablename__: db.session.query(func.count(model.id)).scalar()
+                  for model in (User, Candidate, Project, Bid, Document)}
+        dialect = db.engine.dialect.name
+        db.session.remove()
+
+    if not sample['project_ids'] or not candidate_email:
+        raise SystemExit('No synthetic data found: run `flask synthetic load` first')
+    return sample, counts, dialect
+
+
+# ============================================
+# SCÉNARIOS
+# ============================================
+
+class Scenario:
+    """Une route (``rule``, ``method``) et la fabrique de ses requêtes"""
+
+    def __init__(self, name, method, rule, build):
+        self.name = name
+        self.method = method
+        self.rule = rule
+        self.build = build
+
+
+def _register(ctx, i):
+    return registration_request(ctx)
+
+
+def _login(ctx, i):
+    return json_request('POST', '/api/auth/login',
+                        {'email': ctx.candidate_email, 'password': ctx.password})
+
+
+def _logout(ctx, i):
+    return json_request('POST', '/api/auth/logout', token=ctx.login(ctx.candidate_email))
+
+
+def _projects(ctx, i):
+    return json_request('GET', '/api/projects?status=open&limit=50')
+
+
+def _search(ctx, i):
+    return json_request('GET', f'/api/projects/search?q={SEARCH_TERMS[i % len(SEARCH_TERMS)]}&limit=20')
+
+
+def _project(ctx, i):
+    return json_request('GET', f'/api/projects/{ctx.rng.choice(ctx.project_ids)}')
+
+
+def _submit_bid(ctx, i):
+    project_id = ctx.create_project()
+
+    def remember(response):
+        ctx.submitted_bids.append((project_id, response.json()['bid_id']))
+
+    spec = multipart_request(
+        f'/api/projects/{project_id}/bids',
+        {'proposed_amount': '95000', 'proposed_timeline': '6 mois'},
+        {'technical_proposal': ('technique.pdf', SAMPLE_UPLOAD),
+         'financial_proposal': ('financier.pdf', SAMPLE_UPLOAD)},
+        ctx.candidate_token
+    )
+    spec['on_response'] = remember
+    return spec
+
+
+def _document(ctx, i):
+    return json_request('GET', f'/api/documents/{ctx.rng.choice(ctx.document_ids)}', token=ctx.admin_token)
+
+
+def _archive(ctx, i):
+    project_id = ctx.rng.choice(ctx.bid_project_ids)
+    return json_request('GET', f'/api/admin/projects/{project_id}/documents/archive', token=ctx.admin_token)
+
+
+def _create_project(ctx, i):
+    spec = json_request('POST', '/api/projects', project_payload(ctx), token=ctx.admin_token, expect=(201,))
+    spec['on_response'] = lambda response: ctx.created_projects.append(response.json()['id'])
+    return spec
+
+
+def _update_project(ctx, i):
+    project_id = ctx.created_projects[-1] if ctx.created_projects else ctx.create_project()
+    return json_request('PUT', f'/api/projects/{project_id}',
+                        {'title': f'Bench {ctx.unique()} - Rénovation de la façade'}, token=ctx.admin_token)
+
+
+def _delete_project(ctx, i):
+    project_id = ctx.created_projects.pop() if ctx.created_projects else ctx.create_project()
+    # Les offres jetables de ce projet disparaissent avec lui
+    ctx.submitted_bids = [pair for pair in ctx.submitted_bids if pair[0] != project_id]
+    return json_request('DELETE', f'/api/projects/{project_id}', token=ctx.admin_token)
+
+
+def _dashboard(ctx, i):
+    return json_request('GET', '/api/admin/dashboard', token=ctx.admin_token)
+
+
+def _admin_bids(ctx, i):
+    if i % 2:
+        return json_request('GET', f'/api/admin/bids?project_id={ctx.rng.choice(ctx.bid_project_ids)}',
+                            token=ctx.admin_token)
+    return json_request('GET', '/api/admin/bids?limit=50', token=ctx.admin_token)
+
+
+def _bid_status(ctx, i):
+    _, bid_id = ctx.submitted_bid()
+    return json_request('PUT', f'/api/admin/bids/{bid_id}/status',
+                        {'status': 'under_review'}, token=ctx.admin_token)
+
+
+def _bid_statuses(ctx, i):
+    ctx.submitted_bid()
+    updates = [{'bid_id': bid_id, 'status': 'under_review'}
+               for _, bid_id in ctx.rng.sample(ctx.submitted_bids, min(10, len(ctx.submitted_bids)))]
+    return json_request('PUT', '/api/admin/bids/status', {'updates': updates}, token=ctx.admin_token)
+
+
+def _evaluation(ctx, i):
+    return json_request('GET', f'/api/admin/projects/{ctx.rng.choice(ctx.bid_project_ids)}/evaluation',
+                        token=ctx.admin_token)
+
+
+def _award(ctx, i):
+    project_id, bid_id = ctx.submitted_bid()
+    return json_request('POST', f'/api/admin/projects/{project_id}/award',
+                        {'bid_id': bid_id}, token=ctx.admin_token)
+
+
+def _deactivate(ctx, i):
+    email = ctx.register()
+    user_id = ctx.call(json_request('POST', '/api/auth/login',
+                                    {'email': email, 'password': ctx.password})).json()['user']['id']
+    return json_request('POST', f'/api/admin/users/{user_id}/deactivate', token=ctx.admin_token)
+
+
+def _export_stream(ctx, i):
+    fmt = 'xlsx' if i % 2 else 'csv'
+    return json_request('GET', f'/api/admin/exports/bids?format={fmt}&project_id={ctx.rng.choice(ctx.bid_project_ids)}',
+                        token=ctx.admin_token)
+
+
+def _export_request(ctx, i):
+    return json_request('POST', '/api/admin/exports', export_payload(ctx), token=ctx.admin_token, expect=(202,))
+
+
+def _export_status(ctx, i):
+    ctx.export_id = ctx.export_id or ctx.prepared_export()
+    return json_request('GET', f'/api/admin/exports/{ctx.export_id}', token=ctx.admin_token)
+
+
+def _export_download(ctx, i):
+    ctx.export_id = ctx.export_id or ctx.prepared_export()
+    return json_request('GET', f'/api/admin/exports/{ctx.export_id}/download', token=ctx.admin_token)
+
+
+def _jobs(ctx, i):
+    return json_request('GET', '/api/admin/jobs', token=ctx.admin_token)
+
+
+def _events(ctx, i):
+    # max_duration=0 : abonnement, reprise depuis l'historique puis fermeture
+    return json_request('GET', '/api/events?max_duration=0', token=ctx.candidate_token)
+
+
+def _health(ctx, i):
+    return json_request('GET', '/api/health')
+
+
+def _metrics(ctx, i):
+    return json_request('GET', '/api/metrics', token=ctx.admin_token)
+
+
+def _my_bids(ctx, i):
+    return json_request('GET', '/api/bids/mine', token=ctx.candidate_token)
+
+
+def _bids(ctx, i):
+    return json_request('GET', '/api/bids', token=ctx.candidate_token)
+
+
+SAMPLE_UPLOAD = b'%PDF-1.4\n1 0 obj << /Type /Page >> endobj\n%%EOF\n' + b'0' * 16 * 1024
+
+# Ordre significatif : les écritures réutilisent les objets des scénarios précédents
+ROUTES = (
+    Scenario('register', 'POST', '/api/auth/register', _register),
+    Scenario('login', 'POST', '/api/auth/login', _login),
+    Scenario('logout', 'POST', '/api/auth/logout', _logout),
+    Scenario('projects', 'GET', '/api/projects', _projects),
+    Scenario('projects_search', 'GET', '/api/projects/search', _search),
+    Scenario('project', 'GET', '/api/projects/<int:project_id>', _project),
+    Scenario('submit_bid', 'POST', '/api/projects/<int:project_id>/bids', _submit_bid),
+    Scenario('document', 'GET', '/api/documents/<int:document_id>', _document),
+    Scenario('documents_archive', 'GET', '/api/admin/projects/<int:project_id>/documents/archive', _archive),
+    Scenario('project_create', 'POST', '/api/projects', _create_project),
+    Scenario('project_update', 'PUT', '/api/projects/<int:project_id>', _update_project),
+    Scenario('admin_dashboard', 'GET', '/api/admin/dashboard', _dashboard),
+    Scenario('admin_bids', 'GET', '/api/admin/bids', _admin_bids),
+    Scenario('bid_status', 'PUT', '/api/admin/bids/<int:bid_id>/status', _bid_status),
+    Scenario('bid_statuses', 'PUT', '/api/admin/bids/status', _bid_statuses),
+    Scenario('evaluation', 'GET', '/api/admin/projects/<int:project_id>/evaluation', _evaluation),
+    Scenario('award', 'POST', '/api/admin/projects/<int:project_id>/award', _award),
+    Scenario('project_delete', 'DELETE', '/api/projects/<int:project_id>', _delete_project),
+    Scenario('deactivate_user', 'POST', '/api/admin/users/<int:user_id>/deactivate', _deactivate),
+    Scenario('export_stream', 'GET', '/api/admin/exports/bids', _export_stream),
+    Scenario('export_request', 'POST', '/api/admin/exports', _export_request),
+    Scenario('export_status', 'GET', '/api/admin/exports/<int:export_id>', _export_status),
+    Scenario('export_download', 'GET', '/api/admin/exports/<int:export_id>/download', _export_download),
+    Scenario('admin_jobs', 'GET', '/api/admin/jobs', _jobs),
+    Scenario('events', 'GET', '/api/events', _events),
+    Scenario('health', 'GET', '/api/health', _health),
+    Scenario('metrics', 'GET', '/api/metrics', _metrics),
+    Scenario('my_bids', 'GET', '/api/bids/mine', _my_bids),
+    Scenario('bids', 'GET', '/api/bids', _bids),
+)
+
+
+# ============================================
+# MESURE
+# ============================================
+
+def percentile(values, q):
+    """Percentile ``q`` (0-100) par interpolation linéaire"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def summarize(responses, wall_time, errors):
+    latencies = [r.elapsed * 1000 for r in responses]
+    queries = [r.queries for r in responses if r.queries is not None]
+    return {
+        'requests': len(responses),
+        'errors': errors,
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        'mean_ms': round(sum(latencies) / len(latencies), 3),
+        'throughput_rps': round(len(responses) / wall_time, 1) if wall_time else None,
+        'queries_median': percentile(queries, 50),
+        'queries_max': max(queries) if queries else None,
+    }
+
+
+def run_scenario(ctx, scenario, iterations, warmup=2, concurrency=1):
+    for i in range(warmup):
+        spec = scenario.build(ctx, i)
+        response = ctx.call(spec)
+        if spec.get('on_response'):
+            spec['on_response'](response)
+
+    # Préparation hors chronomètre (jetons, projets jetables...)
+    specs = [scenario.build(ctx, warmup + i) for i in range(iterations)]
+
+    def execute(spec):
+        return ctx.client.request(spec['method'], spec['path'], spec['headers'], spec['body'])
+
+    started = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(concurrency) as pool:
+            responses = list(pool.map(execute, specs))
+    else:
+        responses = [execute(spec) for spec in specs]
+    wall_time = time.perf_counter() - started
+
+    errors = 0
+    for spec, response in zip(specs, responses):
+        if response.status not in spec['expect']:
+            errors += 1
+        elif spec.get('on_response'):
+            spec['on_response'](response)
+    return summarize(responses, wall_time, errors)
+
+
+def run_benchmark(client, sample, iterations=50, warmup=2, concurrency=1, only=None, progress=None):
+    ctx = BenchContext(client, sample)
+    results = {}
+    for scenario in ROUTES:
+        if only and scenario.name not in only:
+            continue
+        results[scenario.name] = run_scenario(ctx, scenario, iterations, warmup, concurrency)
+        if progress:
+            progress(scenario.name, results[scenario.name])
+    return results
+
+
+# ============================================
+# RÉFÉRENCES
+# ============================================
+
+def baseline_path(name):
+    return os.path.join(BASELINE_DIR, f'{name}.json')
+
+
+def save_baseline(name, report):
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    with open(baseline_path(name), 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def load_baseline(name):
+    with open(baseline_path(name)) as f:
+        return json.load(f)
+
+
+def compare(results, baseline, tolerance=0.25):
+    """Écarts par scénario ; régression si p95 dépasse la tolérance ou plus de SQL"""
+    rows = []
+    for name, current in results.items():
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+        p95_change = (current['p95_ms'] - before['p95_ms']) / before['p95_ms'] if before['p95_ms'] else 0.0
+        more_queries = (current['queries_max'] or 0) > (before['queries_max'] or 0)
+        rows.append({
+            'scenario': name,
+            'p95_before': before['p95_ms'],
+            'p95_after': current['p95_ms'],
+            'p95_change': p95_change,
+            'queries_before': before['queries_max'],
+            'queries_after': current['queries_max'],
+            'regression': p95_change > tolerance or more_queries or current['errors'] > before['errors'],
+        })
+    return rows
+
+
+# ============================================
+# CLI
+# ============================================
+
+def _print_result(name, result):
+    print(f'{name:<20} {result["requests"]:>6} {result["errors"]:>4} '
+          f'{result["p50_ms"]:>9.2f} {result["p95_ms"]:>9.2f} {result["p99_ms"]:>9.2f} '
+          f'{result["throughput_rps"] or 0:>9.1f} {result["queries_max"] if result["queries_max"] is not None else "-":>7}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark every API route against the synthetic dataset.')
+    parser.add_argument('--base-url', help='Benchmark a running server instead of the Flask test client.')
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--concurrency', type=int, default=1)
+    parser.add_argument('--only', nargs='*', help='Scenario names to run.')
+    parser.add_argument('--output', help='Write the JSON report to this file.')
+    parser.add_argument('--save-baseline', metavar='NAME')
+    parser.add_argument('--compare', metavar='NAME', help='Compare with a stored baseline.')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed p95 increase (0.25 = +25%%).')
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from app import create_app
+
+    # Le banc mesure le coût des routes, pas les protections : en mode
+    # serveur, lancer celui-ci avec les mêmes variables
+    for name in ('RATE_LIMIT_ENABLED', 'ADMISSION_MAX_INFLIGHT', 'ADMISSION_P99_MS'):
+        os.environ.setdefault(name, '0')
+    app = create_app()
+    sample, counts, dialect = sample_dataset(app)
+    client = HTTPClient(args.base_url) if args.base_url else FlaskClient(app)
+
+    print(f'{"scenario":<20} {"n":>6} {"err":>4} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"req/s":>9} {"queries":>7}')
+    results = run_benchmark(client, sample, args.iterations, args.warmup, args.concurrency,
+                            only=args.only, progress=_print_result)
+
+    report = {
+        'meta': {
+            'created_at': datetime.utcnow().isoformat(),
+            'mode': 'http' if args.base_url else 'test_client',
+            'database': dialect,
+            'dataset': counts,
+            'iterations': args.iterations,
+            'concurrency': args.concurrency,
+            'python': platform.python_version(),
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    if args.save_baseline:
+        save_baseline(args.save_baseline, report)
+        print(f'Baseline saved to {baseline_path(args.save_baseline)}')
+
+    if args.compare:
+        rows = compare(results, load_baseline(args.compare), args.tolerance)
+        print(f'\n{"scenario":<20} {"p95 before":>11} {"p95 after":>10} {"change":>8} {"queries":>9}')
+        for row in rows:
+            flag = '  REGRESSION' if row['regression'] else ''
+            print(f'{row["scenario"]:<20} {row["p95_before"]:>11.2f} {row["p95_after"]:>10.2f} '
+                  f'{row["p95_change"]:>+8.0%} {row["queries_before"]!s:>4}->{row["queries_after"]!s:<4}{flag}')
+        if any(row['regression'] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
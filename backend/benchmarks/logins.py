@@ -0,0 +1,131 @@
+# backend/benchmarks/logins.py
+"""Banc d'essai des connexions : débit par cœur selon les paramètres de hachage.
+
+Pour chaque méthode (``--method``, répétable), l'application est créée sur
+une base SQLite temporaire avec ``PASSWORD_HASH_METHOD`` correspondant, un
+compte est inscrit, puis ``--clients`` threads enchaînent ``--logins``
+connexions (``POST /api/auth/login``) au total. On rapporte :
+
+- connexions/s (temps écoulé) et connexions/s par cœur (temps CPU du
+  processus : ce qu'un cœur absorbe réellement) ;
+- la latence p50/p95 d'une connexion et le coût d'un hachage seul ;
+- les réponses 503 si l'exécuteur de hachage (``--workers``,
+  ``--queue``) déborde.
+
+    python -m benchmarks.logins --method scrypt:32768:8:1 --method scrypt:16384:8:1 \\
+        --method pbkdf2:sha256:600000 --method pbkdf2:sha256:200000 --clients 8 --logins 200
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .harness import percentile
+
+
+DEFAULT_METHODS = ('scrypt:32768:8:1', 'scrypt:16384:8:1', 'pbkdf2:sha256:600000', 'pbkdf2:sha256:200000')
+EMAIL = 'bench-login@court.dz'
+PASSWORD = 'bench123'
+
+
+def make_app(method, workers, queue_size, database_path):
+    os.environ['DATABASE_URL'] = f'sqlite:///{database_path}'
+    os.environ['SCHEDULER_ENABLED'] = '0'
+    # Coût du hachage seul : ni limitation de débit ni contrôle d'admission
+    for name in ('RATE_LIMIT_ENABLED', 'ADMISSION_MAX_INFLIGHT', 'ADMISSION_P99_MS'):
+        os.environ[name] = '0'
+    from app import create_app, db
+
+    app = create_app()
+    app.config.update(PASSWORD_HASH_METHOD=method, PASSWORD_HASH_WORKERS=workers,
+                      PASSWORD_HASH_QUEUE=queue_size, JOB_QUEUE_BACKEND='memory', JOB_WORKERS=0,
+                      SLOW_REQUEST_MS=float('inf'))
+    with app.app_context():
+        db.create_all()
+    response = app.test_client().post('/api/auth/register', json={
+        'username': 'bench-login', 'email': EMAIL, 'password': PASSWORD, 'company_name': 'Bench'
+    })
+    if response.status_code != 201:
+        raise RuntimeError(f'register -> {response.status_code}')
+    return app
+
+
+def single_hash_ms(app, rounds=5):
+    from app.passwords import get_hasher
+    with app.app_context():
+        hasher = get_hasher()
+        started = time.perf_counter()
+        for _ in range(rounds):
+            hasher.hash(PASSWORD)
+        return (time.perf_counter() - started) * 1000 / rounds
+
+
+def run_method(method, clients, logins, workers, queue_size):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(method, workers, queue_size, os.path.join(tmp, 'logins.db'))
+        hash_ms = single_hash_ms(app)
+        latencies = []
+        statuses = {}
+        lock = threading.Lock()
+        local = threading.local()
+
+        def login(_):
+            if not hasattr(local, 'client'):
+                local.client = app.test_client()
+            started = time.perf_counter()
+            status = local.client.post('/api/auth/login', json={'email': EMAIL, 'password': PASSWORD}).status_code
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                latencies.append(elapsed)
+                statuses[status] = statuses.get(status, 0) + 1
+
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            list(pool.map(login, range(logins)))
+        wall = time.perf_counter() - started
+        cpu = time.process_time() - cpu_started
+        app.extensions['password_hasher'].shutdown()
+
+    ok = statuses.get(200, 0)
+    return {
+        'method': method,
+        'hash_ms': round(hash_ms, 2),
+        'logins_per_s': round(ok / wall, 1),
+        'logins_per_core_s': round(ok / cpu, 1) if cpu else None,
+        'p50_ms': round(percentile(latencies, 50), 1),
+        'p95_ms': round(percentile(latencies, 95), 1),
+        'statuses': {str(code): count for code, count in sorted(statuses.items())},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--method', action='append', dest='methods',
+                        help='PASSWORD_HASH_METHOD à mesurer (répétable)')
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--logins', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='PASSWORD_HASH_WORKERS')
+    parser.add_argument('--queue', type=int, default=64, help='PASSWORD_HASH_QUEUE')
+    parser.add_argument('--json', action='store_true', help='sortie JSON')
+    args = parser.parse_args(argv)
+
+    results = [run_method(method, args.clients, args.logins, args.workers, args.queue)
+               for method in args.methods or DEFAULT_METHODS]
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+    print(f'{"method":<24}{"hash ms":>9}{"login/s":>10}{"/core/s":>10}{"p50 ms":>9}{"p95 ms":>9}  statuses')
+    for row in results:
+        print(f'{row["method"]:<24}{row["hash_ms"]:>9}{row["logins_per_s"]:>10}'
+              f'{row["logins_per_core_s"]:>10}{row["p50_ms"]:>9}{row["p95_ms"]:>9}  {row["statuses"]}')
+
+
+if __name__ == '__main__':
+    main()
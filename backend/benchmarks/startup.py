@@ -0,0 +1,164 @@
+# backend/benchmarks/startup.py
+"""Banc d'essai du démarrage : d'un processus neuf à la première réponse.
+
+Chaque essai lance un interpréteur neuf qui importe l'application, appelle
+``create_app()`` puis sert une première requête (``--path``, par défaut
+``GET /api/projects`` : première connexion et première requête SQL
+comprises). On rapporte la médiane et le maximum de chaque étape :
+
+- ``import_ms`` : ``from app import create_app`` ;
+- ``create_app_ms`` : configuration, extensions, blueprints (aucune
+  connexion à la base) ;
+- ``first_request_ms`` : première réponse, par le client de test ;
+- ``process_ms`` : tout l'essai vu du parent, interpréteur compris.
+
+La base est une base SQLite jetable créée par ``flask schema create``.
+Comme le banc des routes, les résultats se gardent comme référence et se
+comparent (échec si la médiane de ``process_ms`` dépasse la tolérance, ou
+le budget ``--budget-ms``) :
+
+    python -m benchmarks.startup --runs 10 --save-baseline startup-sqlite
+    python -m benchmarks.startup --runs 10 --compare startup-sqlite
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from .harness import baseline_path, load_baseline, save_baseline
+
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+STAGES = ('import_ms', 'create_app_ms', 'first_request_ms', 'process_ms')
+
+
+def measure(path):
+    """Dans le processus enfant : durée de chaque étape jusqu'à la première réponse"""
+    started = time.perf_counter()
+    from app import create_app
+    imported = time.perf_counter()
+    app = create_app()
+    created = time.perf_counter()
+    status = app.test_client().get(path).status_code
+    served = time.perf_counter()
+    return {
+        'import_ms': (imported - started) * 1000,
+        'create_app_ms': (created - imported) * 1000,
+        'first_request_ms': (served - created) * 1000,
+        'status': status,
+        'modules': len(sys.modules),
+    }
+
+
+def prepare_database(env):
+    subprocess.run([sys.executable, '-m', 'flask', '--app', 'run', 'schema', 'create'],
+                   cwd=BACKEND_DIR, env=env, check=True, capture_output=True)
+
+
+def run_once(env, path):
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, '-m', 'benchmarks.startup', '--child', '--path', path],
+                               cwd=BACKEND_DIR, env=env, check=True, capture_output=True, text=True)
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result['process_ms'] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def run_benchmark(runs, path):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'startup.db')}",
+                   SCHEDULER_ENABLED='0')
+        prepare_database(env)
+        samples = [run_once(env, path) for _ in range(runs)]
+
+    statuses = sorted({sample['status'] for sample in samples})
+    results = {}
+    for stage in STAGES:
+        values = [sample[stage] for sample in samples]
+        results[stage] = {'median': round(statistics.median(values), 1), 'max': round(max(values), 1)}
+    return results, statuses, samples[-1]['modules']
+
+
+def compare(results, baseline, tolerance=0.25):
+    """Écarts par étape ; régression si la médiane du processus entier dépasse la tolérance"""
+    rows = []
+    for stage in STAGES:
+        before = baseline['results'].get(stage)
+        if before is None:
+            continue
+        after = results[stage]['median']
+        change = (after - before['median']) / before['median'] if before['median'] else 0.0
+        rows.append({
+            'stage': stage,
+            'before': before['median'],
+            'after': after,
+            'change': change,
+            'regression': stage == 'process_ms' and change > tolerance,
+        })
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure process start-up up to the first response.')
+    parser.add_argument('--runs', type=int, default=10, help='Fresh processes to start.')
+    parser.add_argument('--path', default='/api/projects', help='First request (GET).')
+    parser.add_argument('--output', help='Write the JSON report to this file.')
+    parser.add_argument('--save-baseline', metavar='NAME')
+    parser.add_argument('--compare', metavar='NAME', help='Compare with a stored baseline.')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed increase of the median start-up time (0.25 = +25%%).')
+    parser.add_argument('--budget-ms', type=float, help='Fail if the median start-up time exceeds this.')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure(args.path)))
+        return 0
+
+    results, statuses, modules = run_benchmark(args.runs, args.path)
+    print(f'{"stage":<18} {"median ms":>10} {"max ms":>9}')
+    for stage in STAGES:
+        print(f'{stage:<18} {results[stage]["median"]:>10.1f} {results[stage]["max"]:>9.1f}')
+    print(f'first response: GET {args.path} -> {", ".join(map(str, statuses))}; {modules} modules loaded')
+
+    report = {
+        'meta': {
+            'created_at': datetime.utcnow().isoformat(),
+            'runs': args.runs,
+            'path': args.path,
+            'modules': modules,
+            'python': platform.python_version(),
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    if args.save_baseline:
+        save_baseline(args.save_baseline, report)
+        print(f'Baseline saved to {baseline_path(args.save_baseline)}')
+
+    failed = statuses != [200]
+    if args.compare or args.budget_ms is not None:
+        baseline = load_baseline(args.compare) if args.compare else {'results': {}}
+        rows = compare(results, baseline, args.tolerance)
+        if rows:
+            print(f'\n{"stage":<18} {"before":>9} {"after":>9} {"change":>8}')
+        for row in rows:
+            flag = '  REGRESSION' if row['regression'] else ''
+            print(f'{row["stage"]:<18} {row["before"]:>9.1f} {row["after"]:>9.1f} {row["change"]:>+8.0%}{flag}')
+        over_budget = args.budget_ms is not None and results['process_ms']['median'] > args.budget_ms
+        if over_budget:
+            print(f'process_ms median above budget ({args.budget_ms:g} ms)')
+        failed = failed or over_budget or any(row['regression'] for row in rows)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
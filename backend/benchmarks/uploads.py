@@ -0,0 +1,215 @@
+# backend/benchmarks/uploads.py
+"""Banc d'essai des envois lents : déploiement synchrone contre ASGI.
+
+Chaque client envoie un dépôt d'offre (pièce jointe de ``--size`` octets)
+au débit de ``--rate`` octets/s, comme un candidat sur une liaison lente.
+Pendant ce temps, une sonde appelle ``GET /api/health`` en continu. On
+compare, pour chaque serveur :
+
+- le débit d'envois terminés (envois/s) et leur latence ;
+- la latence de la sonde (p50/p95) : sous gunicorn synchrone, elle monte
+  dès que tous les workers sont occupés à lire des corps de requête.
+
+Les deux serveurs partagent la base ``DATABASE_URL`` chargée avec le jeu
+synthétique (``flask synthetic load``) ; les serveurs sont lancés sans
+limitation de débit ni contrôle d'admission (``RATE_LIMIT_ENABLED=0``,
+``ADMISSION_MAX_INFLIGHT=0``, ``ADMISSION_P99_MS=0``) :
+
+    gunicorn -c gunicorn.conf.py run:app --bind 127.0.0.1:8000
+    uvicorn asgi:app --workers 4 --port 8001
+    python -m benchmarks.uploads --target sync=http://127.0.0.1:8000 \\
+        --target asgi=http://127.0.0.1:8001 --clients 32 --size 1048576 --rate 262144
+"""
+import argparse
+import http.client
+import json
+import sys
+import threading
+import time
+import urllib.parse
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from .harness import HTTPClient, json_request, percentile, project_payload
+
+
+CHUNK_SIZE = 16 * 1024
+
+
+class Target:
+    """Serveur mesuré : comptes candidats et projets jetables préparés hors chronomètre"""
+
+    def __init__(self, name, base_url, admin_email, password):
+        self.name = name
+        self.base_url = base_url.rstrip('/')
+        self.client = HTTPClient(self.base_url)
+        self.password = password
+        self.run_id = uuid.uuid4().hex[:8]
+        self._counter = 0
+        self.admin_token = self.login(admin_email)
+
+    def unique(self):
+        self._counter += 1
+        return f'{self.run_id}-{self._counter}'
+
+    def call(self, spec):
+        response = self.client.request(spec['method'], spec['path'], spec['headers'], spec['body'])
+        if response.status not in spec['expect']:
+            raise RuntimeError(f'{self.name}: {spec["method"]} {spec["path"]} -> {response.status}')
+        return response
+
+    def login(self, email):
+        return self.call(json_request('POST', '/api/auth/login',
+                                      {'email': email, 'password': self.password})).json()['access_token']
+
+    def candidate(self):
+        email = f'bench-upload-{self.unique()}@company.dz'
+        self.call(json_request('POST', '/api/auth/register', {
+            'username': email.split('@')[0], 'email': email, 'password': self.password,
+            'company_name': 'Bench Upload SARL'
+        }, expect=(201,)))
+        return self.login(email)
+
+    def project(self):
+        return self.call(json_request('POST', '/api/projects', project_payload(self),
+                                      token=self.admin_token, expect=(201,))).json()['id']
+
+
+# ============================================
+# ENVOIS
+# ============================================
+
+def multipart_parts(size):
+    """(en-tête, pied, Content-Type) d'un dépôt avec une pièce de ``size`` octets"""
+    boundary = uuid.uuid4().hex
+    head = (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="proposed_amount"\r\n\r\n1000\r\n'
+        f'--{boundary}\r\nContent-Disposition: form-data; name="technical_proposal"; filename="bench.pdf"\r\n'
+        f'Content-Type: application/pdf\r\n\r\n'
+    ).encode()
+    tail = f'\r\n--{boundary}--\r\n'.encode()
+    return head, tail, f'multipart/form-data; boundary={boundary}'
+
+
+def throttled(head, size, tail, rate):
+    """Corps envoyé par blocs à ``rate`` octets/s"""
+    payload = b'%PDF-1.4\n' + b'0' * max(size - 9, 0)
+    chunks = [head] + [payload[i:i + CHUNK_SIZE] for i in range(0, len(payload), CHUNK_SIZE)] + [tail]
+    started = time.perf_counter()
+    sent = 0
+    for chunk in chunks:
+        yield chunk
+        sent += len(chunk)
+        delay = sent / rate - (time.perf_counter() - started)
+        if delay > 0:
+            time.sleep(delay)
+
+
+def slow_upload(base_url, token, project_id, size, rate, timeout):
+    """Un dépôt lent ; ``(statut, secondes)``"""
+    url = urllib.parse.urlsplit(base_url)
+    head, tail, content_type = multipart_parts(size)
+    length = len(head) + size + len(tail)
+    connection = http.client.HTTPConnection(url.hostname, url.port, timeout=timeout)
+    started = time.perf_counter()
+    try:
+        connection.request('POST', f'/api/projects/{project_id}/bids',
+                           body=throttled(head, size, tail, rate),
+                           headers={'Content-Type': content_type, 'Content-Length': str(length),
+                                    'Authorization': f'Bearer {token}'})
+        response = connection.getresponse()
+        response.read()
+        status = response.status
+    except (OSError, http.client.HTTPException):
+        status = None
+    finally:
+        connection.close()
+    return status, time.perf_counter() - started
+
+
+def probe(client, stop, interval, latencies, failures):
+    """Sonde ``/api/health`` jusqu'à ``stop``"""
+    while not stop.is_set():
+        response = client.request('GET', '/api/health')
+        if response.status == 200:
+            latencies.append(response.elapsed * 1000)
+        else:
+            failures.append(response.status)
+        stop.wait(interval)
+
+
+def run_target(target, clients, uploads, size, rate, timeout):
+    # Un compte par client, un projet par envoi : (projet, candidat) est unique
+    tokens = [target.candidate() for _ in range(clients)]
+    jobs = [(tokens[i % clients], target.project()) for i in range(uploads)]
+
+    stop = threading.Event()
+    probe_latencies, probe_failures = [], []
+    prober = threading.Thread(target=probe, args=(target.client, stop, 0.05, probe_latencies, probe_failures))
+    prober.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(clients) as pool:
+        results = list(pool.map(lambda job: slow_upload(target.base_url, *job, size, rate, timeout), jobs))
+    wall_time = time.perf_counter() - started
+    stop.set()
+    prober.join()
+
+    done = [elapsed * 1000 for status, elapsed in results if status == 201]
+    return {
+        'uploads': len(results),
+        'errors': len(results) - len(done),
+        'uploads_per_s': round(len(done) / wall_time, 2),
+        'upload_p50_ms': round(percentile(done, 50) or 0, 1),
+        'upload_p95_ms': round(percentile(done, 95) or 0, 1),
+        'probe_requests': len(probe_latencies),
+        'probe_errors': len(probe_failures),
+        'probe_p50_ms': round(percentile(probe_latencies, 50) or 0, 2),
+        'probe_p95_ms': round(percentile(probe_latencies, 95) or 0, 2),
+        'wall_time_s': round(wall_time, 2),
+    }
+
+
+# ============================================
+# CLI
+# ============================================
+
+def main(argv=None):
+    from app.synthetic import BENCH_ADMIN_EMAIL, BENCH_PASSWORD
+
+    parser = argparse.ArgumentParser(description='Compare slow concurrent uploads between running servers.')
+    parser.add_argument('--target', action='append', required=True, metavar='NAME=URL',
+                        help='Server to measure (repeatable), e.g. sync=http://127.0.0.1:8000')
+    parser.add_argument('--clients', type=int, default=32, help='Concurrent slow uploaders.')
+    parser.add_argument('--uploads', type=int, help='Total uploads per server (default: 2 x clients).')
+    parser.add_argument('--size', type=int, default=1024 * 1024, help='Attachment size in bytes.')
+    parser.add_argument('--rate', type=int, default=256 * 1024, help='Upload speed per client (bytes/s).')
+    parser.add_argument('--timeout', type=float, default=120.0)
+    parser.add_argument('--admin-email', default=BENCH_ADMIN_EMAIL)
+    parser.add_argument('--password', default=BENCH_PASSWORD)
+    parser.add_argument('--output', help='Write the JSON report to this file.')
+    args = parser.parse_args(argv)
+
+    report = {
+        'meta': {'clients': args.clients, 'size': args.size, 'rate': args.rate},
+        'results': {},
+    }
+    print(f'{"target":<10} {"uploads":>7} {"err":>4} {"up/s":>7} {"up p95 ms":>10} '
+          f'{"probe p50":>10} {"probe p95":>10} {"probe err":>9}')
+    for item in args.target:
+        name, _, url = item.partition('=')
+        target = Target(name, url, args.admin_email, args.password)
+        result = run_target(target, args.clients, args.uploads or 2 * args.clients,
+                            args.size, args.rate, args.timeout)
+        report['results'][name] = result
+        print(f'{name:<10} {result["uploads"]:>7} {result["errors"]:>4} {result["uploads_per_s"]:>7.2f} '
+              f'{result["upload_p95_ms"]:>10.1f} {result["probe_p50_ms"]:>10.2f} '
+              f'{result["probe_p95_ms"]:>10.2f} {result["probe_errors"]:>9}')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
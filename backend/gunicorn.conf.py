@@ -0,0 +1,54 @@
+# backend/gunicorn.conf.py
+"""Configuration gunicorn, chargée automatiquement depuis ce dossier.
+
+Workers et threads se règlent par l'environnement. Chaque worker a son
+pool SQLAlchemy (``DB_POOL_SIZE`` + ``DB_MAX_OVERFLOW``) : prévoir au moins
+``GUNICORN_THREADS`` connexions par worker, et
+workers × (pool + débordement) sous ``max_connections`` de PostgreSQL.
+"""
+import multiprocessing
+import os
+
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_class = 'gthread' if threads > 1 else 'sync'
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+# Recyclage périodique des workers (fuites mémoire), décalé pour ne pas tous les relancer ensemble
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+
+
+def on_starting(server):
+    """Migrations par le maître avant les workers, seulement si ``MIGRATE_ON_START=1``
+
+    Par défaut le schéma se met à jour à part (``flask --app run schema
+    upgrade``) : le démarrage n'ouvre aucune connexion.
+    """
+    if os.environ.get('MIGRATE_ON_START', '0') != '1':
+        return
+    from app.database import dispose_engines
+    from app.schema import upgrade_schema
+    from run import app
+    with app.app_context():
+        upgrade_schema()
+    # Aucune connexion ouverte ne doit être héritée par les workers
+    dispose_engines(app)
+
+
+def post_fork(server, worker):
+    """Ne pas réutiliser les connexions éventuellement ouvertes avant le fork"""
+    import sys
+    if 'run' in sys.modules:
+        from app.database import dispose_engines
+        dispose_engines(sys.modules['run'].app, close=False)
+
+
+def post_worker_init(worker):
+    """Chaque worker fait tourner le planificateur ; un verrou élit l'exécutant"""
+    from app.scheduler import start_scheduler
+    start_scheduler(worker.wsgi)
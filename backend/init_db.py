@@ -1,3 +1,4 @@
+from flask_migrate import stamp
 from app import create_app, db
 from app.models import User, Candidate, Project
 from datetime import datetime, timedelta
@@ -11,6 +12,7 @@ with app.app_context():
     
     print("Creating all tables...")
     db.create_all()
+    stamp()
     
     # Create admin user
     admin = User(username='admin', email='admin@court.dz', role='admin')
@@ -0,0 +1,39 @@
+"""indexes on hot lookup columns, unique bid per (project, candidate)
+
+Revision ID: 0002_hot_lookup_indexes
+Revises: 0001_initial_schema
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002_hot_lookup_indexes'
+down_revision = '0001_initial_schema'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_candidates_user_id', 'candidates', ['user_id'], unique=False)
+    op.create_index('ix_projects_created_at_id', 'projects', ['created_at', 'id'], unique=False)
+    op.create_index('ix_projects_status_created_at_id', 'projects', ['status', 'created_at', 'id'], unique=False)
+    # Échoue si des doublons existent déjà : les résoudre avant la mise à jour
+    op.create_index('uq_bids_project_candidate', 'bids', ['project_id', 'candidate_id'], unique=True)
+    op.create_index('ix_bids_candidate_submitted_at_id', 'bids', ['candidate_id', 'submitted_at', 'id'], unique=False)
+    op.create_index('ix_bids_submitted_at_id', 'bids', ['submitted_at', 'id'], unique=False)
+    op.create_index('ix_bids_status', 'bids', ['status'], unique=False)
+    op.create_index('ix_documents_bid_id', 'documents', ['bid_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_documents_bid_id', table_name='documents')
+    op.drop_index('ix_bids_status', table_name='bids')
+    op.drop_index('ix_bids_submitted_at_id', table_name='bids')
+    op.drop_index('ix_bids_candidate_submitted_at_id', table_name='bids')
+    op.drop_index('uq_bids_project_candidate', table_name='bids')
+    op.drop_index('ix_projects_status_created_at_id', table_name='projects')
+    op.drop_index('ix_projects_created_at_id', table_name='projects')
+    op.drop_index('ix_candidates_user_id', table_name='candidates')
@@ -0,0 +1,80 @@
+"""full-text search index on projects
+
+Revision ID: 0004_project_search
+Revises: 0003_jobs_queue
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0004_project_search'
+down_revision = '0003_jobs_queue'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+        op.execute(
+            "DO $$ BEGIN "
+            "IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'french_unaccent') THEN "
+            "CREATE TEXT SEARCH CONFIGURATION french_unaccent (COPY = french); "
+            "ALTER TEXT SEARCH CONFIGURATION french_unaccent "
+            "ALTER MAPPING FOR hword, hword_part, word WITH unaccent, french_stem; "
+            "END IF; END $$"
+        )
+        # Colonne générée : remplie pour les lignes existantes à l'ajout
+        op.execute(
+            "ALTER TABLE projects ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('french_unaccent', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('french_unaccent', coalesce(description, '')), 'B')"
+            ") STORED"
+        )
+        op.execute('CREATE INDEX ix_projects_search_vector ON projects USING gin (search_vector)')
+
+    elif dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE projects_fts USING fts5("
+            "title, description, content='projects', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        op.execute(
+            "CREATE TRIGGER projects_fts_insert AFTER INSERT ON projects BEGIN "
+            "INSERT INTO projects_fts(rowid, title, description) "
+            "VALUES (new.id, new.title, new.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER projects_fts_delete AFTER DELETE ON projects BEGIN "
+            "INSERT INTO projects_fts(projects_fts, rowid, title, description) "
+            "VALUES ('delete', old.id, old.title, old.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER projects_fts_update AFTER UPDATE OF title, description ON projects BEGIN "
+            "INSERT INTO projects_fts(projects_fts, rowid, title, description) "
+            "VALUES ('delete', old.id, old.title, old.description); "
+            "INSERT INTO projects_fts(rowid, title, description) "
+            "VALUES (new.id, new.title, new.description); END"
+        )
+        # Indexer les projets déjà présents
+        op.execute("INSERT INTO projects_fts(projects_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_projects_search_vector')
+        op.execute('ALTER TABLE projects DROP COLUMN IF EXISTS search_vector')
+        op.execute('DROP TEXT SEARCH CONFIGURATION IF EXISTS french_unaccent')
+
+    elif dialect == 'sqlite':
+        op.execute('DROP TRIGGER IF EXISTS projects_fts_insert')
+        op.execute('DROP TRIGGER IF EXISTS projects_fts_delete')
+        op.execute('DROP TRIGGER IF EXISTS projects_fts_update')
+        op.execute('DROP TABLE IF EXISTS projects_fts')
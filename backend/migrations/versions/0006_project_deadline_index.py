@@ -0,0 +1,24 @@
+"""index on projects by status and deadline
+
+Revision ID: 0006_project_deadline_index
+Revises: 0005_exports
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006_project_deadline_index'
+down_revision = '0005_exports'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_projects_status_deadline', 'projects', ['status', 'deadline'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_projects_status_deadline', table_name='projects')
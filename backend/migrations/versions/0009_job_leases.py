@@ -0,0 +1,25 @@
+"""lease on running jobs
+
+Revision ID: 0009_job_leases
+Revises: 0008_revoked_tokens
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0009_job_leases'
+down_revision = '0008_revoked_tokens'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('jobs', sa.Column('locked_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.drop_column('locked_at')
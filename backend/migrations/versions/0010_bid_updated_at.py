@@ -0,0 +1,26 @@
+"""updated_at on bids
+
+Revision ID: 0010_bid_updated_at
+Revises: 0009_job_leases
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0010_bid_updated_at'
+down_revision = '0009_job_leases'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('bids', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute('UPDATE bids SET updated_at = COALESCE(reviewed_at, submitted_at)')
+
+
+def downgrade():
+    with op.batch_alter_table('bids') as batch_op:
+        batch_op.drop_column('updated_at')
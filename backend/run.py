@@ -1,14 +1,14 @@
 import os
-from app import create_app, db
+from app import create_app
+from app.scheduler import start_scheduler
 
+# Aucune connexion à la base ici : le schéma se met à jour à part
+# (flask --app run schema upgrade)
 app = create_app()
 
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     
-    with app.app_context():
-        db.create_all()
-        print("✓ Database tables created!")
-    
+    start_scheduler(app)
     app.run(host='0.0.0.0', port=port)
-    
\ No newline at end of file
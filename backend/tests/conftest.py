@@ -1,26 +1,131 @@
-import sys
 import os
+import re
+import sys
+from functools import partial
 
 # Ajouter le dossier parent au PYTHONPATH
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session
+
 from app import create_app, db
-from app.models import User, Candidate, Project
+from app.ratelimit import create_admission, create_rate_limiter
+from factories import make_candidate, make_user
 
-@pytest.fixture(scope='function')
-def app():
-    """Create application for testing"""
+# Réglages de toutes les applications créées par les tests (y compris
+# celles que certains tests construisent eux-mêmes)
+TEST_ENVIRONMENT = {
+    # Base en mémoire par défaut : jamais de fichier instance/app.db dans
+    # l'arborescence (la session et les tests qui le veulent fixent la leur)
+    'DATABASE_URL': 'sqlite://',
+    'SCHEDULER_ENABLED': '0',
+    'JOB_QUEUE_BACKEND': 'memory',
+    'JOB_WORKERS': '0',  # les tests vident la file eux-mêmes (process_jobs)
+    # Hachage au coût minimal, dans le thread appelant : rien à protéger ici
+    'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1',
+    'PASSWORD_HASH_WORKERS': '0',
+    'METRICS_TOKEN': 'test-metrics-token',
+}
+
+TRANSACTION_CONTROL = re.compile(r'\s*(BEGIN|SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK TO SAVEPOINT)\b', re.I)
+
+
+def pytest_configure(config):
+    os.environ.update(TEST_ENVIRONMENT)
+    config.addinivalue_line(
+        'markers', 'commits: écritures réellement validées (autre thread ou connexion), '
+                   'tables vidées après le test au lieu du SAVEPOINT'
+    )
+
+
+def _sqlite_begin(connection):
+    connection.exec_driver_sql('BEGIN')
+
+
+@pytest.fixture(scope='session')
+def _app(tmp_path_factory):
+    """Application et schéma partagés par la session ; une base par worker xdist"""
+    worker = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+    os.environ['DATABASE_URL'] = f"sqlite:///{tmp_path_factory.mktemp('db') / f'test-{worker}.db'}"
     app = create_app()
     app.config['TESTING'] = True
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
     app.config['WTF_CSRF_ENABLED'] = False
-    
+
     with app.app_context():
         db.create_all()
-        yield app
-        db.session.remove()
-        db.drop_all()
+
+    # État de référence, rétabli avant chaque test
+    baseline = (dict(app.config), set(app.extensions), list(app.extensions['metrics']._extra))
+    yield app, baseline
+
+    with app.app_context():
+        db.engine.dispose()
+
+
+def _reset_state(app, baseline):
+    """Configuration d'origine, caches et compteurs du processus remis à zéro"""
+    config, extensions, collectors = baseline
+    app.config.clear()
+    app.config.update(config)
+    for key in set(app.extensions) - extensions:
+        del app.extensions[key]
+    app.extensions['rate_limiter'] = create_rate_limiter(app.config)
+    app.extensions['admission'] = create_admission(app.config)
+    registry = app.extensions['metrics']
+    registry.__init__()
+    registry._extra.extend(collectors)
+
+
+def _delete_all_rows():
+    db.session.rollback()
+    for table in reversed(db.metadata.sorted_tables):
+        db.session.execute(table.delete())
+    db.session.commit()
+
+
+@pytest.fixture(scope='function')
+def app(_app, request, tmp_path):
+    """Application de test ; les écritures du test sont annulées à la fin
+
+    Le test s'exécute dans une transaction ouverte sur une seule connexion :
+    chaque ``commit`` ne libère qu'un SAVEPOINT, et tout est annulé ensuite.
+    """
+    app, baseline = _app
+    _reset_state(app, baseline)
+    app.config['UPLOAD_FOLDER'] = str(tmp_path / 'uploads')
+
+    with app.app_context():
+        if request.node.get_closest_marker('commits'):
+            try:
+                yield app
+            finally:
+                _delete_all_rows()
+                db.session.remove()
+            return
+
+        connection = db.engine.connect()
+        # pysqlite ouvre lui-même ses transactions et gère mal SAVEPOINT :
+        # sur cette connexion, SQLAlchemy les pilote entièrement
+        driver = connection.connection.driver_connection
+        driver.isolation_level = None
+        event.listen(connection, 'begin', _sqlite_begin)
+        outer = connection.begin()
+        # Une session par thread, partagée par les contextes imbriqués du
+        # test : deux sessions sur la même connexion imbriqueraient leurs
+        # SAVEPOINT, et l'annulation de l'une emporterait l'autre
+        scoped = db.session
+        db.session = scoped_session(partial(scoped.session_factory, bind=connection,
+                                            join_transaction_mode='create_savepoint'))
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.session = scoped
+            outer.rollback()
+            driver.isolation_level = ''
+            connection.close()
 
 @pytest.fixture(scope='function')
 def client(app):
@@ -31,9 +136,7 @@ def client(app):
 def admin_user(app):
     """Create admin user"""
     with app.app_context():
-        admin = User(username='admin_test', email='admin@test.com', role='admin')
-        admin.set_password('admin123')
-        db.session.add(admin)
+        admin = make_user(username='admin_test', email='admin@test.com', role='admin', password='admin123')
         db.session.commit()
         return admin
 
@@ -41,18 +144,8 @@ def admin_user(app):
 def candidate_user(app):
     """Create candidate user with profile"""
     with app.app_context():
-        candidate_user = User(username='candidate_test', email='candidate@test.com', role='candidate')
-        candidate_user.set_password('pass123')
-        db.session.add(candidate_user)
-        db.session.flush()
-        
-        candidate = Candidate(
-            user_id=candidate_user.id,
-            company_name='Test Company',
-            phone='0555123456',
-            registration_number='RC123'
-        )
-        db.session.add(candidate)
+        candidate_user = make_user(username='candidate_test', email='candidate@test.com', password='pass123')
+        make_candidate(candidate_user, company_name='Test Company', registration_number='RC123')
         db.session.commit()
         return candidate_user
 
@@ -72,4 +165,33 @@ def candidate_token(client, candidate_user):
         'email': 'candidate@test.com',
         'password': 'pass123'
     })
-    return response.json['access_token']
\ No newline at end of file
+    return response.json['access_token']
+
+@pytest.fixture(scope='function')
+def metrics_headers():
+    """En-tête du collecteur Prometheus pour ``/api/metrics``"""
+    return {'Authorization': f"Bearer {TEST_ENVIRONMENT['METRICS_TOKEN']}"}
+
+
+@pytest.fixture(scope='function')
+def count_queries(app):
+    """Compter les requêtes SQL émises dans un bloc ``with``"""
+    from contextlib import contextmanager
+
+    @contextmanager
+    def _count():
+        statements = []
+
+        def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            # Les SAVEPOINT viennent de l'isolation des tests, pas du code testé
+            if not TRANSACTION_CONTROL.match(statement):
+                statements.append(statement)
+
+        engine = db.engine
+        event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', _before_cursor_execute)
+
+    return _count
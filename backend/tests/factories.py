@@ -0,0 +1,63 @@
+"""Constructeurs des objets de test : valeurs par défaut valides, surchargées au besoin.
+
+Chaque constructeur ajoute l'objet à la session et fait un ``flush`` (pour
+obtenir son identifiant) ; l'appelant décide du ``commit``. Les objets
+manquants sont créés à la volée : ``make_document()`` crée son offre, son
+projet et son candidat.
+"""
+import itertools
+from datetime import datetime, timedelta
+
+from app import db
+from app.models import Bid, Candidate, Document, Project, User
+
+
+_sequence = itertools.count(1)
+
+
+def _add(obj):
+    db.session.add(obj)
+    db.session.flush()
+    return obj
+
+
+def make_user(password='pass123', **overrides):
+    n = next(_sequence)
+    values = {'username': f'user{n}', 'email': f'user{n}@test.com', 'role': 'candidate'}
+    values.update(overrides)
+    user = User(**values)
+    user.set_password(password)
+    return _add(user)
+
+
+def make_candidate(user=None, **overrides):
+    user = user or make_user()
+    values = {'company_name': f'Company {user.id}', 'phone': '0555123456',
+              'registration_number': f'RC{user.id}'}
+    values.update(overrides)
+    return _add(Candidate(user_id=user.id, **values))
+
+
+def make_project(**overrides):
+    n = next(_sequence)
+    values = {'title': f'Project {n}', 'description': 'Test', 'project_type': 'repair',
+              'budget': 50000, 'deadline': datetime.utcnow() + timedelta(days=30)}
+    values.update(overrides)
+    return _add(Project(**values))
+
+
+def make_bid(project=None, candidate=None, **overrides):
+    project = project or make_project()
+    candidate = candidate or make_candidate()
+    values = {'proposed_amount': 45000}
+    values.update(overrides)
+    return _add(Bid(project_id=project.id, candidate_id=candidate.id, **values))
+
+
+def make_document(bid=None, **overrides):
+    bid = bid or make_bid()
+    n = next(_sequence)
+    values = {'document_type': 'technical_proposal', 'file_name': f'document{n}.pdf',
+              'file_path': f'documents/{n}.pdf', 'file_size': 1024}
+    values.update(overrides)
+    return _add(Document(bid_id=bid.id, **values))
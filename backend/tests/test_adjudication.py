@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+
+from app import db
+from app.models import Bid, Candidate, Project, User
+
+
+def _seed_project_with_bids(app, count):
+    with app.app_context():
+        project = Project(title='Award Project', description='Test', project_type='repair',
+                          budget=50000, deadline=datetime.now() + timedelta(days=30))
+        db.session.add(project)
+        db.session.flush()
+        offset = User.query.count()
+        for i in range(offset, offset + count):
+            user = User(username=f'bidder_{i}', email=f'bidder_{i}@test.com',
+                        password_hash='x', role='candidate')
+            db.session.add(user)
+            db.session.flush()
+            candidate = Candidate(user_id=user.id, company_name=f'Company {i}')
+            db.session.add(candidate)
+            db.session.flush()
+            db.session.add(Bid(project_id=project.id, candidate_id=candidate.id,
+                               proposed_amount=40000 + i))
+        db.session.commit()
+        return project.id, [b.id for b in Bid.query.filter_by(project_id=project.id).order_by(Bid.id)]
+
+
+def test_award_project(client, app, admin_token):
+    project_id, bid_ids = _seed_project_with_bids(app, 4)
+    other_project_id, other_bids = _seed_project_with_bids(app, 2)
+
+    response = client.post(f'/api/admin/projects/{project_id}/award',
+                           headers={'Authorization': f'Bearer {admin_token}'},
+                           json={'bid_id': bid_ids[2], 'notes': 'Best offer'})
+    assert response.status_code == 200
+    assert response.json['rejected_bids'] == 3
+
+    bids = {b.id: b for b in Bid.query.filter_by(project_id=project_id)}
+    assert bids[bid_ids[2]].status == 'accepted'
+    assert bids[bid_ids[2]].notes == 'Best offer'
+    assert all(bids[i].status == 'rejected' for i in bid_ids if i != bid_ids[2])
+    assert all(b.reviewed_at is not None for b in bids.values())
+    assert db.session.get(Project, project_id).status == 'awarded'
+
+    # Les offres des autres projets ne bougent pas
+    assert {b.status for b in Bid.query.filter_by(project_id=other_project_id)} == {'submitted'}
+
+
+def test_award_rejects_bid_of_other_project(client, app, admin_token):
+    project_id, _ = _seed_project_with_bids(app, 2)
+    _, other_bids = _seed_project_with_bids(app, 1)
+
+    response = client.post(f'/api/admin/projects/{project_id}/award',
+                           headers={'Authorization': f'Bearer {admin_token}'},
+                           json={'bid_id': other_bids[0]})
+    assert response.status_code == 404
+    assert db.session.get(Project, project_id).status == 'open'
+    assert {b.status for b in Bid.query} == {'submitted'}
+
+
+def test_award_query_count_is_constant(client, app, admin_token, count_queries):
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    small_project, small_bids = _seed_project_with_bids(app, 2)
+    large_project, large_bids = _seed_project_with_bids(app, 40)
+    client.get('/api/admin/bids', headers=headers)  # chauffe la liste de blocage JWT
+
+    with count_queries() as few:
+        client.post(f'/api/admin/projects/{small_project}/award', headers=headers,
+                    json={'bid_id': small_bids[0]})
+    with count_queries() as many:
+        client.post(f'/api/admin/projects/{large_project}/award', headers=headers,
+                    json={'bid_id': large_bids[0]})
+    assert len(many) == len(few)
+
+
+def test_bulk_bid_status_changes(client, app, admin_token, count_queries):
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    _, bid_ids = _seed_project_with_bids(app, 30)
+    client.get('/api/admin/bids', headers=headers)
+
+    updates = [{'bid_id': bid_id, 'status': 'under_review'} for bid_id in bid_ids]
+    updates[0] = {'bid_id': bid_ids[0], 'status': 'rejected', 'notes': 'Incomplete file'}
+    updates.append({'bid_id': 999999, 'status': 'accepted'})
+    updates.append({'bid_id': bid_ids[1], 'status': 'bogus'})
+
+    with count_queries() as statements:
+        response = client.put('/api/admin/bids/status', headers=headers, json={'updates': updates})
+    assert response.status_code == 200
+    # SELECT des identifiants + un seul UPDATE, quel que soit le nombre d'offres
+    assert sum(1 for s in statements if s.lstrip().upper().startswith('UPDATE')) == 1
+
+    results = response.json['results']
+    assert len(results) == len(updates)
+    assert results[-2] == {'bid_id': 999999, 'result': 'error', 'message': 'Bid not found'}
+    assert results[-1]['message'] == 'Invalid status'
+
+    bids = {b.id: b for b in Bid.query}
+    assert bids[bid_ids[0]].status == 'rejected'
+    assert bids[bid_ids[0]].notes == 'Incomplete file'
+    assert bids[bid_ids[5]].status == 'under_review'
+    assert bids[bid_ids[5]].notes is None
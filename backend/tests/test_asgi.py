@@ -0,0 +1,176 @@
+import io
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from starlette.testclient import TestClient
+
+from app import create_app, db
+from app.asgi import create_asgi_app
+from app.models import Candidate, Project, User
+
+PDF = b'%PDF-1.4\n1 0 obj << /Type /Page >> endobj\n%%EOF\n' + b'0' * 4096
+
+
+@pytest.fixture
+def flask_app(tmp_path, monkeypatch):
+    """Base SQLite sur fichier : partagée par les sessions synchrone et asynchrone"""
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'asgi.db'}")
+    app = create_app()
+    app.config.update(
+        TESTING=True,
+        UPLOAD_FOLDER=str(tmp_path / 'uploads'),
+        JOB_QUEUE_BACKEND='memory',
+        JOB_WORKERS=0,
+        SCHEDULER_ENABLED=False,
+    )
+    with app.app_context():
+        db.create_all()
+        admin = User(username='admin_test', email='admin@test.com', role='admin')
+        admin.set_password('admin123')
+        db.session.add(admin)
+        for i in range(2):
+            user = User(username=f'candidate{i}', email=f'candidate{i}@test.com', role='candidate')
+            user.set_password('pass123')
+            db.session.add(user)
+            db.session.flush()
+            db.session.add(Candidate(user_id=user.id, company_name=f'Company {i}'))
+        for i in range(3):
+            db.session.add(Project(title=f'Project {i}', description='Test', project_type='repair', budget=50000,
+                                   deadline=datetime.now() + timedelta(days=30),
+                                   created_at=datetime(2030, 1, 1) + timedelta(days=i)))
+        db.session.commit()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def asgi_client(flask_app):
+    with TestClient(create_asgi_app(flask_app)) as client:
+        yield client
+
+
+def _login(client, email, password):
+    response = client.post('/api/auth/login', json={'email': email, 'password': password})
+    assert response.status_code == 200
+    return {'Authorization': f"Bearer {response.json()['access_token']}"}
+
+
+def _submit_bid(client, headers, project_id=1):
+    return client.post(f'/api/projects/{project_id}/bids', headers=headers,
+                       data={'proposed_amount': '45000', 'proposed_timeline': '3 mois'},
+                       files={'technical_proposal': ('offre.pdf', io.BytesIO(PDF), 'application/pdf')})
+
+
+def test_project_listing_matches_flask_view(flask_app, asgi_client):
+    response = asgi_client.get('/api/projects?limit=2')
+    assert response.status_code == 200
+    assert response.headers['X-Cache'] == 'MISS'
+    assert 'desc="1 queries"' in response.headers['Server-Timing']
+
+    # Même clé, même entrée de cache, même corps que la vue Flask
+    flask_response = flask_app.test_client().get('/api/projects?limit=2')
+    assert flask_response.headers['X-Cache'] == 'HIT'
+    assert flask_response.get_data() == response.content
+    assert [p['title'] for p in response.json()] == ['Project 2', 'Project 1']
+
+    next_page = asgi_client.get(f"/api/projects?limit=2&cursor={response.headers['X-Next-Cursor']}")
+    assert [p['title'] for p in next_page.json()] == ['Project 0']
+
+    revalidated = asgi_client.get('/api/projects?limit=2', headers={'If-None-Match': response.headers['ETag']})
+    assert revalidated.status_code == 304
+
+
+def test_upload_is_buffered_then_handled_by_flask(flask_app, asgi_client):
+    headers = _login(asgi_client, 'candidate0@test.com', 'pass123')
+    response = _submit_bid(asgi_client, headers)
+    assert response.status_code == 201
+
+    bids = asgi_client.get('/api/bids/mine', headers=headers)
+    assert bids.status_code == 200
+    assert [b['id'] for b in bids.json()] == [response.json()['bid_id']]
+    assert bids.json()[0]['company_name'] == 'Company 0'
+
+
+def test_oversized_body_is_rejected(flask_app):
+    flask_app.config['MAX_CONTENT_LENGTH'] = 1024
+    with TestClient(create_asgi_app(flask_app)) as client:
+        headers = _login(client, 'candidate0@test.com', 'pass123')
+        response = _submit_bid(client, headers)
+    assert response.status_code == 413
+
+
+def test_async_document_download(flask_app, asgi_client):
+    owner = _login(asgi_client, 'candidate0@test.com', 'pass123')
+    _submit_bid(asgi_client, owner)
+
+    response = asgi_client.get('/api/documents/1', headers=owner)
+    assert response.status_code == 200
+    assert response.content == PDF
+    assert 'attachment' in response.headers['Content-Disposition']
+
+    etag = response.headers['ETag']
+    assert asgi_client.get('/api/documents/1', headers={**owner, 'If-None-Match': etag}).status_code == 304
+
+    partial = asgi_client.get('/api/documents/1', headers={**owner, 'Range': 'bytes=0-7'})
+    assert partial.status_code == 206
+    assert partial.content == PDF[:8]
+
+    other = _login(asgi_client, 'candidate1@test.com', 'pass123')
+    assert asgi_client.get('/api/documents/1', headers=other).status_code == 403
+    assert asgi_client.get('/api/documents/1').status_code == 401
+    admin = _login(asgi_client, 'admin@test.com', 'admin123')
+    assert asgi_client.get('/api/documents/99', headers=admin).status_code == 404
+
+
+def test_async_event_stream(flask_app, asgi_client):
+    candidate = _login(asgi_client, 'candidate0@test.com', 'pass123')
+    bid_id = _submit_bid(asgi_client, candidate).json()['bid_id']
+    admin = _login(asgi_client, 'admin@test.com', 'admin123')
+
+    def review():
+        flask_app.test_client().put(f'/api/admin/bids/{bid_id}/status', json={'status': 'accepted'}, headers=admin)
+
+    timer = threading.Timer(0.2, review)
+    timer.start()
+    response = asgi_client.get('/api/events?max_duration=0.6', headers=candidate)
+    timer.join()
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/event-stream')
+    assert 'event: bid.status' in response.text
+    assert f'"bid_id": {bid_id}' in response.text
+
+
+def test_async_routes_pass_admission(flask_app, asgi_client):
+    from app.ratelimit import AdmissionControl
+    admission = flask_app.extensions['admission'] = AdmissionControl(max_inflight=1)
+    assert asgi_client.get('/api/projects').status_code == 200
+    assert admission.inflight == 0
+
+    admission.admit()
+    response = asgi_client.get('/api/projects')
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '1'
+    assert asgi_client.get('/api/health').status_code == 200
+    assert admission.shed == {'inflight': 1}
+
+
+def test_sync_routes_still_served(asgi_client):
+    assert asgi_client.get('/api/health').json() == {'status': 'healthy'}
+    assert asgi_client.get('/api/projects/1').json()['title'] == 'Project 0'
+
+
+def test_async_listing_is_compressed(flask_app, asgi_client):
+    flask_app.config['COMPRESSION_MIN_SIZE'] = 0
+    response = asgi_client.get('/api/projects', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert [p['title'] for p in response.json()] == ['Project 2', 'Project 1', 'Project 0']
+
+    etag = response.headers['ETag']
+    assert etag.startswith('W/')
+    assert asgi_client.get('/api/projects', headers={'If-None-Match': etag}).status_code == 304
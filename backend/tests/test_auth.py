@@ -1,3 +1,9 @@
+from datetime import datetime, timedelta
+
+from app.auth import purge_revoked_tokens
+from app.models import User
+
+
 def test_register_candidate(client):
     response = client.post('/api/auth/register', json={
         'username': 'newuser',
@@ -36,4 +42,94 @@ def test_register_duplicate_email(client, admin_user):
         'company_name': 'Another Company'
     })
     assert response.status_code == 400
-    assert 'Email already registered' in response.json['message']
\ No newline at end of file
+    assert 'Email already registered' in response.json['message']
+
+def test_login_token_carries_role_claims(client, candidate_user):
+    from flask_jwt_extended import decode_token
+
+    response = client.post('/api/auth/login', json={
+        'email': 'candidate@test.com',
+        'password': 'pass123'
+    })
+    claims = decode_token(response.json['access_token'])
+    assert claims['role'] == 'candidate'
+    assert claims['candidate_id'] is not None
+
+
+def test_protected_route_does_not_load_user(client, admin_token, count_queries):
+    """L'autorisation se fait sur les claims : aucune lecture de ``users``"""
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    client.get('/api/admin/dashboard', headers=headers)
+
+    with count_queries() as statements:
+        response = client.get('/api/admin/bids', headers=headers)
+    assert response.status_code == 200
+    assert not any('FROM users' in statement for statement in statements)
+
+
+def test_logout_revokes_token(client, admin_token):
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    assert client.post('/api/auth/logout', headers=headers).status_code == 200
+    assert client.get('/api/admin/bids', headers=headers).status_code == 401
+
+
+def test_deactivated_user_token_rejected(client, admin_token, candidate_user, candidate_token):
+    from app.models import User
+
+    candidate_headers = {'Authorization': f'Bearer {candidate_token}'}
+    assert client.get('/api/bids/mine', headers=candidate_headers).status_code == 200
+
+    user_id = User.query.filter_by(email='candidate@test.com').first().id
+    response = client.post(f'/api/admin/users/{user_id}/deactivate',
+                           headers={'Authorization': f'Bearer {admin_token}'})
+    assert response.status_code == 200
+
+    assert client.get('/api/bids/mine', headers=candidate_headers).status_code == 401
+    response = client.post('/api/auth/login', json={
+        'email': 'candidate@test.com',
+        'password': 'pass123'
+    })
+    assert response.status_code == 403
+
+
+def test_revocation_seen_by_other_processes(tmp_path, monkeypatch):
+    """Logout et désactivation dans un worker : refusés par un autre à sa relecture"""
+    from app import create_app, db
+    from factories import make_user
+
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'shared.db'}")
+    first, second = create_app(), create_app()
+    with first.app_context():
+        db.create_all()
+        make_user(email='admin@workers.test', role='admin')
+        make_user(email='other@workers.test', role='admin')
+        db.session.commit()
+
+    def login(email):
+        response = first.test_client().post('/api/auth/login', json={'email': email, 'password': 'pass123'})
+        return {'Authorization': f"Bearer {response.json['access_token']}"}
+
+    admin, other = login('admin@workers.test'), login('other@workers.test')
+    client = second.test_client()
+    assert client.get('/api/admin/dashboard', headers=admin).status_code == 200
+    assert client.get('/api/admin/dashboard', headers=other).status_code == 200
+
+    assert first.test_client().post('/api/auth/logout', headers=admin).status_code == 200
+    with first.app_context():
+        other_id = db.session.query(User.id).filter_by(email='other@workers.test').scalar()
+    response = first.test_client().post(f'/api/admin/users/{other_id}/deactivate',
+                                        headers=login('admin@workers.test'))
+    assert response.status_code == 200
+
+    # Liste de ``second`` relue au prochain contrôle
+    second.config['JWT_BLOCKLIST_REFRESH'] = 0
+    assert client.get('/api/admin/dashboard', headers=admin).status_code == 401
+    assert client.get('/api/admin/dashboard', headers=other).status_code == 401
+
+    with first.app_context():
+        assert purge_revoked_tokens(datetime.utcnow()) == 0
+        assert purge_revoked_tokens(datetime.utcnow() + timedelta(days=2)) == 1
+        db.session.commit()
+        db.engine.dispose()
+    with second.app_context():
+        db.engine.dispose()
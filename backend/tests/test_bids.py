@@ -32,4 +32,140 @@ def test_get_my_bids(client, candidate_token):
         headers={'Authorization': f'Bearer {candidate_token}'}
     )
     assert response.status_code == 200
-    assert isinstance(response.json, list)
\ No newline at end of file
+    assert isinstance(response.json, list)
+
+def _seed_bids(app, count, candidate_email=None):
+    """Créer un projet et ``count`` offres de candidats distincts"""
+    from app.models import User, Candidate, Bid
+
+    with app.app_context():
+        project = Project(
+            title='Bulk Project',
+            description='Test',
+            project_type='repair',
+            budget=50000,
+            deadline=datetime.now() + timedelta(days=30)
+        )
+        db.session.add(project)
+        db.session.flush()
+
+        offset = Bid.query.count()
+        for i in range(offset, offset + count):
+            if candidate_email is not None:
+                user = User.query.filter_by(email=candidate_email).first()
+                candidate = Candidate.query.filter_by(user_id=user.id).first()
+                bid_project = Project(
+                    title=f'Project {i}',
+                    description='Test',
+                    project_type='repair',
+                    budget=50000,
+                    deadline=datetime.now() + timedelta(days=30)
+                )
+                db.session.add(bid_project)
+                db.session.flush()
+                project_id = bid_project.id
+            else:
+                user = User(username=f'bidder_{i}', email=f'bidder_{i}@test.com',
+                            password_hash='x', role='candidate')
+                db.session.add(user)
+                db.session.flush()
+                candidate = Candidate(user_id=user.id, company_name=f'Company {i}')
+                db.session.add(candidate)
+                db.session.flush()
+                project_id = project.id
+
+            db.session.add(Bid(
+                project_id=project_id,
+                candidate_id=candidate.id,
+                proposed_amount=40000 + i,
+                proposed_timeline='15 days'
+            ))
+        db.session.commit()
+
+
+def test_admin_bid_listing_query_count_is_constant(client, admin_token, app, count_queries):
+    """La liste admin coûte le même nombre de requêtes pour 1 ou 25 offres"""
+    headers = {'Authorization': f'Bearer {admin_token}'}
+
+    _seed_bids(app, 1)
+    client.get('/api/admin/bids', headers=headers)  # chauffe la liste de blocage JWT
+    with count_queries() as few:
+        response = client.get('/api/admin/bids', headers=headers)
+    assert response.status_code == 200
+    assert len(response.json) == 1
+
+    _seed_bids(app, 25)
+    with count_queries() as many:
+        response = client.get('/api/admin/bids', headers=headers)
+    assert response.status_code == 200
+    assert len(response.json) == 26
+    assert len(many) == len(few)
+
+    bid = response.json[0]
+    assert bid['project_title'] == 'Bulk Project'
+    assert bid['company_name'].startswith('Company ')
+
+
+def test_my_bids_query_count_is_constant(client, candidate_token, app, count_queries):
+    """La liste « mes offres » ne fait pas de requête par offre"""
+    headers = {'Authorization': f'Bearer {candidate_token}'}
+
+    _seed_bids(app, 1, candidate_email='candidate@test.com')
+    client.get('/api/bids/mine', headers=headers)  # chauffe la liste de blocage JWT
+    with count_queries() as few:
+        response = client.get('/api/bids/mine', headers=headers)
+    assert response.status_code == 200
+    assert len(response.json) == 1
+
+    _seed_bids(app, 10, candidate_email='candidate@test.com')
+    with count_queries() as many:
+        response = client.get('/api/bids/mine', headers=headers)
+    assert response.status_code == 200
+    assert len(response.json) == 11
+    assert len(many) == len(few)
+    assert response.json[0]['company_name'] == 'Test Company'
+
+
+def test_admin_bid_listing_pagination(client, admin_token, app):
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    _seed_bids(app, 25)
+
+    seen = []
+    cursor = None
+    while True:
+        url = '/api/admin/bids?limit=10' + (f'&cursor={cursor}' if cursor else '')
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        seen.extend(b['id'] for b in response.json)
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+
+    assert len(seen) == len(set(seen)) == 25
+
+    response = client.get('/api/admin/bids?status=accepted', headers=headers)
+    assert response.json == []
+
+
+def test_submit_duplicate_bid_rejected(client, candidate_token, app):
+    with app.app_context():
+        project = Project(
+            title='Test Project',
+            description='Test',
+            project_type='repair',
+            budget=50000,
+            deadline=datetime.now() + timedelta(days=30)
+        )
+        db.session.add(project)
+        db.session.commit()
+        project_id = project.id
+
+    headers = {'Authorization': f'Bearer {candidate_token}'}
+    payload = {'proposed_amount': '45000', 'proposed_timeline': '15 days'}
+
+    response = client.post(f'/api/projects/{project_id}/bids', headers=headers, data=payload)
+    assert response.status_code == 201
+
+    response = client.post(f'/api/projects/{project_id}/bids', headers=headers, data=payload)
+    assert response.status_code == 400
+    assert 'already submitted' in response.json['message']
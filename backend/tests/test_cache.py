@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+
+from app import db
+from app.cache import LRUCache, RedisCache, ResponseCache, get_response_cache
+from app.models import Project
+
+
+def _add_project(app, title='Cached Project'):
+    with app.app_context():
+        project = Project(title=title, description='Test', project_type='repair',
+                          budget=1000, deadline=datetime.now() + timedelta(days=30))
+        db.session.add(project)
+        db.session.commit()
+        return project.id
+
+
+def test_project_listing_served_from_cache(client, app, count_queries):
+    _add_project(app)
+
+    first = client.get('/api/projects')
+    assert first.status_code == 200
+    assert first.headers['X-Cache'] == 'MISS'
+    assert first.headers['ETag']
+
+    with count_queries() as statements:
+        second = client.get('/api/projects')
+    assert second.headers['X-Cache'] == 'HIT'
+    assert second.json == first.json
+    assert statements == []
+
+    # Paramètres différents : entrée distincte
+    assert client.get('/api/projects?status=open').headers['X-Cache'] == 'MISS'
+
+    stats = get_response_cache().stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 2
+
+
+def test_if_none_match_returns_304(client, app):
+    project_id = _add_project(app)
+
+    response = client.get(f'/api/projects/{project_id}')
+    etag = response.headers['ETag']
+    assert response.headers['Last-Modified']
+
+    response = client.get(f'/api/projects/{project_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+
+def test_project_write_invalidates_cache(client, app, admin_token):
+    project_id = _add_project(app)
+    headers = {'Authorization': f'Bearer {admin_token}'}
+
+    before = client.get(f'/api/projects/{project_id}')
+    etag = before.headers['ETag']
+
+    response = client.put(f'/api/projects/{project_id}', headers=headers, json={'title': 'Renamed'})
+    assert response.status_code == 200
+
+    after = client.get(f'/api/projects/{project_id}', headers={'If-None-Match': etag})
+    assert after.status_code == 200
+    assert after.headers['X-Cache'] == 'MISS'
+    assert after.json['title'] == 'Renamed'
+    assert after.headers['ETag'] != etag
+    assert get_response_cache().stats()['invalidations'] == 1
+
+
+def test_missing_project_not_cached(client):
+    assert client.get('/api/projects/4242').status_code == 404
+    assert get_response_cache().stats()['entries'] == 0
+
+
+def test_cache_counters_in_metrics(client, app, metrics_headers):
+    _add_project(app)
+    client.get('/api/projects')
+    client.get('/api/projects')
+
+    body = client.get('/api/metrics', headers=metrics_headers).get_data(as_text=True)
+    assert 'response_cache_hits_total 1' in body
+    assert 'response_cache_misses_total 1' in body
+
+
+def test_lru_eviction_and_ttl():
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set('projects:0:a', 1)
+    cache.set('projects:0:b', 2)
+    assert cache.get('projects:0:a') == 1
+    cache.set('projects:0:c', 3)
+    # « b » était le moins récemment utilisé
+    assert cache.get('projects:0:b') is None
+    assert cache.get('projects:0:a') == 1
+
+    expired = LRUCache(maxsize=2, ttl=-1)
+    expired.set('k', 1)
+    assert expired.get('k') is None
+
+
+class StubRedis:
+    """Bouchon local des commandes redis-py utilisées"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+
+def test_redis_backend_shares_invalidation(client, app):
+    shared = StubRedis()
+    app.extensions['response_cache'] = ResponseCache(RedisCache(shared))
+    _add_project(app)
+
+    assert client.get('/api/projects').headers['X-Cache'] == 'MISS'
+    assert client.get('/api/projects').headers['X-Cache'] == 'HIT'
+
+    # Un autre worker invalide via le même serveur Redis
+    ResponseCache(RedisCache(shared)).invalidate('projects')
+    assert client.get('/api/projects').headers['X-Cache'] == 'MISS'
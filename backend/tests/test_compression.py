@@ -0,0 +1,71 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import db
+from app.compression import negotiate
+from app.models import Project
+
+
+def _add_projects(app, count=20):
+    with app.app_context():
+        for i in range(count):
+            db.session.add(Project(title=f'Project {i}', description='Travaux de réfection ' * 10,
+                                   project_type='repair', budget=1000,
+                                   deadline=datetime.now() + timedelta(days=30)))
+        db.session.commit()
+
+
+def test_large_listing_is_gzipped(client, app):
+    _add_projects(app)
+    plain = client.get('/api/projects')
+    assert 'Content-Encoding' not in plain.headers
+    assert 'Accept-Encoding' in plain.headers['Vary']
+
+    response = client.get('/api/projects', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert len(response.data) < len(plain.data)
+    assert json.loads(gzip.decompress(response.data)) == plain.json
+
+    # ETag faible : valable pour les deux représentations
+    etag = response.headers['ETag']
+    assert etag.startswith('W/')
+    revalidated = client.get('/api/projects', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert revalidated.status_code == 304
+
+
+def test_compression_skipped(client, app, admin_token, monkeypatch):
+    _add_projects(app)
+    gzip_only = {'Accept-Encoding': 'gzip'}
+
+    # Petite réponse, algorithme refusé, flux d'export
+    assert 'Content-Encoding' not in client.get('/api/health', headers=gzip_only).headers
+    assert 'Content-Encoding' not in client.get('/api/projects', headers={'Accept-Encoding': 'gzip;q=0'}).headers
+    export = client.get('/api/admin/exports/bids?format=csv',
+                        headers={**gzip_only, 'Authorization': f'Bearer {admin_token}'})
+    assert export.status_code == 200
+    assert 'Content-Encoding' not in export.headers
+
+    monkeypatch.setitem(app.config, 'COMPRESSION_ALGORITHMS', '')
+    assert 'Content-Encoding' not in client.get('/api/projects', headers=gzip_only).headers
+
+
+def test_brotli_preferred_when_installed(client, app):
+    brotli = pytest.importorskip('brotli')
+    _add_projects(app)
+    response = client.get('/api/projects', headers={'Accept-Encoding': 'gzip, br'})
+    assert response.headers['Content-Encoding'] == 'br'
+    assert json.loads(brotli.decompress(response.data)) == client.get('/api/projects').json
+
+
+def test_negotiate():
+    assert negotiate('gzip, deflate', ('br', 'gzip')) == 'gzip'
+    assert negotiate('*', ('gzip',)) == 'gzip'
+    assert negotiate('gzip;q=0, *', ('gzip',)) is None
+    assert negotiate('identity', ('gzip',)) is None
+    assert negotiate(None, ('gzip',)) is None
+    assert negotiate('gzip', ()) is None
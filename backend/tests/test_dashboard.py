@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+
+from app import db
+from app.models import Bid, Candidate, Project, User
+
+
+def _seed(app):
+    with app.app_context():
+        user = User(username='bidder', email='bidder@test.com', password_hash='x', role='candidate')
+        db.session.add(user)
+        db.session.flush()
+        candidate = Candidate(user_id=user.id, company_name='Bidder SARL')
+        db.session.add(candidate)
+
+        for i, (project_type, status) in enumerate([
+            ('repair', 'open'), ('repair', 'closed'), ('construction', 'open')
+        ]):
+            db.session.add(Project(
+                title=f'Project {i}',
+                description='Test',
+                project_type=project_type,
+                budget=10000,
+                deadline=datetime.now() + timedelta(days=30),
+                status=status
+            ))
+        db.session.flush()
+
+        for project, status in zip(Project.query.order_by(Project.id), ['submitted', 'accepted', 'rejected']):
+            db.session.add(Bid(project_id=project.id, candidate_id=candidate.id,
+                               proposed_amount=9000, status=status))
+        db.session.commit()
+
+
+def test_dashboard_stats(client, admin_token, app):
+    _seed(app)
+    response = client.get('/api/admin/dashboard', headers={'Authorization': f'Bearer {admin_token}'})
+    assert response.status_code == 200
+
+    stats = response.json
+    assert stats['total_projects'] == 3
+    assert stats['open_projects'] == 2
+    assert stats['total_bids'] == 3
+    assert stats['pending_bids'] == 1
+    assert stats['accepted_bids'] == 1
+    assert stats['rejected_bids'] == 1
+    assert stats['projects_by_type'] == {'repair': 2, 'construction': 1}
+    assert sum(stats['projects_by_month'].values()) == 3
+    assert sum(stats['bids_by_month'].values()) == 3
+
+
+def test_dashboard_stats_single_query_and_cached(client, admin_token, app, count_queries):
+    _seed(app)
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    client.get('/api/admin/bids', headers=headers)  # chauffe la liste de blocage JWT
+
+    with count_queries() as cold:
+        client.get('/api/admin/dashboard', headers=headers)
+    with count_queries() as warm:
+        client.get('/api/admin/dashboard', headers=headers)
+
+    # Un seul SELECT agrégé, puis plus rien tant que le cache est valide
+    assert len(cold) - len(warm) == 1
+
+
+def test_dashboard_stats_invalidated_on_write(client, admin_token):
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    assert client.get('/api/admin/dashboard', headers=headers).json['total_projects'] == 0
+
+    response = client.post('/api/projects', headers=headers, json={
+        'title': 'New Project',
+        'description': 'Test',
+        'project_type': 'repair',
+        'budget': 1000,
+        'deadline': (datetime.now() + timedelta(days=30)).isoformat()
+    })
+    assert response.status_code == 201
+    assert client.get('/api/admin/dashboard', headers=headers).json['total_projects'] == 1
@@ -0,0 +1,194 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app import create_app, db
+from app.database import RedisWriteMarks, TimedQueuePool, WriteMarks, dispose_engines, engine_options
+from app.exports import iter_export_rows
+from app.models import Project, User
+
+
+POOL_CONFIG = {
+    'DB_POOL_SIZE': 8, 'DB_MAX_OVERFLOW': 4, 'DB_POOL_TIMEOUT': 5.0,
+    'DB_POOL_RECYCLE': 600, 'DB_POOL_PRE_PING': True,
+}
+
+
+def test_engine_options_from_config():
+    options = engine_options('postgresql://user:pass@db/tender', POOL_CONFIG)
+    assert options == {
+        'pool_size': 8, 'max_overflow': 4, 'pool_timeout': 5.0, 'pool_recycle': 600,
+        'pool_pre_ping': True, 'poolclass': TimedQueuePool,
+    }
+    # SQLite en mémoire : pool statique imposé par Flask-SQLAlchemy
+    assert engine_options('sqlite:///:memory:', POOL_CONFIG) == {}
+    assert 'poolclass' not in engine_options('sqlite:////tmp/app.db', POOL_CONFIG, poolclass=None)
+
+
+def test_pool_wait_is_measured(tmp_path):
+    engine = create_engine(f'sqlite:///{tmp_path / "pool.db"}', poolclass=TimedQueuePool,
+                           pool_size=1, max_overflow=0, pool_timeout=5)
+    waits = []
+    engine.pool.on_wait = waits.append
+
+    held = engine.connect()
+    threading.Timer(0.2, held.close).start()
+    with engine.connect() as connection:
+        connection.execute(text('SELECT 1'))
+
+    assert len(waits) == 2
+    assert waits[1] >= 0.15
+
+    # dispose() recrée le pool sans perdre l'observateur
+    engine.dispose()
+    with engine.connect():
+        pass
+    assert len(waits) == 3
+
+
+def test_metrics_expose_pool(client, metrics_headers):
+    client.get('/api/projects')
+    body = client.get('/api/metrics', headers=metrics_headers).get_data(as_text=True)
+    assert 'db_pool_wait_seconds_count{bind="default"}' in body
+    assert 'db_pool_checked_out{bind="default"}' in body
+
+
+# ============================================
+# RÉPLIQUE
+# ============================================
+
+@pytest.fixture
+def replica_app(tmp_path, monkeypatch):
+    """Primaire et réplique distinctes ; la réplique « en retard » reste vide"""
+    monkeypatch.setenv('DATABASE_URL', f'sqlite:///{tmp_path / "primary.db"}')
+    monkeypatch.setenv('DATABASE_REPLICA_URL', f'sqlite:///{tmp_path / "replica.db"}')
+    app = create_app()
+    # RESPONSE_CACHE_PRIMARY_SECONDS=0 : les écritures n'envoient pas les
+    # lectures suivantes sur le primaire via le cache de réponses
+    app.config.update(TESTING=True, JOB_QUEUE_BACKEND='memory', JOB_WORKERS=0,
+                      SCHEDULER_ENABLED=False, UPLOAD_FOLDER=str(tmp_path / 'uploads'),
+                      RESPONSE_CACHE_PRIMARY_SECONDS=0)
+    with app.app_context():
+        db.create_all()
+        db.metadata.create_all(app.extensions['db_replica'])
+        admin = User(username='admin_test', email='admin@test.com', role='admin')
+        admin.set_password('admin123')
+        db.session.add(admin)
+        db.session.add(Project(title='Primary only', description='Pas encore répliqué',
+                               project_type='repair', budget=1000,
+                               deadline=datetime.utcnow() + timedelta(days=30)))
+        db.session.commit()
+        yield app
+        db.session.remove()
+        dispose_engines(app)
+
+
+def _token(client, email='admin@test.com', password='admin123'):
+    return client.post('/api/auth/login', json={'email': email, 'password': password}).get_json()['access_token']
+
+
+def test_reads_are_routed_to_replica(replica_app):
+    client = replica_app.test_client()
+    assert client.get('/api/projects/1').status_code == 404
+    assert client.get('/api/projects').get_json() == []
+
+    # Utilisateur qui vient d'écrire : lectures sur le primaire
+    headers = {'Authorization': f'Bearer {_token(client)}'}
+    assert client.get('/api/projects/1', headers=headers).status_code == 404
+    with replica_app.app_context():
+        admin_id = User.query.filter_by(email='admin@test.com').one().id
+    replica_app.extensions['db_write_marks'].mark(admin_id)
+    assert client.get('/api/projects/1', headers=headers).get_json()['title'] == 'Primary only'
+
+
+def test_writes_stick_user_to_primary(replica_app):
+    client = replica_app.test_client()
+    headers = {'Authorization': f'Bearer {_token(client)}'}
+    with replica_app.app_context():
+        other = User(username='other_admin', email='other@test.com', role='admin')
+        other.set_password('admin123')
+        db.session.add(other)
+        db.session.commit()
+    other_headers = {'Authorization': f"Bearer {_token(client, 'other@test.com')}"}
+
+    response = client.post('/api/projects', headers=headers, json={
+        'title': 'Nouveau marché', 'description': 'Créé sur le primaire', 'project_type': 'repair',
+        'budget': 5000, 'deadline': (datetime.utcnow() + timedelta(days=10)).isoformat(),
+    })
+    assert response.status_code == 201
+    assert 'Set-Cookie' not in response.headers
+
+    # Les autres lisent la réplique...
+    project_id = response.get_json()['id']
+    assert client.get(f'/api/projects/{project_id}', headers=other_headers).status_code == 404
+    assert client.get(f'/api/projects/{project_id}').status_code == 404
+    # ... l'auteur, même jeton et sans cookie (SPA), lit sa propre écriture
+    assert client.get(f'/api/projects/{project_id}', headers=headers).status_code == 200
+
+
+def test_cache_refilled_from_primary_after_write(replica_app):
+    replica_app.config['RESPONSE_CACHE_PRIMARY_SECONDS'] = 10
+    client = replica_app.test_client()
+    headers = {'Authorization': f'Bearer {_token(client)}'}
+    assert client.get('/api/projects').get_json() == []
+
+    response = client.post('/api/projects', headers=headers, json={
+        'title': 'Nouveau marché', 'description': 'Créé sur le primaire', 'project_type': 'repair',
+        'budget': 5000, 'deadline': (datetime.utcnow() + timedelta(days=10)).isoformat(),
+    })
+    assert response.status_code == 201
+
+    # Réplique en retard : la nouvelle version du cache est remplie depuis le primaire
+    listing = client.get('/api/projects')
+    assert listing.headers['X-Cache'] == 'MISS'
+    assert {p['title'] for p in listing.get_json()} == {'Primary only', 'Nouveau marché'}
+    assert client.get('/api/projects').headers['X-Cache'] == 'HIT'
+
+
+def test_async_reads_follow_write_marks(replica_app):
+    from starlette.testclient import TestClient
+    from app.asgi import create_asgi_app
+
+    headers = {'Authorization': f'Bearer {_token(replica_app.test_client())}'}
+    with TestClient(create_asgi_app(replica_app)) as client:
+        assert client.get('/api/projects', params={'status': 'open'}, headers=headers).json() == []
+        with replica_app.app_context():
+            admin_id = User.query.filter_by(email='admin@test.com').one().id
+        replica_app.extensions['db_write_marks'].mark(admin_id)
+        titles = [p['title'] for p in client.get('/api/projects', params={'limit': 5}, headers=headers).json()]
+        assert titles == ['Primary only']
+
+
+def test_write_marks_expire():
+    now = [0.0]
+    marks = WriteMarks(10, clock=lambda: now[0])
+    marks.mark(7)
+    assert marks.recent('7') and not marks.recent(8)
+    now[0] = 10.5
+    assert not marks.recent(7)
+
+
+def test_write_marks_shared_through_redis():
+    class FakeRedis:
+        def __init__(self):
+            self.values = {}
+
+        def set(self, key, value, ex=None):
+            self.values[key] = (value, ex)
+
+        def exists(self, key):
+            return int(key in self.values)
+
+    client = FakeRedis()
+    writer, reader = RedisWriteMarks(client, 10), RedisWriteMarks(client, 10)
+    writer.mark(7)
+    assert reader.recent(7) and not reader.recent(8)
+    assert client.values == {'db_primary:7': ('1', 10)}
+
+
+def test_exports_read_from_replica(replica_app):
+    with replica_app.app_context():
+        assert db.session.query(Project).count() == 1
+        assert list(iter_export_rows({})) == []
@@ -0,0 +1,109 @@
+import io
+import zipfile
+from datetime import datetime, timedelta
+
+from app import db
+from app.models import Candidate, Document, Project, User
+
+
+def _submit_with_documents(client, app, count=2):
+    """Créer un projet et ``count`` offres avec deux documents chacune"""
+    with app.app_context():
+        project = Project(title='Test Project', description='Test', project_type='repair',
+                          budget=50000, deadline=datetime.now() + timedelta(days=30))
+        db.session.add(project)
+        for i in range(count):
+            user = User(username=f'bidder_{i}', email=f'bidder_{i}@test.com', role='candidate')
+            user.set_password('pass123')
+            db.session.add(user)
+            db.session.flush()
+            db.session.add(Candidate(user_id=user.id, company_name=f'Company {i}'))
+        db.session.commit()
+        project_id = project.id
+
+    tokens = []
+    for i in range(count):
+        token = client.post('/api/auth/login', json={
+            'email': f'bidder_{i}@test.com', 'password': 'pass123'
+        }).json['access_token']
+        tokens.append(token)
+        response = client.post(
+            f'/api/projects/{project_id}/bids',
+            headers={'Authorization': f'Bearer {token}'},
+            data={
+                'proposed_amount': '45000',
+                'technical_proposal': (io.BytesIO(b'0123456789 technical'), 'offre.pdf'),
+                'financial_proposal': (io.BytesIO(f'financial {i}'.encode()), 'prix.pdf'),
+            },
+            content_type='multipart/form-data'
+        )
+        assert response.status_code == 201
+    return project_id, tokens
+
+
+def test_download_document_with_etag_and_range(client, app, admin_token):
+    _submit_with_documents(client, app, count=1)
+    document = Document.query.filter_by(document_type='technical_proposal').first()
+    headers = {'Authorization': f'Bearer {admin_token}'}
+
+    response = client.get(f'/api/documents/{document.id}', headers=headers)
+    assert response.status_code == 200
+    assert response.data == b'0123456789 technical'
+    etag = response.headers['ETag']
+    assert etag == '"%s"' % document.file_path.rsplit('/', 1)[-1]
+    assert 'attachment' in response.headers['Content-Disposition']
+
+    response = client.get(f'/api/documents/{document.id}',
+                          headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+
+    response = client.get(f'/api/documents/{document.id}',
+                          headers={**headers, 'Range': 'bytes=0-3'})
+    assert response.status_code == 206
+    assert response.data == b'0123'
+
+
+def test_download_document_restricted_to_owner(client, app):
+    _, tokens = _submit_with_documents(client, app, count=2)
+    own = Document.query.join(Document.bid).join(Candidate).filter(
+        Candidate.company_name == 'Company 0').first()
+
+    response = client.get(f'/api/documents/{own.id}',
+                          headers={'Authorization': f'Bearer {tokens[0]}'})
+    assert response.status_code == 200
+
+    response = client.get(f'/api/documents/{own.id}',
+                          headers={'Authorization': f'Bearer {tokens[1]}'})
+    assert response.status_code == 403
+
+
+def test_download_document_accel_redirect(client, app, admin_token):
+    _submit_with_documents(client, app, count=1)
+    app.config['DOCUMENT_ACCEL_REDIRECT'] = '/protected-uploads'
+    document = Document.query.first()
+
+    response = client.get(f'/api/documents/{document.id}',
+                          headers={'Authorization': f'Bearer {admin_token}'})
+    assert response.status_code == 200
+    assert response.headers['X-Accel-Redirect'] == f'/protected-uploads/{document.file_path}'
+    assert response.data == b''
+
+
+def test_download_project_archive(client, app, admin_token):
+    project_id, _ = _submit_with_documents(client, app, count=2)
+
+    response = client.get(f'/api/admin/projects/{project_id}/documents/archive',
+                          headers={'Authorization': f'Bearer {admin_token}'})
+    assert response.status_code == 200
+    assert response.mimetype == 'application/zip'
+    assert response.is_streamed
+
+    with zipfile.ZipFile(io.BytesIO(response.data)) as archive:
+        names = sorted(archive.namelist())
+        assert names == [
+            'Company_0/financial_proposal_prix.pdf',
+            'Company_0/technical_proposal_offre.pdf',
+            'Company_1/financial_proposal_prix.pdf',
+            'Company_1/technical_proposal_offre.pdf',
+        ]
+        assert archive.read('Company_1/financial_proposal_prix.pdf') == b'financial 1'
@@ -0,0 +1,152 @@
+import json
+from datetime import datetime, timedelta
+
+from app import db
+from app.events import Event, get_bus, publish
+from app.models import Bid, Candidate, Project, User
+
+
+def _project_with_bid(app, email='candidate@test.com'):
+    with app.app_context():
+        project = Project(title='Test Project', description='Test', project_type='repair',
+                          budget=50000, deadline=datetime.now() + timedelta(days=30))
+        db.session.add(project)
+        db.session.flush()
+        user = User.query.filter_by(email=email).first()
+        candidate = Candidate.query.filter_by(user_id=user.id).first()
+        bid = Bid(project_id=project.id, candidate_id=candidate.id, proposed_amount=45000)
+        db.session.add(bid)
+        db.session.commit()
+        return project.id, bid.id
+
+
+def _open_stream(client, token, query='max_duration=0.2', headers=None):
+    """Connexion SSE ouverte (abonnement inscrit), corps lu plus tard"""
+    return client.get(f'/api/events?{query}', buffered=False,
+                      headers={'Authorization': f'Bearer {token}', **(headers or {})})
+
+
+def _events(response):
+    """Blocs ``(id, event, data)`` du corps SSE"""
+    blocks = []
+    for block in response.get_data(as_text=True).split('\n\n'):
+        fields = dict(line.split(': ', 1) for line in block.splitlines() if ': ' in line and not line.startswith(':'))
+        if 'event' in fields:
+            blocks.append((fields.get('id'), fields['event'], json.loads(fields['data'])))
+    return blocks
+
+
+def test_candidate_receives_own_bid_status(client, app, candidate_token, admin_token):
+    project_id, bid_id = _project_with_bid(app)
+    stream = _open_stream(client, candidate_token)
+    assert stream.status_code == 200
+    assert stream.mimetype == 'text/event-stream'
+
+    client.put(f'/api/admin/bids/{bid_id}/status', json={'status': 'accepted'},
+               headers={'Authorization': f'Bearer {admin_token}'})
+
+    events = _events(stream)
+    assert [(e[1], e[2]) for e in events] == [
+        ('bid.status', {'bid_id': bid_id, 'project_id': project_id, 'status': 'accepted'})
+    ]
+
+
+def test_candidate_does_not_receive_other_bids(client, app, candidate_token):
+    with app.app_context():
+        publish('candidate:999', 'bid.status', {'bid_id': 1, 'project_id': 1, 'status': 'rejected'})
+        publish('admin', 'bid.submitted', {'bid_id': 1, 'project_id': 1})
+        stream = _open_stream(client, candidate_token)
+        db.session.commit()
+    assert _events(stream) == []
+
+
+def test_admin_receives_submissions_filtered_by_project(client, app, candidate_token, admin_token):
+    with app.app_context():
+        other = Project(title='Other', description='Test', project_type='repair',
+                        budget=1000, deadline=datetime.now() + timedelta(days=30))
+        watched = Project(title='Watched', description='Test', project_type='repair',
+                          budget=1000, deadline=datetime.now() + timedelta(days=30))
+        db.session.add_all([other, watched])
+        db.session.commit()
+        other_id, watched_id = other.id, watched.id
+
+    stream = _open_stream(client, admin_token, f'max_duration=0.2&project_id={watched_id}')
+    for project_id in (other_id, watched_id):
+        response = client.post(f'/api/projects/{project_id}/bids', json={'proposed_amount': 900},
+                               headers={'Authorization': f'Bearer {candidate_token}'})
+        assert response.status_code == 201
+
+    events = _events(stream)
+    assert [e[1] for e in events] == ['bid.submitted']
+    assert events[0][2]['project_id'] == watched_id
+
+
+def test_project_status_change_notifies_bidders(client, app, candidate_token, admin_token):
+    project_id, _ = _project_with_bid(app)
+    stream = _open_stream(client, candidate_token)
+
+    client.put(f'/api/projects/{project_id}', json={'status': 'under_review'},
+               headers={'Authorization': f'Bearer {admin_token}'})
+    # Sans changement de statut : pas de nouvel événement
+    client.put(f'/api/projects/{project_id}', json={'title': 'Renamed', 'status': 'under_review'},
+               headers={'Authorization': f'Bearer {admin_token}'})
+
+    assert [(e[1], e[2]) for e in _events(stream)] == [
+        ('project.status', {'project_id': project_id, 'status': 'under_review'})
+    ]
+
+
+def test_rolled_back_events_are_not_sent(client, app, candidate_token):
+    with app.app_context():
+        candidate_id = Candidate.query.first().id
+        stream = _open_stream(client, candidate_token)
+        publish(f'candidate:{candidate_id}', 'bid.status', {'bid_id': 1, 'project_id': 1, 'status': 'accepted'})
+        db.session.rollback()
+        db.session.commit()
+    assert _events(stream) == []
+
+
+def test_resume_from_last_event_id(client, app, candidate_token):
+    with app.app_context():
+        candidate_id = Candidate.query.first().id
+        bus = get_bus()
+        sent = [Event(f'candidate:{candidate_id}', 'bid.status', {'bid_id': i, 'project_id': 1, 'status': 'accepted'})
+                for i in range(3)]
+        for event in sent:
+            bus.dispatch(event)
+
+    stream = _open_stream(client, candidate_token, 'max_duration=0',
+                          headers={'Last-Event-ID': sent[0].id})
+    assert [e[0] for e in _events(stream)] == [sent[1].id, sent[2].id]
+
+    # Identifiant sorti de l'historique : le client doit relire ses listes
+    stream = _open_stream(client, candidate_token, 'max_duration=0',
+                          headers={'Last-Event-ID': 'unknown'})
+    assert _events(stream) == [(None, 'reset', {'reason': 'history'})]
+
+
+def test_heartbeat_keeps_connection_alive(client, app, candidate_token):
+    app.config['SSE_HEARTBEAT'] = 0.05
+    stream = _open_stream(client, candidate_token, 'max_duration=0.2')
+    body = stream.get_data(as_text=True)
+    assert body.startswith('retry: 3000\n\n')
+    assert body.count(': keepalive\n\n') >= 2
+
+
+def test_slow_client_overflow_resets(client, app, candidate_token):
+    app.config['SSE_BUFFER_SIZE'] = 2
+    with app.app_context():
+        candidate_id = Candidate.query.first().id
+        stream = _open_stream(client, candidate_token, 'max_duration=1')
+        for i in range(3):
+            get_bus().dispatch(Event(f'candidate:{candidate_id}', 'bid.status', {'bid_id': i, 'project_id': 1}))
+
+    assert _events(stream) == [(None, 'reset', {'reason': 'overflow'})]
+    assert get_bus().subscriber_count() == 0
+
+
+def test_stream_requires_token(client, candidate_token):
+    assert client.get('/api/events').status_code == 401
+    # EventSource : jeton en paramètre de requête
+    response = client.get(f'/api/events?max_duration=0&jwt={candidate_token}')
+    assert response.status_code == 200
@@ -0,0 +1,124 @@
+"""Exports CSV/XLSX des offres : flux, filtres, export différé."""
+import csv
+import io
+import zipfile
+from datetime import datetime
+from xml.etree import ElementTree
+
+from app import db
+from app.exports import EXPORT_COLUMNS
+from app.jobs import process_jobs
+from app.models import Bid, Candidate, Document, Project, User
+
+SHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+
+
+def _seed(app):
+    with app.app_context():
+        project = Project(title='Climatisation', description='Test', project_type='repair',
+                          budget=50000, deadline=datetime(2030, 1, 1))
+        other = Project(title='Toiture', description='Test', project_type='repair',
+                        budget=50000, deadline=datetime(2030, 1, 1))
+        db.session.add_all([project, other])
+        db.session.flush()
+        for i in range(3):
+            user = User(username=f'export_{i}', email=f'export{i}@test.com', role='candidate', password_hash='x')
+            db.session.add(user)
+            db.session.flush()
+            candidate = Candidate(user_id=user.id, company_name='=HYPERLINK("x")' if i == 0 else f'Company {i}')
+            db.session.add(candidate)
+            db.session.flush()
+            bid = Bid(project_id=project.id if i < 2 else other.id, candidate_id=candidate.id,
+                      proposed_amount=1000 * (i + 1), status='submitted',
+                      submitted_at=datetime(2026, 3, 10 + i, 12, 0))
+            db.session.add(bid)
+            db.session.flush()
+            db.session.add_all([
+                Document(bid_id=bid.id, document_type='technical_proposal', file_name='tech.pdf', file_path='k'),
+                Document(bid_id=bid.id, document_type='financial_proposal', file_name='prix.pdf', file_path='k'),
+            ])
+        db.session.commit()
+        return project.id
+
+
+def _auth(token):
+    return {'Authorization': f'Bearer {token}'}
+
+
+def _csv_rows(response):
+    text = response.get_data().decode('utf-8-sig')
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def test_csv_export_streams_rows_with_documents(client, app, admin_token, count_queries):
+    project_id = _seed(app)
+
+    with count_queries() as statements:
+        response = client.get(f'/api/admin/exports/bids?project_id={project_id}', headers=_auth(admin_token))
+        rows = _csv_rows(response)
+
+    assert response.status_code == 200
+    assert 'Content-Length' not in response.headers  # envoi en flux (chunked)
+    assert response.mimetype == 'text/csv'
+    assert len(rows) == 2
+    assert rows[0]['documents'] == 'technical_proposal:tech.pdf; financial_proposal:prix.pdf'
+    # Pas d'injection de formule dans un tableur
+    assert rows[0]['company_name'].startswith("'=")
+    # Une requête pour toutes les lignes, documents compris
+    assert len([s for s in statements if 'FROM bids' in s]) == 1
+
+
+def test_export_filters_by_whole_day_period(client, app, admin_token):
+    _seed(app)
+    response = client.get('/api/admin/exports/bids?date_from=2026-03-11&date_to=2026-03-12',
+                          headers=_auth(admin_token))
+    assert [row['submitted_at'][:10] for row in _csv_rows(response)] == ['2026-03-11', '2026-03-12']
+
+
+def test_export_rejects_bad_parameters(client, app, admin_token, candidate_token):
+    assert client.get('/api/admin/exports/bids?format=pdf', headers=_auth(admin_token)).status_code == 400
+    assert client.get('/api/admin/exports/bids?date_from=2026-02-01&date_to=2026-01-01',
+                      headers=_auth(admin_token)).status_code == 400
+    assert client.get('/api/admin/exports/bids', headers=_auth(candidate_token)).status_code == 403
+
+
+def test_xlsx_export_is_a_valid_workbook(client, app, admin_token):
+    project_id = _seed(app)
+    response = client.get(f'/api/admin/exports/bids?format=xlsx&project_id={project_id}',
+                          headers=_auth(admin_token))
+    assert response.status_code == 200
+
+    with zipfile.ZipFile(io.BytesIO(response.get_data())) as workbook:
+        assert '[Content_Types].xml' in workbook.namelist()
+        sheet = ElementTree.fromstring(workbook.read('xl/worksheets/sheet1.xml'))
+
+    rows = sheet.findall(f'{SHEET_NS}sheetData/{SHEET_NS}row')
+    assert len(rows) == 3
+    header = [cell.find(f'{SHEET_NS}is/{SHEET_NS}t').text for cell in rows[0]]
+    assert header == list(EXPORT_COLUMNS)
+    amount = rows[1].find(f"{SHEET_NS}c[@r='E2']/{SHEET_NS}v")
+    assert float(amount.text) == 1000
+
+
+def test_prepared_export_is_written_to_storage(client, app, admin_token):
+    project_id = _seed(app)
+
+    response = client.post('/api/admin/exports', headers=_auth(admin_token),
+                           json={'format': 'csv', 'project_id': project_id})
+    assert response.status_code == 202
+    export_id = response.json['id']
+    assert response.headers['Location'] == f'/api/admin/exports/{export_id}'
+
+    pending = client.get(f'/api/admin/exports/{export_id}/download', headers=_auth(admin_token))
+    assert pending.status_code == 409
+
+    process_jobs()
+
+    status = client.get(f'/api/admin/exports/{export_id}', headers=_auth(admin_token)).json
+    assert status['status'] == 'ready'
+    assert status['row_count'] == 2
+
+    download = client.get(status['download_url'], headers=_auth(admin_token))
+    assert download.status_code == 200
+    assert len(_csv_rows(download)) == 2
+    assert download.headers['ETag']
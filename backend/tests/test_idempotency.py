@@ -0,0 +1,120 @@
+import io
+import os
+from datetime import datetime, timedelta
+
+from app import db
+from app.idempotency import purge_idempotency_keys
+from app.models import Bid, Document, IdempotencyKey, Project
+from factories import make_project
+
+
+def _project(app):
+    with app.app_context():
+        project_id = make_project().id
+        db.session.commit()
+        return project_id
+
+
+def _submit(client, token, project_id, key=None, amount='45000'):
+    headers = {'Authorization': f'Bearer {token}'}
+    if key:
+        headers['Idempotency-Key'] = key
+    return client.post(
+        f'/api/projects/{project_id}/bids',
+        headers=headers,
+        data={
+            'proposed_amount': amount,
+            'technical_proposal': (io.BytesIO(b'technical proposal'), 'offre.pdf'),
+        },
+        content_type='multipart/form-data'
+    )
+
+
+def _stored_files(app):
+    root = app.config['UPLOAD_FOLDER']
+    return sorted(
+        os.path.relpath(os.path.join(path, name), root)
+        for path, _, names in os.walk(root) for name in names
+    )
+
+
+def test_retry_with_same_key_replays_response(client, app, candidate_token):
+    project_id = _project(app)
+
+    first = _submit(client, candidate_token, project_id, key='retry-1')
+    assert first.status_code == 201
+    assert 'Idempotent-Replayed' not in first.headers
+
+    retry = _submit(client, candidate_token, project_id, key='retry-1')
+    assert retry.status_code == 201
+    assert retry.headers['Idempotent-Replayed'] == 'true'
+    assert retry.json == first.json
+
+    with app.app_context():
+        assert Bid.query.count() == 1
+        assert Document.query.count() == 1
+
+
+def test_replay_after_project_closed(client, app, candidate_token):
+    project_id = _project(app)
+    first = _submit(client, candidate_token, project_id, key='late-retry')
+
+    with app.app_context():
+        db.session.get(Project, project_id).status = 'closed'
+        db.session.commit()
+
+    retry = _submit(client, candidate_token, project_id, key='late-retry')
+    assert retry.status_code == 201
+    assert retry.json['bid_id'] == first.json['bid_id']
+
+    # Sans la clé : le refus habituel
+    assert _submit(client, candidate_token, project_id).status_code == 400
+
+
+def test_key_reused_for_different_request(client, app, candidate_token):
+    project_id = _project(app)
+    assert _submit(client, candidate_token, project_id, key='reused').status_code == 201
+
+    response = _submit(client, candidate_token, project_id, key='reused', amount='30000')
+    assert response.status_code == 422
+    with app.app_context():
+        assert Bid.query.one().proposed_amount == 45000
+
+
+def test_happy_path_adds_no_lookup(client, app, candidate_token, count_queries):
+    project_id = _project(app)
+    with count_queries() as statements:
+        assert _submit(client, candidate_token, project_id, key='happy').status_code == 201
+
+    on_keys = [s for s in statements if 'idempotency_keys' in s]
+    assert len(on_keys) == 1 and on_keys[0].lstrip().upper().startswith('INSERT')
+
+
+def test_failed_commit_leaves_no_files(client, app, candidate_token, monkeypatch):
+    project_id = _project(app)
+
+    def broken_remember(*args, **kwargs):
+        raise RuntimeError('database unavailable')
+    monkeypatch.setattr('app.idempotency.IdempotentRequest.remember', broken_remember)
+
+    assert _submit(client, candidate_token, project_id, key='broken').status_code == 500
+    assert _stored_files(app) == []
+    with app.app_context():
+        assert Bid.query.count() == 0
+        assert IdempotencyKey.query.count() == 0
+
+    # Le même envoi, une fois la base rétablie, passe normalement
+    monkeypatch.undo()
+    assert _submit(client, candidate_token, project_id, key='broken').status_code == 201
+    assert len(_stored_files(app)) == 1
+
+
+def test_expired_keys_purged(client, app, candidate_token):
+    project_id = _project(app)
+    _submit(client, candidate_token, project_id, key='old')
+
+    with app.app_context():
+        assert purge_idempotency_keys(datetime.utcnow()) == 0
+        assert purge_idempotency_keys(datetime.utcnow() + timedelta(days=2)) == 1
+        db.session.commit()
+        assert IdempotencyKey.query.count() == 0
@@ -0,0 +1,71 @@
+"""Les requêtes chaudes doivent passer par un index (EXPLAIN QUERY PLAN)."""
+from datetime import datetime
+
+from sqlalchemy import inspect
+
+from app import db
+from app.models import Bid, Candidate, Project
+from app.pagination import encode_cursor, keyset
+from app.queries import bid_listing_query, project_listing_query
+
+
+def _query_plan(query):
+    """Plan SQLite d'une requête ORM, sous forme de texte"""
+    compiled = query.statement.compile(dialect=db.engine.dialect)
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    with db.engine.connect() as conn:
+        rows = conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + str(compiled), params).fetchall()
+    return '\n'.join(row[-1] for row in rows)
+
+
+def _assert_index_scan(plan, index_name):
+    assert f'INDEX {index_name}' in plan, plan
+
+
+def test_project_listing_by_status_uses_index(app):
+    # Requête de ``GET /api/projects?status=open``, première page puis suivante
+    listing = project_listing_query({'status': 'open'})
+    query = keyset(listing, Project.created_at, Project.id, limit=50)
+    _assert_index_scan(_query_plan(query), 'ix_projects_status_created_at_id')
+
+    cursor = encode_cursor(datetime(2030, 1, 1), 10)
+    query = keyset(listing, Project.created_at, Project.id, cursor, limit=50)
+    _assert_index_scan(_query_plan(query), 'ix_projects_status_created_at_id')
+
+
+def test_duplicate_bid_lookup_uses_unique_index(app):
+    query = Bid.query.filter_by(project_id=1, candidate_id=1)
+    _assert_index_scan(_query_plan(query), 'uq_bids_project_candidate')
+
+
+def test_my_bids_listing_uses_candidate_index(app):
+    query = bid_listing_query(candidate_id=1).limit(51)
+    _assert_index_scan(_query_plan(query), 'ix_bids_candidate_submitted_at_id')
+
+
+def test_bid_status_count_uses_index(app):
+    query = Bid.query.filter_by(status='submitted')
+    _assert_index_scan(_query_plan(query), 'ix_bids_status')
+
+
+def test_candidate_by_user_uses_index(app):
+    query = Candidate.query.filter_by(user_id=1)
+    _assert_index_scan(_query_plan(query), 'ix_candidates_user_id')
+
+
+def test_migrations_match_models(tmp_path, monkeypatch):
+    """``flask schema upgrade`` produit les mêmes index que les modèles"""
+    from app import create_app
+    from app.schema import upgrade_schema
+
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'migrated.db'}")
+    migrated_app = create_app()
+
+    with migrated_app.app_context():
+        upgrade_schema()
+        inspector = inspect(db.engine)
+        for table in db.metadata.sorted_tables:
+            expected = {index.name for index in table.indexes}
+            actual = {index['name'] for index in inspector.get_indexes(table.name)}
+            assert expected <= actual, table.name
+        db.engine.dispose()
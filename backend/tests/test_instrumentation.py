@@ -0,0 +1,59 @@
+import logging
+
+from app.ratelimit import AdmissionControl
+
+
+def test_server_timing_header(client, admin_token):
+    response = client.get('/api/admin/bids', headers={'Authorization': f'Bearer {admin_token}'})
+    assert response.status_code == 200
+
+    timing = response.headers['Server-Timing']
+    assert timing.startswith('app;dur=')
+    assert 'db;dur=' in timing
+    assert 'queries"' in timing
+
+
+def test_metrics_endpoint_exposes_route_histograms(client, metrics_headers):
+    client.get('/api/projects')
+    client.get('/api/projects')
+
+    response = client.get('/api/metrics', headers=metrics_headers)
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+
+    body = response.get_data(as_text=True)
+    assert '# TYPE http_request_duration_seconds histogram' in body
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/projects"} 2' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/api/projects",le="+Inf"} 2' in body
+    assert 'http_request_db_queries_count{method="GET",route="/api/projects"} 2' in body
+    assert 'http_responses_total{method="GET",route="/api/projects",status="200"} 2' in body
+
+
+def test_slow_query_and_request_logged(client, app, caplog, metrics_headers):
+    app.config['SLOW_QUERY_MS'] = 0
+    app.config['SLOW_REQUEST_MS'] = 0
+
+    with caplog.at_level(logging.WARNING, logger='app.perf'):
+        client.get('/api/projects?status=open')
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(m.startswith('Slow query') and 'FROM projects' in m for m in messages)
+    assert any(m.startswith('Slow request GET /api/projects') for m in messages)
+
+    body = client.get('/api/metrics', headers=metrics_headers).get_data(as_text=True)
+    assert 'db_slow_queries_total{route="/api/projects"}' in body
+
+
+def test_metrics_restricted_to_collector_or_admin(client, app, admin_token, candidate_token, metrics_headers):
+    assert client.get('/api/metrics').status_code == 401
+    assert client.get('/api/metrics', headers={'Authorization': f'Bearer {candidate_token}'}).status_code == 403
+    assert client.get('/api/metrics', headers={'Authorization': 'Bearer wrong-token'}).status_code != 200
+    assert client.get('/api/metrics', headers={'Authorization': f'Bearer {admin_token}'}).status_code == 200
+
+    # Ni CORS, ni contrôle d'admission
+    app.extensions['admission'] = AdmissionControl(max_inflight=1)
+    app.extensions['admission'].admit()
+    response = client.get('/api/metrics', headers={**metrics_headers, 'Origin': 'http://example.com'})
+    assert response.status_code == 200
+    assert 'Access-Control-Allow-Origin' not in response.headers
+    assert client.get('/api/projects', headers={'Origin': 'http://example.com'}).status_code == 429
@@ -0,0 +1,266 @@
+import io
+import zlib
+from datetime import datetime, timedelta
+
+from app import db
+from app.jobs import enqueue, get_metrics, get_queue, job, process_jobs
+from app.models import Document, Job, Project
+from app.verification import count_pdf_pages
+
+# En-tête PDF sans table des références : structure illisible
+BROKEN_PDF = b'%PDF-1.4\n1 0 obj << /Type /Pages /Count 2 >>\n2 0 obj << /Type /Page >>\n%%EOF'
+
+
+def _pdf(pages):
+    """PDF 1.5 : catalogue et pages dans un flux d'objets compressé, table en flux"""
+    kids = ' '.join(f'{3 + i} 0 R' for i in range(pages))
+    objects = [b'<< /Type /Catalog /Pages 2 0 R >>', f'<< /Type /Pages /Kids [{kids}] /Count {pages} >>'.encode()]
+    objects += [b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>'] * pages
+    header, body = [], b''
+    for number, obj in enumerate(objects, start=1):
+        header.append(f'{number} {len(body)}')
+        body += obj + b' '
+    header = ' '.join(header).encode() + b' '
+    stream_number = len(objects) + 1
+    packed = zlib.compress(header + body)
+    out = io.BytesIO()
+    out.write(b'%PDF-1.5\n')
+    stream_offset = out.tell()
+    out.write(f'{stream_number} 0 obj\n<< /Type /ObjStm /N {len(objects)} /First {len(header)} '
+              f'/Filter /FlateDecode /Length {len(packed)} >>\nstream\n'.encode() + packed + b'\nendstream\nendobj\n')
+    xref_number = stream_number + 1
+    xref_offset = out.tell()
+    rows = b'\x00\x00\x00\xff'
+    rows += b''.join(b'\x02' + stream_number.to_bytes(2, 'big') + bytes([i]) for i in range(len(objects)))
+    rows += b'\x01' + stream_offset.to_bytes(2, 'big') + b'\x00'
+    rows += b'\x01' + xref_offset.to_bytes(2, 'big') + b'\x00'
+    packed = zlib.compress(rows)
+    out.write(f'{xref_number} 0 obj\n<< /Type /XRef /Size {xref_number + 1} /W [1 2 1] /Root 1 0 R '
+              f'/Filter /FlateDecode /Length {len(packed)} >>\nstream\n'.encode() + packed + b'\nendstream\nendobj\n')
+    out.write(f'startxref\n{xref_offset}\n%%EOF\n'.encode())
+    return out.getvalue()
+
+
+PDF = _pdf(2)
+
+_calls = {'flaky': 0}
+
+
+@job('test_flaky')
+def _flaky(fail_times):
+    _calls['flaky'] += 1
+    if _calls['flaky'] <= fail_times:
+        raise RuntimeError('transient failure')
+
+
+@job('test_always_fails')
+def _always_fails():
+    raise RuntimeError('permanent failure')
+
+
+def test_submit_bid_enqueues_verification(client, app, candidate_token):
+    with app.app_context():
+        project = Project(title='Test Project', description='Test', project_type='repair',
+                          budget=50000, deadline=datetime.now() + timedelta(days=30))
+        db.session.add(project)
+        db.session.commit()
+        project_id = project.id
+
+    response = client.post(
+        f'/api/projects/{project_id}/bids',
+        headers={'Authorization': f'Bearer {candidate_token}'},
+        data={
+            'proposed_amount': '45000',
+            'technical_proposal': (io.BytesIO(PDF), 'offre.pdf'),
+            'financial_proposal': (io.BytesIO(b'not a real document'), 'prix.pdf'),
+        },
+        content_type='multipart/form-data'
+    )
+    assert response.status_code == 201
+
+    # La réponse est partie avant toute vérification
+    assert get_queue().depth()[0]['queued'] == 2
+    assert not any(d.verification_notes for d in Document.query.all())
+
+    assert process_jobs() == 2
+
+    # Relecture depuis une nouvelle session : les écritures ont été validées
+    db.session.remove()
+    technical = Document.query.filter_by(document_type='technical_proposal').one()
+    financial = Document.query.filter_by(document_type='financial_proposal').one()
+    assert technical.verified is True
+    assert technical.verification_notes == 'Detected application/pdf, 2 page(s)'
+    assert financial.verified is False
+    assert financial.verification_notes == 'Unrecognized file type'
+
+
+def test_bid_kept_when_enqueue_fails(client, app, candidate_token, monkeypatch):
+    with app.app_context():
+        project = Project(title='Test Project', description='Test', project_type='repair',
+                          budget=50000, deadline=datetime.now() + timedelta(days=30))
+        db.session.add(project)
+        db.session.commit()
+        project_id = project.id
+
+    def broken_enqueue(*args, **kwargs):
+        raise RuntimeError('queue unavailable')
+    monkeypatch.setattr('app.routes.bids.enqueue', broken_enqueue)
+
+    # Mise en file après le commit : son échec n'annule pas l'offre
+    response = client.post(
+        f'/api/projects/{project_id}/bids',
+        headers={'Authorization': f'Bearer {candidate_token}'},
+        data={'proposed_amount': '45000', 'technical_proposal': (io.BytesIO(PDF), 'offre.pdf')},
+        content_type='multipart/form-data'
+    )
+    assert response.status_code == 201
+    db.session.remove()
+    document = Document.query.one()
+    assert document.bid_id == response.json['bid_id']
+    assert document.verification_notes is None
+
+
+class _Body(io.RawIOBase):
+    """Flux sans accès direct, comme le corps d'un objet S3"""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._data.readinto(buffer)
+
+
+def test_count_pdf_pages_reads_object_streams():
+    assert count_pdf_pages(io.BytesIO(_pdf(3)), 1024) == 3
+    body = _Body(_pdf(3))
+    assert count_pdf_pages(body, 1024, body.read(16)) == 3
+    assert count_pdf_pages(io.BytesIO(BROKEN_PDF), 1024) is None
+
+
+def test_unreadable_pdf_is_indeterminate(client, app, candidate_token, admin_token):
+    with app.app_context():
+        project = Project(title='Test Project', description='Test', project_type='repair',
+                          budget=50000, deadline=datetime.now() + timedelta(days=30))
+        db.session.add(project)
+        db.session.commit()
+        project_id = project.id
+
+    response = client.post(
+        f'/api/projects/{project_id}/bids',
+        headers={'Authorization': f'Bearer {candidate_token}'},
+        data={
+            'proposed_amount': '45000',
+            'technical_proposal': (io.BytesIO(PDF), 'offre.pdf'),
+            'financial_proposal': (io.BytesIO(BROKEN_PDF), 'prix.pdf'),
+        },
+        content_type='multipart/form-data'
+    )
+    assert response.status_code == 201
+    assert process_jobs() == 2
+
+    financial = Document.query.filter_by(document_type='financial_proposal').one()
+    assert financial.verified is None
+    assert 'indeterminate' in financial.verification_notes
+
+    # Seuls les documents effectivement vérifiés comptent dans le critère
+    evaluation = client.get(f'/api/admin/projects/{project_id}/evaluation',
+                            headers={'Authorization': f'Bearer {admin_token}'})
+    assert evaluation.json['bids'][0]['scores']['verification'] == 1.0
+
+
+def test_failed_job_is_retried_with_backoff(app):
+    app.config['JOB_RETRY_BACKOFF'] = 0
+    _calls['flaky'] = 0
+
+    entry = enqueue('test_flaky', fail_times=1)
+    assert process_jobs(max_jobs=1) == 1
+    assert entry.status == 'queued'
+    assert 'transient failure' in entry.last_error
+
+    assert process_jobs() == 1
+    assert entry.status == 'done'
+    assert entry.attempts == 2
+    assert entry.duration_ms is not None
+
+    metrics = get_metrics().snapshot()['test_flaky']
+    assert metrics['runs'] == 2
+    assert metrics['failures'] == 1
+
+
+def test_retry_waits_for_backoff(app):
+    app.config['JOB_RETRY_BACKOFF'] = 60
+    _calls['flaky'] = 0
+
+    entry = enqueue('test_flaky', fail_times=1)
+    process_jobs()
+    assert entry.status == 'queued'
+    assert entry.run_after > datetime.utcnow() + timedelta(seconds=30)
+    # Pas encore prêt : rien à exécuter
+    assert process_jobs() == 0
+
+
+def test_database_queue(app):
+    app.config['JOB_QUEUE_BACKEND'] = 'database'
+    app.config['JOB_RETRY_BACKOFF'] = 0
+    app.extensions.pop('job_queue', None)
+    _calls['flaky'] = 0
+
+    enqueue('test_flaky', fail_times=0)
+    enqueue('test_always_fails', max_attempts=2)
+    db.session.commit()
+    assert Job.query.filter_by(status='queued').count() == 2
+
+    assert process_jobs() == 3
+
+    done = Job.query.filter_by(kind='test_flaky').one()
+    assert done.status == 'done'
+    assert done.attempts == 1
+    assert done.duration_ms is not None
+
+    failed = Job.query.filter_by(kind='test_always_fails').one()
+    assert failed.status == 'failed'
+    assert failed.attempts == 2
+    assert 'permanent failure' in failed.last_error
+
+
+def test_orphaned_job_is_reclaimed_then_failed(app):
+    """Worker mort en cours de travail : repris après le bail, dans la limite des essais"""
+    app.config['JOB_QUEUE_BACKEND'] = 'database'
+    app.config['JOB_VISIBILITY_TIMEOUT'] = 60
+    app.extensions.pop('job_queue', None)
+    _calls['flaky'] = 0
+
+    enqueue('test_flaky', fail_times=0, max_attempts=2)
+    db.session.commit()
+    queue = get_queue()
+    orphan = queue.claim()  # le worker meurt sans rendre de résultat
+    assert orphan.status == 'running'
+    assert queue.claim() is None  # bail encore valide
+
+    orphan.locked_at = datetime.utcnow() - timedelta(seconds=61)
+    db.session.commit()
+    reclaimed = queue.claim()
+    assert reclaimed.id == orphan.id
+    assert reclaimed.attempts == 2
+
+    # Dernier essai perdu aussi : abandon au lieu d'une reprise sans fin
+    reclaimed.locked_at = datetime.utcnow() - timedelta(seconds=61)
+    db.session.commit()
+    assert queue.claim() is None
+    failed = db.session.get(Job, orphan.id)
+    assert failed.status == 'failed'
+    assert 'Worker lost' in failed.last_error
+    assert _calls['flaky'] == 0
+
+
+def test_admin_job_queue_status(client, admin_token):
+    enqueue('test_flaky', fail_times=0)
+    enqueue('test_flaky', fail_times=0)
+
+    response = client.get('/api/admin/jobs', headers={'Authorization': f'Bearer {admin_token}'})
+    assert response.status_code == 200
+    assert response.json['depth'] == 2
+    assert response.json['queued_by_kind'] == {'test_flaky': 2}
@@ -0,0 +1,87 @@
+import threading
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+from app import db
+from app.models import User
+from app.passwords import PasswordHasher, normalize_method
+
+
+def _login(client, password='secret123'):
+    return client.post('/api/auth/login', json={'email': 'legacy@test.com', 'password': password})
+
+
+def _legacy_user(app, method):
+    with app.app_context():
+        user = User(username='legacy', email='legacy@test.com', role='candidate',
+                    password_hash=generate_password_hash('secret123', method))
+        db.session.add(user)
+        db.session.commit()
+        return user.password_hash
+
+
+def _stored_hash(app):
+    with app.app_context():
+        return User.query.filter_by(email='legacy@test.com').one().password_hash
+
+
+def test_normalize_method():
+    assert normalize_method('scrypt') == 'scrypt:32768:8:1'
+    assert normalize_method('pbkdf2') == 'pbkdf2:sha256:600000'
+    assert normalize_method('pbkdf2:sha512') == 'pbkdf2:sha512:600000'
+    assert normalize_method('scrypt:16384:8:1') == 'scrypt:16384:8:1'
+    with pytest.raises(ValueError):
+        normalize_method('md5')
+    with pytest.raises(ValueError):
+        normalize_method('scrypt:16384')
+
+
+def test_hash_parameters_from_config(client, app):
+    app.config['PASSWORD_HASH_METHOD'] = 'pbkdf2:sha256:1000'
+    app.extensions.pop('password_hasher', None)
+
+    response = client.post('/api/auth/register', json={
+        'username': 'new', 'email': 'new@test.com', 'password': 'secret123',
+        'company_name': 'New Company'
+    })
+    assert response.status_code == 201
+    with app.app_context():
+        assert User.query.filter_by(email='new@test.com').one().password_hash.startswith('pbkdf2:sha256:1000$')
+
+
+def test_stale_hash_rehashed_on_login(client, app):
+    app.config['PASSWORD_HASH_METHOD'] = 'pbkdf2:sha256:2000'
+    app.extensions.pop('password_hasher', None)
+    legacy = _legacy_user(app, 'pbkdf2:sha256:1000')
+
+    # Mauvais mot de passe : rien n'est touché
+    assert _login(client, 'wrong').status_code == 401
+    assert _stored_hash(app) == legacy
+
+    assert _login(client).status_code == 200
+    upgraded = _stored_hash(app)
+    assert upgraded.startswith('pbkdf2:sha256:2000$')
+
+    # Paramètres à jour : plus d'écriture
+    assert _login(client).status_code == 200
+    assert _stored_hash(app) == upgraded
+
+
+def test_saturated_hasher_returns_503(client, app):
+    _legacy_user(app, 'pbkdf2:sha256:1000')
+    hasher = app.extensions['password_hasher'] = PasswordHasher('pbkdf2:sha256:1000', workers=1,
+                                                                queue_size=0, timeout=0.05)
+    release = threading.Event()
+    busy = threading.Thread(target=hasher._run, args=(release.wait,))
+    busy.start()
+    try:
+        response = _login(client)
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
+    finally:
+        release.set()
+        busy.join()
+
+    assert _login(client).status_code == 200
+    hasher.shutdown()
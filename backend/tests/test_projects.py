@@ -30,4 +30,60 @@ def test_create_project_as_candidate_fails(client, candidate_token):
             'deadline': (datetime.now() + timedelta(days=30)).isoformat()
         }
     )
-    assert response.status_code == 403
\ No newline at end of file
+    assert response.status_code == 403
+
+def _seed_projects(app, count):
+    from app import db
+    from app.models import Project
+
+    with app.app_context():
+        for i in range(count):
+            db.session.add(Project(
+                title=f'Project {i}',
+                description='Test',
+                project_type='repair' if i % 2 == 0 else 'construction',
+                budget=10000 * (i + 1),
+                deadline=datetime(2030, 1, 1) + timedelta(days=i),
+                status='open'
+            ))
+        db.session.commit()
+
+
+def test_get_projects_keyset_pagination(client, app):
+    _seed_projects(app, 5)
+
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        url = '/api/projects?limit=2' + (f'&cursor={cursor}' if cursor else '')
+        response = client.get(url)
+        assert response.status_code == 200
+        assert len(response.json) <= 2
+        seen.extend(p['id'] for p in response.json)
+        pages += 1
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+
+    assert pages == 3
+    assert len(seen) == len(set(seen)) == 5
+    # Tri stable : du plus récent au plus ancien
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_get_projects_filters(client, app):
+    _seed_projects(app, 6)
+
+    response = client.get('/api/projects?project_type=repair&min_budget=20000&max_budget=50000')
+    assert response.status_code == 200
+    assert [p['title'] for p in response.json] == ['Project 4', 'Project 2']
+
+    response = client.get('/api/projects?deadline_after=2030-01-04T00:00:00')
+    assert {p['title'] for p in response.json} == {'Project 3', 'Project 4', 'Project 5'}
+
+
+def test_get_projects_invalid_cursor(client):
+    response = client.get('/api/projects?cursor=not-a-cursor')
+    assert response.status_code == 400
+    assert 'Invalid cursor' in response.json['message']
@@ -0,0 +1,199 @@
+import io
+import time
+
+import pytest
+from flask import stream_with_context
+
+from app import create_app, db
+from app.ratelimit import (
+    AdmissionControl, MemoryBuckets, RateLimiter, RedisBuckets, gcra, parse_limit
+)
+from factories import make_project
+
+
+def _login(client, ip='10.0.0.1', email='admin@test.com'):
+    return client.post('/api/auth/login', json={'email': email, 'password': 'admin123'},
+                       environ_base={'REMOTE_ADDR': ip})
+
+
+def test_parse_limit():
+    assert parse_limit('20/minute') == (20, 60)
+    assert parse_limit('5/second') == (5, 1)
+    assert parse_limit('0') is None
+    assert parse_limit('') is None
+    with pytest.raises(ValueError):
+        parse_limit('20/fortnight')
+
+
+def test_gcra_burst_then_refill():
+    buckets = MemoryBuckets()
+    # 3 jetons, un de plus toutes les 2 s
+    assert [buckets.take('k', 2.0, 3, 100.0) for _ in range(3)] == [0, 0, 0]
+    assert buckets.take('k', 2.0, 3, 100.0) == pytest.approx(2.0)
+    assert buckets.take('k', 2.0, 3, 101.0) == pytest.approx(1.0)
+    assert buckets.take('k', 2.0, 3, 102.0) == 0
+    # Seau plein après 6 s d'inactivité
+    assert [buckets.take('k', 2.0, 3, 108.0) for _ in range(3)] == [0, 0, 0]
+
+
+def test_login_limited_per_ip(client, app, admin_user, metrics_headers):
+    app.config.update(RATE_LIMIT_LOGIN='3/minute', RATE_LIMIT_LOGIN_ACCOUNT='0')
+
+    assert [_login(client).status_code for _ in range(3)] == [200, 200, 200]
+    response = _login(client)
+    assert response.status_code == 429
+    assert 1 <= int(response.headers['Retry-After']) <= 20
+
+    # Une autre adresse garde son propre seau
+    assert _login(client, ip='10.0.0.2').status_code == 200
+    assert 'rate_limited_total{rule="login"} 1' in client.get('/api/metrics', headers=metrics_headers).get_data(as_text=True)
+
+
+def test_login_limited_per_account(client, app, admin_user):
+    app.config.update(RATE_LIMIT_LOGIN_ACCOUNT='2/minute')
+
+    assert _login(client, ip='10.0.0.1').status_code == 200
+    assert _login(client, ip='10.0.0.2').status_code == 200
+    # Même compte visé depuis une troisième adresse
+    assert _login(client, ip='10.0.0.3').status_code == 429
+    assert _login(client, ip='10.0.0.3', email='other@test.com').status_code == 401
+
+
+def test_forwarded_address_behind_trusted_proxy(client, app, admin_user):
+    app.config.update(RATE_LIMIT_LOGIN='1/minute', RATE_LIMIT_LOGIN_ACCOUNT='0', TRUSTED_PROXIES=1)
+
+    def login(forwarded):
+        return client.post('/api/auth/login', json={'email': 'admin@test.com', 'password': 'admin123'},
+                           headers={'X-Forwarded-For': forwarded})
+
+    assert login('198.51.100.7').status_code == 200
+    assert login('198.51.100.8').status_code == 200
+    # Une adresse ajoutée par le client lui-même ne change pas la clé
+    assert login('203.0.113.1, 198.51.100.8').status_code == 429
+
+
+def test_bid_submission_limited_per_candidate(client, app, candidate_token):
+    app.config['RATE_LIMIT_SUBMIT_BID'] = '1/minute'
+    with app.app_context():
+        project_ids = [make_project().id for _ in range(2)]
+        db.session.commit()
+
+    def submit(project_id):
+        return client.post(f'/api/projects/{project_id}/bids',
+                           headers={'Authorization': f'Bearer {candidate_token}'},
+                           data={'proposed_amount': '45000',
+                                 'technical_proposal': (io.BytesIO(b'offre'), 'offre.pdf')},
+                           content_type='multipart/form-data')
+
+    assert submit(project_ids[0]).status_code == 201
+    assert submit(project_ids[1]).status_code == 429
+
+
+class StubRedis:
+    """Bouchon local de redis-py : exécute le script GCRA en Python"""
+
+    def __init__(self):
+        self.data = {}
+
+    def eval(self, script, numkeys, key, now, interval, burst):
+        tat, wait = gcra(self.data.get(key), float(now), float(interval), int(burst))
+        if not wait:
+            self.data[key] = tat
+        return str(wait)
+
+
+def test_shared_backend_across_workers():
+    shared = StubRedis()
+    clock = lambda: 1000.0  # noqa: E731
+    workers = [RateLimiter(RedisBuckets(shared), clock=clock) for _ in range(2)]
+
+    assert workers[0].hit('login', 'ip:10.0.0.1', (2, 60)) == 0
+    assert workers[1].hit('login', 'ip:10.0.0.1', (2, 60)) == 0
+    assert workers[0].hit('login', 'ip:10.0.0.1', (2, 60)) == pytest.approx(30.0)
+    assert workers[0].rejected == {'login': 1}
+
+
+def test_admission_sheds_when_saturated(client, app, metrics_headers):
+    admission = app.extensions['admission'] = AdmissionControl(max_inflight=1)
+    assert admission.admit() is None  # une requête longue occupe le processus
+
+    response = client.get('/api/projects')
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '1'
+    assert client.get('/api/health').status_code == 200
+
+    admission.release(0.01)
+    assert client.get('/api/projects').status_code == 200
+    assert admission.inflight == 0
+    assert 'admission_shed_total{reason="inflight"} 1' in client.get('/api/metrics', headers=metrics_headers).get_data(as_text=True)
+
+
+def test_admission_sheds_on_p99_then_recovers():
+    now, draw = [0.0], [0.5]
+    admission = AdmissionControl(p99_ms=100, window=10, min_samples=1, max_shed=0.9,
+                                 clock=lambda: now[0], random=lambda: draw[0])
+    for _ in range(5):
+        assert admission.admit() is None
+        admission.release(0.5)
+
+    # p99 à 5× le seuil : 90 % des requêtes refusées, les autres passent
+    now[0] = 1.5
+    assert admission.admit() == 'latency'
+    draw[0] = 0.95
+    assert admission.admit() is None
+    admission.release(0.12)
+
+    # Fenêtre renouvelée par les requêtes admises : la part refusée baisse
+    now[0] = 11.0
+    assert admission._shed_ratio() == pytest.approx(0.2)
+    draw[0] = 0.5
+    assert admission.admit() is None
+    now[0] = 22.0
+    assert admission._shed_ratio() == 0.0
+
+
+def test_event_streams_not_counted_in_flight(client, app, candidate_token):
+    admission = app.extensions['admission'] = AdmissionControl(max_inflight=1)
+    response = client.get('/api/events?max_duration=0.2', buffered=False,
+                          headers={'Authorization': f'Bearer {candidate_token}'})
+    assert response.status_code == 200
+    assert admission.inflight == 0
+    assert client.get('/api/projects').status_code == 200
+    response.close()
+
+    # Processus saturé : pas de nouveau flux non plus
+    admission.admit()
+    assert client.get('/api/events?max_duration=0', headers={'Authorization': f'Bearer {candidate_token}'}).status_code == 429
+    assert admission.inflight == 1
+
+
+def test_streamed_download_does_not_trip_p99(tmp_path, monkeypatch):
+    """Un long téléchargement en flux ne compte que jusqu'à ses en-têtes"""
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'stream.db'}")
+    app = create_app()
+    now = [0.0]
+    admission = app.extensions['admission'] = AdmissionControl(p99_ms=100, window=10, min_samples=1,
+                                                               clock=lambda: now[0])
+
+    @app.route('/slow-export')
+    def slow_export():
+        def generate():
+            yield 'id\n'
+            time.sleep(0.3)
+            yield '1\n'
+        return app.response_class(stream_with_context(generate()), mimetype='text/csv')
+
+    @app.route('/fast')
+    def fast():
+        return 'ok'
+
+    client = app.test_client()
+    response = client.get('/slow-export')
+    assert admission.inflight == 1  # le flux occupe le processus jusqu'à sa fin
+    assert response.get_data() == b'id\n1\n'
+    response.close()
+    assert admission.inflight == 0
+
+    now[0] = 2.0
+    assert client.get('/fast').status_code == 200
+    assert admission._p99_value < 0.1
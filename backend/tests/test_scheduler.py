@@ -0,0 +1,187 @@
+import io
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import db
+from app.events import Subscription, get_bus
+from app.models import Bid, Candidate, Project
+from app.scheduler import Scheduler, close_expired_projects, sweep, sweep_staged_uploads, tick
+from app.storage import get_storage
+from factories import make_bid, make_document
+
+
+def _project(deadline, status='open', title='Project'):
+    project = Project(title=title, description='Test', project_type='repair',
+                      budget=50000, deadline=deadline, status=status)
+    db.session.add(project)
+    db.session.commit()
+    return project.id
+
+
+def test_tick_closes_only_expired_open_projects(app):
+    now = datetime.utcnow()
+    with app.app_context():
+        expired = _project(now - timedelta(hours=1))
+        future = _project(now + timedelta(days=1))
+        awarded = _project(now - timedelta(days=3), status='awarded')
+
+        assert tick(now) == {'closed_projects': 1}
+        assert db.session.get(Project, expired).status == 'closed'
+        assert db.session.get(Project, expired).updated_at == now
+        assert db.session.get(Project, future).status == 'open'
+        assert db.session.get(Project, awarded).status == 'awarded'
+
+        # Idempotent : un second passage ne touche plus rien
+        assert tick(now) == {'closed_projects': 0}
+
+
+def test_tick_publishes_closed_projects(app, candidate_user):
+    now = datetime.utcnow()
+    with app.app_context():
+        expired = _project(now - timedelta(hours=1))
+        candidate = Candidate.query.one()
+        make_bid(db.session.get(Project, expired), candidate)
+        db.session.commit()
+        candidate_id = candidate.id
+        _project(now + timedelta(days=1))
+
+        admin, bidder = Subscription(['admin']), Subscription([f'candidate:{candidate_id}'])
+        for subscription in (admin, bidder):
+            get_bus().subscribe(subscription)
+        try:
+            assert tick(now) == {'closed_projects': 1}
+        finally:
+            for subscription in (admin, bidder):
+                get_bus().unsubscribe(subscription)
+
+        for subscription in (admin, bidder):
+            event = subscription.get(timeout=0)
+            assert (event.type, event.data) == ('project.status', {'project_id': expired, 'status': 'closed'})
+            assert subscription.get(timeout=0) is None
+
+
+def test_close_expired_projects_uses_deadline_index(app):
+    from sqlalchemy import update
+
+    with app.app_context():
+        statement = (update(Project)
+                     .where(Project.status == 'open', Project.deadline <= datetime(2030, 1, 1))
+                     .values(status='closed'))
+        compiled = statement.compile(dialect=db.engine.dialect)
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+        with db.engine.connect() as conn:
+            rows = conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + str(compiled), params).fetchall()
+        plan = '\n'.join(row[-1] for row in rows)
+        assert 'INDEX ix_projects_status_deadline' in plan, plan
+
+
+def test_tick_skipped_without_leader_lock(app, monkeypatch):
+    monkeypatch.setattr('app.scheduler.acquire_leader_lock', lambda: False)
+    with app.app_context():
+        expired = _project(datetime.utcnow() - timedelta(hours=1))
+        assert tick() is None
+        assert db.session.get(Project, expired).status == 'open'
+        assert sweep() is None
+
+
+def test_tick_invalidates_cached_listing(client, app):
+    with app.app_context():
+        _project(datetime.utcnow() + timedelta(days=1), title='Still open')
+        expired = _project(datetime.utcnow() - timedelta(minutes=5), title='Expired')
+
+    first = client.get('/api/projects?status=open')
+    assert expired in {p['id'] for p in first.json}
+
+    with app.app_context():
+        tick()
+
+    second = client.get('/api/projects?status=open')
+    assert expired not in {p['id'] for p in second.json}
+    assert second.headers['ETag'] != first.headers['ETag']
+
+
+def test_late_bid_rejected_before_tick(client, app, candidate_token):
+    with app.app_context():
+        project_id = _project(datetime.utcnow() - timedelta(minutes=1))
+
+    response = client.post(f'/api/projects/{project_id}/bids',
+        headers={'Authorization': f'Bearer {candidate_token}'},
+        json={'proposed_amount': 45000, 'proposed_timeline': '15 days'}
+    )
+    assert response.status_code == 400
+    assert response.json['message'] == 'The bidding deadline has passed'
+    with app.app_context():
+        assert Bid.query.filter_by(project_id=project_id).count() == 0
+
+
+def test_late_bid_check_adds_no_query(client, app, candidate_token, count_queries):
+    with app.app_context():
+        project_id = _project(datetime.utcnow() - timedelta(minutes=1))
+        with count_queries() as statements:
+            client.post(f'/api/projects/{project_id}/bids',
+                headers={'Authorization': f'Bearer {candidate_token}'},
+                json={'proposed_amount': 45000}
+            )
+    assert not any('FROM projects' in s and 'deadline' in s.split('FROM')[-1] for s in statements)
+    assert sum('FROM projects' in s for s in statements) == 1
+
+
+@pytest.mark.commits
+def test_scheduler_thread_closes_projects(app):
+    with app.app_context():
+        expired = _project(datetime.utcnow() - timedelta(hours=1))
+
+    scheduler = Scheduler(app, interval=0.05).start()
+    try:
+        with app.app_context():
+            for _ in range(40):
+                db.session.expire_all()
+                if db.session.get(Project, expired).status == 'closed':
+                    break
+                time.sleep(0.05)
+            assert db.session.get(Project, expired).status == 'closed'
+    finally:
+        scheduler.stop(timeout=2)
+
+
+def test_sweep_recovers_staged_uploads(app, candidate_user):
+    with app.app_context():
+        storage = get_storage()
+        committed = storage.stage(io.BytesIO(b'validated, never promoted'))
+        orphan = storage.stage(io.BytesIO(b'transaction rolled back'))
+        fresh = storage.stage(io.BytesIO(b'request still running'))
+        old = time.time() - 2 * app.config['STAGING_MAX_AGE']
+        for staged in (committed, orphan):
+            os.utime(staged.path, (old, old))
+
+        make_document(make_bid(candidate=Candidate.query.one()),
+                      file_path=committed.key, file_size=committed.size)
+        db.session.commit()
+
+        assert sweep() == {'expired_keys': 0, 'expired_tokens': 0, 'promoted_files': 1, 'discarded_files': 1}
+        assert storage.exists(committed.key)
+        assert not storage.exists(orphan.key)
+        assert os.listdir(storage.staging_dir) == [os.path.basename(fresh.path)]
+
+
+
+def test_concurrent_sweeps_tolerate_vanished_files(app, candidate_user, monkeypatch):
+    """Zone de transit commune : un fichier repris par un autre worker est ignoré"""
+    with app.app_context():
+        storage = get_storage()
+        committed = storage.stage(io.BytesIO(b'promoted by another worker'))
+        orphan = storage.stage(io.BytesIO(b'discarded by another worker'))
+        make_document(make_bid(candidate=Candidate.query.one()),
+                      file_path=committed.key, file_size=committed.size)
+        db.session.commit()
+
+        listed = [committed, orphan]
+        for staged in listed:
+            os.remove(staged.path)
+        monkeypatch.setattr(storage, 'stale_staged', lambda max_age: iter(listed))
+
+        assert sweep_staged_uploads(0) == (0, 1)
+        storage.delete(committed.key)  # absent : pas d'erreur
@@ -0,0 +1,202 @@
+import math
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import db
+from app.models import Bid, Candidate, Document, Project, User
+from app.scoring import (
+    InvalidWeights, Cohort, DEFAULT_WEIGHTS, parse_timeline_days, parse_weights, score_cohort
+)
+
+
+def _seed_project(app, offers, budget=100000):
+    """Projet et offres ``(montant, délai, types de documents, vérifiés)``"""
+    with app.app_context():
+        project = Project(
+            title='Scored Project',
+            description='Test',
+            project_type='repair',
+            budget=budget,
+            deadline=datetime.now() + timedelta(days=30)
+        )
+        db.session.add(project)
+        db.session.flush()
+
+        bid_ids = []
+        for i, (amount, timeline, documents, verified) in enumerate(offers):
+            user = User(username=f'scored{i}', email=f'scored{i}@test.com', role='candidate')
+            user.set_password('pass123')
+            db.session.add(user)
+            db.session.flush()
+            candidate = Candidate(user_id=user.id, company_name=f'Company {i}')
+            db.session.add(candidate)
+            db.session.flush()
+            bid = Bid(
+                project_id=project.id,
+                candidate_id=candidate.id,
+                proposed_amount=amount,
+                proposed_timeline=timeline
+            )
+            db.session.add(bid)
+            db.session.flush()
+            for document_type in documents:
+                db.session.add(Document(
+                    bid_id=bid.id,
+                    document_type=document_type,
+                    file_name=f'{document_type}.pdf',
+                    file_path=f'{bid.id}/{document_type}.pdf',
+                    verified=verified
+                ))
+            bid_ids.append(bid.id)
+        db.session.commit()
+        return project.id, bid_ids
+
+
+FULL = ('technical_proposal', 'financial_proposal')
+
+
+@pytest.mark.parametrize('text, days', [
+    ('6 mois', 180),
+    ('90 jours', 90),
+    ('3 weeks', 21),
+    ('1,5 an', 547.5),
+    ('45', 45),
+])
+def test_parse_timeline_days(text, days):
+    assert parse_timeline_days(text) == days
+
+
+def test_parse_timeline_days_unreadable():
+    assert math.isnan(parse_timeline_days('dès que possible'))
+    assert math.isnan(parse_timeline_days(None))
+
+
+def test_parse_weights_normalizes():
+    weights = parse_weights('price:3,timeline:1,completeness:0,verification:0', DEFAULT_WEIGHTS)
+    assert weights == {'price': 0.75, 'timeline': 0.25, 'completeness': 0.0, 'verification': 0.0}
+
+    with pytest.raises(InvalidWeights):
+        parse_weights('speed:1', DEFAULT_WEIGHTS)
+    with pytest.raises(InvalidWeights):
+        parse_weights('price:-1', DEFAULT_WEIGHTS)
+
+
+def test_score_cohort_flags_abnormally_low_and_over_budget():
+    cohort = Cohort(
+        100000,
+        [1, 2, 3, 4, 5, 6],
+        [90000, 92000, 88000, 91000, 150000, 20000],
+        [90, 90, 90, 90, 90, 90],
+        [1, 1, 1, 1, 1, 1],
+        [1, 1, 1, 1, 1, 1],
+        ['A', 'B', 'C', 'D', 'E', 'F'],
+    )
+    result = score_cohort(cohort, parse_weights(None, DEFAULT_WEIGHTS), k=1.0)
+    by_id = {bid['bid_id']: bid for bid in result['bids']}
+
+    assert by_id[6]['abnormally_low'] is True
+    assert not any(by_id[i]['abnormally_low'] for i in (1, 2, 3, 4, 5))
+    assert by_id[5]['over_budget'] is True
+    # Pénalité budgétaire : prix = (20000/150000) * (100000/150000)
+    assert by_id[5]['scores']['price'] == round(20000 / 150000 * 100000 / 150000, 4)
+    assert [bid['rank'] for bid in result['bids']] == [1, 2, 3, 4, 5, 6]
+
+
+def test_small_cohort_has_no_abnormal_threshold():
+    cohort = Cohort(None, [1, 2], [1000, 10], [10, 10], [1, 1], [0, 0], ['A', 'B'])
+    result = score_cohort(cohort, parse_weights(None, DEFAULT_WEIGHTS), k=0.1)
+    assert result['cohort']['abnormally_low_threshold'] is None
+    assert not any(bid['abnormally_low'] for bid in result['bids'])
+
+
+def test_evaluation_ranks_bids(client, admin_token, app):
+    project_id, bid_ids = _seed_project(app, [
+        (60000, '6 mois', FULL, False),
+        (50000, '90 jours', FULL, True),
+        (50000, '12 mois', ('technical_proposal',), False),
+    ])
+
+    response = client.get(f'/api/admin/projects/{project_id}/evaluation',
+        headers={'Authorization': f'Bearer {admin_token}'}
+    )
+    assert response.status_code == 200
+    bids = response.json['bids']
+    assert [bid['bid_id'] for bid in bids] == [bid_ids[1], bid_ids[0], bid_ids[2]]
+    assert bids[0]['timeline_days'] == 90
+    assert bids[0]['scores'] == {'price': 1.0, 'timeline': 1.0, 'completeness': 1.0, 'verification': 1.0}
+    assert bids[2]['scores']['completeness'] == 0.5
+
+    # Tout sur le délai : l'offre en 6 mois passe devant celle en 12 mois
+    response = client.get(f'/api/admin/projects/{project_id}/evaluation?weights=price:0,timeline:1,completeness:0,verification:0',
+        headers={'Authorization': f'Bearer {admin_token}'}
+    )
+    assert response.json['weights']['timeline'] == 1.0
+    assert [bid['bid_id'] for bid in response.json['bids']] == [bid_ids[1], bid_ids[0], bid_ids[2]]
+
+
+def test_evaluation_rejects_bad_parameters(client, admin_token, app):
+    project_id, _ = _seed_project(app, [(50000, '90 jours', FULL, True)])
+    headers = {'Authorization': f'Bearer {admin_token}'}
+
+    assert client.get(f'/api/admin/projects/{project_id}/evaluation?weights=speed:1', headers=headers).status_code == 400
+    assert client.get(f'/api/admin/projects/{project_id}/evaluation?k=abc', headers=headers).status_code == 400
+    assert client.get('/api/admin/projects/999999/evaluation', headers=headers).status_code == 404
+
+
+def test_evaluation_requires_admin(client, candidate_token, app):
+    project_id, _ = _seed_project(app, [(50000, '90 jours', FULL, True)])
+    response = client.get(f'/api/admin/projects/{project_id}/evaluation',
+        headers={'Authorization': f'Bearer {candidate_token}'}
+    )
+    assert response.status_code == 403
+
+
+def test_evaluation_uses_cached_cohort(client, admin_token, app, count_queries):
+    project_id, _ = _seed_project(app, [(50000 + i * 1000, '90 jours', FULL, True) for i in range(5)])
+    headers = {'Authorization': f'Bearer {admin_token}'}
+
+    with app.app_context():
+        with count_queries() as first:
+            client.get(f'/api/admin/projects/{project_id}/evaluation', headers=headers)
+        with count_queries() as second:
+            response = client.get(f'/api/admin/projects/{project_id}/evaluation', headers=headers)
+
+    assert response.status_code == 200
+    assert len(response.json['bids']) == 5
+    assert sum('FROM bids' in statement for statement in first) >= 1
+    assert not any('FROM bids' in statement or 'FROM documents' in statement for statement in second)
+
+
+def test_new_bid_is_added_incrementally(client, admin_token, candidate_token, app, count_queries):
+    project_id, bid_ids = _seed_project(app, [(50000, '90 jours', FULL, True), (55000, '60 jours', FULL, True)])
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    client.get(f'/api/admin/projects/{project_id}/evaluation', headers=headers)
+
+    response = client.post(f'/api/projects/{project_id}/bids',
+        headers={'Authorization': f'Bearer {candidate_token}'},
+        json={'proposed_amount': 40000, 'proposed_timeline': '30 jours'}
+    )
+    assert response.status_code == 201
+    new_id = response.json['bid_id']
+
+    with app.app_context():
+        with count_queries() as statements:
+            response = client.get(f'/api/admin/projects/{project_id}/evaluation', headers=headers)
+    assert not any('FROM bids' in statement for statement in statements)
+    assert {bid['bid_id'] for bid in response.json['bids']} == {*bid_ids, new_id}
+    assert response.json['bids'][-1]['bid_id'] == new_id  # aucune pièce jointe
+
+
+def test_budget_change_reloads_cohort(client, admin_token, app):
+    project_id, _ = _seed_project(app, [(150000, '90 jours', FULL, True)], budget=200000)
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    response = client.get(f'/api/admin/projects/{project_id}/evaluation', headers=headers)
+    assert response.json['bids'][0]['over_budget'] is False
+
+    with app.app_context():
+        db.session.get(Project, project_id).budget = 100000
+        db.session.commit()
+
+    response = client.get(f'/api/admin/projects/{project_id}/evaluation', headers=headers)
+    assert response.json['bids'][0]['over_budget'] is True
@@ -0,0 +1,94 @@
+"""Recherche plein texte : accents, pertinence, extraits, pagination, index."""
+from datetime import datetime, timedelta
+
+from app import db
+from app.models import Project
+
+
+def _add_project(title, description, status='open', project_type='repair'):
+    project = Project(title=title, description=description, project_type=project_type,
+                      budget=10000, deadline=datetime(2030, 1, 1), status=status)
+    db.session.add(project)
+    db.session.commit()
+    return project.id
+
+
+def test_search_requires_query(client, app):
+    response = client.get('/api/projects/search?q=%20')
+    assert response.status_code == 400
+
+
+def test_search_is_accent_insensitive(client, app):
+    wanted = _add_project('Étanchéité de la toiture', 'Reprise complète du tribunal')
+    _add_project('Peinture', 'Salle des pas perdus')
+
+    response = client.get('/api/projects/search?q=etancheite')
+    assert response.status_code == 200
+    assert [p['id'] for p in response.json] == [wanted]
+
+
+def test_search_ranks_title_matches_first(client, app):
+    in_description = _add_project('Maintenance générale', 'Entretien de la climatisation du bâtiment')
+    in_title = _add_project('Climatisation de la salle d’audience', 'Remplacement des groupes froids')
+
+    ids = [p['id'] for p in client.get('/api/projects/search?q=climatisation').json]
+    assert ids == [in_title, in_description]
+
+
+def test_search_snippet_highlights_and_escapes(client, app):
+    _add_project('Toiture', 'Travaux <urgent> sur la toiture du greffe')
+
+    project = client.get('/api/projects/search?q=greffe').json[0]
+    assert '<mark>greffe</mark>' in project['snippet']
+    assert '&lt;urgent&gt;' in project['snippet']
+    assert isinstance(project['rank'], float)
+
+
+def test_search_filters_and_paginates(client, app):
+    for i in range(5):
+        _add_project(f'Électricité lot {i}', 'Mise aux normes électricité')
+    _add_project('Électricité archivée', 'Mise aux normes électricité', status='closed')
+
+    seen = []
+    cursor = None
+    while True:
+        url = '/api/projects/search?q=electricite&status=open&limit=2' + (f'&cursor={cursor}' if cursor else '')
+        response = client.get(url)
+        assert response.status_code == 200
+        seen.extend(p['id'] for p in response.json)
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+
+    assert len(seen) == len(set(seen)) == 5
+
+
+def test_search_rejects_bad_cursor(client, app):
+    response = client.get('/api/projects/search?q=toiture&cursor=garbage')
+    assert response.status_code == 400
+
+
+def test_search_index_follows_updates_and_deletes(client, app, admin_token):
+    project_id = _add_project('Ascenseur', 'Révision annuelle')
+    headers = {'Authorization': f'Bearer {admin_token}'}
+
+    client.put(f'/api/projects/{project_id}', headers=headers,
+               json={'title': 'Monte-charge', 'deadline': (datetime.now() + timedelta(days=10)).isoformat()})
+    assert client.get('/api/projects/search?q=ascenseur').json == []
+    assert [p['id'] for p in client.get('/api/projects/search?q=monte').json] == [project_id]
+
+    client.delete(f'/api/projects/{project_id}', headers=headers)
+    assert client.get('/api/projects/search?q=monte').json == []
+
+
+def test_search_does_not_scan_projects(app):
+    with db.engine.connect() as conn:
+        rows = conn.exec_driver_sql(
+            'EXPLAIN QUERY PLAN '
+            'SELECT p.id FROM (SELECT rowid AS id, -bm25(projects_fts) AS rank FROM projects_fts '
+            "WHERE projects_fts MATCH '\"toiture\"*') AS hits "
+            'JOIN projects AS p ON p.id = hits.id ORDER BY hits.rank DESC, hits.id DESC'
+        ).fetchall()
+    plan = '\n'.join(row[-1] for row in rows)
+    assert 'VIRTUAL TABLE INDEX' in plan, plan
+    assert 'SEARCH p USING INTEGER PRIMARY KEY' in plan, plan
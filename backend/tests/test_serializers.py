@@ -0,0 +1,120 @@
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app import db
+from app.models import Bid, Candidate, Project, User
+from app.queries import project_listing_query
+from app.serializers import (PROJECT_COLUMNS, PayloadCache, StdlibJSONProvider,
+                             create_json_provider, get_payload_cache)
+
+
+def _seed(app, bids=3):
+    with app.app_context():
+        project = Project(title='Serialized Project', description='Test', project_type='repair',
+                          budget=1000, deadline=datetime.now() + timedelta(days=30))
+        db.session.add(project)
+        db.session.flush()
+        for i in range(bids):
+            user = User(username=f'serial_{i}', email=f'serial_{i}@test.com',
+                        password_hash='x', role='candidate')
+            db.session.add(user)
+            db.session.flush()
+            candidate = Candidate(user_id=user.id, company_name=f'Company {i}')
+            db.session.add(candidate)
+            db.session.flush()
+            db.session.add(Bid(project_id=project.id, candidate_id=candidate.id,
+                               proposed_amount=40000 + i, proposed_timeline='15 days'))
+        db.session.commit()
+
+
+def test_project_listing_reads_columns_not_objects(app):
+    _seed(app, bids=0)
+    with app.app_context():
+        rows = project_listing_query({}).all()
+    assert len(rows) == 1
+    assert not isinstance(rows[0], Project)
+    assert rows[0]._fields == tuple(column.key for column in PROJECT_COLUMNS)
+
+
+def test_json_backends_produce_same_documents(client, app, admin_token, monkeypatch):
+    pytest.importorskip('orjson')
+    from app.serializers import OrjsonProvider
+    _seed(app)
+    headers = {'Authorization': f'Bearer {admin_token}'}
+
+    documents = []
+    for provider in (StdlibJSONProvider, OrjsonProvider):
+        monkeypatch.setattr(app, 'json', provider(app))
+        app.extensions.pop('payload_cache', None)
+        app.extensions.pop('response_cache', None)
+        bids = client.get('/api/admin/bids', headers=headers)
+        projects = client.get('/api/projects')
+        assert bids.status_code == projects.status_code == 200
+        documents.append((bids.json, projects.json))
+    assert documents[0] == documents[1]
+
+    # Conversions de Flask conservées (dates HTTP, Decimal en chaîne)
+    value = {'at': datetime(2024, 1, 2, 3, 4, 5), 'amount': Decimal('1.5')}
+    with app.app_context():
+        assert json.loads(OrjsonProvider(app).dumps(value)) == json.loads(StdlibJSONProvider(app).dumps(value))
+        assert OrjsonProvider(app).loads('{"a": [1, 2]}') == {'a': [1, 2]}
+
+
+def test_create_json_provider(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'JSON_BACKEND', 'stdlib')
+    assert isinstance(create_json_provider(app), StdlibJSONProvider)
+
+    monkeypatch.setitem(app.config, 'JSON_BACKEND', 'yaml')
+    with pytest.raises(RuntimeError):
+        create_json_provider(app)
+
+
+def test_unchanged_rows_reuse_encoded_payloads(client, app, admin_token, metrics_headers):
+    _seed(app)
+    headers = {'Authorization': f'Bearer {admin_token}'}
+
+    first = client.get('/api/admin/bids', headers=headers)
+    with app.app_context():
+        payloads = get_payload_cache()
+        assert (payloads.hits, payloads.misses) == (0, 3)
+
+    assert client.get('/api/admin/bids', headers=headers).json == first.json
+    assert (payloads.hits, payloads.misses) == (3, 3)
+
+    # Offre modifiée : nouvelle clé, seul son fragment est ré-encodé
+    bid_id = first.json[0]['id']
+    response = client.put(f'/api/admin/bids/{bid_id}/status', headers=headers, json={'status': 'accepted'})
+    assert response.status_code == 200
+    updated = client.get('/api/admin/bids', headers=headers).json
+    assert next(b for b in updated if b['id'] == bid_id)['status'] == 'accepted'
+    assert (payloads.hits, payloads.misses) == (5, 4)
+
+    assert 'payload_cache_hits_total 5' in client.get('/api/metrics', headers=metrics_headers).get_data(as_text=True)
+
+
+def test_payload_cache_is_bounded():
+    cache = PayloadCache(maxsize=2)
+    encode = lambda obj: json.dumps(obj).encode()  # noqa: E731
+    for row in [(1,), (2,), (1,), (3,)]:
+        cache.encode(('row', row[0], 0), row, list, encode)
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert cache.encode(('row', 1, 0), (1,), list, encode) == b'[1]'
+    assert cache.hits == 2
+
+    # Même ligne, nouvelle version : ré-encodée
+    assert cache.encode(('row', 1, 1), (1, 'renamed'), list, encode) == b'[1, "renamed"]'
+    assert cache.misses == 4
+
+
+def test_renamed_project_refreshes_bid_fragments(client, app, admin_token):
+    _seed(app, bids=1)
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    assert client.get('/api/admin/bids', headers=headers).json[0]['project_title'] == 'Serialized Project'
+
+    project_id = client.get('/api/projects').json[0]['id']
+    response = client.put(f'/api/projects/{project_id}', headers=headers, json={'title': 'Renamed Project'})
+    assert response.status_code == 200
+    assert client.get('/api/admin/bids', headers=headers).json[0]['project_title'] == 'Renamed Project'
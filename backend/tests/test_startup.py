@@ -0,0 +1,80 @@
+import json
+import os
+import subprocess
+import sys
+
+from sqlalchemy import event, inspect
+from sqlalchemy.pool import Pool
+
+from app import create_app, db
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), '..')
+
+
+def test_create_app_opens_no_connection(tmp_path, monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'boot.db'}")
+    connects = []
+    listener = lambda *args: connects.append(args)  # noqa: E731
+    event.listen(Pool, 'connect', listener)
+    try:
+        app = create_app()
+        assert app.test_client().get('/api/health').status_code == 200
+    finally:
+        event.remove(Pool, 'connect', listener)
+
+    assert connects == []
+    assert not os.path.exists(tmp_path / 'boot.db')
+
+
+def test_blueprints_register_on_several_apps(tmp_path, monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'apps.db'}")
+    first, second = create_app(), create_app()
+
+    def rules(app):
+        return sorted((rule.rule, rule.endpoint) for rule in app.url_map.iter_rules())
+
+    assert rules(first) == rules(second)
+    assert first.test_client().get('/api/health').status_code == 200
+    assert second.test_client().get('/api/health').status_code == 200
+
+
+def test_heavy_modules_loaded_on_demand(tmp_path):
+    """NumPy et Alembic ne sont pas importés au démarrage d'un worker"""
+    script = ('import json, sys\n'
+              'from app import create_app\n'
+              'create_app()\n'
+              'print(json.dumps(sorted(m for m in ("numpy", "alembic", "flask_migrate") if m in sys.modules)))\n')
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{tmp_path / 'modules.db'}")
+    completed = subprocess.run([sys.executable, '-c', script], cwd=BACKEND_DIR, env=env,
+                               check=True, capture_output=True, text=True)
+    assert json.loads(completed.stdout) == []
+
+
+def test_schema_commands(tmp_path, monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'cli.db'}")
+    app = create_app()
+    runner = app.test_cli_runner()
+
+    result = runner.invoke(args=['schema', 'create'])
+    assert result.exit_code == 0, result.output
+    with app.app_context():
+        tables = inspect(db.engine).get_table_names()
+        assert {'users', 'projects', 'bids', 'alembic_version'} <= set(tables)
+
+    # Base déjà à la dernière révision : rien à appliquer
+    assert runner.invoke(args=['schema', 'upgrade']).exit_code == 0
+    result = runner.invoke(args=['db', 'current'])
+    assert result.exit_code == 0, result.output
+    with app.app_context():
+        db.engine.dispose()
+
+
+def test_test_apps_stay_out_of_source_tree():
+    """Une application de test sans DATABASE_URL propre n'écrit pas dans instance/"""
+    app = create_app()
+    with app.app_context():
+        database = db.engine.url.database
+        db.engine.dispose()
+    source_tree = os.path.abspath(BACKEND_DIR)
+    assert not database or not os.path.abspath(database).startswith(source_tree + os.sep)
+    assert not os.path.exists(os.path.join(app.instance_path, 'app.db'))
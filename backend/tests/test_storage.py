@@ -0,0 +1,137 @@
+import hashlib
+import io
+import os
+from datetime import datetime, timedelta
+
+from app import db
+from app.models import Candidate, Document, Project, User
+from app.storage import LocalStorage, S3Storage, content_key
+
+
+def test_local_storage_streams_and_shards(tmp_path):
+    storage = LocalStorage(str(tmp_path), chunk_size=4)
+    payload = b'certificat de qualification' * 10
+
+    stored = storage.save(io.BytesIO(payload))
+
+    sha256 = hashlib.sha256(payload).hexdigest()
+    assert stored.sha256 == sha256
+    assert stored.size == len(payload)
+    assert stored.key == content_key(sha256) == f'{sha256[:2]}/{sha256[2:4]}/{sha256}'
+    with storage.open(stored.key) as f:
+        assert f.read() == payload
+    # Aucun fichier temporaire ne reste en zone de transit
+    assert os.listdir(storage.staging_dir) == []
+
+
+def test_local_storage_deduplicates(tmp_path):
+    storage = LocalStorage(str(tmp_path))
+    first = storage.save(io.BytesIO(b'same bytes'))
+    second = storage.save(io.BytesIO(b'same bytes'))
+    other = storage.save(io.BytesIO(b'other bytes'))
+
+    assert first.key == second.key
+    assert other.key != first.key
+    stored_files = [name for _, _, names in os.walk(tmp_path) for name in names]
+    assert len(stored_files) == 2
+
+
+def test_staged_file_published_only_on_promote(tmp_path):
+    storage = LocalStorage(str(tmp_path))
+    staged = storage.stage(io.BytesIO(b'offre technique'))
+
+    assert not storage.exists(staged.key)
+    assert os.listdir(storage.staging_dir) == [os.path.basename(staged.path)]
+
+    stored = storage.promote(staged)
+    assert storage.exists(stored.key) and stored.size == len(b'offre technique')
+    assert os.listdir(storage.staging_dir) == []
+
+    abandoned = storage.stage(io.BytesIO(b'offre abandonnee'))
+    storage.discard(abandoned)
+    assert not storage.exists(abandoned.key)
+    assert os.listdir(storage.staging_dir) == []
+
+
+class _NotFound(Exception):
+    response = {'Error': {'Code': '404'}}
+
+
+class StubS3Client:
+    """Bouchon minimal de l'API client boto3 S3"""
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = 0
+
+    def head_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise _NotFound()
+        return {'ContentLength': len(self.objects[(Bucket, Key)])}
+
+    def upload_file(self, Filename, Bucket, Key):
+        with open(Filename, 'rb') as f:
+            self.objects[(Bucket, Key)] = f.read()
+        self.uploads += 1
+
+    def get_object(self, Bucket, Key):
+        return {'Body': io.BytesIO(self.objects[(Bucket, Key)])}
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop((Bucket, Key), None)
+
+
+def test_s3_storage_against_stub(tmp_path):
+    client = StubS3Client()
+    storage = S3Storage(client, 'tenders', prefix='documents', staging_dir=str(tmp_path))
+
+    first = storage.save(io.BytesIO(b'pdf bytes'))
+    second = storage.save(io.BytesIO(b'pdf bytes'))
+
+    assert first.key == second.key
+    assert client.uploads == 1
+    assert ('tenders', f'documents/{first.key}') in client.objects
+    assert storage.open(first.key).read() == b'pdf bytes'
+
+    storage.delete(first.key)
+    assert not storage.exists(first.key)
+
+
+def test_submit_bid_stores_documents_by_content(client, app):
+    with app.app_context():
+        project = Project(title='Test Project', description='Test', project_type='repair',
+                          budget=50000, deadline=datetime.now() + timedelta(days=30))
+        db.session.add(project)
+        for i in range(2):
+            user = User(username=f'bidder_{i}', email=f'bidder_{i}@test.com', role='candidate')
+            user.set_password('pass123')
+            db.session.add(user)
+            db.session.flush()
+            db.session.add(Candidate(user_id=user.id, company_name=f'Company {i}'))
+        db.session.commit()
+        project_id = project.id
+
+    for i in range(2):
+        token = client.post('/api/auth/login', json={
+            'email': f'bidder_{i}@test.com', 'password': 'pass123'
+        }).json['access_token']
+        response = client.post(
+            f'/api/projects/{project_id}/bids',
+            headers={'Authorization': f'Bearer {token}'},
+            data={
+                'proposed_amount': '45000',
+                'technical_proposal': (io.BytesIO(b'same certificate'), 'offre.pdf'),
+                'financial_proposal': (io.BytesIO(f'prix {i}'.encode()), 'offre.pdf'),
+            },
+            content_type='multipart/form-data'
+        )
+        assert response.status_code == 201
+
+    documents = Document.query.all()
+    assert len(documents) == 4
+    technical = {d.file_path for d in documents if d.document_type == 'technical_proposal'}
+    financial = {d.file_path for d in documents if d.document_type == 'financial_proposal'}
+    assert len(technical) == 1
+    assert len(financial) == 2
+    assert all(d.file_name == 'offre.pdf' for d in documents)
+    assert {d.file_size for d in documents if d.document_type == 'technical_proposal'} == {16}
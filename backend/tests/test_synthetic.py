@@ -0,0 +1,92 @@
+"""Jeu synthétique (déterministe, chargé en masse) et banc d'essai des routes."""
+from datetime import datetime
+
+from sqlalchemy import func
+
+from app import db
+from app.models import Bid, Candidate, Document, Project, User
+from app.synthetic import BENCH_ADMIN_EMAIL, SyntheticDataset, load_dataset
+from benchmarks.harness import ROUTES, FlaskClient, compare, percentile, run_benchmark, sample_dataset
+
+
+REFERENCE = datetime(2026, 1, 1)
+
+
+def _dataset(seed=7):
+    return SyntheticDataset(seed=seed, candidates=10, projects=12, bids_per_project=3,
+                            documents_per_bid=1.5, reference=REFERENCE)
+
+
+def _rows(dataset):
+    projects = list(dataset.project_rows(1))
+    return projects, list(dataset.bid_and_document_rows(projects, 1, 1, 1, 'key', 10))
+
+
+def test_generation_is_deterministic():
+    assert _rows(_dataset()) == _rows(_dataset())
+    assert _rows(_dataset()) != _rows(_dataset(seed=8))
+
+
+def test_generated_bids_respect_constraints():
+    projects, rows = _rows(_dataset())
+    bids = [row for table, row in rows if table == 'bids']
+    pairs = [(bid['project_id'], bid['candidate_id']) for bid in bids]
+    assert len(pairs) == len(set(pairs))
+
+    by_project = {project['id']: project for project in projects}
+    for bid in bids:
+        project = by_project[bid['project_id']]
+        assert bid['submitted_at'] >= project['created_at']
+        if project['status'] == 'open':
+            assert bid['status'] == 'submitted'
+
+
+def test_load_dataset_uses_bulk_inserts(app, count_queries):
+    dataset = _dataset()
+    with count_queries() as statements:
+        counts = load_dataset(dataset, batch_size=1000)
+
+    assert counts['candidates'] == db.session.query(func.count(Candidate.id)).scalar() == 10
+    assert counts['projects'] == db.session.query(func.count(Project.id)).scalar() == 12
+    assert counts['bids'] == db.session.query(func.count(Bid.id)).scalar()
+    assert counts['documents'] == db.session.query(func.count(Document.id)).scalar()
+    assert User.query.filter_by(email=BENCH_ADMIN_EMAIL).one().role == 'admin'
+
+    inserts = [s for s in statements if s.lstrip().upper().startswith('INSERT INTO BIDS')]
+    assert len(inserts) == 1
+
+
+def test_load_dataset_appends_after_existing_rows(app):
+    first = load_dataset(_dataset())
+    second = load_dataset(_dataset())
+    assert db.session.query(func.count(Project.id)).scalar() == first['projects'] + second['projects']
+
+
+def test_percentile_interpolates():
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile([5], 99) == 5
+    assert percentile([], 50) is None
+
+
+def test_harness_covers_every_route(app):
+    rules = {(rule.rule, method) for rule in app.url_map.iter_rules()
+             if rule.endpoint != 'static'
+             for method in rule.methods - {'HEAD', 'OPTIONS'}}
+    assert rules == {(scenario.rule, scenario.method) for scenario in ROUTES}
+
+
+def test_harness_runs_every_scenario(app):
+    load_dataset(SyntheticDataset(seed=1, candidates=5, projects=6, bids_per_project=2,
+                                  documents_per_bid=1, reference=datetime.utcnow()))
+    sample, counts, _ = sample_dataset(app)
+
+    results = run_benchmark(FlaskClient(app), sample, iterations=2, warmup=1)
+
+    assert set(results) == {scenario.name for scenario in ROUTES}
+    for name, result in results.items():
+        assert result['errors'] == 0, name
+        assert result['p50_ms'] <= result['p95_ms'] <= result['p99_ms']
+
+    regressed = dict(results, health=dict(results['health'], p95_ms=results['health']['p95_ms'] * 10))
+    rows = compare(regressed, {'results': results}, tolerance=0.5)
+    assert [row['scenario'] for row in rows if row['regression']] == ['health']